@@ -0,0 +1,8 @@
+'''
+glTools benchmark suite.
+Runs timed scenarios for the glTools data and weight code paths against an in-process maya stub
+(glTools.bench.mayaStub), so performance regressions can be tracked outside of a Maya session.
+
+Usage:
+	python -m glTools.bench.suite --scale small --scale medium --output results.json
+'''
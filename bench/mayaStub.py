@@ -0,0 +1,1751 @@
+'''
+In-process stand-in for the subset of maya.cmds, maya.mel, maya.OpenMaya and maya.OpenMayaAnim
+used by the glTools data and weight code paths.
+The stub is backed by a small synthetic scene (transforms, joints, polygon meshes, skinClusters and
+anim curves), so glTools modules can be imported and exercised on a machine without Maya.
+Unsupported commands and API classes raise StubUnsupported, so coverage gaps are reported explicitly
+instead of silently returning incorrect results.
+Transforms in the stub scene carry translation only (no rotation or scale).
+'''
+
+import sys
+import types
+import time
+import math
+import fnmatch
+import re
+
+# =============
+# - Constants -
+# =============
+
+# Node Type Inheritance (maya nodeType -inherited)
+NODE_TYPES = {	'transform':['containerBase','entity','dagNode','transform'],
+				'joint':['containerBase','entity','dagNode','transform','joint'],
+				'mesh':['containerBase','entity','dagNode','shape','geometryShape','deformableShape','controlPoint','surfaceShape','mesh'],
+				'nurbsCurve':['containerBase','entity','dagNode','shape','geometryShape','deformableShape','controlPoint','curveShape','nurbsCurve'],
+				'skinCluster':['geometryFilter','skinCluster'],
+				'objectSet':['entity','objectSet'],
+				'animCurveTL':['animCurve','animCurveTL'],
+				'animCurveTA':['animCurve','animCurveTA'],
+				'animCurveTU':['animCurve','animCurveTU']	}
+
+# Attribute Short Names
+ATTR_ALIAS = {	'tx':'translateX','ty':'translateY','tz':'translateZ',
+				'rx':'rotateX','ry':'rotateY','rz':'rotateZ',
+				'sx':'scaleX','sy':'scaleY','sz':'scaleZ',
+				'v':'visibility','io':'intermediateObject','liw':'lockInfluenceWeights'	}
+
+# Component Types
+COMPONENT_TYPES = {	'vtx':'kMeshVertComponent',
+					'e':'kMeshEdgeComponent',
+					'f':'kMeshPolygonComponent',
+					'cv':'kCurveCVComponent'	}
+
+COMPONENT_RE = re.compile(r'^(.+?)\.(vtx|e|f|cv)\[(\d+)(?::(\d+))?\]$')
+
+class StubUnsupported(AttributeError):
+	'''
+	Raised for maya commands and API members that are not implemented by the stub.
+	'''
+	pass
+
+# =========
+# - Scene -
+# =========
+
+class StubNode(object):
+	'''
+	Stub scene node.
+	'''
+	def __init__(self,name,nodeType,parent=None):
+		self.name = name
+		self.nodeType = nodeType
+		self.parent = parent
+		self.children = []
+		self.attrs = {}
+		self.locked = set([])
+		if parent: parent.children.append(self)
+
+	def isDag(self):
+		return 'dagNode' in NODE_TYPES[self.nodeType]
+
+	def longName(self):
+		if not self.isDag(): return self.name
+		path = []
+		node = self
+		while node:
+			path.insert(0,node.name)
+			node = node.parent
+		return '|'+'|'.join(path)
+
+	def worldOffset(self):
+		'''
+		Return the accumulated (translation only) world offset of the node.
+		'''
+		offset = [0.0,0.0,0.0]
+		node = self
+		while node:
+			if 'transform' in NODE_TYPES[node.nodeType]:
+				offset[0] += node.attrs.get('translateX',0.0)
+				offset[1] += node.attrs.get('translateY',0.0)
+				offset[2] += node.attrs.get('translateZ',0.0)
+			node = node.parent
+		return offset
+
+class StubMesh(StubNode):
+	'''
+	Stub polygon mesh shape.
+	'''
+	def __init__(self,name,parent,points,faceCounts,faceConnects,uArray=[],vArray=[],uvIds=[]):
+		super(StubMesh,self).__init__(name,'mesh',parent)
+		self.points = [list(pt) for pt in points]
+		self.faceCounts = list(faceCounts)
+		self.faceConnects = list(faceConnects)
+		self.uArray = list(uArray)
+		self.vArray = list(vArray)
+		self.uvIds = list(uvIds)
+		self.attrs['intermediateObject'] = False
+		self._topology = None
+
+	def faceVertices(self):
+		'''
+		Return the list of vertex IDs for each face.
+		'''
+		if self._topology == None: self._buildTopology()
+		return self._topology['faceVerts']
+
+	def topology(self):
+		if self._topology == None: self._buildTopology()
+		return self._topology
+
+	def _buildTopology(self):
+		'''
+		Build (cached) face, edge and vertex adjacency tables.
+		'''
+		faceVerts = []
+		offset = 0
+		for count in self.faceCounts:
+			faceVerts.append(self.faceConnects[offset:offset+count])
+			offset += count
+		edgeIndex = {}
+		edges = []
+		faceEdges = []
+		vtxFaces = [[] for i in xrange(len(self.points))]
+		vtxEdges = [[] for i in xrange(len(self.points))]
+		for f in xrange(len(faceVerts)):
+			verts = faceVerts[f]
+			fEdges = []
+			for i in xrange(len(verts)):
+				key = (min(verts[i],verts[i-1]),max(verts[i],verts[i-1]))
+				if not key in edgeIndex:
+					edgeIndex[key] = len(edges)
+					vtxEdges[key[0]].append(len(edges))
+					vtxEdges[key[1]].append(len(edges))
+					edges.append(key)
+				fEdges.append(edgeIndex[key])
+				vtxFaces[verts[i]].append(f)
+			faceEdges.append(fEdges)
+		self._topology = {	'faceVerts':faceVerts,
+							'edges':edges,
+							'faceEdges':faceEdges,
+							'vtxFaces':vtxFaces,
+							'vtxEdges':vtxEdges	}
+
+	def normals(self):
+		'''
+		Return (area weighted) vertex normals.
+		'''
+		normals = [[0.0,0.0,0.0] for pt in self.points]
+		for verts in self.faceVertices():
+			p0 = self.points[verts[0]]
+			n = [0.0,0.0,0.0]
+			for i in xrange(1,len(verts)-1):
+				a = self.points[verts[i]]
+				b = self.points[verts[i+1]]
+				u = (a[0]-p0[0],a[1]-p0[1],a[2]-p0[2])
+				v = (b[0]-p0[0],b[1]-p0[1],b[2]-p0[2])
+				n[0] += u[1]*v[2]-u[2]*v[1]
+				n[1] += u[2]*v[0]-u[0]*v[2]
+				n[2] += u[0]*v[1]-u[1]*v[0]
+			for vtx in verts:
+				for c in range(3): normals[vtx][c] += n[c]
+		for n in normals:
+			length = math.sqrt(n[0]*n[0]+n[1]*n[1]+n[2]*n[2]) or 1.0
+			for c in range(3): n[c] /= length
+		return normals
+
+class StubSkinCluster(StubNode):
+	'''
+	Stub skinCluster deformer. Weights are stored as a dense (vertex major) weight table.
+	'''
+	def __init__(self,name,geometry,influences,weights,deformerSet):
+		super(StubSkinCluster,self).__init__(name,'skinCluster')
+		self.geometry = geometry
+		self.influences = list(influences)
+		self.weights = list(weights)
+		self.deformerSet = deformerSet
+		for attr in ['envelope','skinningMethod','useComponents','normalizeWeights','deformUserNormals']:
+			self.attrs[attr] = 1
+		self.attrs['skinningMethod'] = 0
+		self.attrs['useComponents'] = 0
+
+class StubObjectSet(StubNode):
+	'''
+	Stub object set. Members are stored per shape as a sorted list of component indices.
+	'''
+	def __init__(self,name):
+		super(StubObjectSet,self).__init__(name,'objectSet')
+		self.members = {}
+
+class StubAnimCurve(StubNode):
+	'''
+	Stub anim curve. Keys are stored as a time:value dictionary.
+	'''
+	def __init__(self,name,nodeType,plug):
+		super(StubAnimCurve,self).__init__(name,nodeType)
+		self.plug = plug
+		self.keys = {}
+		self.attrs['preInfinity'] = 0
+		self.attrs['postInfinity'] = 0
+		self.attrs['weightedTangents'] = False
+
+class Scene(object):
+	'''
+	Stub scene. Holds the scene nodes, selection, current time and connections.
+	'''
+	def __init__(self):
+		self.clear()
+
+	def clear(self):
+		self.nodes = {}
+		self.order = []
+		self.selection = []
+		self.currentTime = 1.0
+		self.connections = []
+		self.animCurves = {}
+
+	def addNode(self,node):
+		if node.name in self.nodes:
+			raise Exception('Stub scene node "'+node.name+'" already exists!')
+		self.nodes[node.name] = node
+		self.order.append(node)
+		return node
+
+	def uniqueName(self,name):
+		if not name in self.nodes: return name
+		base = name.rstrip('0123456789')
+		i = 1
+		while base+str(i) in self.nodes: i += 1
+		return base+str(i)
+
+	def find(self,name):
+		'''
+		Return the node for the specified (short, long or partial path) node name, or None.
+		'''
+		name = str(name)
+		if '|' in name: name = name.split('|')[-1]
+		return self.nodes.get(name)
+
+	def get(self,name):
+		node = self.find(name)
+		if not node: raise RuntimeError('No object matches name: '+str(name))
+		return node
+
+scene = Scene()
+
+# ===================
+# - Scene Builders -
+# ===================
+
+def createTransform(name,parent=None,translate=(0.0,0.0,0.0),nodeType='transform'):
+	'''
+	Create a stub transform (or joint).
+	@param name: Transform name
+	@type name: str
+	@param parent: Parent transform name
+	@type parent: str or None
+	@param translate: Transform translation
+	@type translate: tuple
+	@param nodeType: Transform node type ("transform" or "joint")
+	@type nodeType: str
+	'''
+	parentNode = None
+	if parent: parentNode = scene.get(parent)
+	node = scene.addNode(StubNode(name,nodeType,parentNode))
+	for attr in ['translate','rotate','scale']:
+		for axis in 'XYZ':
+			node.attrs[attr+axis] = float(attr == 'scale')
+	node.attrs['visibility'] = True
+	node.attrs['translateX'],node.attrs['translateY'],node.attrs['translateZ'] = [float(t) for t in translate]
+	if nodeType == 'joint': node.attrs['lockInfluenceWeights'] = False
+	return name
+
+def createPlaneMesh(name,divisions=10,size=10.0,parent=None):
+	'''
+	Create a stub polygon plane mesh (in the XZ plane, centered at the origin).
+	Returns the mesh transform name. The mesh shape is named name+"Shape".
+	@param name: Mesh transform name
+	@type name: str
+	@param divisions: Number of face divisions along each side of the plane
+	@type divisions: int
+	@param size: Plane width
+	@type size: float
+	@param parent: Parent transform name
+	@type parent: str or None
+	'''
+	points = []
+	uArray = []
+	vArray = []
+	for j in range(divisions+1):
+		for i in range(divisions+1):
+			u = float(i)/divisions
+			v = float(j)/divisions
+			points.append((size*(u-0.5),0.25*math.sin(u*math.pi*3.0)*math.cos(v*math.pi*2.0),size*(0.5-v)))
+			uArray.append(u)
+			vArray.append(v)
+	faceCounts = []
+	faceConnects = []
+	row = divisions+1
+	for j in range(divisions):
+		for i in range(divisions):
+			faceCounts.append(4)
+			faceConnects.extend([j*row+i,j*row+i+1,(j+1)*row+i+1,(j+1)*row+i])
+
+	createTransform(name,parent)
+	scene.addNode(StubMesh(name+'Shape',scene.get(name),points,faceCounts,faceConnects,uArray,vArray,list(faceConnects)))
+	return name
+
+def createJointChain(prefix,count=4,length=10.0):
+	'''
+	Create a chain of stub joints spanning the X axis (centered at the origin).
+	Returns the list of joint names.
+	@param prefix: Joint name prefix
+	@type prefix: str
+	@param count: Number of joints
+	@type count: int
+	@param length: Total chain length
+	@type length: float
+	'''
+	jointList = []
+	parent = None
+	for i in range(count):
+		x = length*(float(i)/max(count-1,1) - 0.5)
+		if parent: x -= scene.get(parent).worldOffset()[0]
+		joint = createTransform(prefix+str(i+1)+'_jnt',parent,(x,0.0,0.0),nodeType='joint')
+		jointList.append(joint)
+		parent = joint
+	return jointList
+
+def createSkinCluster(name,geometry,influences,maxInfluences=4,falloff=2.0):
+	'''
+	Create a stub skinCluster, with distance based (normalized) weights.
+	@param name: SkinCluster name
+	@type name: str
+	@param geometry: Mesh transform or shape to bind
+	@type geometry: str
+	@param influences: Influence transform list
+	@type influences: list
+	@param maxInfluences: Maximum number of non zero influences per vertex
+	@type maxInfluences: int
+	@param falloff: Distance falloff exponent
+	@type falloff: float
+	'''
+	mesh = scene.get(geometry)
+	if not isinstance(mesh,StubMesh): mesh = [c for c in mesh.children if isinstance(c,StubMesh)][0]
+	offset = mesh.worldOffset()
+	infPos = [scene.get(inf).worldOffset() for inf in influences]
+	infCount = len(influences)
+	weights = []
+	for pt in mesh.points:
+		pt = (pt[0]+offset[0],pt[1]+offset[1],pt[2]+offset[2])
+		dist = [(sum([(pt[c]-pos[c])**2 for c in range(3)])+0.0001)**(-0.5*falloff) for pos in infPos]
+		keep = sorted(range(infCount),key=lambda i: -dist[i])[:maxInfluences]
+		total = sum([dist[i] for i in keep])
+		weights.extend([(i in keep) and dist[i]/total or 0.0 for i in range(infCount)])
+
+	deformerSet = scene.addNode(StubObjectSet(name+'Set'))
+	deformerSet.members[mesh.name] = range(len(mesh.points))
+	skin = scene.addNode(StubSkinCluster(name,mesh,[scene.get(inf) for inf in influences],weights,deformerSet))
+	return skin.name
+
+def reset():
+	'''
+	Clear the stub scene.
+	'''
+	scene.clear()
+
+# ===========
+# - Helpers -
+# ===========
+
+def _flattenArgs(args):
+	result = []
+	for arg in args:
+		if arg == None: continue
+		if isinstance(arg,(list,tuple)): result.extend(_flattenArgs(arg))
+		else: result.append(str(arg))
+	return result
+
+def _flag(kwargs,*names):
+	'''
+	Return the value of the first specified command flag (long or short name) found in kwargs.
+	'''
+	for name in names:
+		if name in kwargs: return kwargs[name]
+	return None
+
+def _splitPlug(plug):
+	node,attr = plug.split('.',1)
+	return (node,attr)
+
+def _attrName(attr):
+	return ATTR_ALIAS.get(attr,attr)
+
+def _shapeNode(node):
+	'''
+	Return the (first, non intermediate) shape of a transform, or the node itself.
+	'''
+	if 'transform' in NODE_TYPES[node.nodeType]:
+		shapes = [c for c in node.children if 'shape' in NODE_TYPES[c.nodeType] and not c.attrs.get('intermediateObject')]
+		if shapes: return shapes[0]
+	return node
+
+def _parseComponent(name):
+	'''
+	Parse a component string. Returns (shapeNode,componentType,indexList) or None if the string is not a component.
+	'''
+	match = COMPONENT_RE.match(str(name))
+	if not match: return None
+	node = scene.find(match.group(1))
+	if not node: return None
+	start = int(match.group(3))
+	end = start
+	if match.group(4) != None: end = int(match.group(4))
+	return (_shapeNode(node),match.group(2),range(start,end+1))
+
+def _componentCount(shape,compType):
+	if compType in ['vtx','cv']: return len(shape.points)
+	if compType == 'f': return len(shape.faceCounts)
+	if compType == 'e': return len(shape.topology()['edges'])
+	return 0
+
+def _compactIndices(indexList):
+	'''
+	Return a list of (start,end) ranges for a sorted list of indices.
+	'''
+	ranges = []
+	for ind in indexList:
+		if ranges and ind == ranges[-1][1]+1: ranges[-1][1] = ind
+		else: ranges.append([ind,ind])
+	return ranges
+
+def _componentStrings(shapeName,compType,indexList,flatten=False):
+	if flatten: return [shapeName+'.'+compType+'['+str(i)+']' for i in indexList]
+	result = []
+	for start,end in _compactIndices(sorted(indexList)):
+		if start == end: result.append(shapeName+'.'+compType+'['+str(start)+']')
+		else: result.append(shapeName+'.'+compType+'['+str(start)+':'+str(end)+']')
+	return result
+
+def _groupComponents(itemList):
+	'''
+	Group a list of component strings by shape and component type.
+	Returns a list of (shape,componentType,indexList) items, preserving first occurrence order.
+	'''
+	groups = []
+	groupIndex = {}
+	for item in _flattenArgs(itemList):
+		comp = _parseComponent(item)
+		if not comp: continue
+		key = (comp[0].name,comp[1])
+		if not key in groupIndex:
+			groupIndex[key] = len(groups)
+			groups.append((comp[0],comp[1],[],set([])))
+		group = groups[groupIndex[key]]
+		for ind in comp[2]:
+			if not ind in group[3]:
+				group[3].add(ind)
+				group[2].append(ind)
+	return [(g[0],g[1],g[2]) for g in groups]
+
+# ================
+# - maya.cmds -
+# ================
+
+class _CommandModule(types.ModuleType):
+	'''
+	Module type that reports unsupported commands with StubUnsupported.
+	'''
+	def __getattr__(self,name):
+		if name.startswith('__'): raise AttributeError(name)
+		raise StubUnsupported(self.__name__+'.'+name+' is not supported by the glTools benchmark stub!')
+
+def objExists(name):
+	name = str(name)
+	if _parseComponent(name): return True
+	if '.' in name:
+		node,attr = _splitPlug(name)
+		node = scene.find(node)
+		if not node: return False
+		attr = _attrName(attr.split('[')[0])
+		return attr in node.attrs or attr in ['bindPreMatrix','driverPoints','matrix','worldMatrix','message']
+	return scene.find(name) != None
+
+def objectType(name,isType=None,isAType=None):
+	if isinstance(name,(list,tuple)): name = name[0]
+	comp = _parseComponent(name)
+	if comp: nodeType = comp[0].nodeType
+	else: nodeType = scene.get(name).nodeType
+	if isType: return nodeType == isType
+	if isAType: return isAType in NODE_TYPES[nodeType]
+	return nodeType
+
+def nodeType(name,inherited=False,i=False,apiType=False):
+	if isinstance(name,(list,tuple)): name = name[0]
+	node = scene.get(name)
+	if inherited or i: return list(NODE_TYPES[node.nodeType])
+	return node.nodeType
+
+def listRelatives(*args,**kwargs):
+	nodes = [scene.get(n) for n in _flattenArgs(args)]
+	nodeType = _flag(kwargs,'type')
+	fullPath = _flag(kwargs,'fullPath','f')
+	result = []
+	for node in nodes:
+		if _flag(kwargs,'parent','p'):
+			relatives = node.parent and [node.parent] or []
+		elif _flag(kwargs,'allDescendents','ad'):
+			relatives = []
+			stack = list(node.children)
+			while stack:
+				child = stack.pop()
+				relatives.append(child)
+				stack.extend(child.children)
+		else:
+			relatives = list(node.children)
+			if _flag(kwargs,'shapes','s'): relatives = [r for r in relatives if 'shape' in NODE_TYPES[r.nodeType]]
+		if _flag(kwargs,'noIntermediate','ni'): relatives = [r for r in relatives if not r.attrs.get('intermediateObject')]
+		if nodeType:
+			if isinstance(nodeType,(str,unicode)): nodeType = [nodeType]
+			relatives = [r for r in relatives if [t for t in nodeType if t in NODE_TYPES[r.nodeType]]]
+		for r in relatives:
+			if fullPath: result.append(r.longName())
+			else: result.append(r.name)
+	return result or None
+
+def ls(*args,**kwargs):
+	nodeType = _flag(kwargs,'type','typ')
+	if isinstance(nodeType,(str,unicode)): nodeType = [nodeType]
+	longNames = _flag(kwargs,'long','l')
+	flatten = _flag(kwargs,'flatten','fl')
+	objectsOnly = _flag(kwargs,'objectsOnly','o')
+
+	# Get Items
+	if _flag(kwargs,'selection','sl'): items = list(scene.selection)
+	elif args: items = _flattenArgs(args)
+	else: items = [n.name for n in scene.order]
+
+	result = []
+	for item in items:
+
+		# Components
+		comp = _parseComponent(item)
+		if comp:
+			if objectsOnly: names = [comp[0].name]
+			else: names = _componentStrings(comp[0].name,comp[1],comp[2],flatten)
+			if nodeType and not [t for t in nodeType if t in NODE_TYPES[comp[0].nodeType]]: continue
+			for name in names:
+				if not name in result: result.append(name)
+			continue
+
+		# Plugs
+		if '.' in item:
+			if objExists(item):
+				if objectsOnly: item = item.split('.')[0]
+				if not item in result: result.append(item)
+			continue
+
+		# Nodes (with wildcards)
+		if '*' in item or '?' in item: nodes = [n for n in scene.order if fnmatch.fnmatchcase(n.name,item)]
+		else: nodes = [scene.find(item)]
+		for node in nodes:
+			if not node: continue
+			if nodeType and not [t for t in nodeType if t in NODE_TYPES[node.nodeType]]: continue
+			name = longNames and node.longName() or node.name
+			if not name in result: result.append(name)
+
+	return result
+
+def select(*args,**kwargs):
+	if _flag(kwargs,'clear','cl'):
+		scene.selection = []
+		return
+	items = _flattenArgs(args)
+	if _flag(kwargs,'add','af','tgl'): scene.selection.extend([i for i in items if not i in scene.selection])
+	elif _flag(kwargs,'deselect','d'): scene.selection = [i for i in scene.selection if not i in items]
+	else: scene.selection = items
+
+def _componentPosition(shape,compType,index,worldSpace=True):
+	pt = shape.points[index]
+	if not worldSpace: return [pt[0],pt[1],pt[2]]
+	offset = shape.worldOffset()
+	return [pt[0]+offset[0],pt[1]+offset[1],pt[2]+offset[2]]
+
+def xform(*args,**kwargs):
+	items = _flattenArgs(args)
+	if not _flag(kwargs,'query','q'):
+		for item in items:
+			node = scene.get(item)
+			translation = _flag(kwargs,'translation','t')
+			if translation:
+				node.attrs['translateX'],node.attrs['translateY'],node.attrs['translateZ'] = [float(t) for t in translation]
+		return
+
+	worldSpace = _flag(kwargs,'worldSpace','ws')
+	item = items[0]
+	comp = _parseComponent(item)
+
+	# Component Query
+	if comp:
+		if _flag(kwargs,'boundingBox','bb'):
+			pts = [_componentPosition(comp[0],comp[1],i,worldSpace) for i in comp[2]]
+			return [min([p[c] for p in pts]) for c in range(3)] + [max([p[c] for p in pts]) for c in range(3)]
+		result = []
+		for i in comp[2]: result.extend(_componentPosition(comp[0],comp[1],i,worldSpace))
+		return result
+
+	# Node Query
+	node = scene.get(item)
+	if _flag(kwargs,'boundingBox','bb'):
+		meshes = [n for n in [node]+node.children if isinstance(n,StubMesh)]
+		pts = []
+		for mesh in meshes: pts.extend([_componentPosition(mesh,'vtx',i,True) for i in range(len(mesh.points))])
+		if not pts: pts = [node.worldOffset()]
+		return [min([p[c] for p in pts]) for c in range(3)] + [max([p[c] for p in pts]) for c in range(3)]
+	if _flag(kwargs,'rotatePivot','rp','scalePivot','sp') or _flag(kwargs,'translation','t'):
+		if worldSpace: return node.worldOffset()
+		return [node.attrs.get('translateX',0.0),node.attrs.get('translateY',0.0),node.attrs.get('translateZ',0.0)]
+	if _flag(kwargs,'matrix','m'):
+		offset = worldSpace and node.worldOffset() or [node.attrs.get('translate'+a,0.0) for a in 'XYZ']
+		return [1.0,0.0,0.0,0.0,0.0,1.0,0.0,0.0,0.0,0.0,1.0,0.0,offset[0],offset[1],offset[2],1.0]
+	raise StubUnsupported('maya.cmds.xform query flags '+str(kwargs.keys())+' are not supported by the glTools benchmark stub!')
+
+def pointPosition(item,world=True,w=None,local=False,l=None):
+	comp = _parseComponent(item)
+	if not comp: raise RuntimeError('Invalid point: '+str(item))
+	return _componentPosition(comp[0],comp[1],comp[2][0],not (local or l))
+
+def polyEvaluate(*args,**kwargs):
+	node = _shapeNode(scene.get(_flattenArgs(args)[0]))
+	if _flag(kwargs,'vertex','v'): return len(node.points)
+	if _flag(kwargs,'face','f'): return len(node.faceCounts)
+	if _flag(kwargs,'edge','e'): return len(node.topology()['edges'])
+	if _flag(kwargs,'uvcoord','uv'): return len(node.uArray)
+	raise StubUnsupported('maya.cmds.polyEvaluate flags '+str(kwargs.keys())+' are not supported by the glTools benchmark stub!')
+
+def filterExpand(*args,**kwargs):
+	selectionMask = _flag(kwargs,'selectionMask','sm')
+	if isinstance(selectionMask,int): selectionMask = [selectionMask]
+	maskTypes = {31:'vtx',32:'e',34:'f',28:'cv'}
+	compTypes = [maskTypes[m] for m in selectionMask or [] if m in maskTypes]
+	result = []
+	for shape,compType,indexList in _groupComponents(args):
+		if compTypes and not compType in compTypes: continue
+		result.extend(_componentStrings(shape.name,compType,indexList,flatten=True))
+	return result or None
+
+def polyListComponentConversion(*args,**kwargs):
+	toVertex = _flag(kwargs,'toVertex','tv')
+	toEdge = _flag(kwargs,'toEdge','te')
+	toFace = _flag(kwargs,'toFace','tf')
+	result = []
+	for shape,compType,indexList in _groupComponents(args):
+		topo = shape.topology()
+		vtxSet = set([])
+		if compType == 'vtx': vtxSet.update(indexList)
+		elif compType == 'e':
+			for e in indexList: vtxSet.update(topo['edges'][e])
+		elif compType == 'f':
+			for f in indexList: vtxSet.update(topo['faceVerts'][f])
+		if toVertex: result.extend(_componentStrings(shape.name,'vtx',sorted(vtxSet)))
+		if toEdge:
+			edgeSet = set([])
+			for v in vtxSet: edgeSet.update(topo['vtxEdges'][v])
+			result.extend(_componentStrings(shape.name,'e',sorted(edgeSet)))
+		if toFace:
+			faceSet = set([])
+			for v in vtxSet: faceSet.update(topo['vtxFaces'][v])
+			result.extend(_componentStrings(shape.name,'f',sorted(faceSet)))
+	return result
+
+def _skinClusters():
+	return [n for n in scene.order if isinstance(n,StubSkinCluster)]
+
+def skinCluster(*args,**kwargs):
+	if not _flag(kwargs,'query','q'):
+		raise StubUnsupported('maya.cmds.skinCluster (create/edit) is not supported by the glTools benchmark stub! Use glTools.bench.mayaStub.createSkinCluster().')
+	items = _flattenArgs(args)
+	node = scene.get(items[0])
+	if not isinstance(node,StubSkinCluster):
+		node = [s for s in _skinClusters() if s.geometry == _shapeNode(node)][0]
+	if _flag(kwargs,'geometry','g'): return [node.geometry.name]
+	if _flag(kwargs,'polySmoothness','ps'): return 0.0
+	if _flag(kwargs,'nurbsSamples','ns'): return 10
+	if _flag(kwargs,'influence','inf') != None: return [inf.name for inf in node.influences]
+	raise StubUnsupported('maya.cmds.skinCluster query flags '+str(kwargs.keys())+' are not supported by the glTools benchmark stub!')
+
+def listHistory(*args,**kwargs):
+	result = []
+	for item in _flattenArgs(args):
+		node = _shapeNode(scene.get(item))
+		result.append(node.name)
+		result.extend([s.name for s in _skinClusters() if s.geometry == node])
+	return result
+
+def listConnections(*args,**kwargs):
+	items = _flattenArgs(args)
+	source = _flag(kwargs,'source','s')
+	destination = _flag(kwargs,'destination','d')
+	if source == None and destination == None: source = destination = True
+	plugs = _flag(kwargs,'plugs','p')
+	connections = _flag(kwargs,'connections','c')
+	nodeType = _flag(kwargs,'type','t')
+	result = []
+	for item in items:
+		for src,dst in scene.connections:
+			for this,other,enabled in [(dst,src,source),(src,dst,destination)]:
+				if not enabled: continue
+				if not (this == item or this.split('.')[0] == item or this.startswith(item+'[') or this.startswith(item+'.')): continue
+				otherNode = scene.get(other.split('.')[0])
+				if nodeType and not nodeType in NODE_TYPES[otherNode.nodeType]: continue
+				if connections: result.append(this)
+				result.append(plugs and other or otherNode.name)
+	return result or None
+
+def connectAttr(src,dst,force=False,f=False):
+	scene.connections = [c for c in scene.connections if c[1] != dst]
+	scene.connections.append((src,dst))
+
+def getAttr(plug,settable=False,se=False,lock=False,l=False,type=False,size=False,**kwargs):
+	node,attr = _splitPlug(plug)
+	node = scene.get(node)
+	attr = _attrName(attr)
+	if settable or se:
+		if attr in node.locked: return False
+		return not [c for c in scene.connections if c[1] == node.name+'.'+attr]
+	if lock or l: return attr in node.locked
+	if not attr in node.attrs:
+		raise StubUnsupported('Attribute "'+plug+'" is not defined in the glTools benchmark stub scene!')
+	if attr in scene.animCurves.get(node.name,{}):
+		curve = scene.animCurves[node.name][attr]
+		if scene.currentTime in curve.keys: return curve.keys[scene.currentTime]
+	return node.attrs[attr]
+
+def setAttr(plug,*values,**kwargs):
+	node,attr = _splitPlug(plug)
+	node = scene.get(node)
+	attr = _attrName(attr)
+	lock = _flag(kwargs,'lock','l')
+	if lock != None:
+		if lock: node.locked.add(attr)
+		else: node.locked.discard(attr)
+	if not values: return
+	if attr in node.locked: raise RuntimeError('The attribute "'+plug+'" is locked and cannot be modified!')
+	if len(values) == 1: node.attrs[attr] = values[0]
+	else: node.attrs[attr] = list(values)
+
+def setKeyframe(*args,**kwargs):
+	t = _flag(kwargs,'time','t')
+	if t == None: t = scene.currentTime
+	if isinstance(t,(list,tuple)): t = t[0]
+	v = _flag(kwargs,'value','v')
+	count = 0
+	for plug in _flattenArgs(args):
+		nodeName,attr = _splitPlug(plug)
+		node = scene.get(nodeName)
+		attr = _attrName(attr)
+		curves = scene.animCurves.setdefault(node.name,{})
+		if not attr in curves:
+			curveType = attr.startswith('rotate') and 'animCurveTA' or (attr.startswith('translate') and 'animCurveTL' or 'animCurveTU')
+			curve = scene.addNode(StubAnimCurve(scene.uniqueName(node.name+'_'+attr),curveType,node.name+'.'+attr))
+			curves[attr] = curve
+			scene.connections.append((curve.name+'.output',node.name+'.'+attr))
+		if v == None: v = node.attrs.get(attr,0.0)
+		curves[attr].keys[float(t)] = float(v)
+		count += 1
+	return count
+
+def _curveForPlug(plug):
+	nodeName,attr = _splitPlug(plug)
+	node = scene.get(nodeName)
+	return scene.animCurves.get(node.name,{}).get(_attrName(attr))
+
+def keyframe(*args,**kwargs):
+	curves = [_curveForPlug(p) for p in _flattenArgs(args)]
+	curves = [c for c in curves if c]
+	if _flag(kwargs,'query','q'):
+		result = []
+		for curve in curves:
+			keys = sorted(curve.keys)
+			if _flag(kwargs,'valueChange','vc'): result.extend([curve.keys[k] for k in keys])
+			elif _flag(kwargs,'keyframeCount','kc'): return len(keys)
+			elif _flag(kwargs,'breakdown','bd'): continue
+			else: result.extend(keys)
+		return result or None
+	return len(curves)
+
+def keyTangent(*args,**kwargs):
+	if _flag(kwargs,'query','q'):
+		curve = _curveForPlug(_flattenArgs(args)[0])
+		count = curve and len(curve.keys) or 0
+		if _flag(kwargs,'inTangentType','itt','outTangentType','ott'): return ['auto']*count
+		return [0.0]*count
+	return 0
+
+def setInfinity(*args,**kwargs):
+	infValue = ['constant','linear','constant','cycle','cycleRelative','oscillate']
+	for plug in _flattenArgs(args):
+		curve = _curveForPlug(plug)
+		if not curve: continue
+		pri = _flag(kwargs,'preInfinite','pri')
+		poi = _flag(kwargs,'postInfinite','poi')
+		if pri: curve.attrs['preInfinity'] = infValue.index(pri)
+		if poi: curve.attrs['postInfinity'] = infValue.index(poi)
+
+def filterCurve(*args,**kwargs):
+	return True
+
+def currentTime(*args,**kwargs):
+	if _flag(kwargs,'query','q'): return scene.currentTime
+	if args: scene.currentTime = float(args[0])
+	return scene.currentTime
+
+def polyUVSet(*args,**kwargs):
+	return ['map1']
+
+def timerX(startTime=None,st=None):
+	start = startTime or st
+	if start == None: return time.time()
+	return time.time() - start
+
+def undoInfo(*args,**kwargs):
+	if _flag(kwargs,'query','q'): return True
+	return None
+
+def refresh(*args,**kwargs):
+	return None
+
+def progressBar(*args,**kwargs):
+	if _flag(kwargs,'query','q'): return False
+	return None
+
+def file(*args,**kwargs):
+	if _flag(kwargs,'query','q'): return ''
+	raise StubUnsupported('maya.cmds.file (edit) is not supported by the glTools benchmark stub!')
+
+def about(*args,**kwargs):
+	if _flag(kwargs,'batch','b'): return True
+	return ''
+
+# ============
+# - maya.mel -
+# ============
+
+def melEval(command):
+	'''
+	Evaluate the (small) subset of MEL used by the glTools data and weight paths.
+	'''
+	command = command.strip().rstrip(';')
+	if command.replace(' ','') == '$tmp=$gMainProgressBar': return 'MayaWindow|mainProgressBar'
+	if command.startswith('findRelatedSkinCluster'):
+		geo = command.split()[-1].strip('"')
+		node = _shapeNode(scene.get(geo))
+		skins = [s.name for s in _skinClusters() if s.geometry == node]
+		return skins and skins[0] or ''
+	raise StubUnsupported('MEL command "'+command+'" is not supported by the glTools benchmark stub!')
+
+# =================
+# - OpenMaya API -
+# =================
+
+class MFn(object):
+	'''
+	MFn type constants.
+	'''
+	kInvalid = 0
+	kBase = 1
+	kDependencyNode = 2
+	kDagNode = 3
+	kTransform = 4
+	kJoint = 5
+	kShape = 6
+	kMesh = 7
+	kNurbsCurve = 8
+	kNurbsSurface = 9
+	kLattice = 10
+	kGeometryFilt = 11
+	kSkinClusterFilter = 12
+	kWeightGeometryFilt = 13
+	kSet = 14
+	kAnimCurve = 15
+	kComponent = 16
+	kSingleIndexedComponent = 17
+	kDoubleIndexedComponent = 18
+	kTripleIndexedComponent = 19
+	kMeshVertComponent = 20
+	kMeshEdgeComponent = 21
+	kMeshPolygonComponent = 22
+	kCurveCVComponent = 23
+	kMeshData = 24
+
+NODE_FN = {	'transform':[MFn.kBase,MFn.kDependencyNode,MFn.kDagNode,MFn.kTransform],
+			'joint':[MFn.kBase,MFn.kDependencyNode,MFn.kDagNode,MFn.kTransform,MFn.kJoint],
+			'mesh':[MFn.kBase,MFn.kDependencyNode,MFn.kDagNode,MFn.kShape,MFn.kMesh],
+			'nurbsCurve':[MFn.kBase,MFn.kDependencyNode,MFn.kDagNode,MFn.kShape,MFn.kNurbsCurve],
+			'skinCluster':[MFn.kBase,MFn.kDependencyNode,MFn.kGeometryFilt,MFn.kSkinClusterFilter],
+			'objectSet':[MFn.kBase,MFn.kDependencyNode,MFn.kSet],
+			'animCurveTL':[MFn.kBase,MFn.kDependencyNode,MFn.kAnimCurve],
+			'animCurveTA':[MFn.kBase,MFn.kDependencyNode,MFn.kAnimCurve],
+			'animCurveTU':[MFn.kBase,MFn.kDependencyNode,MFn.kAnimCurve]	}
+
+COMPONENT_FN = {	'vtx':MFn.kMeshVertComponent,
+					'e':MFn.kMeshEdgeComponent,
+					'f':MFn.kMeshPolygonComponent,
+					'cv':MFn.kCurveCVComponent	}
+
+class MSpace(object):
+	kInvalid = 0
+	kTransform = 1
+	kPreTransform = 2
+	kPostTransform = 3
+	kWorld = 4
+	kObject = kPreTransform
+
+class MObject(object):
+	'''
+	Stub MObject. Wraps a scene node, a component (type and element index list) or mesh data.
+	'''
+	def __init__(self,other=None):
+		self._node = None
+		self._comp = None
+		self._mesh = None
+		if other: self._assign(other)
+
+	def _assign(self,other):
+		self._node = other._node
+		self._comp = other._comp
+		self._mesh = other._mesh
+
+	def isNull(self):
+		return self._node == None and self._comp == None and self._mesh == None
+
+	def apiType(self):
+		if self._comp: return self._comp[0]
+		if self._mesh: return MFn.kMeshData
+		if self._node: return NODE_FN[self._node.nodeType][-1]
+		return MFn.kInvalid
+
+	def apiTypeStr(self):
+		apiType = self.apiType()
+		for name,value in MFn.__dict__.items():
+			if value == apiType: return name
+		return 'kInvalid'
+
+	def hasFn(self,fnType):
+		if self._comp:
+			if fnType in [MFn.kBase,MFn.kComponent,MFn.kSingleIndexedComponent]: return True
+			return fnType == self._comp[0]
+		if self._mesh: return fnType in [MFn.kBase,MFn.kMeshData]
+		if self._node: return fnType in NODE_FN[self._node.nodeType]
+		return False
+
+	def __eq__(self,other):
+		return isinstance(other,MObject) and self._node is other._node and self._comp == other._comp and self._mesh is other._mesh
+
+	def __ne__(self,other):
+		return not self.__eq__(other)
+
+MObject.kNullObj = MObject()
+
+def _nodeObject(node):
+	obj = MObject()
+	obj._node = node
+	return obj
+
+def _componentObject(fnType,indexList):
+	obj = MObject()
+	obj._comp = (fnType,list(indexList))
+	return obj
+
+class _MArray(list):
+	'''
+	Base class for the stub Maya array types.
+	'''
+	_itemType = float
+	def __init__(self,*args):
+		list.__init__(self)
+		if not args: return
+		if len(args) == 1 and isinstance(args[0],(list,tuple)): self.extend([self._cast(v) for v in args[0]])
+		elif len(args) == 1 and isinstance(args[0],(int,long)): self.extend([self._cast(0)]*args[0])
+		elif len(args) == 2 and isinstance(args[0],(int,long)): self.extend([self._cast(args[1]) for i in xrange(args[0])])
+		else: raise StubUnsupported(self.__class__.__name__+' constructor arguments are not supported by the glTools benchmark stub!')
+	def _cast(self,value):
+		return self._itemType(value)
+	def length(self):
+		return len(self)
+	def append(self,value):
+		list.append(self,self._cast(value))
+	def set(self,value,index):
+		self[index] = self._cast(value)
+	def setLength(self,length):
+		if length < len(self): del self[length:]
+		else: self.extend([self._cast(0)]*(length-len(self)))
+	def clear(self):
+		del self[:]
+	def remove(self,index):
+		del self[index]
+	def copy(self,source):
+		self[:] = list(source)
+
+class MIntArray(_MArray): _itemType = int
+class MDoubleArray(_MArray): _itemType = float
+class MFloatArray(_MArray): _itemType = float
+
+class MPoint(object):
+	'''
+	Stub MPoint (and MFloatPoint).
+	'''
+	def __init__(self,x=0.0,y=0.0,z=0.0,w=1.0):
+		if hasattr(x,"x"): x,y,z = x.x,x.y,x.z
+		self.x = float(x)
+		self.y = float(y)
+		self.z = float(z)
+		self.w = float(w)
+	def __getitem__(self,i):
+		return (self.x,self.y,self.z,self.w)[i]
+	def distanceTo(self,other):
+		return math.sqrt((self.x-other.x)**2+(self.y-other.y)**2+(self.z-other.z)**2)
+	def __sub__(self,other):
+		return MVector(self.x-other.x,self.y-other.y,self.z-other.z)
+	def __add__(self,other):
+		return self.__class__(self.x+other.x,self.y+other.y,self.z+other.z)
+	def set(self,x,y,z,w=1.0):
+		self.x,self.y,self.z,self.w = float(x),float(y),float(z),float(w)
+
+MPoint.origin = MPoint()
+
+class MFloatPoint(MPoint): pass
+MFloatPoint.origin = MFloatPoint()
+
+class MVector(object):
+	'''
+	Stub MVector (and MFloatVector).
+	'''
+	def __init__(self,x=0.0,y=0.0,z=0.0):
+		if isinstance(x,(MPoint,MVector)): x,y,z = x.x,x.y,x.z
+		self.x = float(x)
+		self.y = float(y)
+		self.z = float(z)
+	def __getitem__(self,i):
+		return (self.x,self.y,self.z)[i]
+	def length(self):
+		return math.sqrt(self.x*self.x+self.y*self.y+self.z*self.z)
+	def normal(self):
+		length = self.length() or 1.0
+		return self.__class__(self.x/length,self.y/length,self.z/length)
+	def __add__(self,other):
+		return self.__class__(self.x+other.x,self.y+other.y,self.z+other.z)
+	def __sub__(self,other):
+		return self.__class__(self.x-other.x,self.y-other.y,self.z-other.z)
+	def __mul__(self,other):
+		if isinstance(other,MVector): return self.x*other.x+self.y*other.y+self.z*other.z
+		return self.__class__(self.x*other,self.y*other,self.z*other)
+	def __xor__(self,other):
+		return self.__class__(self.y*other.z-self.z*other.y,self.z*other.x-self.x*other.z,self.x*other.y-self.y*other.x)
+
+class MFloatVector(MVector): pass
+
+class _MPointArrayBase(_MArray):
+	_itemType = MPoint
+	def _cast(self,value):
+		if isinstance(value,(int,long,float)): return self._itemType()
+		return self._itemType(value.x,value.y,value.z,getattr(value,'w',1.0))
+	def set(self,*args):
+		# set(index,x,y,z,w) or set(point,index)
+		if len(args) >= 4: self[args[0]] = self._itemType(*args[1:])
+		else: self[args[1]] = self._cast(args[0])
+
+class MPointArray(_MPointArrayBase): _itemType = MPoint
+class MFloatPointArray(_MPointArrayBase): _itemType = MFloatPoint
+
+class MVectorArray(_MArray):
+	_itemType = MVector
+	def _cast(self,value):
+		if isinstance(value,(int,long,float)): return self._itemType()
+		return self._itemType(value.x,value.y,value.z)
+
+class MFloatVectorArray(MVectorArray): _itemType = MFloatVector
+
+class MObjectArray(_MArray):
+	def _cast(self,value):
+		return MObject(value)
+
+class MDagPath(object):
+	'''
+	Stub MDagPath.
+	'''
+	def __init__(self,other=None):
+		self._node = None
+		if other: self._node = other._node
+	def _assign(self,node):
+		self._node = node
+	def isValid(self):
+		return self._node != None
+	def node(self):
+		return _nodeObject(self._node)
+	def transform(self):
+		node = self._node
+		while node and not 'transform' in NODE_TYPES[node.nodeType]: node = node.parent
+		return _nodeObject(node)
+	def apiType(self):
+		return NODE_FN[self._node.nodeType][-1]
+	def hasFn(self,fnType):
+		return fnType in NODE_FN[self._node.nodeType]
+	def fullPathName(self):
+		return self._node.longName()
+	def partialPathName(self):
+		return self._node.name
+	def length(self):
+		return len(self._node.longName().split('|'))-1
+	def numberOfShapesDirectlyBelow(self,ptr):
+		ptr[0] = len([c for c in self._node.children if 'shape' in NODE_TYPES[c.nodeType]])
+	def extendToShape(self):
+		self._node = _shapeNode(self._node)
+	def extendToShapeDirectlyBelow(self,index):
+		self._node = [c for c in self._node.children if 'shape' in NODE_TYPES[c.nodeType]][index]
+	def inclusiveMatrix(self):
+		return MMatrix(translate=self._node.worldOffset())
+	def __eq__(self,other):
+		return isinstance(other,MDagPath) and self._node is other._node
+	def __ne__(self,other):
+		return not self.__eq__(other)
+
+class MDagPathArray(_MArray):
+	def _cast(self,value):
+		return MDagPath(value)
+
+class MMatrix(object):
+	'''
+	Stub MMatrix (translation only).
+	'''
+	def __init__(self,translate=(0.0,0.0,0.0)):
+		self._translate = list(translate)
+	def __call__(self,row,column):
+		if row == 3 and column < 3: return self._translate[column]
+		return float(row == column)
+
+class MSelectionList(object):
+	'''
+	Stub MSelectionList. Items are stored as (node,componentObject) pairs.
+	Components of the same shape are merged into a single item, as in Maya.
+	'''
+	def __init__(self,other=None):
+		self._items = []
+		if other: self._items = list(other._items)
+	def clear(self):
+		self._items = []
+	def length(self):
+		return len(self._items)
+	def isEmpty(self):
+		return not self._items
+	def add(self,item,component=None,mergeWithExisting=True):
+		if isinstance(item,MDagPath):
+			if component and not component.isNull(): self._addComponent(item._node,component._comp[0],component._comp[1])
+			else: self._items.append((item._node,None))
+			return
+		if isinstance(item,MObject):
+			self._items.append((item._node,None))
+			return
+		comp = _parseComponent(item)
+		if comp:
+			self._addComponent(comp[0],COMPONENT_FN[comp[1]],comp[2])
+			return
+		node = scene.find(item)
+		if not node:
+			if '*' in str(item):
+				for name in ls(item): self.add(name)
+				return
+			raise RuntimeError('(kInvalidParameter): Object does not exist: '+str(item))
+		self._items.append((node,None))
+	def _addComponent(self,node,fnType,indexList):
+		for i in range(len(self._items)):
+			itemNode,itemComp = self._items[i]
+			if itemNode is node and itemComp and itemComp._comp[0] == fnType:
+				existing = set(itemComp._comp[1])
+				merged = itemComp._comp[1] + [ind for ind in indexList if not ind in existing]
+				self._items[i] = (node,_componentObject(fnType,merged))
+				return
+		self._items.append((node,_componentObject(fnType,indexList)))
+	def getDependNode(self,index,obj):
+		obj._assign(_nodeObject(self._items[index][0]))
+	def getDagPath(self,index,path,component=None):
+		node,comp = self._items[index]
+		if not node.isDag(): raise RuntimeError('(kInvalidParameter): Object is not a DAG node: '+node.name)
+		path._assign(node)
+		if component != None:
+			if comp: component._assign(comp)
+			else: component._assign(MObject())
+	def getSelectionStrings(self,stringList,*args):
+		for node,comp in self._items:
+			if not comp: stringList.append(node.name)
+			else:
+				compType = [k for k,v in COMPONENT_FN.items() if v == comp._comp[0]][0]
+				stringList.extend(_componentStrings(node.name,compType,comp._comp[1]))
+
+class MGlobal(object):
+	'''
+	Stub MGlobal.
+	'''
+	kInteractive = 0
+	kBatch = 1
+	kLibraryApp = 2
+	@staticmethod
+	def getSelectionListByName(name,selectionList):
+		selectionList.add(name)
+	@staticmethod
+	def mayaState():
+		return MGlobal.kBatch
+	@staticmethod
+	def displayWarning(msg):
+		print('# Warning: '+str(msg))
+	@staticmethod
+	def displayError(msg):
+		print('# Error: '+str(msg))
+
+class _Ptr(list):
+	'''
+	Pointer stand in (single value or array) returned by MScriptUtil.
+	'''
+	pass
+
+class MScriptUtil(object):
+	'''
+	Stub MScriptUtil. Pointers are represented by (mutable) python lists.
+	'''
+	def __init__(self,value=None):
+		self._ptr = None
+		if isinstance(value,_Ptr): self._ptr = value
+		elif isinstance(value,(list,tuple)): self._ptr = _Ptr(value)
+		elif value != None: self._ptr = _Ptr([value])
+	def _pointer(self,default):
+		if self._ptr == None: self._ptr = _Ptr([default])
+		return self._ptr
+	def createFromInt(self,*values):
+		self._ptr = _Ptr(values)
+	def createFromDouble(self,*values):
+		self._ptr = _Ptr([float(v) for v in values])
+	def createFromList(self,values,length=None):
+		self._ptr = _Ptr(values)
+	def asIntPtr(self): return self._pointer(0)
+	def asUintPtr(self): return self._pointer(0)
+	def asShortPtr(self): return self._pointer(0)
+	def asFloatPtr(self): return self._pointer(0.0)
+	def asDoublePtr(self): return self._pointer(0.0)
+	def asInt(self): return int(self._pointer(0)[0])
+	def asUint(self): return int(self._pointer(0)[0])
+	def asFloat(self): return float(self._pointer(0.0)[0])
+	def asDouble(self): return float(self._pointer(0.0)[0])
+	@staticmethod
+	def getInt(ptr): return int(ptr[0])
+	@staticmethod
+	def getUint(ptr): return int(ptr[0])
+	@staticmethod
+	def getFloat(ptr): return float(ptr[0])
+	@staticmethod
+	def getDouble(ptr): return float(ptr[0])
+	@staticmethod
+	def getFloatArrayItem(ptr,index): return ptr[index]
+	@staticmethod
+	def getDoubleArrayItem(ptr,index): return ptr[index]
+	@staticmethod
+	def getIntArrayItem(ptr,index): return ptr[index]
+	@staticmethod
+	def setInt(ptr,value): ptr[0] = int(value)
+	@staticmethod
+	def setDouble(ptr,value): ptr[0] = float(value)
+	@staticmethod
+	def createIntArrayFromList(values,array):
+		array[:] = [int(v) for v in values]
+	@staticmethod
+	def createFloatArrayFromList(values,array):
+		array[:] = [float(v) for v in values]
+	@staticmethod
+	def createMatrixFromList(values,matrix):
+		matrix._translate = list(values[12:15])
+
+class MFnBase(object):
+	def __init__(self,obj=None):
+		self._node = None
+		if obj != None: self.setObject(obj)
+	def setObject(self,obj):
+		if isinstance(obj,MDagPath): self._node = obj._node
+		else: self._node = obj._node
+	def object(self):
+		return _nodeObject(self._node)
+
+class MFnDependencyNode(MFnBase):
+	def name(self):
+		return self._node.name
+	def typeName(self):
+		return self._node.nodeType
+	def hasAttribute(self,attr):
+		return attr in self._node.attrs
+
+class MFnDagNode(MFnDependencyNode):
+	def parent(self,index=0):
+		return _nodeObject(self._node.parent)
+	def parentCount(self):
+		return int(self._node.parent != None)
+	def child(self,index):
+		return _nodeObject(self._node.children[index])
+	def childCount(self):
+		return len(self._node.children)
+	def fullPathName(self):
+		return self._node.longName()
+	def partialPathName(self):
+		return self._node.name
+	def getPath(self,path):
+		path._assign(self._node)
+
+class MFnSet(MFnDependencyNode):
+	'''
+	Stub MFnSet (deformer sets).
+	'''
+	def getMembers(self,selectionList,flatten=True):
+		for shapeName in sorted(self._node.members):
+			selectionList._items.append((scene.get(shapeName),_componentObject(MFn.kMeshVertComponent,self._node.members[shapeName])))
+	def removeMember(self,path,component):
+		removed = set(component._comp[1])
+		members = self._node.members.get(path._node.name,[])
+		self._node.members[path._node.name] = [i for i in members if not i in removed]
+	def addMember(self,path,component):
+		members = self._node.members.setdefault(path._node.name,[])
+		self._node.members[path._node.name] = sorted(set(members + component._comp[1]))
+
+class MFnSingleIndexedComponent(object):
+	'''
+	Stub MFnSingleIndexedComponent.
+	'''
+	def __init__(self,obj=None):
+		self._obj = obj
+	def create(self,fnType):
+		self._obj = _componentObject(fnType,[])
+		return self._obj
+	def addElements(self,indexList):
+		self._obj._comp = (self._obj._comp[0],self._obj._comp[1]+[int(i) for i in indexList])
+	def addElement(self,index):
+		self._obj._comp = (self._obj._comp[0],self._obj._comp[1]+[int(index)])
+	def getElements(self,indexArray):
+		indexArray[:] = list(self._obj._comp[1])
+	def elementCount(self):
+		return len(self._obj._comp[1])
+	def element(self,index):
+		return self._obj._comp[1][index]
+	def setCompleteData(self,count):
+		self._obj._comp = (self._obj._comp[0],range(count))
+
+class MFnMeshData(object):
+	'''
+	Stub MFnMeshData.
+	'''
+	def create(self):
+		obj = MObject()
+		obj._mesh = {}
+		return obj
+
+class MFnMesh(MFnDagNode):
+	'''
+	Stub MFnMesh.
+	'''
+	def setObject(self,obj):
+		if isinstance(obj,MObject) and obj._mesh != None: self._node = obj._mesh.get('mesh')
+		else: MFnDagNode.setObject(self,obj)
+	def numVertices(self):
+		return len(self._node.points)
+	def numPolygons(self):
+		return len(self._node.faceCounts)
+	def numEdges(self):
+		return len(self._node.topology()['edges'])
+	def _offset(self,space):
+		if space == MSpace.kWorld: return self._node.worldOffset()
+		return (0.0,0.0,0.0)
+	def getPoints(self,pointArray,space=MSpace.kObject):
+		offset = self._offset(space)
+		pointArray[:] = [MPoint(p[0]+offset[0],p[1]+offset[1],p[2]+offset[2]) for p in self._node.points]
+	def getPoint(self,index,point,space=MSpace.kObject):
+		offset = self._offset(space)
+		p = self._node.points[index]
+		point.set(p[0]+offset[0],p[1]+offset[1],p[2]+offset[2])
+	def getRawPoints(self):
+		ptr = _Ptr()
+		for p in self._node.points: ptr.extend(p)
+		return ptr
+	def getVertices(self,polygonCounts,polygonConnects):
+		polygonCounts[:] = list(self._node.faceCounts)
+		polygonConnects[:] = list(self._node.faceConnects)
+	def getVertexNormals(self,angleWeighted,normalArray,space=MSpace.kObject):
+		normalArray[:] = [MFloatVector(*n) for n in self._node.normals()]
+	def getAssignedUVs(self,uvCounts,uvIds,uvSet=None):
+		uvCounts[:] = list(self._node.faceCounts)
+		uvIds[:] = list(self._node.uvIds)
+	def getUVs(self,uArray,vArray,uvSet=None):
+		uArray[:] = list(self._node.uArray)
+		vArray[:] = list(self._node.vArray)
+	def getPolygonTriangleVertices(self,faceId,triangleId,vertexList):
+		verts = self._node.faceVertices()[faceId]
+		vertexList[0:3] = [verts[0],verts[triangleId+1],verts[triangleId+2]]
+	def create(self,numVertices,numPolygons,vertexArray,polygonCounts,polygonConnects,*args):
+		parent = args and args[-1] or None
+		mesh = StubMesh('polySurfaceShape',None,[(p.x,p.y,p.z) for p in vertexArray],polygonCounts,polygonConnects)
+		self._node = mesh
+		if isinstance(parent,MObject) and parent._mesh != None:
+			parent._mesh['mesh'] = mesh
+			return parent
+		obj = MObject()
+		obj._mesh = {'mesh':mesh}
+		return obj
+
+class MItMeshPolygon(object):
+	'''
+	Stub MItMeshPolygon.
+	'''
+	def __init__(self,path,component=None):
+		self._mesh = path._node
+		self._faces = range(len(self._mesh.faceCounts))
+		if component and not component.isNull(): self._faces = list(component._comp[1])
+		self._index = 0
+	def reset(self):
+		self._index = 0
+	def isDone(self):
+		return self._index >= len(self._faces)
+	def next(self):
+		self._index += 1
+	def index(self):
+		return self._faces[self._index]
+	def count(self):
+		return len(self._faces)
+	def setIndex(self,index,prevIndexPtr):
+		prevIndexPtr[0] = self.index()
+		self._index = self._faces.index(index)
+	def polygonVertexCount(self):
+		return self._mesh.faceCounts[self.index()]
+	def getVertices(self,vertexArray):
+		vertexArray[:] = list(self._mesh.faceVertices()[self.index()])
+	def getUVs(self,uArray,vArray,uvSet=None):
+		verts = self._mesh.faceVertices()[self.index()]
+		uArray[:] = [self._mesh.uArray[v] for v in verts]
+		vArray[:] = [self._mesh.vArray[v] for v in verts]
+
+class MItMeshVertex(object):
+	'''
+	Stub MItMeshVertex.
+	'''
+	def __init__(self,path,component=None):
+		self._mesh = path._node
+		self._verts = range(len(self._mesh.points))
+		if component and not component.isNull(): self._verts = list(component._comp[1])
+		self._index = 0
+	def reset(self):
+		self._index = 0
+	def isDone(self):
+		return self._index >= len(self._verts)
+	def next(self):
+		self._index += 1
+	def index(self):
+		return self._verts[self._index]
+	def count(self):
+		return len(self._verts)
+	def setIndex(self,index,prevIndexPtr):
+		prevIndexPtr[0] = self.index()
+		self._index = self._verts.index(index)
+	def position(self,space=MSpace.kObject):
+		p = self._mesh.points[self.index()]
+		offset = (space == MSpace.kWorld) and self._mesh.worldOffset() or (0.0,0.0,0.0)
+		return MPoint(p[0]+offset[0],p[1]+offset[1],p[2]+offset[2])
+	def getConnectedVertices(self,vertexArray):
+		topo = self._mesh.topology()
+		index = self.index()
+		vertexArray[:] = [e[0] == index and e[1] or e[0] for e in [topo['edges'][i] for i in topo['vtxEdges'][index]]]
+	def getConnectedFaces(self,faceArray):
+		faceArray[:] = list(self._mesh.topology()['vtxFaces'][self.index()])
+
+class MPointOnMesh(object):
+	'''
+	Stub MPointOnMesh.
+	'''
+	def __init__(self):
+		self._point = MPoint()
+		self._normal = MVector()
+		self._faceIndex = -1
+		self._triangleIndex = -1
+		self._bary = (0.0,0.0)
+	def getPoint(self):
+		return MFloatPoint(self._point)
+	def getNormal(self):
+		return MFloatVector(self._normal)
+	def faceIndex(self):
+		return self._faceIndex
+	def triangleIndex(self):
+		return self._triangleIndex
+	def getBarycentricCoords(self,uPtr,vPtr):
+		uPtr[0] = self._bary[0]
+		vPtr[0] = self._bary[1]
+
+class MMeshIntersector(object):
+	'''
+	Stub MMeshIntersector. Closest point queries use a uniform grid of mesh triangles.
+	'''
+	def __init__(self):
+		self._triangles = []
+		self._grid = {}
+		self._cellSize = 1.0
+	def create(self,meshObj,matrix=None):
+		mesh = meshObj._mesh and meshObj._mesh['mesh'] or meshObj._node
+		pts = mesh.points
+		self._triangles = []
+		for f,verts in enumerate(mesh.faceVertices()):
+			for t in range(len(verts)-2):
+				self._triangles.append((f,t,pts[verts[0]],pts[verts[t+1]],pts[verts[t+2]]))
+
+		# Build Grid
+		bbMin = [min([p[c] for p in pts]) for c in range(3)]
+		bbMax = [max([p[c] for p in pts]) for c in range(3)]
+		extent = max([bbMax[c]-bbMin[c] for c in range(3)]) or 1.0
+		self._cellSize = extent / max(int(math.sqrt(len(self._triangles))),1)
+		self._grid = {}
+		for i,tri in enumerate(self._triangles):
+			lo = [int(math.floor(min(tri[2][c],tri[3][c],tri[4][c])/self._cellSize)) for c in range(3)]
+			hi = [int(math.floor(max(tri[2][c],tri[3][c],tri[4][c])/self._cellSize)) for c in range(3)]
+			for x in range(lo[0],hi[0]+1):
+				for y in range(lo[1],hi[1]+1):
+					for z in range(lo[2],hi[2]+1):
+						self._grid.setdefault((x,y,z),[]).append(i)
+	def getClosestPoint(self,point,pointOnMesh,maxDistance=1e30):
+		cell = [int(math.floor(point[c]/self._cellSize)) for c in range(3)]
+		best = None
+		ring = 0
+		visited = set([])
+		while True:
+			for x in range(cell[0]-ring,cell[0]+ring+1):
+				for y in range(cell[1]-ring,cell[1]+ring+1):
+					for z in range(cell[2]-ring,cell[2]+ring+1):
+						for i in self._grid.get((x,y,z),[]):
+							if i in visited: continue
+							visited.add(i)
+							result = _closestPointOnTriangle((point[0],point[1],point[2]),*self._triangles[i][2:])
+							if best == None or result[0] < best[0]: best = result + (i,)
+			if best != None and math.sqrt(best[0]) <= ring*self._cellSize: break
+			if len(visited) == len(self._triangles): break
+			ring += 1
+
+		dist,pt,u,v,i = best
+		pointOnMesh._point = MPoint(*pt)
+		pointOnMesh._faceIndex = self._triangles[i][0]
+		pointOnMesh._triangleIndex = self._triangles[i][1]
+		pointOnMesh._bary = (u,v)
+
+def _closestPointOnTriangle(p,a,b,c):
+	'''
+	Return (squared distance,closest point,u,v) for the closest point on triangle abc, where u and v are
+	the barycentric weights of vertices a and b.
+	'''
+	ab = [b[i]-a[i] for i in range(3)]
+	ac = [c[i]-a[i] for i in range(3)]
+	ap = [p[i]-a[i] for i in range(3)]
+	d1 = sum([ab[i]*ap[i] for i in range(3)])
+	d2 = sum([ac[i]*ap[i] for i in range(3)])
+	if d1 <= 0.0 and d2 <= 0.0: w = (1.0,0.0,0.0)
+	else:
+		bp = [p[i]-b[i] for i in range(3)]
+		d3 = sum([ab[i]*bp[i] for i in range(3)])
+		d4 = sum([ac[i]*bp[i] for i in range(3)])
+		cp = [p[i]-c[i] for i in range(3)]
+		d5 = sum([ab[i]*cp[i] for i in range(3)])
+		d6 = sum([ac[i]*cp[i] for i in range(3)])
+		vc = d1*d4 - d3*d2
+		vb = d5*d2 - d1*d6
+		va = d3*d6 - d5*d4
+		if d3 >= 0.0 and d4 <= d3: w = (0.0,1.0,0.0)
+		elif d6 >= 0.0 and d5 <= d6: w = (0.0,0.0,1.0)
+		elif vc <= 0.0 and d1 >= 0.0 and d3 <= 0.0:
+			t = d1/(d1-d3)
+			w = (1.0-t,t,0.0)
+		elif vb <= 0.0 and d2 >= 0.0 and d6 <= 0.0:
+			t = d2/(d2-d6)
+			w = (1.0-t,0.0,t)
+		elif va <= 0.0 and (d4-d3) >= 0.0 and (d5-d6) >= 0.0:
+			t = (d4-d3)/((d4-d3)+(d5-d6))
+			w = (0.0,1.0-t,t)
+		else:
+			denom = 1.0/(va+vb+vc)
+			w = (va*denom,vb*denom,vc*denom)
+	pt = [a[i]*w[0]+b[i]*w[1]+c[i]*w[2] for i in range(3)]
+	dist = sum([(pt[i]-p[i])**2 for i in range(3)])
+	return (dist,pt,w[0],w[1])
+
+# =====================
+# - OpenMayaAnim API -
+# =====================
+
+class MFnGeometryFilter(MFnDependencyNode):
+	'''
+	Stub MFnGeometryFilter.
+	'''
+	def deformerSet(self):
+		return _nodeObject(self._node.deformerSet)
+	def getOutputGeometry(self,objectArray):
+		objectArray[:] = [_nodeObject(self._node.geometry)]
+	def getInputGeometry(self,objectArray):
+		objectArray[:] = [_nodeObject(self._node.geometry)]
+	def indexForOutputShape(self,shapeObj):
+		if shapeObj._node is not self._node.geometry:
+			raise RuntimeError('(kInvalidParameter): Object is not affected by deformer '+self._node.name)
+		return 0
+	def inputShapeAtIndex(self,index):
+		return _nodeObject(self._node.geometry)
+	def outputShapeAtIndex(self,index):
+		return _nodeObject(self._node.geometry)
+
+class MFnSkinCluster(MFnGeometryFilter):
+	'''
+	Stub MFnSkinCluster. Weights are read from and written to the dense stub weight table.
+	'''
+	def influenceObjects(self,pathArray):
+		pathArray[:] = []
+		for inf in self._node.influences:
+			path = MDagPath()
+			path._assign(inf)
+			pathArray.append(path)
+		return len(self._node.influences)
+	def indexForInfluenceObject(self,path):
+		return self._node.influences.index(path._node)
+	def _indices(self,component):
+		if component == None or component.isNull(): return range(len(self._node.geometry.points))
+		return component._comp[1]
+	def getWeights(self,path,component,*args):
+		skin = self._node
+		infCount = len(skin.influences)
+		indices = self._indices(component)
+		weights = skin.weights
+		if isinstance(args[0],_MArray) and not isinstance(args[0],MIntArray):
+			# getWeights(path,component,weights,infCountPtr)
+			result = args[0]
+			result[:] = []
+			for i in indices: result.extend(weights[i*infCount:(i+1)*infCount])
+			args[1][0] = infCount
+			return
+		if isinstance(args[0],(int,long)):
+			# getWeights(path,component,influenceIndex,weights)
+			args[1][:] = [weights[i*infCount+args[0]] for i in indices]
+			return
+		# getWeights(path,component,influenceIndices,weights)
+		infList = list(args[0])
+		result = args[1]
+		result[:] = []
+		for i in indices: result.extend([weights[i*infCount+inf] for inf in infList])
+	def setWeights(self,path,component,influenceIndices,values,normalize=True,oldValues=None):
+		skin = self._node
+		infCount = len(skin.influences)
+		indices = self._indices(component)
+		if isinstance(influenceIndices,(int,long)): influenceIndices = [influenceIndices]
+		infList = list(influenceIndices)
+		if oldValues != None:
+			oldValues[:] = []
+			for i in indices: oldValues.extend([skin.weights[i*infCount+inf] for inf in infList])
+		singleValue = len(values) == 1
+		n = 0
+		for i in indices:
+			for inf in infList:
+				skin.weights[i*infCount+inf] = float(values[0] if singleValue else values[n])
+				n += 1
+
+class MFnWeightGeometryFilter(MFnGeometryFilter):
+	def getWeights(self,*args):
+		raise StubUnsupported('MFnWeightGeometryFilter.getWeights is not supported by the glTools benchmark stub!')
+
+# ===================
+# - OpenMayaMPx API -
+# ===================
+
+class MPxCommand(object):
+	'''
+	Stub MPxCommand. Commands can be defined, but not registered.
+	'''
+	def __init__(self):
+		pass
+
+# ===========
+# - Install -
+# ===========
+
+def _module(name,members,moduleType=types.ModuleType):
+	module = moduleType(name)
+	for key,value in members.items(): setattr(module,key,value)
+	return module
+
+def install(force=False):
+	'''
+	Install the stub maya modules (maya, maya.cmds, maya.mel, maya.OpenMaya, maya.OpenMayaAnim, maya.OpenMayaUI, maya.OpenMayaMPx, maya.utils) into sys.modules.
+	If a real maya module is importable, the stub is not installed unless force is True.
+	Returns True if the stub is installed.
+	@param force: Install the stub even if a real maya module is available
+	@type force: bool
+	'''
+	# Check Existing Maya
+	if not force:
+		existing = sys.modules.get('maya')
+		if existing and not getattr(existing,'GLTOOLS_STUB',False): return False
+		if not existing:
+			try:
+				import maya.cmds
+				return False
+			except ImportError:
+				pass
+
+	this = sys.modules[__name__]
+
+	# Commands
+	cmdNames = [	'objExists','objectType','nodeType','listRelatives','ls','select','xform','pointPosition',
+					'polyEvaluate','filterExpand','polyListComponentConversion','skinCluster','listHistory',
+					'listConnections','connectAttr','getAttr','setAttr','setKeyframe','keyframe','keyTangent',
+					'setInfinity','filterCurve','currentTime','polyUVSet','timerX','undoInfo','refresh',
+					'progressBar','file','about'	]
+	cmds = _module('maya.cmds',dict([(n,getattr(this,n)) for n in cmdNames]),_CommandModule)
+	mel = _module('maya.mel',{'eval':melEval},_CommandModule)
+
+	# API
+	apiNames = [	'MFn','MSpace','MObject','MIntArray','MDoubleArray','MFloatArray','MPoint','MFloatPoint',
+					'MVector','MFloatVector','MPointArray','MFloatPointArray','MVectorArray','MFloatVectorArray',
+					'MObjectArray','MDagPath','MDagPathArray','MMatrix','MSelectionList','MGlobal','MScriptUtil',
+					'MFnDependencyNode','MFnDagNode','MFnSet','MFnSingleIndexedComponent','MFnMeshData','MFnMesh',
+					'MItMeshPolygon','MItMeshVertex','MPointOnMesh','MMeshIntersector'	]
+	openMaya = _module('maya.OpenMaya',dict([(n,getattr(this,n)) for n in apiNames]),_CommandModule)
+	animNames = ['MFnGeometryFilter','MFnSkinCluster','MFnWeightGeometryFilter']
+	openMayaAnim = _module('maya.OpenMayaAnim',dict([(n,getattr(this,n)) for n in animNames]),_CommandModule)
+	openMayaUI = _module('maya.OpenMayaUI',{},_CommandModule)
+	openMayaMPx = _module('maya.OpenMayaMPx',{'MPxCommand':MPxCommand},_CommandModule)
+	utils = _module('maya.utils',{},_CommandModule)
+
+	maya = _module('maya',{'cmds':cmds,'mel':mel,'OpenMaya':openMaya,'OpenMayaAnim':openMayaAnim,'OpenMayaUI':openMayaUI,'OpenMayaMPx':openMayaMPx,'utils':utils,'GLTOOLS_STUB':True})
+	maya.__path__ = []
+	sys.modules['maya'] = maya
+	sys.modules['maya.cmds'] = cmds
+	sys.modules['maya.mel'] = mel
+	sys.modules['maya.OpenMaya'] = openMaya
+	sys.modules['maya.OpenMayaAnim'] = openMayaAnim
+	sys.modules['maya.OpenMayaUI'] = openMayaUI
+	sys.modules['maya.OpenMayaMPx'] = openMayaMPx
+	sys.modules['maya.utils'] = utils
+
+	return True
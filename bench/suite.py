@@ -0,0 +1,317 @@
+'''
+glTools benchmark scenarios.
+Each scenario builds a synthetic stub scene for the requested scale, then times one or more glTools operations.
+Results are recorded per scale and scenario (best/mean/max seconds over the requested repeats) and can be written to JSON.
+Absolute timings include the overhead of the maya stub, and should only be compared against other runs of this suite.
+'''
+
+import glTools.bench.mayaStub as mayaStub
+mayaStub.install()
+
+import os
+import sys
+import time
+import json
+import random
+import shutil
+import platform
+import tempfile
+import traceback
+import optparse
+
+# =============
+# - Constants -
+# =============
+
+# Scale Settings
+#	divisions	: Mesh plane divisions (vertex count = (divisions+1)^2)
+#	joints		: Skin influence count
+#	points		: kdTree point count
+#	queries		: kdTree query count
+#	frames		: meshCache frame count
+#	channels	: animLib animated channel count
+#	keys		: animLib keys per channel
+SCALES = {	'small':{'divisions':10,'joints':4,'points':1000,'queries':200,'frames':2,'channels':12,'keys':24},
+			'medium':{'divisions':30,'joints':8,'points':10000,'queries':1000,'frames':4,'channels':60,'keys':48},
+			'large':{'divisions':60,'joints':16,'points':50000,'queries':5000,'frames':8,'channels':240,'keys':96}	}
+
+DEFAULT_SCALES = ['small','medium']
+
+# ===========
+# - Helpers -
+# ===========
+
+class Scenario(object):
+	'''
+	Benchmark scenario.
+	@param name: Scenario name
+	@type name: str
+	@param setup: Setup function. Called with the scale settings and working directory, returns a context object passed to run.
+	@type setup: function
+	@param run: Timed function. Called with the context object returned by setup.
+	@type run: function
+	'''
+	def __init__(self,name,setup,run):
+		self.name = name
+		self.setup = setup
+		self.run = run
+
+def buildSkinScene(settings,name='bench'):
+	'''
+	Build a stub scene with a skinned mesh plane.
+	Returns a dictionary containing the mesh, joint and skinCluster names.
+	@param settings: Scale settings
+	@type settings: dict
+	@param name: Name prefix
+	@type name: str
+	'''
+	mayaStub.reset()
+	mesh = mayaStub.createPlaneMesh(name+'_mesh',divisions=settings['divisions'])
+	jointList = mayaStub.createJointChain(name+'_',count=settings['joints'])
+	skin = mayaStub.createSkinCluster(name+'_skinCluster',mesh,jointList)
+	return {'mesh':mesh,'shape':mesh+'Shape','joints':jointList,'skinCluster':skin}
+
+def writeAnimFile(filePath,nodeList,channels,keys):
+	'''
+	Write a synthetic .anim file with the specified number of animated channels and keys.
+	Every third channel is written as a static channel.
+	@param filePath: Anim file path
+	@type filePath: str
+	@param nodeList: Source node list (without namespace)
+	@type nodeList: list
+	@param channels: Number of channels to write
+	@type channels: int
+	@param keys: Number of keys per animated channel
+	@type keys: int
+	'''
+	attrList = ['translateX','translateY','translateZ','rotateX','rotateY','rotateZ']
+	f = open(filePath,'w')
+	for i in range(channels):
+		node = nodeList[(i/len(attrList))%len(nodeList)]
+		attr = attrList[i%len(attrList)]
+		if not i%3:
+			f.write('static '+attr+' '+attr+' src:'+node+' 0 '+str(float(i))+'\n')
+			continue
+		f.write('anim '+attr+' '+attr+' src:'+node+' 0 0 0;\n')
+		f.write('animData {\n')
+		f.write('  weighted 0;\n')
+		f.write('  preInfinity constant;\n')
+		f.write('  postInfinity constant;\n')
+		f.write('  keys {\n')
+		for k in range(keys):
+			f.write('    '+str(k+1)+' '+str(round(random.uniform(-10.0,10.0),4))+' auto auto 1 0 0;\n')
+		f.write('  }\n')
+		f.write('}\n')
+	f.close()
+	return filePath
+
+# =============
+# - Scenarios -
+# =============
+
+def _skinSetup(settings,workDir):
+	return buildSkinScene(settings)
+
+def _skinBuild(ctx):
+	import glTools.data.skinClusterData
+	return glTools.data.skinClusterData.SkinClusterData(ctx['skinCluster'])
+
+def _skinSaveLoadSetup(settings,workDir):
+	import glTools.data.skinClusterData
+	ctx = buildSkinScene(settings)
+	ctx['data'] = glTools.data.skinClusterData.SkinClusterData(ctx['skinCluster'])
+	ctx['file'] = os.path.join(workDir,'skinCluster.pkl')
+	return ctx
+
+def _skinSave(ctx):
+	ctx['data'].save(ctx['file'],force=True)
+
+def _skinLoad(ctx):
+	if not os.path.isfile(ctx['file']): ctx['data'].save(ctx['file'],force=True)
+	return ctx['data'].load(ctx['file'])
+
+def _skinWorldSpace(ctx):
+	ctx['data'].rebuildWorldSpaceData()
+
+def _symSetup(settings,workDir):
+	return buildSkinScene(settings)
+
+def _symBuild(ctx):
+	import glTools.tools.symmetryTable
+	return glTools.tools.symmetryTable.SymmetryTable().buildSymTable(ctx['mesh'])
+
+def _smoothSetup(settings,workDir):
+	ctx = buildSkinScene(settings)
+	count = (settings['divisions']+1)**2
+	ctx['vtxList'] = [ctx['shape']+'.vtx[0:'+str(count-1)+']']
+	return ctx
+
+def _smoothRun(ctx):
+	import glTools.tools.smoothWeights
+	glTools.tools.smoothWeights.smoothWeights(ctx['vtxList'])
+
+def _kdTreeSetup(settings,workDir):
+	rand = random.Random(1)
+	pts = [(rand.uniform(-10,10),rand.uniform(-10,10),rand.uniform(-10,10)) for i in xrange(settings['points'])]
+	queries = [(rand.uniform(-10,10),rand.uniform(-10,10),rand.uniform(-10,10)) for i in xrange(settings['queries'])]
+	return {'points':pts,'queries':queries}
+
+def _kdTreeBuild(ctx):
+	import glTools.utils.kdTree
+	ctx['tree'] = glTools.utils.kdTree.KdTree(ctx['points'])
+
+def _kdTreeQuerySetup(settings,workDir):
+	import glTools.utils.kdTree
+	ctx = _kdTreeSetup(settings,workDir)
+	ctx['tree'] = glTools.utils.kdTree.KdTree(ctx['points'])
+	return ctx
+
+def _kdTreeQuery(ctx):
+	for pt in ctx['queries']: ctx['tree'].getClosest(pt)
+
+def _meshCacheSetup(settings,workDir):
+	ctx = buildSkinScene(settings)
+	ctx['path'] = os.path.join(workDir,'meshCache')
+	ctx['frames'] = settings['frames']
+	return ctx
+
+def _meshCacheWrite(ctx):
+	import glTools.tools.meshCache
+	glTools.tools.meshCache.writeGeoCache(ctx['path'],'bench',ctx['mesh'],1,ctx['frames'])
+
+def _animLibSetup(settings,workDir):
+	mayaStub.reset()
+	nodeList = ['node'+str(i) for i in range(max(settings['channels']/6,1))]
+	for node in nodeList: mayaStub.createTransform('tgt:'+node)
+	random.seed(1)
+	animFile = writeAnimFile(os.path.join(workDir,'bench.anim'),nodeList,settings['channels'],settings['keys'])
+	return {'file':animFile}
+
+def _animLibLoad(ctx):
+	import glTools.tools.animLib
+	glTools.tools.animLib.loadAnim(ctx['file'],'tgt')
+
+SCENARIOS = [	Scenario('skinClusterData.build',_skinSetup,_skinBuild),
+				Scenario('skinClusterData.save',_skinSaveLoadSetup,_skinSave),
+				Scenario('skinClusterData.load',_skinSaveLoadSetup,_skinLoad),
+				Scenario('skinClusterData.rebuildWorldSpaceData',_skinSaveLoadSetup,_skinWorldSpace),
+				Scenario('symmetryTable.buildSymTable',_symSetup,_symBuild),
+				Scenario('smoothWeights.smoothWeights',_smoothSetup,_smoothRun),
+				Scenario('kdTree.build',_kdTreeSetup,_kdTreeBuild),
+				Scenario('kdTree.getClosest',_kdTreeQuerySetup,_kdTreeQuery),
+				Scenario('meshCache.writeGeoCache',_meshCacheSetup,_meshCacheWrite),
+				Scenario('animLib.loadAnim',_animLibSetup,_animLibLoad)	]
+
+# ==========
+# - Runner -
+# ==========
+
+def runScenario(scenario,settings,repeat=3,workDir=''):
+	'''
+	Run a single benchmark scenario.
+	Setup is run (untimed) before each timed run. Scenario errors are recorded in the result instead of being raised.
+	@param scenario: Scenario to run
+	@type scenario: Scenario
+	@param settings: Scale settings
+	@type settings: dict
+	@param repeat: Number of timed runs
+	@type repeat: int
+	@param workDir: Working directory for scenario files
+	@type workDir: str
+	'''
+	timings = []
+	result = {'scenario':scenario.name}
+	stdout = sys.stdout
+	try:
+		for i in range(repeat):
+			# Suppress scenario output (print messages)
+			sys.stdout = open(os.devnull,'w')
+			try:
+				ctx = scenario.setup(settings,workDir)
+				start = time.time()
+				scenario.run(ctx)
+				timings.append(time.time()-start)
+			finally:
+				sys.stdout.close()
+				sys.stdout = stdout
+	except Exception, e:
+		result['error'] = str(e)
+		result['traceback'] = traceback.format_exc()
+
+	if timings:
+		result['best'] = min(timings)
+		result['mean'] = sum(timings)/len(timings)
+		result['max'] = max(timings)
+		result['runs'] = timings
+	return result
+
+def run(scales=DEFAULT_SCALES,scenarios=[],repeat=3,verbose=True):
+	'''
+	Run the benchmark suite.
+	Returns the results as a dictionary.
+	@param scales: List of scales to run. Valid scales are "small", "medium" and "large".
+	@type scales: list
+	@param scenarios: List of scenario names (or name prefixes) to run. If empty, run all scenarios.
+	@type scenarios: list
+	@param repeat: Number of timed runs per scenario
+	@type repeat: int
+	@param verbose: Print results as they are generated
+	@type verbose: bool
+	'''
+	# Check Scales
+	for scale in scales:
+		if not SCALES.has_key(scale): raise Exception('Invalid benchmark scale "'+scale+'"!')
+
+	# Get Scenarios
+	scenarioList = SCENARIOS
+	if scenarios: scenarioList = [s for s in SCENARIOS if [n for n in scenarios if s.name.startswith(n)]]
+	if not scenarioList: raise Exception('No benchmark scenarios match '+str(scenarios)+'!')
+
+	results = {	'time':time.strftime('%Y-%m-%d %H:%M:%S'),
+				'python':platform.python_version(),
+				'platform':platform.platform(),
+				'repeat':repeat,
+				'scales':{}	}
+
+	workDir = tempfile.mkdtemp(prefix='glToolsBench_')
+	try:
+		for scale in scales:
+			settings = SCALES[scale]
+			results['scales'][scale] = {'settings':settings,'results':[]}
+			for scenario in scenarioList:
+				result = runScenario(scenario,settings,repeat,workDir)
+				results['scales'][scale]['results'].append(result)
+				if verbose:
+					if result.has_key('error'): print('%-8s %-44s ERROR: %s' % (scale,scenario.name,result['error']))
+					else: print('%-8s %-44s %10.4fs' % (scale,scenario.name,result['best']))
+	finally:
+		shutil.rmtree(workDir,ignore_errors=True)
+
+	return results
+
+def main(argv=None):
+	'''
+	Command line entry point.
+	'''
+	parser = optparse.OptionParser(usage='%prog [options]')
+	parser.add_option('-s','--scale',action='append',dest='scales',help='Scale to run (small, medium, large). May be specified more than once.')
+	parser.add_option('-k','--scenario',action='append',dest='scenarios',default=[],help='Scenario name (or prefix) to run. May be specified more than once.')
+	parser.add_option('-r','--repeat',type='int',default=3,help='Number of timed runs per scenario.')
+	parser.add_option('-o','--output',default='',help='JSON output file path.')
+	options,args = parser.parse_args(argv)
+
+	results = run(options.scales or DEFAULT_SCALES,options.scenarios,options.repeat)
+
+	if options.output:
+		f = open(options.output,'w')
+		json.dump(results,f,indent=2,sort_keys=True)
+		f.close()
+		print('Saved benchmark results: "'+options.output+'"')
+
+	# Return non zero if any scenario failed
+	for scale in results['scales'].values():
+		if [r for r in scale['results'] if r.has_key('error')]: return 1
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
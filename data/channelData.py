@@ -1,5 +1,7 @@
 import maya.cmds as mc
 
+import glTools.utils.profiler
+
 import data
 
 class ChannelData( data.Data ):
@@ -51,7 +53,7 @@ class ChannelData( data.Data ):
 		# ==============
 		
 		# Start timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('ChannelData.buildData')
 		
 		# Reset Data --- ?
 		self.reset()
@@ -152,7 +154,7 @@ class ChannelData( data.Data ):
 				self._channelData[node][chan]['destination'] = dstChanList[i+1]
 		
 		# Print timer result
-		buildTime = mc.timerX(st=timer)
+		buildTime = timer.stop()
 		print('ChannelData: Data build time for nodes "'+str(nodeList)+'": '+str(buildTime))
 		
 		# =================
@@ -186,7 +188,7 @@ class ChannelData( data.Data ):
 		# ========================
 		
 		# Start Timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('ChannelData.rebuild')
 		
 		# Get Node List
 		if not nodeList: nodeList = self._data['channelDataNodes']
@@ -333,7 +335,7 @@ class ChannelData( data.Data ):
 									if self.verbosity > 0: print('ChannelData: Relocked channel "'+dst+'"')
 		
 		# Print timer result
-		buildTime = mc.timerX(st=timer)
+		buildTime = timer.stop()
 		print('ChannelData: Rebuild time "'+str(nodeList)+'": '+str(buildTime))
 			
 		# =================
@@ -5,7 +5,7 @@ import maya.OpenMayaAnim as OpenMayaAnim
 import glTools.utils.arrayUtils
 import glTools.utils.deformer
 import glTools.utils.mesh
-import glTools.utils.progressBar
+import glTools.utils.profiler
 
 import data
 import meshData
@@ -67,7 +67,7 @@ class DeformerData( data.Data ):
 		# ==============
 		
 		# Start timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('DeformerData.buildData',deformer=deformer)
 		
 		# Reset Data Object - (Maintain Incoming Attribute Lists)
 		attrValueList = copy.deepcopy(self._data['attrValueList'])
@@ -106,7 +106,7 @@ class DeformerData( data.Data ):
 		self.getDeformerAttrConnections()
 		
 		# Get Timer Val
-		buildTime = mc.timerX(st=timer)
+		buildTime = timer.stop()
 		print('DeformerData: Data build time for "'+deformer+'": '+str(buildTime))
 		
 		# =================
@@ -138,7 +138,7 @@ class DeformerData( data.Data ):
 		# ====================
 		
 		# Start timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('DeformerData.rebuild')
 		
 		deformer = self._data['name']
 		if not mc.objExists(self._data['name']):
@@ -161,7 +161,7 @@ class DeformerData( data.Data ):
 		# =================
 		
 		# Print Timed Result
-		totalTime = mc.timerX(st=timer)
+		totalTime = timer.stop()
 		print(self.__class__.__name__+': Rebuild time for deformer "'+deformer+'": '+str(totalTime))
 		
 		return deformer
@@ -428,10 +428,7 @@ class DeformerData( data.Data ):
 		@type method: str
 		'''
 		# Start timer
-		timer = mc.timerX()
-		
-		# Display Progress
-		glTools.utils.progressBar.init(status=('Rebuilding world space deformer data...'),maxValue=100)
+		timer = glTools.utils.profiler.start('DeformerData.rebuildWorldSpaceData',method=method)
 		
 		# ==========
 		# - Checks -
@@ -502,8 +499,8 @@ class DeformerData( data.Data ):
 		uPtr = uUtil.asFloatPtr()
 		vPtr = vUtil.asFloatPtr()
 		
-		# Get Progress Step
-		progressInd = int(numTargetVerts*0.01)
+		# Display Progress
+		progress = glTools.utils.profiler.Progress(status=('Rebuilding world space deformer data...'),maxValue=numTargetVerts)
 		
 		for i in range(numTargetVerts):
 			
@@ -546,7 +543,10 @@ class DeformerData( data.Data ):
 				new_membership.append(i)
 				
 			# Update Progress Bar
-			if not i % progressInd: glTools.utils.progressBar.update(step=1)
+			progress.update()
+		
+		# End Progress
+		progress.end()
 		
 		# ========================
 		# - Update Deformer Data -
@@ -559,11 +559,8 @@ class DeformerData( data.Data ):
 		# - Return Result -
 		# =================
 		
-		# End Progress
-		glTools.utils.progressBar.end()	
-		
 		# Print Timed Result
-		buildTime = mc.timerX(st=timer)
+		buildTime = timer.stop()
 		print('DeformerData: Rebuild world space data for deformer "'+self._data['name']+'": '+str(buildTime))
 		
 		# Return Weights
@@ -4,6 +4,7 @@ import maya.OpenMaya as OpenMaya
 
 import data
 import glTools.utils.mesh
+import glTools.utils.profiler
 import glTools.utils.progressBar
 
 class MeshData( data.Data ):
@@ -54,7 +55,7 @@ class MeshData( data.Data ):
 		# ==============
 		
 		# Start timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('MeshData.buildData')
 		
 		# Get basic mesh info
 		self._data['name'] = mesh
@@ -94,7 +95,7 @@ class MeshData( data.Data ):
 		self._data['vArray'] = list(vArray)
 
 		# Print timer result
-		buildTime = mc.timerX(st=timer)
+		buildTime = timer.stop()
 		print('MeshData: Data build time for mesh "'+mesh+'": '+str(buildTime))
 		
 		# =================
@@ -107,7 +108,7 @@ class MeshData( data.Data ):
 		'''
 		'''
 		# Start timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('MeshData.rebuild')
 
 		# Rebuild Mesh Data
 		meshUtil = OpenMaya.MScriptUtil()
@@ -150,7 +151,7 @@ class MeshData( data.Data ):
 		meshObjHandle = OpenMaya.MObjectHandle(meshObj)
 
 		# Print Timed Result
-		buildTime = mc.timerX(st=timer)
+		buildTime = timer.stop()
 		print('MeshIntersectData: Data rebuild time for mesh "'+self._data['name']+'": '+str(buildTime))
 
 		# =================
@@ -163,7 +164,7 @@ class MeshData( data.Data ):
 		'''
 		'''
 		# Start timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('MeshData.rebuildMesh')
 
 		# Rebuild Mesh Data
 		meshData = OpenMaya.MObject()
@@ -211,7 +212,7 @@ class MeshData( data.Data ):
 		mc.sets(meshShape,fe='initialShadingGroup')
 
 		# Print timer result
-		buildTime = mc.timerX(st=timer)
+		buildTime = timer.stop()
 		print('MeshIntersectData: Geometry rebuild time for mesh "'+mesh+'": '+str(buildTime))
 
 		# =================
@@ -3,6 +3,8 @@ import maya.OpenMaya as OpenMaya
 import maya.OpenMayaAnim as OpenMayaAnim
 
 import glTools.utils.deformer
+import glTools.utils.profiler
+import glTools.utils.queryCache
 import glTools.utils.skinCluster
 
 import data
@@ -59,7 +61,7 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		# =======================
 		
 		# Start Timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('SkinClusterData.buildData',skinCluster=skinCluster)
 		
 		self._data['name'] = skinCluster
 		self._data['type'] = 'skinCluster'
@@ -135,7 +137,7 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		# - Return Result -
 		# =================
 		
-		skinTime = mc.timerX(st=timer)
+		skinTime = timer.stop()
 		print('SkinClusterData: Data build time for "'+skinCluster+'": '+str(skinTime))
 
 	def rebuild(self):
@@ -156,7 +158,7 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		# =======================
 		
 		# Start timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('SkinClusterData.rebuild')
 		
 		# Initialize Temp Joint
 		tempJnt = ''
@@ -247,7 +249,7 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		# =================
 		
 		# Print Timed Result
-		totalTime = mc.timerX(st=timer)
+		totalTime = timer.stop()
 		print('SkinClusterData: Rebuild time for skinCluster "'+skinCluster+'": '+str(totalTime))
 		
 		return skinCluster
@@ -307,6 +309,7 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		
 		# Set skinCluster weights
 		skinFn.setWeights(componentSel[0],componentSel[1],infIndexArray,wtArray,False,oldWtArray)
+		glTools.utils.queryCache.invalidate()
 		
 		# =================
 		# - Return Result -
@@ -345,8 +348,9 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		
 		# Check Influence List
 		if not influenceList: influenceList = self._influenceData.keys() or []
+		skinInfluenceList = mc.skinCluster(skinCluster,q=True,inf=True) or []
 		for influence in influenceList:
-			if not influence in mc.skinCluster(skinCluster,q=True,inf=True) or []:
+			if not influence in skinInfluenceList:
 				raise Exception('Object "'+influence+'" is not a valid influence of skinCluster "'+skinCluster+'"! Unable to load influence weights...')
 			if not self._influenceData.has_key(influence):
 				raise Exception('No influence data stored for "'+influence+'"! Unable to load influence weights...')
@@ -369,10 +373,10 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		# =====================================
 		
 		# Get Influence Index
+		infIndexMap = glTools.utils.skinCluster.getInfluencePhysicalIndexMap(skinCluster)
 		infIndexArray = OpenMaya.MIntArray()
 		for influence in influenceList:
-			infIndex = glTools.utils.skinCluster.getInfluencePhysicalIndex(skinCluster,influence)
-			infIndexArray.append(infIndex)
+			infIndexArray.append(infIndexMap[influence])
 		
 		# Build Weight Array
 		wtArray = OpenMaya.MDoubleArray()
@@ -389,6 +393,7 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		
 		# Set skinCluster weights
 		skinFn.setWeights(componentSel[0],componentSel[1],infIndexArray,wtArray,normalize,oldWtArray)
+		glTools.utils.queryCache.invalidate()
 		
 		# =================
 		# - Return Result -
@@ -610,10 +615,7 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		@type method: str
 		'''
 		# Start timer
-		timer = mc.timerX()
-		
-		# Display Progress
-		glTools.utils.progressBar.init(status=('Rebuilding world space skinCluster data...'),maxValue=100)
+		timer = glTools.utils.profiler.start('SkinClusterData.rebuildWorldSpaceData',method=method)
 		
 		# ==========
 		# - Checks -
@@ -627,20 +629,16 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		
 		# Check Deformer Data
 		if not self._data.has_key(sourceGeo):
-			glTools.utils.progressBar.end()
 			raise Exception('No deformer data stored for geometry "'+sourceGeo+'"!')
 		
 		# Check Geometry
 		if not mc.objExists(targetGeo):
-			glTools.utils.progressBar.end()
 			raise Exception('Geometry "'+targetGeo+'" does not exist!')
 		if not glTools.utils.mesh.isMesh(targetGeo):
-			glTools.utils.progressBar.end()
 			raise Exception('Geometry "'+targetGeo+'" is not a valid mesh!')
 		
 		# Check Mesh Data
 		if not self._data[sourceGeo].has_key('mesh'):
-			glTools.utils.progressBar.end()
 			raise Exception('No world space mesh data stored for mesh geometry "'+sourceGeo+'"!')
 		
 		# =====================
@@ -692,9 +690,8 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		uPtr = uUtil.asFloatPtr()
 		vPtr = vUtil.asFloatPtr()
 		
-		# Get Progress Step
-		progressInd = int(numTargetVerts*0.01)
-		if progressInd < 1: progressInd = 1 
+		# Display Progress
+		progress = glTools.utils.profiler.Progress(status=('Rebuilding world space skinCluster data...'),maxValue=numTargetVerts)
 		
 		for i in range(numTargetVerts):
 			
@@ -741,7 +738,10 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 					membership.add(i)
 			
 			# Update Progress Bar
-			if not i % progressInd: glTools.utils.progressBar.update(step=1)
+			progress.update()
+		
+		# End Progress
+		progress.end()
 		
 		# ========================
 		# - Update Deformer Data -
@@ -767,11 +767,8 @@ class SkinClusterData( deformerData.MultiInfluenceDeformerData ):
 		# - Return Result -
 		# =================
 		
-		# End Progress
-		glTools.utils.progressBar.end()	
-		
 		# Print Timed Result
-		buildTime = mc.timerX(st=timer)
+		buildTime = timer.stop()
 		print('SkinClusterData: Rebuild world space data for skinCluster "'+self._data['name']+'": '+str(buildTime))
 		
 		# Return Weights
@@ -864,7 +861,7 @@ class SkinClusterListData( data.Data ):
 		@type skinClusterList: dict
 		'''
 		# Start timer
-		timer = mc.timerX()
+		timer = glTools.utils.profiler.start('SkinClusterListData.rebuild')
 		
 		# For Each SkinCluster
 		for skinCluster in skinClusterList:
@@ -877,5 +874,5 @@ class SkinClusterListData( data.Data ):
 			self._data[skinCluster].rebuild()
 		
 		# Print timed result
-		totalTime = mc.timerX(st=timer)
-		print('SkinClusterListData: Total build time for skinCluster list: '+str(skinTime))
+		totalTime = timer.stop()
+		print('SkinClusterListData: Total build time for skinCluster list: '+str(totalTime))
@@ -5,6 +5,7 @@ import glTools.rig.utils
 
 import glTools.utils.attribute
 import glTools.utils.base
+import glTools.utils.bulkCreate
 import glTools.utils.curve
 import glTools.utils.joint
 import glTools.utils.lib
@@ -682,28 +683,19 @@ def createVertexLocators(vtxList,locScale=0.1,prefix=''):
 	# Get mesh from vertex selection
 	mesh = mc.ls(vtxList[0],o=True)[0]
 	
-	# Initialize locator list
-	locList = []
+	# Get vertex positions and locator names
+	ptList = [mc.pointPosition(vtx) for vtx in vtxList]
+	nameList = [prefix+'_'+glTools.utils.stringUtils.stringIndex(v+1)+'_loc' for v in range(len(vtxList))]
 	
-	# For each vertex
-	for v in range(len(vtxList)):
-		
-		# Determine string index
-		strInd = glTools.utils.stringUtils.stringIndex(v+1)
-		
-		# Get Vtx Position
-		pt = mc.pointPosition(vtxList[v])
-		# Create Locator
-		loc = mc.spaceLocator(n=prefix+'_'+strInd+'_loc')[0]
-		mc.setAttr(loc+'.localScale',locScale,locScale,locScale)
-		# Position Locator
-		mc.move(pt[0],pt[1],pt[2],loc,ws=True)
+	mc.undoInfo(openChunk=True)
+	try:
+		# Create Locators
+		locList = glTools.utils.bulkCreate.createLocators(nameList,positionList=ptList,localScale=locScale)
 		
 		# Record Vertex ID
-		glTools.utils.mesh.closestVertexAttr(loc,mesh)
-		
-		# Append Return List
-		locList.append(loc)
+		for loc in locList: glTools.utils.mesh.closestVertexAttr(loc,mesh)
+	finally:
+		mc.undoInfo(closeChunk=True)
 	
 	# =================
 	# - Return Result -
@@ -1,7 +1,124 @@
 import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
+import maya.OpenMayaAnim as OpenMayaAnim
 
+import glTools.utils.apiUndo
+import glTools.utils.arrayUtils
+import glTools.utils.base
+import glTools.utils.matrix
 import glTools.utils.namespace
 
+import math
+
+# =================
+# - Mirror Tables -
+# =================
+
+# Mirror tables are defined as data. Each control entry is [name,flipAttrs] or [name,flipAttrs,mode].
+# - name: Control name (without namespace). The "SIDE" token is replaced with the table left/right
+#   tokens to find mirror pairs. Names without the "SIDE" token are centre controls (mirrored onto themselves).
+#   A trailing "#" expands to the name followed by an optional index (name, name1, name2 ...).
+# - flipAttrs: Channels to negate after the left/right animation has been swapped.
+# - mode: "local" (default) swaps and flips the animation curves. "world" rebuilds the animation by mirroring
+#   world space matrices, for controls whose orientations are not symmetric.
+
+BIPED_ANIM_MIRROR_TABLE = {
+	'left'		: 'lf',
+	'right'		: 'rt',
+	'controls'	: [	
+		# Body
+		['cn_bodyA_jnt',['tx','ry','rz']],
+		['cn_bodyB_jnt',['tx','ry','rz']],
+		# Spine/Neck/Head
+		['cn_spineA_jnt',['tz','rx','ry']],
+		['cn_spineB_jnt',['tz','rx','ry']],
+		['cn_spineC_jnt',['tz','rx','ry']],
+		['cn_spine_base_ctrl',['tz','rx','ry']],
+		['cn_spine_mid_ctrl',['tz','rx','ry']],
+		['cn_spine_top_ctrl',['tz','rx','ry']],
+		['cn_neckA_jnt',['tz','rx','ry']],
+		['cn_headA_jnt',['tz','rx','ry']],
+		# Arms - FK
+		['SIDE_clavicleA_jnt',['tx','ty','tz']],
+		['SIDE_arm_fkA_jnt',['tx','ty','tz']],
+		['SIDE_arm_fkB_jnt',['tx','ty','tz']],
+		['SIDE_handA_jnt',['tx','ty','tz']],
+		# Arms - IK
+		['SIDE_arm_ik_ctrl',['tx','ry','rz']],
+		['SIDE_arm_pv_ctrl',['tx','ry','rz']],
+		# Fingers
+		['SIDE_thumbA_jnt',['tx','ty','tz']],
+		['SIDE_thumbB_jnt',['tx','ty','tz']],
+		['SIDE_thumbC_jnt',['tx','ty','tz']],
+		['SIDE_indexA_jnt',['tx','ty','tz']],
+		['SIDE_indexB_jnt',['tx','ty','tz']],
+		['SIDE_indexC_jnt',['tx','ty','tz']],
+		['SIDE_indexD_jnt',['tx','ty','tz']],
+		['SIDE_middleA_jnt',['tx','ty','tz']],
+		['SIDE_middleB_jnt',['tx','ty','tz']],
+		['SIDE_middleC_jnt',['tx','ty','tz']],
+		['SIDE_middleD_jnt',['tx','ty','tz']],
+		['SIDE_ringA_jnt',['tx','ty','tz']],
+		['SIDE_ringB_jnt',['tx','ty','tz']],
+		['SIDE_ringC_jnt',['tx','ty','tz']],
+		['SIDE_ringD_jnt',['tx','ty','tz']],
+		['SIDE_pinkyA_jnt',['tx','ty','tz']],
+		['SIDE_pinkyB_jnt',['tx','ty','tz']],
+		['SIDE_pinkyC_jnt',['tx','ty','tz']],
+		['SIDE_pinkyD_jnt',['tx','ty','tz']],
+		# Legs - FK
+		['SIDE_leg_fkA_jnt',['tx','ty','tz']],
+		['SIDE_leg_fkB_jnt',['tx','ty','tz']],
+		['SIDE_foot_fkA_jnt',['tx','ty','tz']],
+		['SIDE_foot_fkB_jnt',['tx','ty','tz']],
+		# Legs - IK
+		['SIDE_leg_ik_ctrl',['tx','ry','rz']],
+		['SIDE_leg_pv_ctrl',['tx','ry','rz']],
+		# Feet - IK
+		['SIDE_foot_ik_ctrl',['tx','ry','rz']],
+		['SIDE_foot_toe_ctrl',['tx','ry','rz']]	]	}
+
+BIPED_MOCAP_MIRROR_TABLE = {
+	'left'		: 'Left',
+	'right'		: 'Right',
+	'controls'	: [	
+		# Body
+		['Hips',['tx','ry','rz']],
+		# Spine/Neck/Head
+		['Spine#',['rx','ry']],
+		['Neck#',['rx','ry']],
+		['Head#',['rx','ry']],
+		# Shoulder
+		['SIDEShoulder',['tz']],
+		# Arms
+		['SIDEArm',['tx','ty','tz']],
+		['SIDEArmRoll',['tx','ty','tz']],
+		['SIDEForeArm',['tx','ty','tz']],
+		['SIDEForeArmRoll',['tx','ty','tz']],
+		['SIDEHand',['tx','ty','tz']],
+		['SIDEHandRoll',['tx','ty','tz']],
+		# Fingers
+		['SIDEHandThumb#',['tx','ty','tz']],
+		['SIDEHandIndex#',['tx','ty','tz']],
+		['SIDEHandMiddle#',['tx','ty','tz']],
+		['SIDEHandRing#',['tx','ty','tz']],
+		['SIDEHandPinky#',['tx','ty','tz']],
+		# Legs
+		['SIDEUpLeg',['tx','ty','tz']],
+		['SIDEUpLegRoll',['tx','ty','tz']],
+		['SIDELeg',['tx','ty','tz']],
+		['SIDELegRoll',['tx','ty','tz']],
+		['SIDEFoot',['tx','ty','tz']],
+		['SIDEFootRoll',['tx','ty','tz']],
+		['SIDEToeBase',['tx','ty','tz']],
+		['SIDEToeBaseRoll',['tx','ty','tz']]	]	}
+
+# Transform channel long to short name map
+CHANNEL_SHORT_NAME = {	'translateX':'tx','translateY':'ty','translateZ':'tz',
+						'rotateX':'rx','rotateY':'ry','rotateZ':'rz',
+						'scaleX':'sx','scaleY':'sy','scaleZ':'sz',
+						'visibility':'v'	}
+
 def cutPasteKey(src,dst):
 	'''
 	'''
@@ -24,170 +141,354 @@ def swapAnim(srcCtrl,dstCtrl):
 		try: mc.delete(tmpCtrl)
 		except: print('Error deleting temp control object "'+tmpCtrl+'"!')
 
-def mirrorBipedAnim(rigNS):
+# =================
+# - Mirror Engine -
+# =================
+
+def getMirrorPairs(rigNS,mirrorTable):
 	'''
-	Mirror biped body animation
+	Build the list of mirror pairs for the specified rig namespace from a mirror table.
+	Returns a list of [source,destination,flipAttrs,mode] items. Centre controls are returned with source == destination.
+	Only controls that exist in the scene are returned.
 	@param rigNS: Rig namespace.
 	@type rigNS: str
+	@param mirrorTable: Mirror table dictionary (see BIPED_ANIM_MIRROR_TABLE)
+	@type mirrorTable: dict
 	'''
-	# =============
-	# - Check Rig -
-	# =============
-	
-	if not mc.namespace(ex=rigNS):
-		raise Exception('Rig namespace "'+rigNS+'" not found! Unable to mirror animation...')
+	# Get Existing Nodes (single query)
+	prefix = ''
+	if rigNS: prefix = rigNS+':'
+	existing = set(mc.ls(prefix+'*') or [])
 	
-	# ====================
-	# - Get Rig Controls -
-	# ====================
+	left = mirrorTable['left']
+	right = mirrorTable['right']
 	
-	# Body
-	bodyA = rigNS+':cn_bodyA_jnt'
-	bodyB = rigNS+':cn_bodyB_jnt'
-	
-	# Spine/Neck/Head
-	spineA = rigNS+':cn_spineA_jnt'
-	spineB = rigNS+':cn_spineB_jnt'
-	spineC = rigNS+':cn_spineC_jnt'
-	
-	spineBase = rigNS+':cn_spine_base_ctrl'
-	spineMid = rigNS+':cn_spine_mid_ctrl'
-	spineTop = rigNS+':cn_spine_top_ctrl'
-	
-	neck = rigNS+':cn_neckA_jnt'
-	head = rigNS+':cn_headA_jnt'
-	
-	# Arms
-	clav = rigNS+':SIDE_clavicleA_jnt'
-	armFkA = rigNS+':SIDE_arm_fkA_jnt'
-	armFkB = rigNS+':SIDE_arm_fkB_jnt'
-	armIk = rigNS+':SIDE_arm_ik_ctrl'
-	armPv = rigNS+':SIDE_arm_pv_ctrl'
-	hand = rigNS+':SIDE_handA_jnt'
-	
-	# Fingers
-	fingerList = [	'thumbA','thumbB','thumbC',
-					'indexA','indexB','indexC','indexD',
-					'middleA','middleB','middleC','middleD',
-					'ringA','ringB','ringC','ringD',
-					'pinkyA','pinkyB','pinkyC','pinkyD'	]
-	fingers = [rigNS+':SIDE_'+finger+'_jnt' for finger in fingerList]
-	
-	# Legs
-	legFkA = rigNS+':SIDE_leg_fkA_jnt'
-	legFkB = rigNS+':SIDE_leg_fkB_jnt'
-	legIk = rigNS+':SIDE_leg_ik_ctrl'
-	legPv = rigNS+':SIDE_leg_pv_ctrl'
-	
-	# Feet
-	footIk = rigNS+':SIDE_foot_ik_ctrl'
-	toeIk = rigNS+':SIDE_foot_toe_ctrl'
-	footFkA = rigNS+':foot_fkA_jnt'
-	footFkB = rigNS+':foot_fkB_jnt'
+	pairList = []
+	for entry in mirrorTable['controls']:
+		
+		name = entry[0]
+		flipAttrs = [CHANNEL_SHORT_NAME.get(attr,attr) for attr in entry[1]]
+		mode = 'local'
+		if len(entry) > 2: mode = entry[2]
+		
+		# Expand Indexed Names
+		nameList = [name]
+		if name.endswith('#'):
+			name = name[:-1]
+			nameList = [name]
+			ind = 1
+			while (prefix+name+str(ind)).replace('SIDE',left) in existing or (prefix+name+str(ind)).replace('SIDE',right) in existing:
+				nameList.append(name+str(ind))
+				ind += 1
+		
+		# Build Pairs
+		for name in nameList:
+			src = (prefix+name).replace('SIDE',left)
+			dst = (prefix+name).replace('SIDE',right)
+			if not src in existing or not dst in existing: continue
+			pairList.append([src,dst,flipAttrs,mode])
+	
+	# Return Result
+	return pairList
+
+def getAnimCurveMap(nodeList):
+	'''
+	Return a dictionary of animCurves connected to the specified nodes, keyed by (node,attr).
+	All connections are queried with a single listConnections call.
+	@param nodeList: List of nodes to get animCurves for
+	@type nodeList: list
+	'''
+	curveMap = {}
+	if not nodeList: return curveMap
+	
+	# Get AnimCurve Connections (Returned as [nodePlug,curvePlug] pairs)
+	connList = mc.listConnections(nodeList,s=True,d=False,type='animCurve',connections=True,plugs=True) or []
+	for i in range(0,len(connList),2):
+		node,attr = connList[i].split('.',1)
+		node = node.split('|')[-1]
+		attr = CHANNEL_SHORT_NAME.get(attr,attr)
+		curveMap[(node,attr)] = connList[i+1].split('.')[0]
+	
+	# Return Result
+	return curveMap
+
+def mirrorAnimLocal(pairList):
+	'''
+	Mirror animation for a list of mirror pairs by swapping animCurve connections between the left and right controls,
+	then negating the flip channels of all mirrored curves with a single scaleKey call.
+	@param pairList: List of [source,destination,flipAttrs] mirror pairs (see getMirrorPairs())
+	@type pairList: list
+	'''
+	if not pairList: return []
 	
-	# ====================
-	# - Mirror Animation -
-	# ====================
+	# Get AnimCurves
+	nodeList = []
+	for pair in pairList: nodeList.extend([pair[0],pair[1]])
+	curveMap = getAnimCurveMap(list(set(nodeList)))
 	
-	# Body
-	for ctrl in [bodyA,bodyB]:
-		if mc.objExists(ctrl):
-			mc.scaleKey(ctrl,at=['tx','ry','rz'],valueScale=-1.0,valuePivot=0.0)
+	# ===================
+	# - Swap Left/Right -
+	# ===================
 	
-	# Spine/Neck/Head
-	for ctrl in [spineA,spineB,spineC,spineBase,spineMid,spineTop,neck,head]:
-		if mc.objExists(ctrl):
-			mc.scaleKey(ctrl,at=['tz','rx','ry'],valueScale=-1.0,valuePivot=0.0)
+	# Animated Attributes per Node
+	nodeAttrs = {}
+	for node,attr in curveMap.keys(): nodeAttrs.setdefault(node,set()).add(attr)
 	
-	# Arms - FK (Clavicle,Arm,Hand)
-	for ctrl in [clav,armFkA,armFkB,hand]:
+	newCurveMap = dict(curveMap)
+	for pair in pairList:
+		src,dst = pair[0],pair[1]
+		if src == dst: continue
 		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE','lf')
-		rtCtrl = ctrl.replace('SIDE','rt')
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
+		srcNode = src.split('|')[-1]
+		dstNode = dst.split('|')[-1]
+		attrList = nodeAttrs.get(srcNode,set()).union(nodeAttrs.get(dstNode,set()))
+		for attr in attrList:
+			srcCurve = curveMap.get((srcNode,attr))
+			dstCurve = curveMap.get((dstNode,attr))
 			
-			# Swap Left <> Right
-			swapAnim(lfCtrl,rtCtrl)
-			
-			# Scale Keys
-			mc.scaleKey(lfCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-	
-	# Arms - IK
-	for ctrl in [armIk,armPv]:
-		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE','lf')
-		rtCtrl = ctrl.replace('SIDE','rt')
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
+			# Disconnect
+			if srcCurve: mc.disconnectAttr(srcCurve+'.output',src+'.'+attr)
+			if dstCurve: mc.disconnectAttr(dstCurve+'.output',dst+'.'+attr)
 			
-			# Swap Left <> Right
-			swapAnim(lfCtrl,rtCtrl)
+			# Reconnect Swapped
+			if srcCurve: mc.connectAttr(srcCurve+'.output',dst+'.'+attr,f=True)
+			if dstCurve: mc.connectAttr(dstCurve+'.output',src+'.'+attr,f=True)
 			
-			# Scale Keys
-			mc.scaleKey(lfCtrl,at=['tx','ry','rz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ry','rz'],valueScale=-1.0,valuePivot=0.0)
-	
-	# Fingers
-	for ctrl in fingers:
+			# Update Curve Map
+			newCurveMap.pop((srcNode,attr),None)
+			newCurveMap.pop((dstNode,attr),None)
+			if srcCurve: newCurveMap[(dstNode,attr)] = srcCurve
+			if dstCurve: newCurveMap[(srcNode,attr)] = dstCurve
+	
+	# ===================
+	# - Flip Curve Sign -
+	# ===================
+	
+	flipCurveList = []
+	for pair in pairList:
+		for node in set([pair[0],pair[1]]):
+			for attr in pair[2]:
+				curve = newCurveMap.get((node.split('|')[-1],attr))
+				if curve: flipCurveList.append(curve)
+	flipCurveList = list(set(flipCurveList))
+	if flipCurveList: mc.scaleKey(flipCurveList,valueScale=-1.0,valuePivot=0.0)
+	
+	# Return Result
+	return flipCurveList
+
+def _mirrorMatrix(matrix):
+	'''
+	Mirror a matrix across the world YZ plane. The result is a valid (non reflected) transformation matrix.
+	@param matrix: Matrix to mirror
+	@type matrix: maya.OpenMaya.MMatrix
+	'''
+	mirror = OpenMaya.MMatrix()
+	OpenMaya.MScriptUtil.setDoubleArray(mirror[0],0,-1.0)
+	return mirror * matrix * mirror
+
+def mirrorAnimWorld(pairList,referenceFrame=None,localPairList=[]):
+	'''
+	Mirror animation for a list of mirror pairs by mirroring the sampled world space matrices of each control.
+	Key times are read from the existing animCurves of both sides of each pair. The new translate/rotate values are
+	computed for all controls and frames first, then written back in bulk (one MFnAnimCurve.addKeys call per curve).
+	Use this mode for controls whose left/right orientations are not symmetric.
+	@param pairList: List of [source,destination,flipAttrs] mirror pairs (see getMirrorPairs())
+	@type pairList: list
+	@param referenceFrame: Frame at which the rig is in a symmetric pose. Used to calculate the orientation offset between mirror pairs. If None, no offset is applied.
+	@type referenceFrame: float or None
+	@param localPairList: Mirror pairs mirrored in local mode. Used to determine the mirrored parent space of world mode controls.
+	@type localPairList: list
+	'''
+	if not pairList: return []
+	
+	# =================
+	# - Get Key Times -
+	# =================
+	
+	nodeList = []
+	for pair in pairList: nodeList.extend([pair[0],pair[1]])
+	nodeList = list(set(nodeList))
+	curveMap = getAnimCurveMap(nodeList)
+	if not curveMap: return []
+	
+	frameList = sorted(set(mc.keyframe(list(set(curveMap.values())),q=True,timeChange=True) or []))
+	if not frameList: return []
+	
+	# =========================
+	# - Sample World Matrices -
+	# =========================
+	
+	# Partner Map
+	partner = {}
+	for pair in localPairList+pairList:
+		partner[pair[0]] = pair[1]
+		partner[pair[1]] = pair[0]
+	
+	# Parent Map
+	parent = {}
+	for node in nodeList:
+		parentList = mc.listRelatives(node,p=True,pa=True) or []
+		if parentList: parent[node] = parentList[0]
+	
+	# Sample Nodes (world mode nodes, their partners and parents/parent partners)
+	sampleNodes = set(nodeList)
+	for node in parent.values():
+		sampleNodes.add(node)
+		if partner.has_key(node): sampleNodes.add(partner[node])
+	
+	worldMatrix = {}
+	for node in sampleNodes:
+		worldMatrix[node] = [glTools.utils.matrix.fromList(mc.getAttr(node+'.worldMatrix[0]',t=frame)) for frame in frameList]
+	
+	# Reference Offsets
+	offset = {}
+	for node in nodeList:
+		offset[node] = OpenMaya.MMatrix()
+		if referenceFrame != None:
+			nodeRef = glTools.utils.matrix.fromList(mc.getAttr(node+'.worldMatrix[0]',t=referenceFrame))
+			partnerRef = glTools.utils.matrix.fromList(mc.getAttr(partner[node]+'.worldMatrix[0]',t=referenceFrame))
+			offset[node] = nodeRef * _mirrorMatrix(partnerRef).inverse()
+	
+	# ===========================
+	# - Calculate Mirror Values -
+	# ===========================
+	
+	# Process parents before children, so mirrored parent matrices are available
+	nodeList.sort(key=lambda node: len(mc.ls(node,l=True)[0].split('|')))
+	
+	newWorld = {}
+	valueMap = {}
+	for node in nodeList:
 		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE','lf')
-		rtCtrl = ctrl.replace('SIDE','rt')
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
-			
-			# Swap Left <> Right
-			swapAnim(lfCtrl,rtCtrl)
-			
-			# Scale Keys
-			mc.scaleKey(lfCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			
-	# Legs - FK
-	for ctrl in [legFkA,legFkB,footFkA,footFkB]:
+		# Joint Orient
+		jointOrient = None
+		if mc.objExists(node+'.jointOrient'):
+			jo = mc.getAttr(node+'.jointOrient')[0]
+			jointOrient = OpenMaya.MEulerRotation(math.radians(jo[0]),math.radians(jo[1]),math.radians(jo[2])).asMatrix().inverse()
+		rotateOrder = mc.getAttr(node+'.rotateOrder')
 		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE','lf')
-		rtCtrl = ctrl.replace('SIDE','rt')
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
+		newWorld[node] = []
+		translate = [[],[],[]]
+		rotate = [[],[],[]]
+		for f in range(len(frameList)):
 			
-			# Swap Left <> Right
-			swapAnim(lfCtrl,rtCtrl)
+			# Mirror Partner World Matrix
+			world = offset[node] * _mirrorMatrix(worldMatrix[partner[node]][f])
+			newWorld[node].append(world)
 			
-			# Scale Keys
-			mc.scaleKey(lfCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-	
-	# Legs - IK
-	for ctrl in [legIk,legPv]:
-		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE','lf')
-		rtCtrl = ctrl.replace('SIDE','rt')
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
+			# Get Mirrored Parent Matrix
+			parentMatrix = OpenMaya.MMatrix()
+			if parent.has_key(node):
+				p = parent[node]
+				if newWorld.has_key(p): parentMatrix = newWorld[p][f]
+				elif partner.has_key(p): parentMatrix = _mirrorMatrix(worldMatrix[partner[p]][f])
+				else: parentMatrix = worldMatrix[p][f]
 			
-			# Swap Left <> Right
-			swapAnim(lfCtrl,rtCtrl)
+			# Local Matrix
+			local = world * parentMatrix.inverse()
+			t = glTools.utils.matrix.getTranslation(local)
+			if jointOrient: local = local * jointOrient
+			euler = OpenMaya.MTransformationMatrix(local).eulerRotation()
+			euler.reorderIt(rotateOrder)
 			
-			# Scale Keys
-			mc.scaleKey(lfCtrl,at=['tx','ry','rz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ry','rz'],valueScale=-1.0,valuePivot=0.0)		
-	
-	# Feet - IK
-	for ctrl in [footIk,toeIk]:
+			for i in range(3):
+				translate[i].append(t[i])
+				rotate[i].append([euler.x,euler.y,euler.z][i])
 		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE','lf')
-		rtCtrl = ctrl.replace('SIDE','rt')
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
-			
-			# Swap Left <> Right
-			swapAnim(lfCtrl,rtCtrl)
-			
-			# Scale Keys
-			mc.scaleKey(lfCtrl,at=['tx','ry','rz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ry','rz'],valueScale=-1.0,valuePivot=0.0)
+		valueMap[node] = {	'tx':translate[0],'ty':translate[1],'tz':translate[2],
+							'rx':rotate[0],'ry':rotate[1],'rz':rotate[2]	}
+	
+	# ==========================
+	# - Write Animation Curves -
+	# ==========================
+	
+	timeArray = OpenMaya.MTimeArray()
+	for frame in frameList: timeArray.append(OpenMaya.MTime(frame,OpenMaya.MTime.uiUnit()))
+	
+	# Get Settable Channels
+	attrMap = {}
+	for node in nodeList:
+		attrList = [attr for attr in ['tx','ty','tz','rx','ry','rz'] if mc.getAttr(node+'.'+attr,se=True)]
+		if not attrList: continue
+		attrMap[node] = attrList
+		
+		# Create Missing Curves
+		if [attr for attr in attrList if not curveMap.has_key((node.split('|')[-1],attr))]:
+			mc.setKeyframe(node,at=attrList,t=frameList[0])
+			curveMap.update(getAnimCurveMap([node]))
+	
+	# Write Keys (recorded in a single MAnimCurveChange, so the edits are undoable)
+	curveList = []
+	rotateCurveList = []
+	with glTools.utils.apiUndo.ApiUndo() as undo:
+		animChange = undo.animCurveChange()
+		for node in nodeList:
+			if not attrMap.has_key(node): continue
+			for attr in attrMap[node]:
+				curve = curveMap[(node.split('|')[-1],attr)]
+				curveFn = OpenMayaAnim.MFnAnimCurve(glTools.utils.base.getMObject(curve))
+				valueArray = glTools.utils.arrayUtils.toMDoubleArray(valueMap[node][attr])
+				curveFn.addKeys(timeArray,valueArray,OpenMayaAnim.MFnAnimCurve.kTangentGlobal,OpenMayaAnim.MFnAnimCurve.kTangentGlobal,False,animChange)
+				curveList.append(curve)
+				if attr.startswith('r'): rotateCurveList.append(curve)
+	
+	# Euler Filter Rotations
+	if rotateCurveList: mc.filterCurve(rotateCurveList)
+	
+	# Return Result
+	return curveList
+
+def mirrorAnim(rigNS,mirrorTable,worldSpace=False,referenceFrame=None):
+	'''
+	Mirror animation for a rig based on a data defined mirror table.
+	@param rigNS: Rig namespace.
+	@type rigNS: str
+	@param mirrorTable: Mirror table dictionary (see BIPED_ANIM_MIRROR_TABLE)
+	@type mirrorTable: dict
+	@param worldSpace: Mirror all controls in world space. If False, only table entries with mode "world" are mirrored in world space.
+	@type worldSpace: bool
+	@param referenceFrame: Frame at which the rig is in a symmetric pose. Used for world space mirroring only.
+	@type referenceFrame: float or None
+	'''
+	# =============
+	# - Check Rig -
+	# =============
+	
+	if rigNS and not mc.namespace(ex=rigNS):
+		raise Exception('Rig namespace "'+rigNS+'" not found! Unable to mirror animation...')
+	
+	# ====================
+	# - Mirror Animation -
+	# ====================
+	
+	pairList = getMirrorPairs(rigNS,mirrorTable)
+	if worldSpace:
+		localPairList = []
+		worldPairList = pairList
+	else:
+		localPairList = [pair for pair in pairList if pair[3] != 'world']
+		worldPairList = [pair for pair in pairList if pair[3] == 'world']
+	
+	mc.undoInfo(openChunk=True)
+	try:
+		# World space pairs are sampled before any local mirroring modifies the animation
+		mirrorAnimWorld(worldPairList,referenceFrame,localPairList)
+		mirrorAnimLocal(localPairList)
+	finally:
+		mc.undoInfo(closeChunk=True)
+	
+	# Return Result
+	return pairList
+
+def mirrorBipedAnim(rigNS,worldSpace=False):
+	'''
+	Mirror biped body animation
+	@param rigNS: Rig namespace.
+	@type rigNS: str
+	@param worldSpace: Mirror animation in world space.
+	@type worldSpace: bool
+	'''
+	return mirrorAnim(rigNS,BIPED_ANIM_MIRROR_TABLE,worldSpace=worldSpace)
 
 def mirrorBipedAnimFromSel():
 	'''
@@ -201,142 +502,15 @@ def mirrorBipedAnimFromSel():
 		try: mirrorBipedAnim(rigNS)
 		except Exception, e: print('Error mirroring animation for "'+rigNS+'"! Skipping...')
 
-def mirrorBipedMocap(rigNS):
+def mirrorBipedMocap(rigNS,worldSpace=False):
 	'''
 	Mirror biped body mocap animation
 	@param rigNS: Rig namespace.
 	@type rigNS: str
+	@param worldSpace: Mirror animation in world space.
+	@type worldSpace: bool
 	'''
-	# =============
-	# - Check Rig -
-	# =============
-	
-	if not mc.namespace(ex=rigNS):
-		raise Exception('Rig namespace "'+rigNS+'" not found! Unable to mirror animation...')
-	
-	# ====================
-	# - Get Rig Controls -
-	# ====================
-	
-	# Body
-	body = rigNS+':Hips'
-	
-	# Spine/Neck/Head
-	spine = rigNS+':Spine'
-	neck = rigNS+':Neck'
-	head = rigNS+':Head'
-	
-	# Arms
-	clav = rigNS+':SIDEShoulder'
-	arm = rigNS+':SIDEArm'
-	foreArm = rigNS+':SIDEForeArm'
-	
-	# Hand
-	hand = rigNS+':SIDEHand'
-	thumb = rigNS+':SIDEHandThumb'
-	index = rigNS+':SIDEHandIndex'
-	middle = rigNS+':SIDEHandMiddle'
-	ring = rigNS+':SIDEHandRing'
-	pinky = rigNS+':SIDEHandPinky'
-	finger = [thumb,index,middle,ring,pinky]
-	
-	# Legs
-	upLeg = rigNS+':SIDEUpLeg'
-	leg = rigNS+':SIDELeg'
-	
-	# Foot
-	foot = rigNS+':SIDEFoot'
-	toe = rigNS+':SIDEToeBase'
-	
-	# Roll
-	roll = 'Roll'
-	
-	# Side
-	left = 'Left'
-	right = 'Right'
-	
-	# ====================
-	# - Mirror Animation -
-	# ====================
-	
-	# Body
-	for ctrl in [body]:
-		if mc.objExists(ctrl):
-			mc.scaleKey(ctrl,at=['tx','ry','rz'],valueScale=-1.0,valuePivot=0.0)
-	
-	# Spine/Neck/Head
-	for item in [spine,neck,head]:
-		ind = ''
-		while mc.objExists(item+str(ind)):
-			ctrl = item+str(ind)
-			mc.scaleKey(ctrl,at=['rx','ry'],valueScale=-1.0,valuePivot=0.0)
-			if not ind: ind = 0
-			ind += 1
-	
-	# Shoulder
-	for ctrl in [clav]:
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE',left)
-		rtCtrl = ctrl.replace('SIDE',right)
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
-			swapAnim(lfCtrl,rtCtrl)
-			mc.scaleKey(lfCtrl,at=['tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tz'],valueScale=-1.0,valuePivot=0.0)
-	
-	# Arms
-	for ctrl in [arm,foreArm,hand]:
-		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE',left)
-		rtCtrl = ctrl.replace('SIDE',right)
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
-			swapAnim(lfCtrl,rtCtrl)
-			mc.scaleKey(lfCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-		
-		# Get Roll Nodes
-		lfCtrl = lfCtrl+roll
-		rtCtrl = rtCtrl+roll
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
-			swapAnim(lfCtrl,rtCtrl)
-			mc.scaleKey(lfCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-		
-	# Fingers
-	for ctrl in finger:
-		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE',left)
-		rtCtrl = ctrl.replace('SIDE',right)
-		
-		ind = 1
-		while mc.objExists(lfCtrl+str(ind)) and mc.objExists(rtCtrl+str(ind)):
-			lfCtrlInd = lfCtrl+str(ind)
-			rtCtrlInd = rtCtrl+str(ind)
-			swapAnim(lfCtrlInd,rtCtrlInd)
-			mc.scaleKey(lfCtrlInd,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrlInd,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			if not ind: ind = 0
-			ind += 1
-	
-	# Legs
-	for ctrl in [upLeg,leg,foot,toe]:
-		
-		# Get Left/Right Nodes
-		lfCtrl = ctrl.replace('SIDE',left)
-		rtCtrl = ctrl.replace('SIDE',right)
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
-			swapAnim(lfCtrl,rtCtrl)
-			mc.scaleKey(lfCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-		
-		# Get Roll Nodes
-		lfCtrl = lfCtrl+roll
-		rtCtrl = rtCtrl+roll
-		if mc.objExists(lfCtrl) and mc.objExists(rtCtrl):
-			swapAnim(lfCtrl,rtCtrl)
-			mc.scaleKey(lfCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
-			mc.scaleKey(rtCtrl,at=['tx','ty','tz'],valueScale=-1.0,valuePivot=0.0)
+	return mirrorAnim(rigNS,BIPED_MOCAP_MIRROR_TABLE,worldSpace=worldSpace)
 
 def mirrorBipedMocaFromSel():
 	'''
@@ -1,10 +1,13 @@
 import maya.cmds as mc
 import maya.mel as mm
+import maya.OpenMaya as OpenMaya
+import maya.OpenMayaAnim as OpenMayaAnim
 
 import glTools.rig.utils
 
 import glTools.tools.constraint
 
+import glTools.utils.animCurve
 import glTools.utils.attribute
 import glTools.utils.base
 import glTools.utils.channelState
@@ -12,8 +15,14 @@ import glTools.utils.constraint
 import glTools.utils.joint
 import glTools.utils.stringUtils
 
+import os
 import os.path
+import sys
 import types
+import shutil
+import cPickle
+import tempfile
+import subprocess
 
 def overrideAttribute():
 	'''
@@ -545,6 +554,390 @@ def constrainControlToTarget(	control,
 	
 	return overrideCtrlConstraint
 
+# ===============
+# - Bake Engine -
+# ===============
+
+def bakeFrameList(start,end,step=1):
+	'''
+	Return the list of bake sample frames for the specified range.
+	@param start: Start frame of the bake range.
+	@type start: float
+	@param end: End frame of the bake range.
+	@type end: float
+	@param step: Bake sample step.
+	@type step: float
+	'''
+	frameList = []
+	frame = float(start)
+	while frame <= end + 0.0001:
+		frameList.append(frame)
+		frame += step
+	return frameList
+
+def bakeChunkRanges(start,end,chunks,step=1):
+	'''
+	Split a bake range into a list of contiguous [start,end] frame chunks.
+	@param start: Start frame of the bake range.
+	@type start: float
+	@param end: End frame of the bake range.
+	@type end: float
+	@param chunks: Number of chunks to split the range into.
+	@type chunks: int
+	@param step: Bake sample step.
+	@type step: float
+	'''
+	frameList = bakeFrameList(start,end,step)
+	chunks = max(1,min(int(chunks),len(frameList)))
+	chunkSize = len(frameList) / chunks
+	remainder = len(frameList) % chunks
+	
+	rangeList = []
+	ind = 0
+	for i in range(chunks):
+		size = chunkSize + int(i < remainder)
+		rangeList.append([frameList[ind],frameList[ind+size-1]])
+		ind += size
+	return rangeList
+
+def sampleChannels(transformList,start,end,attrList=['tx','ty','tz','rx','ry','rz'],step=1):
+	'''
+	Sample transform channel values over a frame range.
+	The scene is evaluated once per frame, and all channels of all transforms are sampled in a single sweep
+	(directly from the evaluated plugs), instead of evaluating the scene for each baked node.
+	Returns a bake data dictionary that can be applied with applyBakeData().
+	@param transformList: List of transforms to sample.
+	@type transformList: list
+	@param start: Start frame of the sample range.
+	@type start: float
+	@param end: End frame of the sample range.
+	@type end: float
+	@param attrList: List of channels to sample.
+	@type attrList: list
+	@param step: Sample step.
+	@type step: float
+	'''
+	# Get Channel Plugs
+	plugList = []
+	for transform in transformList:
+		nodeFn = OpenMaya.MFnDependencyNode(glTools.utils.base.getMObject(transform))
+		for attr in attrList: plugList.append(nodeFn.findPlug(attr))
+	
+	# Sample Channels
+	frameList = bakeFrameList(start,end,step)
+	valueList = [[] for plug in plugList]
+	
+	currentTime = mc.currentTime(q=True)
+	mc.refresh(suspend=True)
+	try:
+		for frame in frameList:
+			OpenMayaAnim.MAnimControl.setCurrentTime(OpenMaya.MTime(frame,OpenMaya.MTime.uiUnit()))
+			for i in range(len(plugList)):
+				valueList[i].append(plugList[i].asDouble())
+	finally:
+		mc.refresh(suspend=False)
+		mc.currentTime(currentTime)
+	
+	# Return Result
+	return {'transforms':list(transformList),'attrs':list(attrList),'frames':frameList,'values':valueList}
+
+def mergeBakeData(bakeDataList):
+	'''
+	Merge bake data sampled in frame chunks (see sampleChannels()) into a single bake data dictionary.
+	@param bakeDataList: List of bake data dictionaries to merge. All items must share the same transform and channel list.
+	@type bakeDataList: list
+	'''
+	if not bakeDataList: return None
+	bakeDataList = sorted(bakeDataList,key=lambda data: data['frames'] and data['frames'][0])
+	
+	bakeData = {	'transforms':bakeDataList[0]['transforms'],
+					'attrs':bakeDataList[0]['attrs'],
+					'frames':[],
+					'values':[[] for i in bakeDataList[0]['values']]	}
+	for data in bakeDataList:
+		if data['transforms'] != bakeData['transforms'] or data['attrs'] != bakeData['attrs']:
+			raise Exception('Unable to merge bake data! Transform or channel lists do not match.')
+		bakeData['frames'].extend(data['frames'])
+		for i in range(len(data['values'])): bakeData['values'][i].extend(data['values'][i])
+	
+	# Return Result
+	return bakeData
+
+def writeBakeData(bakeData,filePath):
+	'''
+	Write bake data to file.
+	@param bakeData: Bake data dictionary to write.
+	@type bakeData: dict
+	@param filePath: Bake data file path.
+	@type filePath: str
+	'''
+	fileOut = open(filePath,'wb')
+	cPickle.dump(bakeData,fileOut,cPickle.HIGHEST_PROTOCOL)
+	fileOut.close()
+	return filePath
+
+def readBakeData(filePath):
+	'''
+	Read bake data from file.
+	@param filePath: Bake data file path.
+	@type filePath: str
+	'''
+	if not os.path.isfile(filePath):
+		raise Exception('Bake data file "'+filePath+'" does not exist!')
+	fileIn = open(filePath,'rb')
+	bakeData = cPickle.load(fileIn)
+	fileIn.close()
+	return bakeData
+
+def applyBakeData(bakeData,preserveOutsideKeys=True):
+	'''
+	Write sampled bake data to animation curves (see glTools.utils.animCurve.writeKeys()).
+	Each curve is written with one MFnAnimCurve.addKeys call, and the whole write is a single undoable operation.
+	Baked channels should no longer be driven (constraints deleted) when the bake data is applied.
+	@param bakeData: Bake data dictionary (see sampleChannels()).
+	@type bakeData: dict
+	@param preserveOutsideKeys: Keep existing keys outside the bake range.
+	@type preserveOutsideKeys: bool
+	'''
+	transformList = bakeData['transforms']
+	attrList = bakeData['attrs']
+	frameList = bakeData['frames']
+	if not transformList or not frameList: return []
+	
+	# Write Keys
+	channelList = [transform+'.'+attr for transform in transformList for attr in attrList]
+	return glTools.utils.animCurve.writeKeys(channelList,frameList,bakeData['values'],preserveOutsideKeys)
+
+def checkBakeChannels(transformList,attrList,deleteList=[]):
+	'''
+	Check that all bake channels can be keyed once the driving nodes (deleteList) are deleted.
+	Channels can be undriven, animated or driven by a node in the delete list. Channels driven through a pairBlend are
+	returned, so they can be resolved to the pairBlend input animCurve (see resolvePairBlendChannels()).
+	Raises an exception for any other driven channel, before anything is deleted or keyed.
+	Returns a dictionary of {channel:pairBlendOutputPlug}.
+	@param transformList: List of transforms to bake.
+	@type transformList: list
+	@param attrList: List of channels to bake.
+	@type attrList: list
+	@param deleteList: List of nodes (constraints) that will be deleted before the bake data is applied.
+	@type deleteList: list
+	'''
+	deleteSet = set(mc.ls(deleteList,l=True))
+	pairBlendMap = {}
+	for transform in transformList:
+		for attr in attrList:
+			channel = transform+'.'+attr
+			srcPlug = mc.listConnections(channel,s=True,d=False,p=True,scn=True)
+			if not srcPlug: continue
+			srcNode = srcPlug[0].split('.')[0]
+			if mc.ls(srcNode,type='animCurve'): continue
+			if deleteSet.count(mc.ls(srcNode,l=True)[0]): continue
+			if mc.objectType(srcNode) == 'pairBlend':
+				pairBlendMap[channel] = srcPlug[0]
+				continue
+			raise Exception('Channel "'+channel+'" is driven by "'+srcPlug[0]+'", which is not an animCurve, pairBlend or a deleted node! Unable to bake...')
+	
+	# Return Result
+	return pairBlendMap
+
+def resolvePairBlendChannels(pairBlendMap):
+	'''
+	Replace the pairBlend connection of each channel with the pairBlend (input 1) animCurve, so baked keys are written
+	to the existing animation. Channels with no pairBlend input animCurve are disconnected.
+	@param pairBlendMap: Dictionary of {channel:pairBlendOutputPlug}, as returned by checkBakeChannels().
+	@type pairBlendMap: dict
+	'''
+	for channel in sorted(pairBlendMap.keys()):
+		
+		# Get PairBlend Input Curve (ie. outTranslateX > inTranslateX1)
+		pairBlend,outAttr = pairBlendMap[channel].split('.',1)
+		inCurve = mc.listConnections(pairBlend+'.in'+outAttr[3:]+'1',s=True,d=False,type='animCurve') or []
+		
+		# Disconnect PairBlend (including any conversion node)
+		for srcPlug in mc.listConnections(channel,s=True,d=False,p=True) or []:
+			mc.disconnectAttr(srcPlug,channel)
+		
+		# Connect Input Curve
+		if inCurve: mc.connectAttr(inCurve[0]+'.output',channel,f=True)
+
+def applyBake(bakeData,deleteList=[],preserveOutsideKeys=True,pairBlendMap=None):
+	'''
+	Delete the driving nodes (deleteList) and write the sampled bake data to animation curves, as a single undo chunk.
+	All channels are checked (see checkBakeChannels()) before anything is deleted. If the bake fails, the
+	deletion and any partially written keys are undone.
+	@param bakeData: Bake data dictionary (see sampleChannels()).
+	@type bakeData: dict
+	@param deleteList: List of nodes (constraints) to delete before the bake data is applied.
+	@type deleteList: list
+	@param preserveOutsideKeys: Keep existing keys outside the bake range.
+	@type preserveOutsideKeys: bool
+	@param pairBlendMap: PairBlend driven channels, as returned by checkBakeChannels(). If None, the channels are checked here.
+	@type pairBlendMap: dict or None
+	'''
+	# Check Channels
+	if pairBlendMap == None: pairBlendMap = checkBakeChannels(bakeData['transforms'],bakeData['attrs'],deleteList)
+	
+	# Apply Bake
+	mc.undoInfo(openChunk=True)
+	try:
+		if deleteList: mc.delete(deleteList)
+		resolvePairBlendChannels(pairBlendMap)
+		curveList = applyBakeData(bakeData,preserveOutsideKeys)
+	except:
+		# Roll Back
+		excInfo = sys.exc_info()
+		mc.undoInfo(closeChunk=True)
+		if mc.undoInfo(q=True,state=True): mc.undo()
+		raise excInfo[0],excInfo[1],excInfo[2]
+	mc.undoInfo(closeChunk=True)
+	
+	# Return Result
+	return curveList
+
+def bakeChannels(	transformList,
+					start,
+					end,
+					attrList = ['tx','ty','tz','rx','ry','rz'],
+					step = 1,
+					deleteList = [],
+					preserveOutsideKeys = True	):
+	'''
+	Bake transform channels to keyframes. All transforms are sampled in a single pass over the frame range,
+	the driving nodes (deleteList) are deleted, and all curves are written at the end (see applyBake()).
+	Channels are checked before sampling, so an unsupported channel driver fails the bake before anything is modified.
+	@param transformList: List of transforms to bake.
+	@type transformList: list
+	@param start: Start frame of the bake range.
+	@type start: float
+	@param end: End frame of the bake range.
+	@type end: float
+	@param attrList: List of channels to bake.
+	@type attrList: list
+	@param step: Bake sample step.
+	@type step: float
+	@param deleteList: List of nodes (constraints) to delete after sampling.
+	@type deleteList: list
+	@param preserveOutsideKeys: Keep existing keys outside the bake range.
+	@type preserveOutsideKeys: bool
+	'''
+	pairBlendMap = checkBakeChannels(transformList,attrList,deleteList)
+	bakeData = sampleChannels(transformList,start,end,attrList,step)
+	return applyBake(bakeData,deleteList,preserveOutsideKeys,pairBlendMap)
+
+def bakeChunkWorker(sceneFile,transformList,start,end,attrList,step,dataFile):
+	'''
+	Headless bake worker. Opens the specified scene, samples the transform channels for a frame chunk and writes the bake data to file.
+	Intended to be run from a standalone (mayapy) session. See bakeChannelsParallel().
+	@param sceneFile: Scene file to open.
+	@type sceneFile: str
+	@param transformList: List of transforms to sample.
+	@type transformList: list
+	@param start: Start frame of the chunk.
+	@type start: float
+	@param end: End frame of the chunk.
+	@type end: float
+	@param attrList: List of channels to sample.
+	@type attrList: list
+	@param step: Sample step.
+	@type step: float
+	@param dataFile: Bake data output file path.
+	@type dataFile: str
+	'''
+	mc.file(sceneFile,o=True,f=True)
+	bakeData = sampleChannels(transformList,start,end,attrList,step)
+	return writeBakeData(bakeData,dataFile)
+
+def bakeChannelsParallel(	transformList,
+							start,
+							end,
+							attrList = ['tx','ty','tz','rx','ry','rz'],
+							step = 1,
+							deleteList = [],
+							preserveOutsideKeys = True,
+							workers = 4,
+							mayapy = 'mayapy',
+							sceneFile = '',
+							tmpDir = ''	):
+	'''
+	Bake transform channels to keyframes, sampling the frame range in chunks with multiple headless (mayapy) workers.
+	Each worker opens the scene file, samples its frame chunk and writes the bake data to file.
+	The chunk data is then merged and applied in the current session (see applyBake()).
+	@param transformList: List of transforms to bake.
+	@type transformList: list
+	@param start: Start frame of the bake range.
+	@type start: float
+	@param end: End frame of the bake range.
+	@type end: float
+	@param attrList: List of channels to bake.
+	@type attrList: list
+	@param step: Bake sample step.
+	@type step: float
+	@param deleteList: List of nodes (constraints) to delete after sampling.
+	@type deleteList: list
+	@param preserveOutsideKeys: Keep existing keys outside the bake range.
+	@type preserveOutsideKeys: bool
+	@param workers: Number of headless workers (frame chunks).
+	@type workers: int
+	@param mayapy: Path to the mayapy executable.
+	@type mayapy: str
+	@param sceneFile: Scene file for the workers to sample. If empty, use the current (saved) scene.
+	@type sceneFile: str
+	@param tmpDir: Directory for the intermediate bake data files. If empty, use the system temp directory.
+	@type tmpDir: str
+	'''
+	# ==========
+	# - Checks -
+	# ==========
+	
+	if not sceneFile:
+		sceneFile = mc.file(q=True,sn=True)
+		if not sceneFile: raise Exception('Scene has not been saved! Unable to bake in parallel...')
+		if mc.file(q=True,modified=True): raise Exception('Scene has unsaved changes! Save the scene before baking in parallel...')
+	if not os.path.isfile(sceneFile):
+		raise Exception('Scene file "'+sceneFile+'" does not exist!')
+	if not tmpDir: tmpDir = tempfile.gettempdir()
+	
+	# Use Full Path Names (Unambiguous in the worker sessions)
+	transformList = mc.ls(transformList,l=True)
+	pairBlendMap = checkBakeChannels(transformList,attrList,deleteList)
+	
+	# =================
+	# - Start Workers -
+	# =================
+	
+	rangeList = bakeChunkRanges(start,end,workers,step)
+	dataDir = tempfile.mkdtemp(prefix='bakeChannels_',dir=tmpDir)
+	procList = []
+	dataFileList = []
+	for c in range(len(rangeList)):
+		chunkStart,chunkEnd = rangeList[c]
+		dataFile = os.path.join(dataDir,'bakeChunk_'+str(c)+'.pkl')
+		script = 'import maya.standalone; maya.standalone.initialize(name="python"); '
+		script += 'import sys; sys.path.extend([p for p in '+repr(sys.path)+' if not p in sys.path]); '
+		script += 'import glTools.rig.mocapOverride; '
+		script += 'glTools.rig.mocapOverride.bakeChunkWorker('+repr(sceneFile)+','+repr(transformList)+','+repr(chunkStart)+','+repr(chunkEnd)+','+repr(list(attrList))+','+repr(step)+','+repr(dataFile)+')'
+		procList.append(subprocess.Popen([mayapy,'-c',script]))
+		dataFileList.append(dataFile)
+	
+	# Wait for Workers
+	failed = [i for i in range(len(procList)) if procList[i].wait()]
+	
+	# ==============
+	# - Merge Data -
+	# ==============
+	
+	try:
+		if failed: raise Exception('Bake worker(s) failed for frame chunk(s) '+str([rangeList[i] for i in failed])+'!')
+		bakeData = mergeBakeData([readBakeData(dataFile) for dataFile in dataFileList])
+	finally:
+		shutil.rmtree(dataDir,ignore_errors=True)
+	
+	# =========
+	# - Apply -
+	# =========
+	
+	return applyBake(bakeData,deleteList,preserveOutsideKeys,pairBlendMap)
+
 def bakeControlOverrideTarget(controlList,start=None,end=None,bakeSim=True):
 	'''
 	Bake control override target constraint to transform channel keys.
@@ -554,7 +947,7 @@ def bakeControlOverrideTarget(controlList,start=None,end=None,bakeSim=True):
 	@type start: float
 	@param end: End frame of the bake animation range. If less that start, use current playback settings.
 	@type end: float
-	@param bakeSim: Bake results using simulation option which updates the entire scene at each bake sample.
+	@param bakeSim: Unused. The bake engine always evaluates the entire scene once per bake sample.
 	@type bakeSim: bool
 	'''
 	print('!!==== DEPRICATED ====!! (glTools.rig.mocapOverride.bakeControlOverrideTarget)')
@@ -617,19 +1010,14 @@ def bakeControlOverrideTarget(controlList,start=None,end=None,bakeSim=True):
 	# - Bake Override Target Channels -
 	# =================================
 	
-	mc.bakeResults(	overrideTargetList,
-					t = (start,end),
-					at = ['tx','ty','tz','rx','ry','rz'],
-					preserveOutsideKeys = True,
-					simulation = bakeSim )
-	
-	# ======================
-	# - Delete Constraints -
-	# ======================
-	
-	mc.delete(overrideConstraintList)
+	bakeChannels(	overrideTargetList,
+					start,
+					end,
+					attrList = ['tx','ty','tz','rx','ry','rz'],
+					deleteList = overrideConstraintList,
+					preserveOutsideKeys = True )
 
-def bakeControlOverride(controlList,start=None,end=None,bakeSim=True):
+def bakeControlOverride(controlList,start=None,end=None,bakeSim=True,workers=1,mayapy='mayapy'):
 	'''
 	Bake control constraint to transform channel keys.
 	@param controlList: The control list that will have its constraints baked to keyframes.
@@ -638,8 +1026,12 @@ def bakeControlOverride(controlList,start=None,end=None,bakeSim=True):
 	@type start: float
 	@param end: End frame of the bake animation range. If less that start, use current playback settings.
 	@type end: float
-	@param bakeSim: Bake results using simulation option which updates the entire scene at each bake sample.
+	@param bakeSim: Unused. The bake engine always evaluates the entire scene once per bake sample.
 	@type bakeSim: bool
+	@param workers: Number of headless workers to sample the bake range with. If 1, sample in the current session.
+	@type workers: int
+	@param mayapy: Path to the mayapy executable. Only used if workers > 1.
+	@type mayapy: str
 	'''
 	print('!!==== DEPRICATED ====!! (glTools.rig.mocapOverride.bakeControlOverride)')
 	
@@ -651,33 +1043,45 @@ def bakeControlOverride(controlList,start=None,end=None,bakeSim=True):
 	if start == None: start = mc.playbackOptions(q=True,min=True)
 	if end == None: end = mc.playbackOptions(q=True,max=True)
 	
-	# For Each Control
-	bakeControlList = []
-	constraintList = []
+	# Controls
 	for control in controlList:
-		
-		# Control
 		if not mc.objExists(control):
 			raise Exception('Rig control transform "'+control+'" does not exist!')
-		
-		# Override Target Constraint
-		overrideConstraint = mc.ls(mc.listConnections(control+'.'+overrideAttribute(),d=True,s=False),type='constraint')
-		if not overrideConstraint:
-			
-			# Check PairBlend (intermediate) Connection
-			# - This fix was made in preparation for baking keys from multiple mocap sources (bake in frame chunks).
-			overridePairBlend = mc.ls(mc.listConnections(control,s=True,d=False),type='pairBlend')
-			if overridePairBlend:
-				overrideConstraint = mc.ls(mc.listConnections(overrideTargetPairBlend,s=True,d=False) or [],type='constraint')
-			
-			if not overrideConstraint:
-				print('Unable to determine override constraint from control transform "'+control+'"!')
-				continue
-		
-		# Append to Override Target List
+	
+	# ======================================
+	# - Get Override Constraints (Batched) -
+	# ======================================
+	
+	# Override Constraints (Returned as [controlPlug,constraint] pairs)
+	overrideAttr = overrideAttribute()
+	overridePlugs = [control+'.'+overrideAttr for control in controlList if mc.objExists(control+'.'+overrideAttr)]
+	connList = []
+	if overridePlugs: connList = mc.listConnections(overridePlugs,s=False,d=True,type='constraint',connections=True) or []
+	constraintMap = {}
+	for n in range(0,len(connList),2):
+		control = mc.ls(connList[n].split('.')[0],l=True)[0]
+		constraintMap.setdefault(control,[]).append(connList[n+1])
+	
+	# Check PairBlend (intermediate) Connection
+	# - This fix was made in preparation for baking keys from multiple mocap sources (bake in frame chunks).
+	longNameMap = dict([(control,mc.ls(control,l=True)[0]) for control in controlList])
+	missingList = [control for control in controlList if not constraintMap.has_key(longNameMap[control])]
+	if missingList:
+		connList = mc.listConnections(missingList,s=True,d=False,type='pairBlend',connections=True) or []
+		for n in range(0,len(connList),2):
+			control = mc.ls(connList[n].split('.')[0],l=True)[0]
+			pairBlendConstraint = mc.ls(mc.listConnections(connList[n+1],s=True,d=False) or [],type='constraint')
+			if pairBlendConstraint: constraintMap.setdefault(control,[]).extend(pairBlendConstraint)
+	
+	# Build Bake List
+	bakeControlList = []
+	constraintList = []
+	for control in controlList:
+		if not constraintMap.has_key(longNameMap[control]):
+			print('Unable to determine override constraint from control transform "'+control+'"!')
+			continue
 		bakeControlList.append(control)
-		# Append to Override Constraint List
-		[constraintList.append(i) for i in overrideConstraint if not i in constraintList]
+		[constraintList.append(i) for i in constraintMap[longNameMap[control]] if not i in constraintList]
 	
 	# =================================
 	# - Bake Override Target Channels -
@@ -689,17 +1093,22 @@ def bakeControlOverride(controlList,start=None,end=None,bakeSim=True):
 		return None
 	
 	# Bake to Controls
-	mc.bakeResults(	bakeControlList,
-					t = (start,end),
-					at = ['tx','ty','tz','rx','ry','rz'],
-					preserveOutsideKeys = True,
-					simulation = bakeSim )
-	
-	# ======================
-	# - Delete Constraints -
-	# ======================
-	
-	if constraintList: mc.delete(constraintList)
+	if workers > 1:
+		bakeChannelsParallel(	bakeControlList,
+								start,
+								end,
+								attrList = ['tx','ty','tz','rx','ry','rz'],
+								deleteList = constraintList,
+								preserveOutsideKeys = True,
+								workers = workers,
+								mayapy = mayapy )
+	else:
+		bakeChannels(	bakeControlList,
+						start,
+						end,
+						attrList = ['tx','ty','tz','rx','ry','rz'],
+						deleteList = constraintList,
+						preserveOutsideKeys = True )
 	
 	# =================
 	# - Return Result -
@@ -707,7 +1116,7 @@ def bakeControlOverride(controlList,start=None,end=None,bakeSim=True):
 	
 	return bakeControlList
 
-def bakeExportSkeleton(exportNS,start=1,end=0):
+def bakeExportSkeleton(exportNS,start=1,end=0,workers=1,mayapy='mayapy'):
 	'''
 	Bake export skeleton constraints to joint channel keysframes.
 	@param exportNS: The namespace of the export skeleton.
@@ -716,6 +1125,10 @@ def bakeExportSkeleton(exportNS,start=1,end=0):
 	@type start: float
 	@param end: End frame of the bake animation range. If less that start, use current playback settings.
 	@type end: float
+	@param workers: Number of headless workers to sample the bake range with. If 1, sample in the current session.
+	@type workers: int
+	@param mayapy: Path to the mayapy executable. Only used if workers > 1.
+	@type mayapy: str
 	'''
 	# ==========
 	# - Checks -
@@ -739,17 +1152,21 @@ def bakeExportSkeleton(exportNS,start=1,end=0):
 	# ======================
 	
 	jointList = mc.ls(exportNS+'*',type='joint')
-	bakeList = [i for i in jointList if mc.ls(mc.listConnections(i,s=True,d=False),type='constraint')]
-	mc.bakeResults(bakeList,t=(start,end),at=['tx','ty','tz','rx','ry','rz','sx','sy','sz'],simulation=True)
 	
-	# ======================
-	# - Delete Constraints -
-	# ======================
+	# Get Constrained Joints (single query, returned as [jointPlug,constraint] pairs)
+	connList = mc.listConnections(jointList,s=True,d=False,type='constraint',connections=True) or []
+	constrained = set([connList[n].split('.')[0] for n in range(0,len(connList),2)])
+	bakeList = [i for i in jointList if i in constrained]
 	
 	constraintList = mc.ls(exportNS+'*',type='constraint')
 	if not constraintList:
 		raise Exception('Unbale to determine export skeleton constraint list!')
-	mc.delete(constraintList)
+	
+	# Bake and Delete Constraints
+	if workers > 1:
+		bakeChannelsParallel(bakeList,start,end,attrList=['tx','ty','tz','rx','ry','rz','sx','sy','sz'],deleteList=constraintList,preserveOutsideKeys=False,workers=workers,mayapy=mayapy)
+	else:
+		bakeChannels(bakeList,start,end,attrList=['tx','ty','tz','rx','ry','rz','sx','sy','sz'],deleteList=constraintList,preserveOutsideKeys=False)
 	
 	# =================
 	# - Return Result -
@@ -6,6 +6,7 @@ import glTools.tools.mesh
 import glTools.utils.component
 import glTools.utils.mathUtils
 import glTools.utils.mesh
+import glTools.utils.profiler
 import glTools.utils.skinCluster
 
 def cutSkin(mesh,weightThreshold=0.25,reducePercent=None,parentShape=False):
@@ -19,7 +20,7 @@ def cutSkin(mesh,weightThreshold=0.25,reducePercent=None,parentShape=False):
 	@type reducePercent: int or None
 	'''
 	# Initialize
-	startTime = mc.timerX()
+	timer = glTools.utils.profiler.start('cutSkin',mesh=mesh)
 	mc.undoInfo(state=False)
 	
 	# Get Skin Info
@@ -54,13 +55,14 @@ def cutSkin(mesh,weightThreshold=0.25,reducePercent=None,parentShape=False):
 			infMeshList.append(infMesh)
 	
 	# Finalize
-	totalTime = mc.timerX(startTime=startTime)
+	totalTime = timer.stop()
 	print('CutSkin - Total Time: '+str(totalTime))
 	mc.undoInfo(state=True)
 	
 	# Return Result
 	return infMeshList
 
+@glTools.utils.profiler.timed()
 def cutSkin_extractInfluenceMesh(mesh,influence):
 	'''
 	Extract new mesh from faces of original skinned mesh based on influence weights.
@@ -124,6 +126,7 @@ def cutSkin_extractInfluenceMesh(mesh,influence):
 	# Return Result
 	return infMesh
 	
+@glTools.utils.profiler.timed()
 def cutSkin_reduce(mesh,percent=50):
 	'''
 	Basic mesh cleanup and reduce.
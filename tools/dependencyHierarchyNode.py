@@ -1,4 +1,7 @@
 import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
+
+import glTools.utils.base
 
 class UserInputError( Exception ): pass
 
@@ -208,3 +211,235 @@ class DependencyHierarchyNode( object ):
 		for key in generationDictKeys: generationList.extend(generationDict[key])
 		return generationList
 		
+
+class DependencyHierarchyGraph( object ):
+	'''
+	Flat, array backed representation of a maya DAG hierarchy.
+	Each node is stored as an integer index into parallel name, parent and depth arrays, with a name to index
+	lookup table, so node lookups and reparenting are constant time operations. The graph is built from a single
+	MItDag sweep, and provides the same generation (evaluation order) queries as DependencyHierarchyNode.
+	'''
+	
+	def __init__(self):
+		
+		self.fullName = ''
+		self.shortName = ''
+		
+		self.fullNames = []
+		self.shortNames = []
+		self.parents = []
+		self.depths = []
+		self.children = []
+		self.order = []
+		self.orderCount = 0
+		self.index = {}
+		self.shortIndex = {}
+		
+	def buildHierarchyFromNode(self,root):
+		'''
+		Map an entire hierarchy from a given root node with a single MItDag traversal.
+		@param root: The root transform from which the hierarchy will be mapped
+		@type root: str
+		'''
+		# Check root exists
+		if not mc.objExists(root): raise UserInputError('Root object '+root+' does not exists!')
+		
+		# Reset graph
+		self.__init__()
+		
+		# Get root information
+		self.fullName = mc.ls(root,l=True)[0]
+		self.shortName = self.fullName.split('|')[-1]
+		
+		# Traverse hierarchy
+		dagIt = OpenMaya.MItDag(OpenMaya.MItDag.kDepthFirst,OpenMaya.MFn.kTransform)
+		dagIt.reset(glTools.utils.base.getMObject(root),OpenMaya.MItDag.kDepthFirst,OpenMaya.MFn.kTransform)
+		dagPath = OpenMaya.MDagPath()
+		while not dagIt.isDone():
+			
+			# Get node path
+			dagIt.getPath(dagPath)
+			fullName = dagPath.fullPathName()
+			
+			# Get parent index (Parent precedes child in depth first order)
+			parent = self.index.get(fullName.rsplit('|',1)[0],-1)
+			if self.fullNames and parent < 0:
+				dagIt.prune()
+				dagIt.next()
+				continue
+			
+			# Add node
+			self._addNode(fullName,parent)
+			dagIt.next()
+	
+	def _addNode(self,fullName,parent=-1):
+		'''
+		Append a node to the graph arrays.
+		@param fullName: Full path name of the node to add
+		@type fullName: str
+		@param parent: Index of the parent node. -1 for the root node.
+		@type parent: int
+		'''
+		node = len(self.fullNames)
+		shortName = fullName.split('|')[-1]
+		
+		self.fullNames.append(fullName)
+		self.shortNames.append(shortName)
+		self.parents.append(parent)
+		self.children.append(set())
+		self.order.append(self.orderCount)
+		self.orderCount += 1
+		self.index[fullName] = node
+		
+		# Short name lookup (Unique names only)
+		if self.shortIndex.has_key(shortName): self.shortIndex[shortName] = -1
+		else: self.shortIndex[shortName] = node
+		
+		# Depth
+		if parent < 0:
+			self.depths.append(0)
+		else:
+			self.depths.append(self.depths[parent]+1)
+			self.children[parent].add(node)
+		
+		return node
+	
+	def findDependNode(self,name):
+		'''
+		Return the graph index of the specified maya object. Returns -1 if the object is not in the graph.
+		@param name: Find the index of this object
+		@type name: str
+		'''
+		# Full path lookup
+		if self.index.has_key(name): return self.index[name]
+		
+		# Unique short name lookup
+		node = self.shortIndex.get(name,-1)
+		if node >= 0: return node
+		
+		# Resolve name
+		if not mc.objExists(name): raise UserInputError('Object '+name+' does not exists!')
+		return self.index.get(mc.ls(name,l=True)[0],-1)
+	
+	def getGeneration(self,node):
+		'''
+		Return the dependency depth (generation) of the specified graph node
+		@param node: Graph node index
+		@type node: int
+		'''
+		return self.depths[node]
+	
+	def getDependPath(self,node,delineator='|'):
+		'''
+		Return the dependency based path for the specified graph node
+		@param node: Graph node index
+		@type node: int
+		@param delineator: String that will be used to separate nodes in the return path string
+		@type delineator: str
+		'''
+		path = [self.shortNames[node]]
+		parent = self.parents[node]
+		while parent >= 0:
+			path.append(self.shortNames[parent])
+			parent = self.parents[parent]
+		path.reverse()
+		return delineator.join(path)
+	
+	def isDecendant(self,node,ancestor):
+		'''
+		Check if a graph node is a decendant of another graph node
+		@param node: Graph node index to check
+		@type node: int
+		@param ancestor: Graph node index of the potential ancestor
+		@type ancestor: int
+		'''
+		parent = self.parents[node]
+		while parent >= 0:
+			if parent == ancestor: return True
+			parent = self.parents[parent]
+		return False
+	
+	def reparent(self,node,newParent):
+		'''
+		Reparent a graph node under another graph node. Decendant depths are updated incrementally.
+		@param node: Graph node index to reparent
+		@type node: int
+		@param newParent: Graph node index of the new parent
+		@type newParent: int
+		'''
+		# Check parent is not the current node
+		if node == newParent: return
+		# Check current node is not already a child of parent
+		currentParent = self.parents[node]
+		if currentParent == newParent: return
+		# Check parent is not a decendant of child
+		if self.isDecendant(newParent,node): raise UserInputError('Object "'+self.shortNames[newParent]+'" is a decendant of "'+self.shortNames[node]+'"!! Unable to perform reparent!')
+		
+		# Break old child/parent connection
+		if currentParent >= 0: self.children[currentParent].discard(node)
+		
+		# Make new child/parent connection (Appended to end of child order)
+		self.parents[node] = newParent
+		self.children[newParent].add(node)
+		self.order[node] = self.orderCount
+		self.orderCount += 1
+		
+		# Update decendant depths
+		depthOffset = (self.depths[newParent]+1) - self.depths[node]
+		if depthOffset:
+			stack = [node]
+			while stack:
+				n = stack.pop()
+				self.depths[n] += depthOffset
+				stack.extend(self.children[n])
+	
+	def listChildren(self,node,recursive=False):
+		'''
+		Return an ordered list of child graph node indices
+		@param node: Graph node index to list children for
+		@type node: int
+		@param recursive: Traverse the entire downstream decendant hierarchy
+		@type recursive: bool
+		'''
+		order = self.order
+		childList = sorted(self.children[node],key=lambda n: order[n])
+		if not recursive: return childList
+		
+		# Depth first (pre-order) traversal
+		result = []
+		stack = childList[::-1]
+		while stack:
+			n = stack.pop()
+			result.append(n)
+			stack.extend(sorted(self.children[n],key=lambda c: order[c],reverse=True))
+		return result
+	
+	def flatList(self,longNames=False):
+		'''
+		Return a dependency node name list from the current hierarchy
+		@param longNames: Return a list of long object names
+		@type longNames: bool
+		'''
+		nameList = self.shortNames
+		if longNames: nameList = self.fullNames
+		nodeList = [0] + self.listChildren(0,recursive=True)
+		return [nameList[n] for n in nodeList]
+	
+	def generationDict(self):
+		'''
+		Create a generation based dictionary of all nodes in the dependency hierarchy.
+		'''
+		generationDict = {}
+		for node in [0] + self.listChildren(0,recursive=True):
+			generationDict.setdefault(self.depths[node],[]).append(self.shortNames[node])
+		return generationDict
+	
+	def generationList(self):
+		'''
+		Create a list of all dependency hierarchy nodes in order of generation (topological evaluation order).
+		Nodes within a generation are listed in hierarchy (depth first) order.
+		'''
+		generationDict = self.generationDict()
+		generationList = []
+		for key in sorted(generationDict.keys()): generationList.extend(generationDict[key])
+		return generationList
@@ -7,12 +7,16 @@ import glTools.tools.dependencyHierarchyNode
 class EvaluationOrder( object ):
 	'''
 	This python class object is used to determine a reliable evaluation order for a hierarchy of rig controls.
-	The DependencyHierarchyNode object is first used to map an entire rig hierarchy. Class methods of the
+	The DependencyHierarchyGraph object is first used to map an entire rig hierarchy. Class methods of the
 	EvaluationOrder class is then used to reshuffle the hierarchy based on various rig dependencies.
 	'''
-	def __init__(self,debug=False):
+	def __init__(self,root='',debug=False):
 		'''
 		EvaluationOrder object initializer
+		@param root: Hierarchy root node. If specified, the dependency hierarchy is built on initialization.
+		@type root: str
+		@param debug: Print debug messages
+		@type debug: bool
 		'''
 		# Valid transform type list
 		self.transform = ['transform','joint','ikHandle']
@@ -20,11 +24,14 @@ class EvaluationOrder( object ):
 		self.attribute = 'evalOrder'
 		# Initialize hierarchy root
 		self.root = ''
-		# Initialize dependencyHierarchyNode
-		self.hierarchy = glTools.tools.dependencyHierarchyNode.DependencyHierarchyNode()
+		# Initialize dependency hierarchy graph
+		self.hierarchy = glTools.tools.dependencyHierarchyNode.DependencyHierarchyGraph()
 		
 		# DEBUG
 		self.debug = debug
+		
+		# Build Hierarchy
+		if root: self.buildHierarchy(root)
 	
 	def buildHierarchy(self,root):
 		'''
@@ -48,22 +55,26 @@ class EvaluationOrder( object ):
 		'''
 		Reorganize the evaluation order based on ikHandle/joint relationships.
 		'''
+		hierarchy = self.hierarchy
+		
 		# Iterate through all ikHandles below hierarchy root
-		ikList = mc.listRelatives(self.hierarchy.fullName,ad=True,type='ikHandle')
+		ikList = mc.listRelatives(hierarchy.fullName,ad=True,type='ikHandle') or []
 		for ik in ikList:
-			ikNode = self.hierarchy.findDependNode(ik)
+			ikNode = hierarchy.findDependNode(ik)
 			# Find ikHandle start joint
 			startJoint = mc.listConnections(ik+'.startJoint',s=True,d=False)[0]
-			startJointNode = self.hierarchy.findDependNode(startJoint)
+			startJointNode = hierarchy.findDependNode(startJoint)
+			if ikNode < 0 or startJointNode < 0: continue
 			
 			# Check ikHandle is in a lower generation than the startJoints current parent
-			if startJointNode.parent:
-				if startJointNode.parent.getGeneration() >= ikNode.getGeneration(): continue
+			startJointParent = hierarchy.parents[startJointNode]
+			if startJointParent >= 0:
+				if hierarchy.depths[startJointParent] >= hierarchy.depths[ikNode]: continue
 			
 			# Adjust dependency hierarchy
-			if ikNode.getGeneration() > startJointNode.getGeneration():
+			if hierarchy.depths[ikNode] > hierarchy.depths[startJointNode]:
 				if self.debug: print('Parent '+startJoint+' under ikHandle '+ik)
-				startJointNode.reparent(ikNode)
+				hierarchy.reparent(startJointNode,ikNode)
 			
 		# Print complete message
 		print('EvaluationOrder::ikReorder() completed.')
@@ -74,48 +85,40 @@ class EvaluationOrder( object ):
 		@param constraintList: List of constraints to consider in the reorder.
 		@type constraintList: list
 		'''
+		hierarchy = self.hierarchy
+		
 		# Iterate through all constraints below hierarchy root
 		if not constraintList:
-			constraintList = mc.listRelatives(self.hierarchy.fullName,ad=True,type='constraint')
+			constraintList = mc.listRelatives(hierarchy.fullName,ad=True,type='constraint') or []
 		
-		if self.debug: print constraintList
+		if self.debug: print(constraintList)
 		
 		for constraintNode in constraintList:
 			
-			if self.debug: print constraintNode
-			
-			# Initialize comparison variables
-			lowestNode = None
-			generation = -1
+			if self.debug: print(constraintNode)
 			
 			# Iterate through constraint targets, to find the target at the lowest generation
 			targetList = glTools.utils.constraint.targetList(constraintNode)
-			if self.debug: print 'targetlist = '
-			if self.debug: print targetList
-			for target in targetList:                                             
-				targetNode = self.hierarchy.findDependNode(target)
-				targetGeneration = targetNode.getGeneration()
-				
-				if self.debug: print 'targetGen = '+str(targetGeneration)+' : gen = '+str(generation)
-				
-				if targetGeneration > generation:
-					lowestNode = targetNode
-					generation = targetGeneration
+			if self.debug: print('targetlist = '+str(targetList))
+			
+			targetNodeList = [hierarchy.findDependNode(target) for target in targetList]
+			targetNodeList = [node for node in targetNodeList if node >= 0]
+			if not targetNodeList:
+				if self.debug: print('Lowest node = None')
+				continue
+			lowestNode = max(targetNodeList,key=lambda node: hierarchy.depths[node])
 			
-			if self.debug:
-				if lowestNode: print 'Lowest node = '+lowestNode.shortName
-				else: print 'Lowest node = None'
+			if self.debug: print('Lowest node = '+hierarchy.shortNames[lowestNode])
 			
 			# Move constraint slaves below the lowest generation constraint target
-			if lowestNode:
-				slaveList = glTools.utils.constraint.slaveList(constraintNode)
-				if self.debug: print 'slaveList = '
-				if self.debug: print slaveList
-				for slave in slaveList:
-					slaveNode = self.hierarchy.findDependNode(slave)
-					if lowestNode.getGeneration() > slaveNode.getGeneration():
-						if self.debug: print('Parent '+slave+' under constraint target '+lowestNode.shortName)
-						slaveNode.reparent(lowestNode)
+			slaveList = glTools.utils.constraint.slaveList(constraintNode)
+			if self.debug: print('slaveList = '+str(slaveList))
+			for slave in slaveList:
+				slaveNode = hierarchy.findDependNode(slave)
+				if slaveNode < 0: continue
+				if hierarchy.depths[lowestNode] > hierarchy.depths[slaveNode]:
+					if self.debug: print('Parent '+slave+' under constraint target '+hierarchy.shortNames[lowestNode])
+					hierarchy.reparent(slaveNode,lowestNode)
 			
 		# Print complete message
 		print('EvaluationOrder::constraintReorder() completed.')
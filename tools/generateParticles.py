@@ -1,6 +1,8 @@
 import maya.mel as mm
 import maya.cmds as mc
 
+import glTools.utils.bulkCreate
+
 def locatorParticlesUI():
 	'''
 	'''
@@ -166,20 +168,20 @@ def particleLocators(particle,bakeSimulation=False,rotate=False,scale=False,star
 	count = mc.getAttr(particle+'.count')
 	if not count: raise Exception('Invalid particle count! ('+count+')')
 	
+	# Get particle positions and rotations
+	ptList = [mc.pointPosition(particle+'.pt['+str(i)+']') for i in range(count)]
+	rtList = []
+	if rotate: rtList = [mc.particle(particle,q=True,at='rotatePP',id=i) for i in range(count)]
+	
 	# Create locators
-	partiLocs = [mc.spaceLocator(n=prefix+'_loc'+str(i))[0] for i in range(count)]
 	partiLocsGrp = prefix+'_locGrp'
 	if not mc.objExists(partiLocsGrp): partiLocsGrp = mc.group(em=True,n=partiLocsGrp)
-	mc.parent(partiLocs,partiLocsGrp)
+	nameList = [prefix+'_loc'+str(i) for i in range(count)]
+	partiLocs = glTools.utils.bulkCreate.createLocators(nameList,positionList=ptList,rotationList=rtList,parentList=[partiLocsGrp]*count,worldSpace=False)
 	
-	# For each particle, set locator position
-	for i in range(count):
-		pt = mc.pointPosition(particle+'.pt['+str(i)+']')
-		mc.setAttr(partiLocs[i]+'.t',*pt)
-		if rotate:
-			rt = mc.particle(particle,q=True,at='rotatePP',id=i)
-			mc.setAttr(partiLocs[i]+'.r',*rt)
-		if scale:
+	# For each particle, set locator scale
+	if scale:
+		for i in range(count):
 			sc = mc.particle(particle,q=True,at='scalePP',id=i)
 			mc.setAttr(partiLocs[i]+'.s',*sc)
 	
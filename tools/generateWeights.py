@@ -32,18 +32,14 @@ def gradientWeights(geometry,pnt1,pnt2,smooth=0):
 	pntLen = pntVec.length()
 	
 	# Get points to generate weights from
-	pointList = glTools.utils.base.getMPointArray(geometry)
+	pointList = glTools.utils.base.getPointArray(geometry)
 	
 	# Build weight array
-	wtList = []
-	for i in range(pointList.length()):
-		offsetVec = pointList[i] - pnt1
-		wt = ((pntVecNorm*offsetVec)/pntLen)
-		if wt < 0.0: wt = 0.0
-		if wt > 1.0: wt = 1.0
-		for i in range(int(smooth)):
-			wt = glTools.utils.mathUtils.smoothStep(wt)
-		wtList.append(wt)
+	vx,vy,vz = pntVecNorm.x/pntLen,pntVecNorm.y/pntLen,pntVecNorm.z/pntLen
+	px,py,pz = pnt1.x,pnt1.y,pnt1.z
+	wtList = [(pt[0]-px)*vx + (pt[1]-py)*vy + (pt[2]-pz)*vz for pt in pointList]
+	wtList = [min(max(wt,0.0),1.0) for wt in wtList]
+	wtList = glTools.utils.mathUtils.smoothStepArray(wtList,iterations=smooth)
 	
 	# Return result
 	return wtList
@@ -98,26 +94,16 @@ def radialWeights(geometry,center,radius,innerRadius=0.0,smooth=0):
 	pnt = glTools.utils.base.getMPoint(center)
 	
 	# Get points to generate weights from
-	pointList = glTools.utils.base.getMPointArray(geometry)
+	pointList = glTools.utils.base.getPointArray(geometry)
 	
-	# Build weight array
-	wtList = []
-	for i in range(pointList.length()):
-		
-		# Initialize zero weight value
-		wt = 0.0
-		
-		# Calculate distance to radial center
-		dist = (pnt-pointList[i]).length()
-		
-		# Generate weight value
-		if dist < radius:
-			wt = (radius-innerRadius-dist)/(radius-innerRadius)
-			for i in range(int(smooth)):
-				wt = glTools.utils.mathUtils.smoothStep(wt)
-		
-		# Append weight value to weight list
-		wtList.append(wt)
+	# Calculate distance to radial center
+	distList = glTools.utils.mathUtils.distanceArray(pointList,(pnt.x,pnt.y,pnt.z))
+	
+	# Build weight array (zero weight outside radius)
+	wtList = [(radius-innerRadius-dist)/(radius-innerRadius) if dist < radius else 0.0 for dist in distList]
+	
+	# Smooth weights (zero weight is unchanged by smoothStep)
+	wtList = glTools.utils.mathUtils.smoothStepArray(wtList,iterations=smooth)
 	
 	# Return result
 	return wtList
@@ -226,7 +212,6 @@ def geometryVolumeWeights(geometry,volumeCenter,volumeBoundary,volumeCenterCurve
 			if offsetDist > intBoundaryDist:
 				if offsetDist < boundaryDist:
 					wt = 1.0 - (offsetDist - intBoundaryDist)/(boundaryDist - intBoundaryDist)
-					for n in range(int(smoothValue)): wt = glTools.utils.mathUtils.smoothStep(wt)
 				else:
 					wt = 0.0
 			
@@ -238,6 +223,9 @@ def geometryVolumeWeights(geometry,volumeCenter,volumeBoundary,volumeCenterCurve
 			# Point is outside volume bounding box. Append zero weight
 			wtList.append(0.0)
 	
+	# Smooth weights (zero and full weights are unchanged by smoothStep)
+	wtList = glTools.utils.mathUtils.smoothStepArray(wtList,iterations=smoothValue)
+	
 	# Return result
 	return wtList
 
@@ -291,7 +279,6 @@ def curveProximityWeights(geometry,curve,maxDistance,minDistance=0.0,smoothValue
 			elif dist > maxDistance: wt = 0.0
 			else:
 				wt = 1.0 - (dist - minDistance)/(maxDistance - minDistance)
-				for n in range(int(smoothValue)): wt = glTools.utils.mathUtils.smoothStep(wt)
 			
 			# Append to weight list
 			wtList.append(wt)
@@ -300,7 +287,10 @@ def curveProximityWeights(geometry,curve,maxDistance,minDistance=0.0,smoothValue
 			
 			# Point is outside volume bounding box. Append zero weight
 			wtList.append(0.0)
-			
+	
+	# Smooth weights (zero and full weights are unchanged by smoothStep)
+	wtList = glTools.utils.mathUtils.smoothStepArray(wtList,iterations=smoothValue)
+	
 	# Return result
 	return wtList
 
@@ -338,30 +328,31 @@ def meshOffsetWeights(baseMesh,targetMesh,normalizeWeights=False,normalRayInters
 	# Get base normal array
 	normalArray = glTools.utils.mesh.getNormals(baseMesh,worldSpace=False)
 	
+	# Cast normal rays (Single Batch)
+	if normalRayIntersect:
+		hitPtList = glTools.utils.mesh.intersectPoints(targetMesh,basePtList,normalArray,True)
+	
 	# Build offset list
-	maxDist = 0.0
 	distArray = []
 	for i in range(basePtLen):
 		
 		# Determine target distance
 		if normalRayIntersect:
-			targetPt = glTools.utils.mesh.intersect(targetMesh,basePtList[i],normalArray[i],True)
-			targetPt = glTools.utils.base.getMPoint(targetPt)
+			targetPt = OpenMaya.MPoint(*(hitPtList[i] or (0,0,0)))
 			dist = OpenMaya.MVector(normalArray[i]) * (targetPt - basePtList[i])
 		else:
 			offset = targetPtList[i] - basePtList[i]
 			dist = OpenMaya.MVector(normalArray[i]) * offset
 		
-		# Smooth
-		if normalizeWeights and smoothValue:
-			for n in range(int(smoothValue)):
-				dist = glTools.utils.mathUtils.smoothStep(dist)
-		
 		# Append to target distance array
 		distArray.append(dist)
-		
-		# Check maxDistance
-		if abs(dist) > maxDist: maxDist = abs(dist)
+	
+	# Smooth
+	if normalizeWeights and smoothValue:
+		distArray = glTools.utils.mathUtils.smoothStepArray(distArray,iterations=smoothValue)
+	
+	# Check maxDistance
+	maxDist = max([abs(dist) for dist in distArray] or [0.0])
 	
 	# Normalize distance array
 	if normalizeWeights:
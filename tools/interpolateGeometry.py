@@ -1,52 +1,326 @@
 import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
 
+import glTools.utils.apiUndo
+import glTools.utils.mesh
+import glTools.utils.stringUtils
+
+import os
+import gzip
 import random
+import itertools
+
+# ===========
+# - Weights -
+# ===========
+
+def randomWeights(numSources,numVariants,seed=None):
+	'''
+	Generate a list of random convex blend weights (positive, normalized to sum to 1.0) for each variant.
+	Results are reproducible for a given seed.
+	@param numSources: Number of source geometries (weights per variant)
+	@type numSources: int
+	@param numVariants: Number of variants to generate weights for
+	@type numVariants: int
+	@param seed: Random seed. If None, the weights are not reproducible.
+	@type seed: int or None
+	'''
+	rand = random.Random(seed)
+	weightList = []
+	for i in xrange(numVariants):
+		wt = [rand.random() for n in xrange(numSources)]
+		wtTotal = sum(wt) or 1.0
+		weightList.append([w/wtTotal for w in wt])
+	return weightList
+
+# ==========
+# - Points -
+# ==========
+
+def getPointMatrix(geoList):
+	'''
+	Read the (object space) points of each source mesh into a stacked point matrix.
+	Returns a list containing a flat [x,y,z,x,y,z,...] point list per source mesh.
+	@param geoList: List of source meshes. All meshes must have the same vertex count.
+	@type geoList: list
+	'''
+	# Check Source Geometry
+	if not geoList: raise Exception('No source geometry specified!')
+	for geo in geoList:
+		if not glTools.utils.mesh.isMesh(geo): raise Exception('Object "'+geo+'" is not a valid mesh!')
+
+	# Get Source Points
+	pointMatrix = []
+	numVerts = None
+	for geo in geoList:
+		meshFn = glTools.utils.mesh.getMeshFn(geo)
+		ptArray = OpenMaya.MPointArray()
+		meshFn.getPoints(ptArray,OpenMaya.MSpace.kObject)
+		if numVerts == None: numVerts = ptArray.length()
+		elif ptArray.length() != numVerts:
+			raise Exception('Mesh "'+geo+'" vertex count ('+str(ptArray.length())+') does not match "'+geoList[0]+'" ('+str(numVerts)+')!')
+		pointMatrix.append([v for i in xrange(numVerts) for v in (ptArray[i].x,ptArray[i].y,ptArray[i].z)])
+
+	# Return Result
+	return pointMatrix
+
+def interpolatePoints(pointMatrix,weightList):
+	'''
+	Compute the weighted (convex) combination of the source points for each variant (weightList x pointMatrix).
+	Variants are generated lazily, one flat point list at a time, so results can be streamed.
+	@param pointMatrix: Stacked source point matrix, as returned by getPointMatrix()
+	@type pointMatrix: list
+	@param weightList: List of per source blend weights for each variant
+	@type weightList: list
+	'''
+	numSources = len(pointMatrix)
+	for weights in weightList:
+		if len(weights) != numSources:
+			raise Exception('Weight count ('+str(len(weights))+') does not match the source count ('+str(numSources)+')!')
+
+		# Accumulate Weighted Source Points
+		w = weights[0]
+		row = [w*v for v in pointMatrix[0]]
+		for n in xrange(1,numSources):
+			w = weights[n]
+			if not w: continue
+			row = [a+w*b for a,b in itertools.izip(row,pointMatrix[n])]
+
+		yield row
+
+# ==========
+# - Output -
+# ==========
+
+def buildVariantMeshes(baseMesh,pointRows,nameList):
+	'''
+	Build a new mesh for each variant point list, from the topology and UVs of the base mesh.
+	Meshes are created directly (MFnMesh.create), with no construction history or deformers.
+	The whole build is a single undoable operation (see glTools.utils.apiUndo).
+	@param baseMesh: Mesh to copy topology, UVs and transform from
+	@type baseMesh: str
+	@param pointRows: Iterable of flat [x,y,z,...] point lists, one per variant
+	@type pointRows: list or generator
+	@param nameList: List of variant mesh names
+	@type nameList: list
+	'''
+	# ================
+	# - Get Topology -
+	# ================
+
+	meshFn = glTools.utils.mesh.getMeshFn(baseMesh)
+	numVertices = meshFn.numVertices()
+	numPolygons = meshFn.numPolygons()
+	polygonCounts = OpenMaya.MIntArray()
+	polygonConnects = OpenMaya.MIntArray()
+	meshFn.getVertices(polygonCounts,polygonConnects)
+
+	# Get UVs
+	uArray = OpenMaya.MFloatArray()
+	vArray = OpenMaya.MFloatArray()
+	uvCounts = OpenMaya.MIntArray()
+	uvIds = OpenMaya.MIntArray()
+	meshFn.getUVs(uArray,vArray)
+	meshFn.getAssignedUVs(uvCounts,uvIds)
+
+	# Get Base Transform
+	baseTransform = baseMesh
+	if mc.objectType(baseMesh) == 'mesh': baseTransform = mc.listRelatives(baseMesh,p=True,pa=True)[0]
+	baseMatrix = mc.xform(baseTransform,q=True,ws=True,m=True)
+
+	# ================
+	# - Build Meshes -
+	# ================
+
+	mc.undoInfo(openChunk=True)
+	try:
+		meshList = []
+		shapeList = []
+		for row,name in itertools.izip(pointRows,nameList):
+
+			# Build Vertex Array
+			vertexArray = OpenMaya.MFloatPointArray(numVertices,OpenMaya.MFloatPoint.origin)
+			for i in xrange(numVertices): vertexArray.set(i,row[i*3],row[i*3+1],row[i*3+2],1.0)
+
+			# Build Mesh Data
+			meshData = OpenMaya.MFnMeshData().create()
+			variantFn = OpenMaya.MFnMesh()
+			variantFn.create(	numVertices,
+								numPolygons,
+								vertexArray,
+								polygonCounts,
+								polygonConnects,
+								uArray,
+								vArray,
+								meshData	)
+			if uvIds.length(): variantFn.assignUVs(uvCounts,uvIds)
+
+			with glTools.utils.apiUndo.ApiUndo() as undo:
+
+				# Create Mesh Nodes
+				dagMod = undo.dagModifier()
+				meshObj = dagMod.createNode('transform')
+				dagMod.renameNode(meshObj,name)
+				shapeObj = dagMod.createNode('mesh',meshObj)
+				dagMod.renameNode(shapeObj,name+'Shape')
+				dagMod.doIt()
+
+				# Set Mesh Geometry (Undo deletes the nodes, so the geometry only needs to be reapplied on redo)
+				setGeometry = _copyMeshFn(shapeObj,meshData)
+				setGeometry()
+				undo.callback(lambda: None,setGeometry)
+
+			meshList.append(OpenMaya.MFnDagNode(meshObj).partialPathName())
+			shapeList.append(OpenMaya.MFnDagNode(shapeObj).partialPathName())
+
+		# Match Base Transform
+		for mesh in meshList: mc.xform(mesh,ws=True,m=baseMatrix)
+
+		# Assign Initial Shading Group
+		if shapeList: mc.sets(shapeList,fe='initialShadingGroup')
+	finally:
+		mc.undoInfo(closeChunk=True)
+
+	# Return Result
+	return meshList
+
+def _copyMeshFn(shapeObj,meshData):
+	'''
+	Return a function that copies the specified mesh data to a mesh shape. Used to reapply variant geometry on redo.
+	'''
+	def copyMesh(): OpenMaya.MFnMesh(shapeObj).copyInPlace(meshData)
+	return copyMesh
+
+def writeVariantCache(baseMesh,pointRows,path,name,pad=4,gz=False):
+	'''
+	Write a .geo point cache file per variant point list, using the topology of the base mesh.
+	Variants are written as they are generated, so pointRows can be a generator (see interpolatePoints()).
+	Returns the list of written file paths.
+	@param baseMesh: Mesh to copy topology from
+	@type baseMesh: str
+	@param pointRows: Iterable of flat [x,y,z,...] point lists, one per variant
+	@type pointRows: list or generator
+	@param path: Destination directory path for the cache files.
+	@type path: str
+	@param name: Cache file output name.
+	@type name: str
+	@param pad: Variant number padding for file name.
+	@type pad: int
+	@param gz: Gzip the cache files
+	@type gz: bool
+	'''
+	# Check path
+	if not os.path.isdir(path): os.makedirs(path)
+
+	# ================
+	# - Get Topology -
+	# ================
+
+	meshFn = glTools.utils.mesh.getMeshFn(baseMesh)
+	numVerts = meshFn.numVertices()
+	numFaces = meshFn.numPolygons()
+	polygonCounts = OpenMaya.MIntArray()
+	polygonConnects = OpenMaya.MIntArray()
+	meshFn.getVertices(polygonCounts,polygonConnects)
+
+	# Build Face Data (shared by all variants)
+	faceData = ['Run '+str(numFaces)+' Poly\n']
+	offset = 0
+	for count in polygonCounts:
+		vtxArray = [str(polygonConnects[offset+i]) for i in xrange(count)]
+		vtxArray.reverse()
+		faceData.append(' '+str(count)+' < '+' '.join(vtxArray)+'\n')
+		offset += count
+	faceData.append('beginExtra\n')
+	faceData.append('endExtra\n')
+	faceData = ''.join(faceData)
+
+	# Header
+	header = 'PGEOMETRY V5\n'
+	header += 'NPoints '+str(numVerts)+' NPrims '+str(numFaces)+'\n'
+	header += 'NPointGroups 0 NPrimGroups 0\n'
+	header += 'NPointAttrib 0 NVertexAttrib 0 NPrimAttrib 0 NAttrib 0\n'
+
+	# ==================
+	# - Write Variants -
+	# ==================
+
+	fileList = []
+	for v,row in enumerate(pointRows):
+
+		# Open file for writing
+		filename = path+'/'+name+'.'+glTools.utils.stringUtils.stringIndex(v+1,pad)+'.geo'
+		if gz:
+			filename += '.gz'
+			FILE = gzip.open(filename,'wb')
+		else:
+			FILE = open(filename,'w')
+
+		# Write Points
+		FILE.write(header)
+		FILE.write(''.join([str(row[i*3])+' '+str(row[i*3+1])+' '+str(row[i*3+2])+' 1\n' for i in xrange(numVerts)]))
+
+		# Write Faces
+		FILE.write(faceData)
+
+		# Close File
+		FILE.close()
+		fileList.append(filename)
+
+	# Print result
+	print('Wrote '+str(len(fileList))+' variant cache files to "'+path+'"')
+
+	# Return Result
+	return fileList
+
+# ========================
+# - Interpolate Geometry -
+# ========================
+
+def interpolateGeometry(geoList,numGeo,prefix='interpGeo',seed=None):
+	'''
+	Generate a number of random (convex) interpolations of a list of source meshes.
+	Variants are built as new meshes, with no blendShape or other deformer nodes.
+	@param geoList: List of source meshes. All meshes must have the same topology.
+	@type geoList: list
+	@param numGeo: Number of variants to generate
+	@type numGeo: int
+	@param prefix: Name prefix for the variant meshes
+	@type prefix: str
+	@param seed: Random seed. If None, the variants are not reproducible.
+	@type seed: int or None
+	'''
+	# Generate Variant Points
+	pointMatrix = getPointMatrix(geoList)
+	weightList = randomWeights(len(geoList),numGeo,seed)
+	pointRows = interpolatePoints(pointMatrix,weightList)
+
+	# Build Variant Meshes
+	nameList = [prefix+str(i+1) for i in xrange(numGeo)]
+	dupGeoList = buildVariantMeshes(geoList[0],pointRows,nameList)
 
-def interpolateGeometry(geoList,numGeo,prefix='interpGeo'):
-	'''
-	'''
-	# Initialize outoput list
-	dupGeoList = []
-	
-	# Generate base Geo
-	baseGeo = mc.duplicate(geoList[0],n=prefix+'_baseGeo')[0]
-	baseTargetList = geoList[1:]
-	baseBlendShape = mc.blendShape(baseTargetList,baseGeo)[0]
-	baseBlendAlias = mc.listAttr(baseBlendShape+'.w',m=True)
-	baseBlendCount = len(baseBlendAlias)
-	baseBlendWeight = 1.0/baseBlendCount
-	for i in range(baseBlendCount): mc.setAttr(baseBlendShape+'.'+baseBlendAlias[i],baseBlendWeight)
-	
-	# Generate interpolated geometry
-	for i in range(numGeo):
-		
-		# Duplicate Geo as blended
-		intGeo = mc.duplicate(baseGeo,n=prefix+'#')[0]
-		mc.parent(intGeo,w=True)
-		
-		# Blend to source geometry
-		intBlendShape = mc.blendShape(geoList,intGeo)[0]
-		intBlendAlias = mc.listAttr(intBlendShape+'.w',m=True)
-		intBlendCount = len(intBlendAlias)
-		
-		# Generate blend weights
-		wt = []
-		wtTotal = 0.0
-		for i in range(intBlendCount):
-			wt.append(random.random())
-			wtTotal += wt[-1]
-		for i in range(len(wt)):
-			wt[i] /= wtTotal
-		
-		# Assign blend weights
-		for i in range(intBlendCount):
-			mc.setAttr(intBlendShape+'.'+intBlendAlias[i],wt[i])
-		
-		# Append output list
-		dupGeoList.append(intGeo)
-	
-	# Delete base Geo
-	mc.delete(baseGeo)
-	
 	# Return result
 	return dupGeoList
+
+def interpolateGeometryCache(geoList,numGeo,path,name='interpGeo',seed=None,pad=4,gz=False):
+	'''
+	Generate a number of random (convex) interpolations of a list of source meshes, and write them
+	to a .geo point cache file per variant. No scene nodes are created.
+	@param geoList: List of source meshes. All meshes must have the same topology.
+	@type geoList: list
+	@param numGeo: Number of variants to generate
+	@type numGeo: int
+	@param path: Destination directory path for the cache files.
+	@type path: str
+	@param name: Cache file output name.
+	@type name: str
+	@param seed: Random seed. If None, the variants are not reproducible.
+	@type seed: int or None
+	@param pad: Variant number padding for file name.
+	@type pad: int
+	@param gz: Gzip the cache files
+	@type gz: bool
+	'''
+	pointMatrix = getPointMatrix(geoList)
+	weightList = randomWeights(len(geoList),numGeo,seed)
+	return writeVariantCache(geoList[0],interpolatePoints(pointMatrix,weightList),path,name,pad,gz)
@@ -45,11 +45,10 @@ def buildPointWeights(	points,
 
 	cmd = ''
 	ptWts = {}
-	for i, pt in enumerate(points):
-		
-		ptPos = glTools.utils.base.getPosition(pt)
-		wt, influenceID = calcPointWeights(ptPos,influencePts,maxInfluences)
-		ptWts[pt] = [influenceID, wt]
+	ptPosList = [glTools.utils.base.getPosition(pt) for pt in points]
+	wtList = calcPointWeightsArray(ptPosList,influencePts,maxInfluences)
+	for pt, wt in zip(points,wtList):
+		ptWts[pt] = [_closestInfluenceIDs(wt,maxInfluences), wt]
 		
 	cmd += buildSkinPercentCmd(pt, influenceList, wt, skinCluster, ptWts)
 		
@@ -82,21 +81,43 @@ def calcPointWeights(	pos,
 	# Get Point Position
 	pt = glTools.utils.base.getPosition(pos)
 	
-	# Sort By Distance
-	dist = [glTools.utils.mathUtils.distanceBetween(pt,i) for i in influencePts]
-	distSorted = sorted(dist)
-	closestID = [dist.index(distSorted[i]) for i in range(maxInfluences)]
-	
 	# Calculate Inverse Distance Weight
-	ptArray = [influencePts[i] for i in closestID]
-	wt = glTools.utils.mathUtils.inverseDistanceWeight3D(ptArray,pt)
-	if smoothInterp:
-		wt = [ glTools.utils.mathUtils.smoothStep(x) for x in wt ]
-	infWt = [wt[closestID.index(i)] if i in closestID else 0.0 for i in range(len(influencePts))]
+	infWt = calcPointWeightsArray([pt],influencePts,maxInfluences,smoothInterp)[0]
 	
+	# Return Result
+	return infWt, _closestInfluenceIDs(infWt,maxInfluences)
+
+def calcPointWeightsArray(	posList,
+							influencePts,
+							maxInfluences,
+							smoothInterp	= True ):
+	'''
+	Calculate inverse distance weights for a list of point positions.
+	Returns a list of per influence weights for each point.
+	@param posList: List of point positions to calculate weights for
+	@type posList: list
+	@param influencePts: List of influence points to calculate weights from
+	@type influencePts: list
+	@param maxInfluences: Maximum number of influences per point
+	@type maxInfluences: int
+	@param smoothInterp: Smooth interpolation of weights.
+	@type smoothInterp: bool
+	'''
+	# Calculate Inverse Distance Weights (closest influences only)
+	wtList = glTools.utils.mathUtils.inverseDistanceWeight3DArray(influencePts,posList,maxPoints=maxInfluences)
+	
+	# Smooth Weights
+	if smoothInterp:
+		wtList = [glTools.utils.mathUtils.smoothStepArray(wt) for wt in wtList]
 	
 	# Return Result
-	return infWt, closestID
+	return wtList
+
+def _closestInfluenceIDs(wt,maxInfluences):
+	'''
+	Return the indices of the closest (highest weighted) influences, sorted by distance.
+	'''
+	return sorted(range(len(wt)),key=lambda i: -wt[i])[:maxInfluences]
 
 def buildSkinPercentCmd(	pt,
 							influenceList,
@@ -1,37 +1,36 @@
 import maya.cmds as mc
 
 import glTools.utils.base
+import glTools.utils.bulkCreate
 import glTools.utils.stringUtils
 
 class UIError(Exception): pass
 
 def jointPerVertex(ptList,orientSurface='',prefix='',suffix='jnt'):
 	'''
+	Create a joint at each point in a list. All joints are created in a single batch (see glTools.utils.bulkCreate).
+	@param ptList: List of points (vertices, transforms or positions) to create joints at
+	@type ptList: list
+	@param orientSurface: Optional surface to orient the joints to. The joint X axis is aimed along the closest surface normal.
+	@type orientSurface: str
+	@param prefix: Name prefix for the created joints
+	@type prefix: str
+	@param suffix: Name suffix for the created joints
+	@type suffix: str
 	'''
 	# Generate position list from input point
 	posList = []
 	for pt in ptList: posList.append(glTools.utils.base.getPosition(pt))
 	
+	# Get joint names
+	nameList = [prefix+'_'+glTools.utils.stringUtils.stringIndex(i+1,2)+'_'+suffix for i in range(len(posList))]
+	
+	# Get joint orientation (closest surface normals)
+	rotList = []
+	if mc.objExists(orientSurface): rotList = glTools.utils.bulkCreate.surfaceNormalRotations(orientSurface,posList)
+	
 	# Create joints
-	jntList = []
-	for i in range(len(posList)):
-		
-		# Clear selection
-		mc.select(cl=1)
-		
-		# Get string index
-		strInd = glTools.utils.stringUtils.stringIndex(i+1,2)
-		
-		# Create joint
-		jnt = mc.joint(n=prefix+'_'+strInd+'_'+suffix)
-		# Position joint
-		mc.move(posList[i][0],posList[i][1],posList[i][2],jnt,ws=True,a=True)
-		
-		# Orient joint
-		if mc.objExists(orientSurface): mc.delete(mc.normalConstraint(orientSurface,jnt))
-		
-		# Append return list
-		jntList.append(jnt)
+	jntList = glTools.utils.bulkCreate.createJoints(nameList,positionList=posList,rotationList=rotList)
 	
 	# Return Result
 	return  jntList
@@ -1,6 +1,9 @@
 import maya.cmds as mc
 import maya.OpenMaya as OpenMaya
+import maya.OpenMayaAnim as OpenMayaAnim
 
+import glTools.utils.animCurve
+import glTools.utils.base
 import glTools.utils.mathUtils
 import glTools.utils.namespace
 import glTools.utils.transform
@@ -98,6 +101,11 @@ class Match( object ):
 		
 		# Maya Window Elements
 		self.channelBox = 'mainChannelBox'
+		
+		# Batch twin cache
+		self.twinTable = {}
+		self.twinNodeTable = {}
+		self.numericAttrTypes = ['bool','enum','byte','short','long','float','double','doubleLinear','doubleAngle']
 	
 	# =========
 	# - SETUP -
@@ -640,13 +648,500 @@ class Match( object ):
 		#			try: mc.setAttr(slave+'.'+attr,customAttrVals[attr])
 		#			except: pass
 	
+	# =========
+	# - BATCH -
+	# =========
+	
+	def getTwinNodeInfo(self,node):
+		'''
+		Return (cached) transform information for the specified node, as used by the batch twin methods.
+		@param node: The transform to get information for
+		@type node: str
+		'''
+		# Check Cache
+		if self.twinNodeTable.has_key(node): return self.twinNodeTable[node]
+		
+		# Check Node
+		if not mc.objExists(node):
+			raise Exception('Object "'+node+'" does not exist!')
+		
+		# Get Node Info
+		dagPath = glTools.utils.base.getMDagPath(node)
+		nodeFn = OpenMaya.MFnDependencyNode(dagPath.node())
+		parent = mc.listRelatives(node,p=True,f=True)
+		info = {}
+		info['path'] = dagPath
+		info['parent'] = parent and str(parent[0]) or None
+		info['rotateOrder'] = mc.getAttr(node+'.ro')
+		info['transformation'] = OpenMaya.MFnTransform(dagPath).transformation()
+		info['plugs'] = [nodeFn.findPlug(attr) for attr in self.xform]
+		info['jointOrient'] = None
+		if mc.objectType(node) == 'joint':
+			jointOrient = mc.getAttr(node+'.jointOrient')[0]
+			jointOrient = [jointOrient[i]/self.radian for i in range(3)]
+			info['jointOrient'] = OpenMaya.MEulerRotation(jointOrient[0],jointOrient[1],jointOrient[2],0).asMatrix()
+		
+		# Return Result
+		self.twinNodeTable[node] = info
+		return info
+	
+	def buildTwinTable(self,masterList,refresh=False):
+		'''
+		Resolve twin pair information for a list of master controls.
+		The twin, pivot, mirror axis, match mode, twinX/Y/Z and rotate order values, as well as the slave channel
+		settable states and the custom attribute list, are queried once per master and cached on the Match object.
+		Masters without a twin attribute are skipped.
+		@param masterList: List of master controls to resolve twin pair information for
+		@type masterList: list
+		@param refresh: Clear the cached twin pair information and query the scene again
+		@type refresh: bool
+		'''
+		# Check Refresh
+		if refresh:
+			self.twinTable = {}
+			self.twinNodeTable = {}
+		
+		twinTable = []
+		for master in masterList:
+			
+			# Check Cache
+			if self.twinTable.has_key(master):
+				twinTable.append(self.twinTable[master])
+				continue
+			
+			# ==========
+			# - Checks -
+			# ==========
+			
+			if not mc.objExists(master): raise Exception('Master object '+master+' does not exists!')
+			if not mc.objExists(master+'.'+self.twinAttr): continue
+			
+			skip = False
+			for attr in [self.pivotAttr,self.axisAttr,self.modeAttr]:
+				if not mc.attributeQuery(attr,n=master,ex=True):
+					print('Object "'+master+'" has no "'+attr+'" attribute! Unable to twin transform...')
+					skip = True
+			if skip: continue
+			
+			slave = str(mc.getAttr(master+'.'+self.twinAttr))
+			pivot = str(mc.getAttr(master+'.'+self.pivotAttr))
+			
+			# Check namespace
+			if master.count(':'):
+				ns = master.split(':')[0]+':'
+				if not slave.startswith(ns): slave = ns+slave
+				if not pivot.startswith(ns): pivot = ns+pivot
+			
+			if not mc.objExists(slave): raise Exception('Slave object '+slave+' does not exists!')
+			if not mc.objExists(pivot): raise Exception('Pivot object '+pivot+' does not exists!')
+			
+			# =================
+			# - Get Twin Info -
+			# =================
+			
+			mirrorAxis = mc.getAttr(master+'.'+self.axisAttr)
+			if isinstance(mirrorAxis,basestring): mirrorAxis = self.axisIndex[mirrorAxis]
+			
+			entry = {}
+			entry['master'] = str(mc.ls(master,l=True)[0])
+			entry['slave'] = str(mc.ls(slave,l=True)[0])
+			entry['pivot'] = str(mc.ls(pivot,l=True)[0])
+			entry['mirrorAxis'] = mirrorAxis % 3
+			entry['mirrorMode'] = mc.getAttr(master+'.'+self.modeAttr)
+			entry['twinX'] = mc.getAttr(slave+'.'+self.twinXAttr)
+			entry['twinY'] = mc.getAttr(slave+'.'+self.twinYAttr)
+			entry['twinZ'] = mc.getAttr(slave+'.'+self.twinZAttr)
+			entry['settable'] = [mc.getAttr(slave+'.'+attr,se=True) for attr in self.xform]
+			
+			# Custom Attributes
+			entry['customAttrs'] = []
+			masterFn = OpenMaya.MFnDependencyNode(glTools.utils.base.getMObject(master))
+			slaveFn = OpenMaya.MFnDependencyNode(glTools.utils.base.getMObject(slave))
+			for attr in mc.listAttr(master,keyable=True,userDefined=True) or []:
+				twinAttr = attr
+				if master == slave:
+					if attr.startswith('lf'): twinAttr = attr.replace('lf','rt')
+					if attr.startswith('rt'): twinAttr = attr.replace('rt','lf')
+				if not mc.objExists(slave+'.'+twinAttr): continue
+				if not mc.getAttr(slave+'.'+twinAttr,se=True): continue
+				attrType = mc.getAttr(master+'.'+attr,type=True)
+				if not self.numericAttrTypes.count(attrType): continue
+				entry['customAttrs'].append([attr,twinAttr,attrType,masterFn.findPlug(attr),slaveFn.findPlug(twinAttr)])
+			
+			# Cache Node Info
+			for node in [entry['master'],entry['slave'],entry['pivot']]:
+				while node:
+					node = self.getTwinNodeInfo(node)['parent']
+			
+			# Append Result
+			self.twinTable[master] = entry
+			twinTable.append(entry)
+		
+		# Return Result
+		return twinTable
+	
+	def sampleTwinTable(self,twinTable):
+		'''
+		Sample the current world matrices and channel values of all nodes referenced by the twin table in a single pass.
+		Matrices and values are read directly from the cached dag paths and plugs.
+		Returns a tuple of (matrixMap,valueMap,customMap) dictionaries keyed by node name.
+		@param twinTable: Twin pair table (see buildTwinTable())
+		@type twinTable: list
+		'''
+		matrixMap = {}
+		valueMap = {}
+		customMap = {}
+		
+		for entry in twinTable:
+			
+			# Sample Matrices
+			for node in [entry['master'],entry['slave'],entry['pivot']]:
+				while node and not matrixMap.has_key(node):
+					info = self.getTwinNodeInfo(node)
+					matrixMap[node] = info['path'].inclusiveMatrix()
+					node = info['parent']
+			
+			# Sample Channel Values
+			for node in [entry['master'],entry['slave']]:
+				if valueMap.has_key(node): continue
+				values = [plug.asDouble() for plug in self.getTwinNodeInfo(node)['plugs']]
+				valueMap[node] = values[0:3] + [(val*self.radian) for val in values[3:6]] + values[6:9]
+			
+			# Sample Custom Attributes
+			customMap[entry['master']] = [attr[3].asDouble() for attr in entry['customAttrs']]
+		
+		# Return Result
+		return (matrixMap,valueMap,customMap)
+	
+	def twinTableValues(self,twinTable,matrixMap,valueMap,xformList=[1,1,1,1,1,1,1,1,1]):
+		'''
+		Calculate twin transform values for all pairs in the twin table from sampled matrix and channel data.
+		Pairs are processed in twin table order. Where a slave parent or pivot is itself posed by the batch,
+		its updated world matrix is used, matching the result of a sequential twin in order of evaluation.
+		Returns a dictionary of slave:[tx,ty,tz,rx,ry,rz,sx,sy,sz] values.
+		@param twinTable: Twin pair table (see buildTwinTable())
+		@type twinTable: list
+		@param matrixMap: Sampled world matrices (see sampleTwinTable())
+		@type matrixMap: dict
+		@param valueMap: Sampled channel values (see sampleTwinTable())
+		@type valueMap: dict
+		@param xformList: List of 9 boolean elements. Each element specifies if a particular transform attribute will be affected by the twin operation.
+		@type xformList: list
+		'''
+		slaveTable = dict([(entry['slave'],entry) for entry in twinTable])
+		resultMap = {}
+		worldMap = {}
+		pending = []
+		
+		def worldMatrix(node):
+			'''
+			Return the world matrix of the specified node with the current twin results applied.
+			'''
+			if not node: return OpenMaya.MMatrix()
+			if worldMap.has_key(node): return worldMap[node]
+			
+			info = self.getTwinNodeInfo(node)
+			parent = info['parent']
+			
+			if slaveTable.has_key(node) and not pending.count(node):
+				local = self.twinLocalMatrix(node,twinValues(slaveTable[node]))
+			elif parent:
+				local = matrixMap[node] * matrixMap[parent].inverse()
+			else:
+				local = matrixMap[node]
+			
+			if parent: worldMap[node] = local * worldMatrix(parent)
+			else: worldMap[node] = local
+			return worldMap[node]
+		
+		def twinValues(entry):
+			'''
+			Calculate the twin transform values for the specified twin table entry.
+			'''
+			slave = entry['slave']
+			if resultMap.has_key(slave): return resultMap[slave]
+			pending.append(slave)
+			
+			master = entry['master']
+			pivot = entry['pivot']
+			mirrorAxis = entry['mirrorAxis']
+			mirrorMode = entry['mirrorMode']
+			twinX = entry['twinX']
+			twinY = entry['twinY']
+			twinZ = entry['twinZ']
+			slaveInfo = self.getTwinNodeInfo(slave)
+			
+			# Get Master Transform channel values
+			masterValues = valueMap[master]
+			pos = masterValues[0:3]
+			rot = masterValues[3:6]
+			scl = masterValues[6:9]
+			
+			if mirrorMode == 0: # WORLD Match
+				
+				# Axis Mirror Matrix
+				mirrorMatrix = OpenMaya.MMatrix()
+				OpenMaya.MScriptUtil.setDoubleArray(mirrorMatrix[mirrorAxis],mirrorAxis,-1.0)
+				
+				# Translate #===============
+				if xformList[0] or xformList[1] or xformList[2]:
+					
+					# Check Self Pivot
+					if master == pivot: pos[mirrorAxis] *= -1
+					else:
+						masterParent = self.getTwinNodeInfo(master)['parent']
+						pivotMatrix = worldMatrix(pivot)
+						pointMatrix = pivotMatrix.inverse() * mirrorMatrix * pivotMatrix
+						if masterParent: pointMatrix = matrixMap[masterParent] * pointMatrix
+						if slaveInfo['parent']: pointMatrix = pointMatrix * worldMatrix(slaveInfo['parent']).inverse()
+						point = OpenMaya.MPoint(pos[0],pos[1],pos[2],1.0) * pointMatrix
+						pos = [point.x,point.y,point.z]
+				
+				# Rotate #===============
+				if xformList[3] or xformList[4] or xformList[5] or xformList[6] or xformList[7] or xformList[8]:
+					
+					# Check Self Pivot
+					if master == pivot: pivotMatrix = worldMatrix(self.getTwinNodeInfo(pivot)['parent'])
+					else: pivotMatrix = worldMatrix(pivot)
+					
+					# Build basis vectors
+					vectorMatrix = matrixMap[master] * pivotMatrix.inverse() * mirrorMatrix * pivotMatrix
+					if slaveInfo['parent']: vectorMatrix = vectorMatrix * worldMatrix(slaveInfo['parent']).inverse()
+					if slaveInfo['jointOrient']: vectorMatrix = vectorMatrix * slaveInfo['jointOrient'].inverse()
+					twinAxis = [[vectorMatrix(i,j) for j in range(3)] for i in range(3)]
+					twinAxis.extend([[-val for val in axis] for axis in twinAxis])
+					xAxis = twinAxis[twinX]
+					yAxis = twinAxis[twinY]
+					zAxis = twinAxis[twinZ]
+					
+					# Create rotation matrix from basis vectors
+					matrix = OpenMaya.MMatrix()
+					OpenMaya.MScriptUtil.createMatrixFromList(xAxis+[0.0]+yAxis+[0.0]+zAxis+[0.0,0.0,0.0,0.0,1.0],matrix)
+					eulerRotation = OpenMaya.MTransformationMatrix(matrix).eulerRotation()
+					eulerRotation = eulerRotation.reorder(slaveInfo['rotateOrder'])
+					rot = [eulerRotation.x*self.radian,eulerRotation.y*self.radian,eulerRotation.z*self.radian]
+					
+					# Scale #===============
+					if xformList[6] or xformList[7] or xformList[8]:
+						scl = [OpenMaya.MVector(axis[0],axis[1],axis[2]).length() for axis in [xAxis,yAxis,zAxis]]
+			
+			elif mirrorMode == 1: # LOCAL Match
+				
+				# Translate #===============
+				translate = [pos[0],pos[1],pos[2],-pos[0],-pos[1],-pos[2]]
+				pos = [translate[twinX],translate[twinY],translate[twinZ]]
+				
+				# Rotate #===============
+				eulerRotation = OpenMaya.MEulerRotation(rot[0]/self.radian,rot[1]/self.radian,rot[2]/self.radian,self.getTwinNodeInfo(master)['rotateOrder'])
+				eulerRotation.reorderIt(0)
+				rot = [eulerRotation.x,eulerRotation.y,eulerRotation.z]
+				rotate = [-rot[0],-rot[1],-rot[2],rot[0],rot[1],rot[2]]
+				rot = [rotate[twinX],rotate[twinY],rotate[twinZ]]
+				rotateOrderStr = 'xyz'[twinX%3] + 'xyz'[twinY%3] + 'xyz'[twinZ%3]
+				eulerRotation = OpenMaya.MEulerRotation(rot[0],rot[1],rot[2],self.rotateOrder[rotateOrderStr])
+				eulerRotation = eulerRotation.reorder(slaveInfo['rotateOrder'])
+				rot = [eulerRotation.x*self.radian,eulerRotation.y*self.radian,eulerRotation.z*self.radian]
+				
+				# Scale #===============
+				scl = [scl[twinX%3],scl[twinY%3],scl[twinZ%3]]
+			
+			elif mirrorMode != 2: # INVALID Match Mode
+				
+				raise Exception('Invalid match mode! ('+str(mirrorMode)+')')
+			
+			# Apply to settable channels only
+			values = list(valueMap[slave])
+			xform = pos+rot+scl
+			for i in range(9):
+				if xformList[i] and entry['settable'][i]: values[i] = xform[i]
+			
+			pending.remove(slave)
+			resultMap[slave] = values
+			return values
+		
+		# Calculate Twin Values
+		for entry in twinTable: twinValues(entry)
+		
+		# Return Result
+		return resultMap
+	
+	def twinLocalMatrix(self,node,values):
+		'''
+		Return the local matrix of the specified node for the given transform channel values.
+		@param node: The transform to build the local matrix for
+		@type node: str
+		@param values: List of transform channel values [tx,ty,tz,rx,ry,rz,sx,sy,sz]
+		@type values: list
+		'''
+		info = self.getTwinNodeInfo(node)
+		
+		# Build Transformation Matrix
+		xformMatrix = OpenMaya.MTransformationMatrix(info['transformation'])
+		xformMatrix.setTranslation(OpenMaya.MVector(values[0],values[1],values[2]),OpenMaya.MSpace.kTransform)
+		xformMatrix.rotateTo(OpenMaya.MEulerRotation(values[3]/self.radian,values[4]/self.radian,values[5]/self.radian,info['rotateOrder']))
+		scaleUtil = OpenMaya.MScriptUtil()
+		scaleUtil.createFromList(values[6:9],3)
+		xformMatrix.setScale(scaleUtil.asDoublePtr(),OpenMaya.MSpace.kTransform)
+		matrix = xformMatrix.asMatrix()
+		
+		# Compensate for joint orientation
+		if info['jointOrient']:
+			translate = [matrix(3,i) for i in range(3)]
+			for i in range(3): OpenMaya.MScriptUtil.setDoubleArray(matrix[3],i,0.0)
+			matrix = matrix * info['jointOrient']
+			for i in range(3): OpenMaya.MScriptUtil.setDoubleArray(matrix[3],i,translate[i])
+		
+		# Return Result
+		return matrix
+	
+	def twinBatch(self,masterList,xformList=[1,1,1,1,1,1,1,1,1],swap=False,start=None,end=None,step=1):
+		'''
+		Twin a list of master controls in a single batch operation.
+		Twin pair information is resolved once (see buildTwinTable()), the scene state is sampled in a single pass,
+		and all twin values are calculated before any slave is modified. The result is applied in a single undo chunk.
+		If a frame range is specified, the twin is calculated for every frame in the range and the results are written
+		to animation curves on the slave channels.
+		@param masterList: List of master controls to twin, in order of evaluation
+		@type masterList: list
+		@param xformList: List of 9 boolean elements. Each element specifies if a particular transform attribute will be affected by the twin operation.
+		@type xformList: list
+		@param swap: Swap the master and slave poses. All pairs are calculated from the original pose.
+		@type swap: bool
+		@param start: Start frame of the range to twin. If None, the current pose is twinned.
+		@type start: float or None
+		@param end: End frame of the range to twin. If None, the current pose is twinned.
+		@type end: float or None
+		@param step: Frame step for range twin.
+		@type step: float
+		'''
+		# Build Twin Table
+		twinTable = self.buildTwinTable(masterList)
+		masterNames = [entry['master'] for entry in twinTable]
+		slaveNames = [entry['slave'] for entry in twinTable]
+		if swap:
+			# Add reverse pairs
+			twinTable = twinTable + self.buildTwinTable([slave for slave in slaveNames if not masterNames.count(slave)])
+		else:
+			# Skip masters already posed by a previous pair (matches sequential twin result)
+			twinTable = [entry for entry in twinTable if entry['master'] == entry['slave'] or not slaveNames[:masterNames.index(entry['master'])].count(entry['master'])]
+		if not twinTable: return []
+		
+		# ====================
+		# - Twin Frame Range -
+		# ====================
+		
+		if start != None and end != None:
+			return self.twinBatchRange(twinTable,xformList,start,end,step)
+		
+		# =============
+		# - Twin Pose -
+		# =============
+		
+		# Calculate Twin Values
+		matrixMap,valueMap,customMap = self.sampleTwinTable(twinTable)
+		resultMap = self.twinTableValues(twinTable,matrixMap,valueMap,xformList)
+		
+		# Apply Twin Values
+		mc.undoInfo(openChunk=True)
+		try:
+			for entry in twinTable:
+				slave = entry['slave']
+				for i in range(9):
+					if xformList[i] and entry['settable'][i]:
+						mc.setAttr(slave+'.'+self.xform[i],resultMap[slave][i])
+				for attr,value in zip(entry['customAttrs'],customMap[entry['master']]):
+					if attr[2] == 'doubleAngle': value *= self.radian
+					try: mc.setAttr(slave+'.'+attr[1],value)
+					except: pass
+		finally:
+			mc.undoInfo(closeChunk=True)
+		
+		# Return Result
+		return [entry['slave'] for entry in twinTable]
+	
+	def twinBatchRange(self,twinTable,xformList,start,end,step=1):
+		'''
+		Twin all pairs in the twin table over a frame range, and key the results on the slave channels.
+		The scene is evaluated once per frame, all pairs are sampled and calculated in a single pass per frame,
+		and all slave channel curves are written in a single undoable operation (see glTools.utils.animCurve.writeKeys()).
+		Existing keys within the frame range are replaced.
+		@param twinTable: Twin pair table (see buildTwinTable())
+		@type twinTable: list
+		@param xformList: List of 9 boolean elements. Each element specifies if a particular transform attribute will be affected by the twin operation.
+		@type xformList: list
+		@param start: Start frame of the range to twin
+		@type start: float
+		@param end: End frame of the range to twin
+		@type end: float
+		@param step: Frame step
+		@type step: float
+		'''
+		# Build Frame List
+		frameList = []
+		frame = start
+		while frame <= end:
+			frameList.append(frame)
+			frame += step
+		
+		# Get Channel List
+		channelList = []
+		for entry in twinTable:
+			for i in range(9):
+				if xformList[i] and entry['settable'][i]:
+					channelList.append(entry['slave']+'.'+self.xform[i])
+			for attr in entry['customAttrs']:
+				channelList.append(entry['slave']+'.'+attr[1])
+		valueList = [[] for channel in channelList]
+		
+		# =================
+		# - Sample Frames -
+		# =================
+		
+		currentTime = mc.currentTime(q=True)
+		mc.refresh(suspend=True)
+		try:
+			for frame in frameList:
+				
+				OpenMayaAnim.MAnimControl.setCurrentTime(OpenMaya.MTime(frame,OpenMaya.MTime.uiUnit()))
+				matrixMap,valueMap,customMap = self.sampleTwinTable(twinTable)
+				resultMap = self.twinTableValues(twinTable,matrixMap,valueMap,xformList)
+				
+				c = 0
+				for entry in twinTable:
+					values = resultMap[entry['slave']]
+					for i in range(9):
+						if xformList[i] and entry['settable'][i]:
+							if i > 2 and i < 6: valueList[c].append(values[i]/self.radian)
+							else: valueList[c].append(values[i])
+							c += 1
+					for value in customMap[entry['master']]:
+						valueList[c].append(value)
+						c += 1
+		finally:
+			mc.refresh(suspend=False)
+			mc.currentTime(currentTime)
+		
+		# ==============
+		# - Write Keys -
+		# ==============
+		
+		if not channelList: return []
+		
+		return glTools.utils.animCurve.writeKeys(channelList,frameList,valueList,preserveOutsideKeys=True)
+	
 	# ============
 	# - WRAPPERS -
 	# ============
 	
-	def twinSelection(self):
+	def twinSelection(self,batch=True,start=None,end=None):
 		'''
 		Twin the current selected objects.
+		@param batch: Twin all selected objects in a single batch operation (see twinBatch())
+		@type batch: bool
+		@param start: Start frame of the range to twin (batch only). If None, the current pose is twinned.
+		@type start: float or None
+		@param end: End frame of the range to twin (batch only). If None, the current pose is twinned.
+		@type end: float or None
 		'''
 		# Get selection list
 		selection = mc.ls(sl=1,transforms=True)
@@ -662,6 +1157,9 @@ class Match( object ):
 			evalOrder = [(ns+mc.getAttr(ns+self.evalOrderAttr+'['+str(i)+']')) for i in range(evalOrderLen)]
 			orderedSel = [str(i) for i in evalOrder if selection.count(i)]
 		
+		# Batch twin
+		if batch: return self.twinBatch(orderedSel,start=start,end=end)
+		
 		# Get channelBox attribute selection
 		#cbXformList = [] # DISABLED - self.getCBxformList()
 		#cbUserDefList = [] # DISABLED - self.getCBuserDefList()
@@ -671,9 +1169,15 @@ class Match( object ):
 			#dcXformList = copy.deepcopy(cbXformList)
 			self.twin(master) # DISABLED - ,dcXformList,userDefList)
 	
-	def swapSelection(self):
+	def swapSelection(self,batch=True,start=None,end=None):
 		'''
 		Swap the current selected objects.
+		@param batch: Swap all selected objects in a single batch operation (see twinBatch())
+		@type batch: bool
+		@param start: Start frame of the range to swap (batch only). If None, the current pose is swapped.
+		@type start: float or None
+		@param end: End frame of the range to swap (batch only). If None, the current pose is swapped.
+		@type end: float or None
 		'''
 		# =================
 		# - Get Selection -
@@ -694,6 +1198,9 @@ class Match( object ):
 			evalOrder = [(ns+mc.getAttr(ns+self.evalOrderAttr+'['+str(i)+']')) for i in range(evalOrderLen)]
 			orderedSel = [str(i) for i in evalOrder if selection.count(i)]
 		
+		# Batch swap
+		if batch: return self.twinBatch(orderedSel,swap=True,start=start,end=end)
+		
 		# Get list of master and slave controls
 		slaveList = []
 		masterList = []
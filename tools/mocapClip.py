@@ -10,6 +10,17 @@ import glTools.utils.reference
 
 import os
 import os.path
+import sys
+import time
+import json
+import shutil
+import hashlib
+import tempfile
+import subprocess
+
+EXT_TYPE_MAP = {'fbx':'FBX','ma':'mayaAscii','mb':'mayaBinary'}
+MANIFEST_FILE = 'mocapClipManifest.json'
+REPORT_FILE = 'mocapClipReport.json'
 
 def createMocapClipsFromFbxWip(sourceDir,targetDir,skipUpToDate=False,skipExistsing=False):
 	'''
@@ -145,18 +156,10 @@ def createMocapClips(sourceDir,targetDir='',extList=['fbx'],skipUpToDate=False,s
 	if not os.path.isdir(sourceDir):
 		raise Exception('Source directory "'+sourceDir+'" does not exist!')
 	
-	extTypeMap = {}
-	extTypeMap['fbx'] = 'FBX'
-	extTypeMap['ma'] = 'mayaAscii'
-	extTypeMap['mb'] = 'mayaBinary'
-	
 	# =================
 	# - Process Clips -
 	# =================
 	
-	# New File
-	mc.file(newFile=True,force=True,prompt=False)
-	
 	clipPathList = []
 	clipFileList = os.listdir(sourceDir)
 	clipFileList.sort()
@@ -193,30 +196,15 @@ def createMocapClips(sourceDir,targetDir='',extList=['fbx'],skipUpToDate=False,s
 		
 		# Print Status
 		print ('Generating Clip "'+clipName+'"...')
-			
-		# Import Clip File
-		mc.file(sourceDir+'/'+clipFile,i=True,type="FBX",defaultNamespace=True)
-		
-		# Create Character Set
-		mocap = glTools.nrig.rig.bipedMocap.BipedMocapRigRoll()
-		try: charSet = mocap.createCharSet('char','')
-		except: print('ERROR: Problem creating characterSet for clip "'+clipName+'"!')
 		
-		# Create Character Clip
-		start = mc.keyframe('Hips',q=True,tc=True)[0]
-		end = mc.keyframe('Hips',q=True,tc=True)[-1]
-		clip = glTools.utils.clip.createClip(charSet,startTime=start,endTime=end,name=clipName)
-		if not clip: continue
-		
-		# Export Clip
-		print 'Exporting: '+clipName
-		export = glTools.utils.clip.exportClip(clip,clipPath,force=True)
+		# Process Clip File
+		try: processMocapClip(sourceDir+'/'+clipFile,clipPath,EXT_TYPE_MAP.get(ext,'FBX'))
+		except Exception, e:
+			print('ERROR: Problem generating clip "'+clipName+'"! Exception Msg: '+str(e))
+			continue
 		
 		# Update Result
 		clipPathList.append(clipPath)
-		
-		# Clear Scene
-		mc.file(newFile=True,force=True,prompt=False)
 	
 	# =================
 	# - Return Result -
@@ -280,3 +268,407 @@ def createSourceClipFile(sourceDir,setLatest=False):
 	
 	return
 
+def processMocapClip(clipFile,clipPath,fileType='FBX'):
+	'''
+	Generate and export a trax clip from a single mocap anim file.
+	The current scene is cleared before the file is imported.
+	@param clipFile: Mocap anim file to generate the clip from.
+	@type clipFile: str
+	@param clipPath: Clip file path to export the generated clip to.
+	@type clipPath: str
+	@param fileType: Maya file type of the mocap anim file.
+	@type fileType: str
+	'''
+	# Check Clip File
+	if not os.path.isfile(clipFile):
+		raise Exception('Clip file "'+clipFile+'" does not exist!')
+	
+	# Get Clip Name
+	clipName = os.path.splitext(os.path.basename(clipFile))[0]
+	
+	# Clear Scene
+	mc.file(newFile=True,force=True,prompt=False)
+	
+	# Import Clip File
+	mc.file(clipFile,i=True,type=fileType,defaultNamespace=True)
+	
+	# Create Character Set
+	mocap = glTools.nrig.rig.bipedMocap.BipedMocapRigRoll()
+	try: charSet = mocap.createCharSet('char','')
+	except: raise Exception('Problem creating characterSet for clip "'+clipName+'"!')
+	
+	# Create Character Clip
+	keys = mc.keyframe('Hips',q=True,tc=True)
+	if not keys: raise Exception('No animation on Hips for clip "'+clipName+'"!')
+	clip = glTools.utils.clip.createClip(charSet,startTime=keys[0],endTime=keys[-1],name=clipName)
+	if not clip: raise Exception('Unable to create character clip "'+clipName+'"!')
+	
+	# Export Clip
+	print 'Exporting: '+clipName
+	glTools.utils.clip.exportClip(clip,clipPath,force=True)
+	
+	# Return Result
+	return clipPath
+
+# ===================
+# - Batch Ingestion -
+# ===================
+
+def fileHash(filePath,blockSize=1048576):
+	'''
+	Return the MD5 hex digest of the contents of the specified file.
+	@param filePath: File to hash.
+	@type filePath: str
+	@param blockSize: File read block size.
+	@type blockSize: int
+	'''
+	md5 = hashlib.md5()
+	f = open(filePath,'rb')
+	try:
+		block = f.read(blockSize)
+		while block:
+			md5.update(block)
+			block = f.read(blockSize)
+	finally:
+		f.close()
+	return md5.hexdigest()
+
+def loadManifest(manifestPath):
+	'''
+	Load a mocap clip ingestion manifest. Returns an empty manifest if the file does not exist.
+	The manifest stores a {sourceFile:{hash,mtime,size,clipPath,status}} entry for each ingested file.
+	@param manifestPath: Manifest file path.
+	@type manifestPath: str
+	'''
+	if not os.path.isfile(manifestPath): return {}
+	f = open(manifestPath,'r')
+	try: manifest = json.load(f)
+	finally: f.close()
+	return manifest
+
+def saveManifest(manifest,manifestPath):
+	'''
+	Save a mocap clip ingestion manifest. The file is replaced atomically where supported.
+	@param manifest: Manifest dictionary.
+	@type manifest: dict
+	@param manifestPath: Manifest file path.
+	@type manifestPath: str
+	'''
+	tmpPath = manifestPath+'.tmp'
+	f = open(tmpPath,'w')
+	try: json.dump(manifest,f,indent=1,sort_keys=True)
+	finally: f.close()
+	if os.path.isfile(manifestPath): os.remove(manifestPath)
+	os.rename(tmpPath,manifestPath)
+	return manifestPath
+
+def isClipUpToDate(sourceFile,clipPath,manifest):
+	'''
+	Check if the clip generated from the specified source file is up to date, based on the ingestion manifest.
+	Source files with an unchanged modification time and size are considered unchanged. Otherwise the content hash is compared.
+	Returns a tuple of (upToDate,hash). Hash is None if it was not calculated.
+	@param sourceFile: Source mocap anim file.
+	@type sourceFile: str
+	@param clipPath: Clip file path generated from the source file.
+	@type clipPath: str
+	@param manifest: Ingestion manifest (see loadManifest()).
+	@type manifest: dict
+	'''
+	# Check Clip and Manifest Entry
+	if not os.path.isfile(clipPath): return (False,None)
+	entry = manifest.get(sourceFile)
+	if not entry or entry.get('status') != 'ok': return (False,None)
+	
+	# Check Modification Time and Size
+	stat = os.stat(sourceFile)
+	if entry.get('mtime') == stat.st_mtime and entry.get('size') == stat.st_size:
+		return (True,entry.get('hash'))
+	
+	# Check Content Hash
+	sourceHash = fileHash(sourceFile)
+	return (sourceHash == entry.get('hash'),sourceHash)
+
+def mocapClipWorker(jobFile,resultFile):
+	'''
+	Headless mocap clip ingestion worker. Processes each job listed in the job file and appends one result
+	record (json) per job to the result file, so completed jobs are kept if the worker fails.
+	Intended to be run from a standalone (mayapy) session. See ingestMocapClips().
+	@param jobFile: Job file (json) containing a list of [sourceFile,clipPath,fileType] jobs.
+	@type jobFile: str
+	@param resultFile: Result file path.
+	@type resultFile: str
+	'''
+	# Read Jobs
+	f = open(jobFile,'r')
+	try: jobList = json.load(f)
+	finally: f.close()
+	
+	# Process Jobs
+	for sourceFile,clipPath,fileType in jobList:
+		
+		result = {'source':sourceFile,'clipPath':clipPath,'status':'ok','error':''}
+		startTime = time.time()
+		try: processMocapClip(sourceFile,clipPath,fileType)
+		except Exception, e:
+			result['status'] = 'failed'
+			result['error'] = str(e)
+		result['time'] = time.time() - startTime
+		
+		# Write Result
+		f = open(resultFile,'a')
+		try: f.write(json.dumps(result)+'\n')
+		finally: f.close()
+
+def readWorkerResults(resultFile):
+	'''
+	Read the result records written by mocapClipWorker().
+	@param resultFile: Result file path.
+	@type resultFile: str
+	'''
+	resultList = []
+	if not os.path.isfile(resultFile): return resultList
+	f = open(resultFile,'r')
+	try:
+		for line in f:
+			line = line.strip()
+			if not line: continue
+			try: resultList.append(json.loads(line))
+			except ValueError: pass
+	finally:
+		f.close()
+	return resultList
+
+def ingestMocapClips(	sourceDir,
+						targetDir,
+						extList = ['fbx'],
+						workers = 4,
+						chunkSize = 8,
+						retries = 2,
+						skipUpToDate = True,
+						mayapy = 'mayapy',
+						manifestPath = '',
+						reportPath = '',
+						tmpDir = '',
+						pollInterval = 1.0,
+						chunkTimeout = 3600.0	):
+	'''
+	Generate trax clips from a directory of mocap anim files, using a pool of headless (mayapy) worker processes.
+	Files are distributed to the workers in chunks. Failed files are retried (individually) up to the specified
+	number of times. Workers that exceed the chunk timeout are killed, the file being processed is counted as a failed
+	attempt and the unprocessed files of the chunk are requeued. A persistent manifest (content hash, modification time and size per source file) is used
+	to skip files whose clips are up to date, and a summary report with per file timing is written on completion.
+	@param sourceDir: Source directory to generate clips from.
+	@type sourceDir: str
+	@param targetDir: Target clip directory to export processed clips to.
+	@type targetDir: str
+	@param extList: List of file extensions to generate clips from
+	@type extList: list
+	@param workers: Number of concurrent worker processes.
+	@type workers: int
+	@param chunkSize: Number of files processed by each worker process.
+	@type chunkSize: int
+	@param retries: Number of times a failed file is retried.
+	@type retries: int
+	@param skipUpToDate: Skip files that are up to date, based on the ingestion manifest.
+	@type skipUpToDate: bool
+	@param mayapy: Path to the mayapy executable.
+	@type mayapy: str
+	@param manifestPath: Ingestion manifest file path. If empty, use "mocapClipManifest.json" in the target directory.
+	@type manifestPath: str
+	@param reportPath: Summary report file path. If empty, use "mocapClipReport.json" in the target directory.
+	@type reportPath: str
+	@param tmpDir: Directory for the intermediate job and result files. If empty, use the system temp directory.
+	@type tmpDir: str
+	@param pollInterval: Worker status poll interval (in seconds).
+	@type pollInterval: float
+	@param chunkTimeout: Maximum run time (in seconds) of a worker process. If 0, workers are never timed out.
+	@type chunkTimeout: float
+	'''
+	# ==========
+	# - Checks -
+	# ==========
+	
+	# Check Source Directory
+	if not os.path.isdir(sourceDir):
+		raise Exception('Source directory "'+sourceDir+'" does not exist!')
+	
+	# Check Target Directory
+	if not os.path.isdir(targetDir): os.makedirs(targetDir)
+	
+	if not manifestPath: manifestPath = os.path.join(targetDir,MANIFEST_FILE)
+	if not reportPath: reportPath = os.path.join(targetDir,REPORT_FILE)
+	if not tmpDir: tmpDir = tempfile.gettempdir()
+	workers = max(1,workers)
+	chunkSize = max(1,chunkSize)
+	
+	ingestStart = time.time()
+	manifest = loadManifest(manifestPath)
+	
+	# ==================
+	# - Build Job List -
+	# ==================
+	
+	report = {}
+	jobList = []
+	hashMap = {}
+	for clipFile in sorted(os.listdir(sourceDir)):
+		
+		# Get Source File
+		sourceFile = os.path.abspath(os.path.join(sourceDir,clipFile))
+		if not os.path.isfile(sourceFile): continue
+		
+		# Get Clip Extension
+		ext = os.path.splitext(clipFile)[1].lower()[1:]
+		if not extList.count(ext): continue
+		
+		# Build New Clip Path
+		clipName = os.path.splitext(clipFile)[0]
+		clipPath = os.path.abspath(os.path.join(targetDir,clipName+'.mb'))
+		
+		# Check Up To Date
+		upToDate,sourceHash = isClipUpToDate(sourceFile,clipPath,manifest)
+		if skipUpToDate and upToDate:
+			report[sourceFile] = {'clipPath':clipPath,'status':'skipped','error':'','time':0.0,'attempts':0}
+			continue
+		
+		# Append Job
+		hashMap[sourceFile] = sourceHash or fileHash(sourceFile)
+		report[sourceFile] = {'clipPath':clipPath,'status':'pending','error':'','time':0.0,'attempts':0}
+		jobList.append([sourceFile,clipPath,EXT_TYPE_MAP.get(ext,'FBX')])
+	
+	print('Ingesting '+str(len(jobList))+' mocap clip(s) with '+str(workers)+' worker(s). Skipped '+str(len(report)-len(jobList))+' up to date clip(s).')
+	
+	# =================
+	# - Process Files -
+	# =================
+	
+	workDir = tempfile.mkdtemp(prefix='mocapClipIngest_',dir=tmpDir)
+	workerCount = 0
+	runningList = []
+	try:
+		while jobList or runningList:
+			
+			# Start Workers
+			while jobList and len(runningList) < workers:
+				chunk = jobList[:chunkSize]
+				jobList = jobList[chunkSize:]
+				workerCount += 1
+				jobFile = os.path.join(workDir,'job_'+str(workerCount)+'.json')
+				resultFile = os.path.join(workDir,'result_'+str(workerCount)+'.json')
+				f = open(jobFile,'w')
+				try: json.dump(chunk,f)
+				finally: f.close()
+				script = 'import maya.standalone; maya.standalone.initialize(name="python"); '
+				script += 'import sys; sys.path.extend([p for p in '+repr(sys.path)+' if not p in sys.path]); '
+				script += 'import glTools.tools.mocapClip; '
+				script += 'glTools.tools.mocapClip.mocapClipWorker('+repr(jobFile)+','+repr(resultFile)+')'
+				proc = subprocess.Popen([mayapy,'-c',script])
+				runningList.append([proc,chunk,jobFile,resultFile,time.time()])
+			
+			# Wait
+			time.sleep(pollInterval)
+			
+			# Collect Finished Workers
+			for worker in list(runningList):
+				
+				proc,chunk,jobFile,resultFile,workerStart = worker
+				exitCode = proc.poll()
+				workerTime = time.time() - workerStart
+				
+				# Check Timeout
+				timedOut = False
+				if exitCode == None:
+					if not chunkTimeout or workerTime < chunkTimeout: continue
+					proc.kill()
+					exitCode = proc.wait()
+					timedOut = True
+				runningList.remove(worker)
+				
+				# Read Results
+				resultMap = dict([(result['source'],result) for result in readWorkerResults(resultFile)])
+				for path in [jobFile,resultFile]:
+					if os.path.isfile(path): os.remove(path)
+				
+				# Unfinished Jobs (The first is the file the worker failed on, the remaining files were not processed)
+				unfinished = [job for job in chunk if not resultMap.has_key(job[0])]
+				if unfinished:
+					if timedOut: error = 'Worker timed out ('+('%.1f' % workerTime)+'s) while processing file!'
+					else: error = 'Worker exited (code '+str(exitCode)+') while processing file!'
+					unfinishedTime = max(0.0,workerTime-sum([result['time'] for result in resultMap.values()]))
+					resultMap[unfinished[0][0]] = {'status':'failed','error':error,'time':unfinishedTime}
+					for job in unfinished[1:]:
+						print('Requeued unprocessed file "'+job[0]+'"')
+						jobList.append(job)
+				
+				for job in chunk:
+					
+					sourceFile = job[0]
+					result = resultMap.get(sourceFile)
+					if not result: continue
+					entry = report[sourceFile]
+					entry['attempts'] += 1
+					entry['time'] += result['time']
+					entry['status'] = result['status']
+					entry['error'] = result['error']
+					
+					if result['status'] == 'ok':
+						
+						# Update Manifest
+						stat = os.stat(sourceFile)
+						manifest[sourceFile] = {	'hash':hashMap[sourceFile],
+													'mtime':stat.st_mtime,
+													'size':stat.st_size,
+													'clipPath':job[1],
+													'status':'ok'	}
+						print('Generated clip "'+job[1]+'" ('+('%.2f' % result['time'])+'s)')
+						
+					elif entry['attempts'] <= retries:
+						
+						# Retry
+						print('Failed to generate clip from "'+sourceFile+'"! Retrying... ('+entry['error']+')')
+						jobList.append(job)
+						
+					else:
+						
+						# Failed
+						manifest.pop(sourceFile,None)
+						print('ERROR: Failed to generate clip from "'+sourceFile+'"! ('+entry['error']+')')
+				
+				# Save Manifest
+				saveManifest(manifest,manifestPath)
+	
+	finally:
+		
+		# Stop Workers and Remove Intermediate Files
+		for worker in runningList:
+			if worker[0].poll() == None:
+				worker[0].kill()
+				worker[0].wait()
+		shutil.rmtree(workDir,ignore_errors=True)
+	
+	# ================
+	# - Write Report -
+	# ================
+	
+	statusList = [entry['status'] for entry in report.values()]
+	summary = {	'sourceDir':os.path.abspath(sourceDir),
+				'targetDir':os.path.abspath(targetDir),
+				'workers':workers,
+				'wallTime':time.time() - ingestStart,
+				'processTime':sum([entry['time'] for entry in report.values()]),
+				'generated':statusList.count('ok'),
+				'skipped':statusList.count('skipped'),
+				'failed':statusList.count('failed'),
+				'files':report	}
+	
+	f = open(reportPath,'w')
+	try: json.dump(summary,f,indent=1,sort_keys=True)
+	finally: f.close()
+	
+	print('Mocap clip ingestion complete: '+str(summary['generated'])+' generated, '+str(summary['skipped'])+' skipped, '+str(summary['failed'])+' failed ('+('%.1f' % summary['wallTime'])+'s). Report: "'+reportPath+'"')
+	
+	# =================
+	# - Return Result -
+	# =================
+	
+	return summary
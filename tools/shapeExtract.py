@@ -52,6 +52,9 @@ def shapeExtract_skinCluster(baseGeo,targetGeo,skinCluster,influenceList=[],dele
 	if not influenceList:
 		influenceList = mc.skinCluster(skinCluster,q=True,inf=True)
 	
+	# Read skinCluster weights (Single Read)
+	skinWeights = glTools.utils.skinCluster.SkinWeightAccessor(skinCluster)
+	
 	# ------------------------------
 	# - Iterate through influences -
 	# ------------------------------
@@ -70,7 +73,7 @@ def shapeExtract_skinCluster(baseGeo,targetGeo,skinCluster,influenceList=[],dele
 		mc.setAttr(blendShape+'.'+targetGeo,1)
 		
 		# Get skinCluster influence weights
-		wt = glTools.utils.skinCluster.getInfluenceWeights(skinCluster,inf)
+		wt = skinWeights.getInfluenceWeights(inf)
 		
 		# Set belndShape target weights
 		glTools.utils.blendShape.setTargetWeights(blendShape,targetGeo,wt,dupGeo)
@@ -93,6 +96,55 @@ def shapeExtract_skinCluster(baseGeo,targetGeo,skinCluster,influenceList=[],dele
 	
 	return returnList
 
+def shapeExtract_blendShapeTarget(blendShape,target,skinCluster,influenceList=[],geometry='',prefix=''):
+	'''
+	Split a blendShape target into regions using skinCluster influence weights as region maps.
+	Region shapes are added to the blendShape as new targets directly from the weighted target deltas,
+	without duplicating geometry or building temporary blendShape nodes.
+	@param blendShape: BlendShape containing the target to split
+	@type blendShape: str
+	@param target: BlendShape target to split
+	@type target: str
+	@param skinCluster: SkinCluster that provides the influence weight maps used to split the target
+	@type skinCluster: str
+	@param influenceList: List of skinCluster infuences to use for shape extraction. If empty, use all influences.
+	@type influenceList: list
+	@param geometry: BlendShape base geometry to split target deltas for
+	@type geometry: str
+	@param prefix: Naming prefix
+	@type prefix: str
+	'''
+	# ---------
+	# - Check -
+	# ---------
+	
+	suffix = ''
+	if prefix: suffix = '_'+prefix
+	
+	# Check blendShape
+	if not glTools.utils.blendShape.isBlendShape(blendShape):
+		raise Exception('Object "'+blendShape+'" is not a valid blendShape node!')
+	
+	# Check skinCluster
+	if not mc.objExists(skinCluster):
+		raise Exception('SkinCluster "'+skinCluster+'" does not exist!')
+	
+	# ---------------------------
+	# - Get skinCluster weights -
+	# ---------------------------
+	
+	if not influenceList:
+		influenceList = mc.skinCluster(skinCluster,q=True,inf=True)
+	
+	skinWeights = glTools.utils.skinCluster.SkinWeightAccessor(skinCluster)
+	weightMaps = dict([(inf+suffix,skinWeights.getInfluenceWeights(inf)) for inf in influenceList])
+	
+	# ----------------
+	# - Split Target -
+	# ----------------
+	
+	return glTools.utils.blendShape.splitTarget(blendShape,target,weightMaps,geometry)
+
 def shapeExtract_weights(baseGeo,targetGeo,weightList,deleteHistory=True,name=''):
 	'''
 	Extract a portioin of a blendShape target based on a list of vertex weight value
@@ -1,5 +1,7 @@
 import maya.cmds as mc
 
+import glTools.utils.matrix
+
 class UserInputError(Exception): pass
 
 class Spaces(object):
@@ -13,6 +15,9 @@ class Spaces(object):
 		self.transform = ['transform','joint']
 		self.worldNode = 'spaces_wld01_loc'
 		
+		self.matrixCache = {}
+		self.cacheMatrices = False
+		
 		self.managerUI = 'spacesUI'
 		self.uiRCL = 'spacesRCL'
 		self.uiKeyCBG = 'spacesKeyCBG'
@@ -241,6 +246,68 @@ class Spaces(object):
 		# Return result
 		return [spacesNode,spacesNodeConstraint]
 		
+	def worldMatrix(self,node,frame=None):
+		'''
+		Return the world matrix of the specified node as an MMatrix, offset to the node rotate pivot.
+		Matrices are cached (per node and frame) while a batch switch is in progress.
+		@param node: Node to return the world matrix for
+		@type node: str
+		@param frame: The frame to get the world matrix at. If None, use the current frame.
+		@type frame: float or None
+		'''
+		# Check Cache
+		cacheKey = (node,frame)
+		if self.matrixCache.has_key(cacheKey): return self.matrixCache[cacheKey]
+		
+		# Get World Matrix and Rotate Pivot
+		if frame == None:
+			worldMatrix = mc.getAttr(node+'.worldMatrix[0]')
+			rotatePivot = mc.getAttr(node+'.rotatePivot')[0]
+		else:
+			worldMatrix = mc.getAttr(node+'.worldMatrix[0]',t=frame)
+			rotatePivot = mc.getAttr(node+'.rotatePivot',t=frame)[0]
+		
+		# Build Pivot Matrix
+		pivotMatrix = glTools.utils.matrix.fromList([1,0,0,0,0,1,0,0,0,0,1,0,rotatePivot[0],rotatePivot[1],rotatePivot[2],1])
+		matrix = pivotMatrix * glTools.utils.matrix.fromList(worldMatrix)
+		
+		# Update Cache
+		if self.cacheMatrices: self.matrixCache[cacheKey] = matrix
+		
+		# Return Result
+		return matrix
+	
+	def getOffset(self,ctrl,target,frame=None):
+		'''
+		Calculate the spaces constraint target offset values that maintain the current spaces node position
+		when switched to the specified target. Offsets are computed directly from the world matrices of
+		the spaces node and the target transform.
+		@param ctrl: Control to calculate spaces offset for
+		@type ctrl: str
+		@param target: Spaces target to calculate offset for
+		@type target: str
+		@param frame: The frame to calculate the offset at. If None, use the current frame.
+		@type frame: float or None
+		'''
+		# Get Spaces Target Transform
+		spacesNode = self.getSpacesNode(ctrl)
+		spacesNodeConstraint = self.getSpacesConstraint(ctrl)
+		targetTransform = mc.parentConstraint(spacesNodeConstraint,q=True,targetList=True)
+		targetIndex = self.targetIndex(ctrl,target)
+		
+		# Calculate Offset Matrix
+		spacesMatrix = self.worldMatrix(spacesNode,frame)
+		targetMatrix = self.worldMatrix(targetTransform[targetIndex],frame)
+		offsetMatrix = spacesMatrix * targetMatrix.inverse()
+		
+		# Decompose Offset
+		rotateOrder = mc.getAttr(spacesNode+'.rotateOrder')
+		translateOffset = glTools.utils.matrix.getTranslation(offsetMatrix)
+		rotateOffset = glTools.utils.matrix.getRotation(offsetMatrix,rotateOrder)
+		
+		# Return Result
+		return [translateOffset,rotateOffset]
+	
 	def switch(self,ctrl,newTarget,key=0,keyPreviousFrame=0,maintainPos=1):
 		'''
 		Switch spaces state for specified control.
@@ -271,21 +338,7 @@ class Spaces(object):
 		
 		# Calculate constraint offsets to maintain control position
 		if maintainPos:
-			# Create temporary constraint transform
-			temp = mc.duplicate(spacesNode,rr=True,rc=True,n='temp_spaceNode')
-			mc.delete(mc.listRelatives(temp[0],ad=True,pa=True))
-			
-			# Unlock channels
-			for ch in self.channels: mc.setAttr(temp[0]+'.'+ch,l=False)
-			
-			# Create temporary parent constraint
-			conn = mc.parentConstraint(targetTransform[newTargetIndex],temp[0],mo=True)
-			translateOffset = mc.getAttr(conn[0]+'.target[0].targetOffsetTranslate')[0]
-			rotateOffset = mc.getAttr(conn[0]+'.target[0].targetOffsetRotate')[0]
-			
-			# Delete temporary nodes
-			mc.delete(conn)
-			mc.delete(temp)
+			translateOffset,rotateOffset = self.getOffset(ctrl,newTarget)
 			
 			# Set Constraint Offsets
 			mc.setAttr(spacesNode+'.tot',translateOffset[0],translateOffset[1],translateOffset[2])
@@ -315,12 +368,116 @@ class Spaces(object):
 		@param keyPreviousFrame: Set key on previous frame for spaces state before switch. Only relevant when "key" is also True.
 		@type keyPreviousFrame: bool
 		'''
-		# Find all spacesNodes
-		spaceNodeList = mc.ls('*_spn',r=True,et='transform')
-		for spacesNode in spaceNodeList:
-			child = mc.listRelatives(spacesNode,c=1)
-			try: self.switch(child[0],target,key,keyPrevious,maintainPos)
-			except: print('Object '+child[0]+' is not able to be placed in the space of '+target+'! Skipping control!!')
+		# Switch all spacesNodes
+		self.switchAll(target,[],char,key,keyPrevious,maintainPos)
+	
+	def switchAll(self,target,ctrlList=[],char='',key=0,keyPrevious=0,maintainPos=1,startFrame=None,endFrame=None):
+		'''
+		Switch a list of controls (or all spaces nodes) to the specified target as a single batch.
+		All world matrices are sampled before any spaces attribute is changed, and all changes are
+		applied in a single undo chunk. If a frame range is specified, offsets are calculated per frame
+		and baked as keys on each spaces node.
+		@param target: Spaces target to switch to
+		@type target: str
+		@param ctrlList: List of controls or spaces nodes to switch. If empty, switch all spaces nodes.
+		@type ctrlList: list
+		@param char: Character namespace to filter for when searching for spaces nodes
+		@type char: str
+		@param key: Set key for spaces state after switch. Ignored in frame range mode.
+		@type key: bool
+		@param keyPrevious: Set key on previous frame for spaces state before switch. Only relevant when "key" is also True.
+		@type keyPrevious: bool
+		@param maintainPos: Maintain the current control positions
+		@type maintainPos: bool
+		@param startFrame: Start of the frame range to switch spaces over. If None, switch at the current frame only.
+		@type startFrame: float or None
+		@param endFrame: End of the frame range to switch spaces over. If None, use startFrame.
+		@type endFrame: float or None
+		'''
+		# Get Spaces Nodes
+		if not ctrlList:
+			if char: char += ':'
+			ctrlList = mc.ls(char+'*_spn',r=True,et='transform')
+		
+		# Get Frame List
+		if startFrame == None: frameList = [None]
+		else:
+			if endFrame == None: endFrame = startFrame
+			frameList = range(int(startFrame),int(endFrame)+1)
+		
+		# =================
+		# - Sample Spaces -
+		# =================
+		
+		self.matrixCache = {}
+		self.cacheMatrices = True
+		
+		switchList = []
+		for ctrl in ctrlList:
+			try:
+				spacesNode = self.getSpacesNode(ctrl)
+				spacesNodeConstraint = self.getSpacesConstraint(ctrl)
+				targetIndex = self.targetIndex(ctrl,target)
+			except Exception, e:
+				print('Object '+ctrl+' is not able to be placed in the space of '+target+'! Skipping control!! ('+str(e)+')')
+				continue
+			
+			# Get Offsets (Per Frame)
+			offsetList = []
+			if maintainPos:
+				offsetList = [self.getOffset(spacesNode,target,frame) for frame in frameList]
+			else:
+				translateOffset = mc.getAttr(spacesNode+'.defaultOffset['+str(targetIndex)+'].dot')[0]
+				rotateOffset = mc.getAttr(spacesNode+'.defaultOffset['+str(targetIndex)+'].dor')[0]
+				offsetList = [[translateOffset,rotateOffset] for frame in frameList]
+			
+			# Append Switch Data
+			weightAliasList = mc.parentConstraint(spacesNodeConstraint,q=True,weightAliasList=True)
+			switchList.append([spacesNode,targetIndex,weightAliasList,offsetList])
+		
+		self.matrixCache = {}
+		self.cacheMatrices = False
+		
+		# ================
+		# - Apply Switch -
+		# ================
+		
+		mc.undoInfo(openChunk=True)
+		try:
+			for spacesNode,targetIndex,weightAliasList,offsetList in switchList:
+				
+				# Frame Range Mode
+				if frameList[0] != None:
+					for i in range(len(frameList)):
+						translateOffset,rotateOffset = offsetList[i]
+						for n in range(len(weightAliasList)):
+							mc.setKeyframe(spacesNode,at=weightAliasList[n],t=frameList[i],v=int(n==targetIndex),itt='clamped',ott='step')
+						for n in range(3):
+							mc.setKeyframe(spacesNode,at='tot'+'xyz'[n],t=frameList[i],v=translateOffset[n],itt='clamped',ott='step')
+							mc.setKeyframe(spacesNode,at='tor'+'xyz'[n],t=frameList[i],v=rotateOffset[n],itt='clamped',ott='step')
+						mc.setKeyframe(spacesNode,at='spaces',t=frameList[i],v=targetIndex,itt='clamped',ott='step')
+					continue
+				
+				# Key previous frame
+				if keyPrevious: self.key(spacesNode,[],mc.currentTime(q=True)-1,)
+				
+				# Set Constraint Offsets
+				translateOffset,rotateOffset = offsetList[0]
+				mc.setAttr(spacesNode+'.tot',translateOffset[0],translateOffset[1],translateOffset[2])
+				mc.setAttr(spacesNode+'.tor',rotateOffset[0],rotateOffset[1],rotateOffset[2])
+				
+				# Set Constraint Target Weights
+				for i in range(len(weightAliasList)): mc.setAttr(spacesNode+'.'+weightAliasList[i],i==targetIndex)
+				# Set ".spaces" attribute
+				mc.setAttr(spacesNode+'.spaces',targetIndex)
+				
+				# Key current frame
+				if key: self.key(spacesNode,[],mc.currentTime(q=True))
+		finally:
+			mc.undoInfo(closeChunk=True)
+		
+		# Return Result
+		return [i[0] for i in switchList]
 	
 	def key(self,ctrl,targetList=[],frame=None):
 		'''
@@ -1,6 +1,7 @@
 import maya.cmds as mc
 
-import glTools.utils.attrPreset
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.attrPreset')
 
 def ui():
 	'''
@@ -1,6 +1,7 @@
 import maya.cmds as mc
 
-import glTools.utils.base
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.base')
 
 def parentListUI():
 	'''
@@ -1,7 +1,8 @@
 import maya.cmds as mc
 
-import glTools.tools.blendShape
-import glTools.utils.blendShape
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.blendShape')
+glTools.utils.lazyImport.lazyModule('glTools.utils.blendShape')
 
 import glTools.ui.utils
 
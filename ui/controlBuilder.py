@@ -1,9 +1,10 @@
 import maya.cmds as mc
 
-import glTools.tools.controlBuilder
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.controlBuilder')
 
-import glTools.utils.base
-import glTools.utils.transform
+glTools.utils.lazyImport.lazyModule('glTools.utils.base')
+glTools.utils.lazyImport.lazyModule('glTools.utils.transform')
 
 class UserInputError(Exception): pass
 class UIError(Exception): pass
@@ -1,10 +1,11 @@
 import maya.cmds as mc
 
 import glTools.ui.utils
-import glTools.utils.attach
-import glTools.utils.curve
-import glTools.tools.createAlongCurve
-import glTools.utils.transform
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.attach')
+glTools.utils.lazyImport.lazyModule('glTools.utils.curve')
+glTools.utils.lazyImport.lazyModule('glTools.tools.createAlongCurve')
+glTools.utils.lazyImport.lazyModule('glTools.utils.transform')
 
 class UserInputError(Exception): pass
 class UIError(Exception): pass
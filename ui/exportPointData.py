@@ -1,7 +1,8 @@
 import maya.mel as mm
 import maya.cmds as mc
 
-import glTools.tools.exportPointData
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.exportPointData')
 
 import os.path
 
@@ -1,6 +1,7 @@
 import maya.cmds as mc
 
-import glTools.tools.faceForward
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.faceForward')
 import glTools.ui.utils
 
 class UserInputError(Exception): pass
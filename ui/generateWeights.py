@@ -1,8 +1,9 @@
 import maya.cmds as mc
 
-import glTools.utils.deformer
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.deformer')
 
-import glTools.tools.generateWeights
+glTools.utils.lazyImport.lazyModule('glTools.tools.generateWeights')
 
 def generateWeightsUI():
 	'''
@@ -1,9 +1,12 @@
 import maya.cmds as mc
 
 import glTools.ui.utils
-import glTools.utils.ik
-import glTools.tools.ikHandle
-import glTools.tools.stretchyIkChain
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.ik')
+glTools.utils.lazyImport.lazyModule('glTools.tools.ikHandle')
+glTools.utils.lazyImport.lazyModule('glTools.tools.stretchyIkChain')
+glTools.utils.lazyImport.lazyModule('glTools.tools.stretchyIkLimb')
+glTools.utils.lazyImport.lazyModule('glTools.tools.stretchyIkSpline')
 
 class UIError(Exception): pass
 
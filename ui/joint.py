@@ -1,8 +1,9 @@
 import maya.cmds as mc
 
-import glTools.utils.joint
-import glTools.utils.mathUtils
-import glTools.utils.stringUtils
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.joint')
+glTools.utils.lazyImport.lazyModule('glTools.utils.mathUtils')
+glTools.utils.lazyImport.lazyModule('glTools.utils.stringUtils')
 
 class UserInputError(Exception): pass
 class UIError(Exception): pass
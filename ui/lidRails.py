@@ -1,7 +1,8 @@
 import maya.cmds as mc
 
 import glTools.ui.utils
-import glTools.utils.lidSurface
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.lidSurface')
 
 class UIError(Exception): pass
 
@@ -1,7 +1,8 @@
 import maya.cmds as mc
 import glTools.ui.utils
-import glTools.utils.base
-import glTools.utils.mesh
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.base')
+glTools.utils.lazyImport.lazyModule('glTools.utils.mesh')
 
 class UIError(Exception): pass
 
@@ -1,7 +1,8 @@
 import maya.cmds as mc
 
-import glTools.tools.meshCache
-import glTools.utils.mesh
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.meshCache')
+glTools.utils.lazyImport.lazyModule('glTools.utils.mesh')
 
 def meshCacheUI():
 	'''
@@ -1,6 +1,7 @@
 import maya.cmds as mc
 
-import glTools.tools.mirrorDeformerWeights
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.mirrorDeformerWeights')
 
 def ui():
 	'''
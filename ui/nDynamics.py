@@ -1,10 +1,11 @@
 import maya.cmds as mc
 import maya.mel as mm
 
-import glTools.utils.attrPreset
-import glTools.utils.base
-import glTools.utils.mesh
-import glTools.utils.nDynamics
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.attrPreset')
+glTools.utils.lazyImport.lazyModule('glTools.utils.base')
+glTools.utils.lazyImport.lazyModule('glTools.utils.mesh')
+glTools.utils.lazyImport.lazyModule('glTools.utils.nDynamics')
 
 import glTools.ui.utils
 
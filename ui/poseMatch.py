@@ -1,5 +1,6 @@
 import maya.cmds as mc
-import glTools.tools.match
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.match')
 import glTools.ui.utils
 
 global gEvalOrder
@@ -1,5 +1,6 @@
 import maya.cmds as mc
-import glTools.utils.geometry
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.geometry')
 
 def replaceGeometryFromUI():
 	'''
@@ -1,5 +1,6 @@
 import maya.cmds as mc
-import glTools.utils.resolution
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.resolution')
 
 def addResAttr(isProp=True):
 	'''
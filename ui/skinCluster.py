@@ -1,5 +1,6 @@
 import maya.cmds as mc
-import glTools.utils.skinCluster
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.skinCluster')
 
 class UserInputError(Exception): pass
 
@@ -3,7 +3,8 @@ import maya.cmds as mc
 from glTools.data import data
 from glTools.data import skinClusterData
 
-import glTools.utils.skinCluster
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.skinCluster')
 
 import glTools.gl_global
 
@@ -1,5 +1,6 @@
 import maya.cmds as mc
-import glTools.tools.spaces
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.spaces')
 
 class UserInputError(Exception): pass
 
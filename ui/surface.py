@@ -1,6 +1,7 @@
 import maya.cmds as mc
 import glTools.ui.utils
-import glTools.utils.surface
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.surface')
 
 class UserInputError(Exception): pass
 class UIError(Exception): pass
@@ -1,6 +1,7 @@
 import maya.cmds as mc
 
-import glTools.tools.transformDrivenBlend
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.tools.transformDrivenBlend')
 import glTools.ui.utils
 
 def ui():
@@ -1,13 +1,14 @@
 import maya.cmds as mc
 import maya.mel as mm
 
-import glTools.utils.base
-import glTools.utils.curve
-import glTools.utils.mesh
-import glTools.utils.namespace
-import glTools.utils.osUtils
-import glTools.utils.stringUtils
-import glTools.utils.surface
+import glTools.utils.lazyImport
+glTools.utils.lazyImport.lazyModule('glTools.utils.base')
+glTools.utils.lazyImport.lazyModule('glTools.utils.curve')
+glTools.utils.lazyImport.lazyModule('glTools.utils.mesh')
+glTools.utils.lazyImport.lazyModule('glTools.utils.namespace')
+glTools.utils.lazyImport.lazyModule('glTools.utils.osUtils')
+glTools.utils.lazyImport.lazyModule('glTools.utils.stringUtils')
+glTools.utils.lazyImport.lazyModule('glTools.utils.surface')
 
 import re
 
@@ -1 +1,2 @@
-import component
+import lazyImport
+lazyImport.lazyModule(__name__+'.component')
@@ -0,0 +1,105 @@
+import maya.OpenMaya as OpenMaya
+import maya.OpenMayaAnim as OpenMayaAnim
+
+import glTools.utils.apiUndo
+import glTools.utils.arrayUtils
+
+# ==============
+# - Get Curves -
+# ==============
+
+def getChannelPlug(channel):
+	'''
+	Return the MPlug for the specified channel.
+	@param channel: Channel (node.attr) to get the plug for
+	@type channel: str
+	'''
+	selList = OpenMaya.MSelectionList()
+	try: selList.add(channel)
+	except: raise Exception('Channel "'+channel+'" does not exist!')
+	plug = OpenMaya.MPlug()
+	selList.getPlug(0,plug)
+	return plug
+
+def getChannelCurve(plug):
+	'''
+	Return the animCurve (MObject) connected to the specified channel plug.
+	Returns None if the channel has no incoming connection.
+	@param plug: Channel plug to get the animCurve for
+	@type plug: MPlug
+	'''
+	srcPlugs = OpenMaya.MPlugArray()
+	plug.connectedTo(srcPlugs,True,False)
+	if not srcPlugs.length(): return None
+	curveObj = srcPlugs[0].node()
+	if not curveObj.hasFn(OpenMaya.MFn.kAnimCurve):
+		raise Exception('Channel "'+plug.name()+'" is driven by a non animCurve node! Unable to write keys...')
+	return curveObj
+
+# ==============
+# - Write Keys -
+# ==============
+
+def writeKeys(channelList,frameList,valueList,preserveOutsideKeys=True):
+	'''
+	Key a list of channels over a list of frames. Each channel curve is written with a single MFnAnimCurve.addKeys call.
+	Missing curves are created and connected through a single MDGModifier. Existing keys within the frame range are replaced.
+	All edits are registered on the undo queue as a single entry (see glTools.utils.apiUndo).
+	Returns the list of animCurves, in channel order.
+	@param channelList: List of channels (node.attr) to key
+	@type channelList: list
+	@param frameList: Ordered list of key frames
+	@type frameList: list
+	@param valueList: List of key values per channel, one value per frame. Values are in internal units (ie. radians).
+	@type valueList: list
+	@param preserveOutsideKeys: Keep existing keys outside the frame range. If False, all existing keys are replaced.
+	@type preserveOutsideKeys: bool
+	'''
+	# Checks
+	if len(valueList) != len(channelList):
+		raise Exception('Value list length ('+str(len(valueList))+') does not match the channel count ('+str(len(channelList))+')!')
+	if not channelList or not frameList: return []
+
+	# Get Plugs
+	plugList = [getChannelPlug(channel) for channel in channelList]
+
+	# Time Array
+	timeArray = OpenMaya.MTimeArray()
+	for frame in frameList: timeArray.append(OpenMaya.MTime(frame,OpenMaya.MTime.uiUnit()))
+	startTime = timeArray[0]
+	endTime = timeArray[timeArray.length()-1]
+
+	curveList = []
+	with glTools.utils.apiUndo.ApiUndo() as undo:
+
+		# Get/Create Curves
+		dgMod = undo.dgModifier()
+		curveObjList = []
+		for plug in plugList:
+			curveObj = getChannelCurve(plug)
+			if curveObj == None: curveObj = OpenMayaAnim.MFnAnimCurve().create(plug,dgMod)
+			curveObjList.append(curveObj)
+		dgMod.doIt()
+
+		# Write Keys
+		animChange = undo.animCurveChange()
+		for i in range(len(curveObjList)):
+			curveFn = OpenMayaAnim.MFnAnimCurve(curveObjList[i])
+
+			# Remove Keys In Range
+			if preserveOutsideKeys:
+				for k in reversed(range(curveFn.numKeys())):
+					keyTime = curveFn.time(k)
+					if keyTime >= startTime and keyTime <= endTime: curveFn.remove(k,animChange)
+
+			valueArray = glTools.utils.arrayUtils.toMDoubleArray(valueList[i])
+			curveFn.addKeys(	timeArray,
+								valueArray,
+								OpenMayaAnim.MFnAnimCurve.kTangentGlobal,
+								OpenMayaAnim.MFnAnimCurve.kTangentGlobal,
+								preserveOutsideKeys,
+								animChange	)
+			curveList.append(curveFn.name())
+
+	# Return Result
+	return curveList
@@ -0,0 +1,181 @@
+'''
+Undoable API (OpenMaya) edits.
+Edits applied through MDGModifier/MDagModifier.doIt() or recorded in an MAnimCurveChange are not added to Maya's undo queue.
+An ApiUndo records these objects, and commit() registers them as a single undo queue entry (through the glToolsApiUndo command),
+so one undo reverts (and one redo reapplies) all of the recorded edits.
+	with glTools.utils.apiUndo.ApiUndo() as undo:
+		dgMod = undo.dgModifier()
+		dgMod.renameNode(nodeObj,'newName')
+		dgMod.doIt()
+Edits are committed when the scope exits, including on error, so partially applied edits can still be undone.
+This module is also loaded as a Maya plugin (see loadPlugin()) to register the glToolsApiUndo command.
+'''
+
+import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
+import maya.OpenMayaAnim as OpenMayaAnim
+import maya.OpenMayaMPx as OpenMayaMPx
+
+import glTools.utils.queryCache
+
+import os
+
+# =============
+# - Constants -
+# =============
+
+COMMAND_NAME = 'glToolsApiUndo'
+
+# ApiUndo objects waiting to be registered by the undo command
+_pending = []
+
+# ============
+# - Recorder -
+# ============
+
+class ApiUndo(object):
+	'''
+	Records API modifiers and anim curve changes, and registers them as a single undo queue entry on commit().
+	Edits are reverted in reverse order on undo, and reapplied in order on redo.
+	'''
+	def __init__(self):
+		self._items = []
+		self._committed = False
+
+	def dgModifier(self):
+		'''
+		Return a new recorded MDGModifier.
+		'''
+		return self._record(OpenMaya.MDGModifier())
+
+	def dagModifier(self):
+		'''
+		Return a new recorded MDagModifier.
+		'''
+		return self._record(OpenMaya.MDagModifier())
+
+	def animCurveChange(self):
+		'''
+		Return a new recorded MAnimCurveChange.
+		'''
+		return self._record(OpenMayaAnim.MAnimCurveChange())
+
+	def callback(self,undoFn,redoFn):
+		'''
+		Record an edit that is reverted and reapplied by callables. Use for API edits that do not support a modifier.
+		The edit should already be applied when it is recorded.
+		@param undoFn: Callable that reverts the edit
+		@type undoFn: function
+		@param redoFn: Callable that reapplies the edit
+		@type redoFn: function
+		'''
+		return self._record(_CallbackEdit(undoFn,redoFn))
+
+	def _record(self,item):
+		if self._committed: raise Exception('ApiUndo edits have already been committed!')
+		# Recorded edits modify the scene outside of maya.cmds
+		glTools.utils.queryCache.invalidate()
+		self._items.append(item)
+		return item
+
+	def undoIt(self):
+		'''
+		Revert all recorded edits.
+		'''
+		for item in reversed(self._items): item.undoIt()
+		glTools.utils.queryCache.invalidate()
+
+	def redoIt(self):
+		'''
+		Reapply all recorded edits.
+		'''
+		for item in self._items:
+			# MAnimCurveChange is reapplied with redoIt(), modifiers and callback edits with doIt()
+			if hasattr(item,'redoIt'): item.redoIt()
+			else: item.doIt()
+		glTools.utils.queryCache.invalidate()
+
+	def commit(self):
+		'''
+		Register the recorded edits as a single entry on the Maya undo queue.
+		Nothing is registered if no edits were recorded, or if undo is disabled.
+		'''
+		if self._committed: return
+		self._committed = True
+		glTools.utils.queryCache.invalidate()
+		if not self._items: return
+		if not mc.undoInfo(q=True,state=True): return
+
+		# Register Undo
+		loadPlugin()
+		_pending.append(self)
+		try: getattr(mc,COMMAND_NAME)()
+		finally:
+			if self in _pending: _pending.remove(self)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self,excType,excValue,tb):
+		self.commit()
+		return False
+
+class _CallbackEdit(object):
+	'''
+	Recorded edit that is reverted and reapplied by callables (see ApiUndo.callback()).
+	'''
+	def __init__(self,undoFn,redoFn):
+		self.undoFn = undoFn
+		self.redoFn = redoFn
+
+	def undoIt(self):
+		self.undoFn()
+
+	def doIt(self):
+		self.redoFn()
+
+# ==========
+# - Plugin -
+# ==========
+
+class ApiUndoCommand(OpenMayaMPx.MPxCommand):
+	'''
+	Undoable command that takes ownership of the pending ApiUndo edits.
+	The edits are already applied when the command runs, so doIt() only records them.
+	'''
+	def __init__(self):
+		OpenMayaMPx.MPxCommand.__init__(self)
+		self._undo = None
+
+	def isUndoable(self):
+		return True
+
+	def doIt(self,args):
+		# The plugin is loaded as a separate module, so get the pending edits from the glTools module
+		import glTools.utils.apiUndo
+		pending = glTools.utils.apiUndo._pending
+		if pending: self._undo = pending.pop(-1)
+
+	def undoIt(self):
+		if self._undo: self._undo.undoIt()
+
+	def redoIt(self):
+		if self._undo: self._undo.redoIt()
+
+def _commandCreator():
+	return OpenMayaMPx.asMPxPtr(ApiUndoCommand())
+
+def initializePlugin(mobject):
+	plugin = OpenMayaMPx.MFnPlugin(mobject,'glTools','1.0','Any')
+	plugin.registerCommand(COMMAND_NAME,_commandCreator)
+
+def uninitializePlugin(mobject):
+	plugin = OpenMayaMPx.MFnPlugin(mobject)
+	plugin.deregisterCommand(COMMAND_NAME)
+
+def loadPlugin():
+	'''
+	Load this module as a Maya plugin, to register the glToolsApiUndo command.
+	'''
+	if hasattr(mc,COMMAND_NAME): return
+	mc.loadPlugin(os.path.splitext(__file__)[0]+'.py',quiet=True)
@@ -42,3 +42,35 @@ def flattenList(listToFlatten):
 		else: elems.append(i)
 	return elems
 
+
+def toMDoubleArray(valueList):
+	'''
+	Build an MDoubleArray from a list of values with a single MScriptUtil copy.
+	@param valueList: The list of values to convert
+	@type valueList: list
+	'''
+	valueList = list(valueList)
+	if not valueList: return OpenMaya.MDoubleArray()
+	arrayUtil = OpenMaya.MScriptUtil()
+	arrayUtil.createFromList(valueList,len(valueList))
+	return OpenMaya.MDoubleArray(arrayUtil.asDoublePtr(),len(valueList))
+
+def toMFloatArray(valueList):
+	'''
+	Build an MFloatArray from a list of values with a single MScriptUtil copy.
+	@param valueList: The list of values to convert
+	@type valueList: list
+	'''
+	floatArray = OpenMaya.MFloatArray()
+	OpenMaya.MScriptUtil().createFloatArrayFromList(list(valueList),floatArray)
+	return floatArray
+
+def toMIntArray(valueList):
+	'''
+	Build an MIntArray from a list of values with a single MScriptUtil copy.
+	@param valueList: The list of values to convert
+	@type valueList: list
+	'''
+	intArray = OpenMaya.MIntArray()
+	OpenMaya.MScriptUtil().createIntArrayFromList(list(valueList),intArray)
+	return intArray
@@ -647,19 +647,14 @@ def closestPointIndex(pt,ptList):
 	@param ptList: List of target points
 	@type pt: list
 	'''
-	# Initialize
-	dist = 99999999999
-	ind = -1
+	# Check Target Points
+	if not ptList: return -1
 	
-	# Iterate over target points
-	for p in range(len(ptList)):
-		d = glTools.utils.mathUtils.distanceBetween(pt,ptList[p])
-		if d < dist:
-			dist = d
-			ind = p
+	# Get Target Point Distances
+	dist = glTools.utils.mathUtils.distanceArray(ptList,pt)
 	
 	# Return Result
-	return ind
+	return dist.index(min(dist))
 
 def unitConversion(plug,conversionFactor=1.0,conversionFactorSourcePlug='',plugIsSource=True,prefix=''):
 	'''
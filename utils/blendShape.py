@@ -1,5 +1,9 @@
 import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
 
+import glTools.utils.apiUndo
+import glTools.utils.arrayUtils
+import glTools.utils.base
 import glTools.utils.component
 import glTools.utils.deformer
 import glTools.utils.shape
@@ -549,6 +553,322 @@ def setTargetWeights(blendShape,target,wt,geometry=''):
 	# Set target weights
 	mc.setAttr(blendShape+'.it['+str(geomIndex)+'].itg['+str(targetIndex)+'].tw[0:'+str(compCount-1)+']',*wt)
 
+def _getTargetPlug(blendShape,target,geometry='',inbetween=None):
+	'''
+	Return the inputTargetGroup (or inputTargetItem, if inbetween is specified) MPlug of the specified blendShape target.
+	@param blendShape: Name of blendShape to get target plug for
+	@type blendShape: str
+	@param target: Name of blendShape target to get plug for
+	@type target: str
+	@param geometry: Name of blendShape driven geometry. If empty, use geometry index 0.
+	@type geometry: str
+	@param inbetween: Target inbetween weight to return the inputTargetItem plug for. If None, return the inputTargetGroup plug.
+	@type inbetween: float or None
+	'''
+	# Get Target and Geometry Index
+	targetIndex = getTargetIndex(blendShape,target)
+	geomIndex = 0
+	if geometry: geomIndex = glTools.utils.deformer.getGeomIndex(geometry,blendShape)
+	
+	# Get Target Plug
+	blendShapeFn = OpenMaya.MFnDependencyNode(glTools.utils.base.getMObject(blendShape))
+	targetPlug = blendShapeFn.findPlug('inputTarget').elementByLogicalIndex(geomIndex)
+	targetPlug = targetPlug.child(blendShapeFn.attribute('inputTargetGroup')).elementByLogicalIndex(targetIndex)
+	
+	# Get Inbetween Plug
+	if inbetween != None:
+		targetPlug = targetPlug.child(blendShapeFn.attribute('inputTargetItem')).elementByLogicalIndex(int(round(inbetween*1000))+5000)
+	
+	# Return Result
+	return targetPlug
+
+def _getTargetChildPlug(plug,attr):
+	'''
+	Return the named child plug of a blendShape compound target plug.
+	@param plug: Compound target plug to get child plug from
+	@type plug: MPlug
+	@param attr: Child attribute name
+	@type attr: str
+	'''
+	blendShapeFn = OpenMaya.MFnDependencyNode(plug.node())
+	return plug.child(blendShapeFn.attribute(attr))
+
+def getTargetWeightMap(blendShape,target,geometry=''):
+	'''
+	Get the dense per vertex target weight map for the specified blendShape target.
+	Weights are read from the existing (sparse) targetWeights elements via MPlug. Unset elements return the default weight of 1.0.
+	@param blendShape: Name of blendShape to get target weights for
+	@type blendShape: str
+	@param target: Name of blendShape target to get weights for
+	@type target: str
+	@param geometry: Name of blendShape driven geometry to get weights from
+	@type geometry: str
+	'''
+	# Check blendShape
+	if not isBlendShape(blendShape):
+		raise Exception('Object "'+blendShape+'" is not a valid blendShape node!')
+	
+	# Get Component Count
+	if not geometry: geometry = getBaseGeo(blendShape)[0]
+	compCount = glTools.utils.component.getComponentCount(geometry)
+	
+	# Get Target Weight Plug
+	weightPlug = _getTargetChildPlug(_getTargetPlug(blendShape,target,geometry),'targetWeights')
+	
+	# Get Weights
+	indexList = OpenMaya.MIntArray()
+	weightPlug.getExistingArrayAttributeIndices(indexList)
+	wt = [1.0 for i in xrange(compCount)]
+	for i in indexList:
+		if i < compCount: wt[i] = weightPlug.elementByLogicalIndex(i).asFloat()
+	
+	# Return Result
+	return wt
+
+def setTargetWeightMap(blendShape,target,wt,geometry=''):
+	'''
+	Set the dense per vertex target weight map for the specified blendShape target via MPlug.
+	Plug values are set through a single recorded MDGModifier, so the change is undoable (see glTools.utils.apiUndo).
+	@param blendShape: Name of blendShape to set target weights for
+	@type blendShape: str
+	@param target: Name of blendShape target to set weights for
+	@type target: str
+	@param wt: Weight value list to apply to the specified blendShape target
+	@type wt: list
+	@param geometry: Name of blendShape driven geometry to set weights on
+	@type geometry: str
+	'''
+	# Check blendShape
+	if not isBlendShape(blendShape):
+		raise Exception('Object "'+blendShape+'" is not a valid blendShape node!')
+	
+	# Get Target Weight Plug
+	weightPlug = _getTargetChildPlug(_getTargetPlug(blendShape,target,geometry),'targetWeights')
+	
+	# Set Weights
+	with glTools.utils.apiUndo.ApiUndo() as undo:
+		dgMod = undo.dgModifier()
+		for i in xrange(len(wt)): dgMod.newPlugValueFloat(weightPlug.elementByLogicalIndex(i),wt[i])
+		dgMod.doIt()
+
+def getTargetDeltas(blendShape,target,geometry='',inbetween=1.0):
+	'''
+	Get the sparse point deltas stored on the specified blendShape target.
+	Deltas are read from the inputPointsTarget and inputComponentsTarget attributes.
+	Returns a tuple of (componentIndexList,deltaList).
+	@param blendShape: Name of blendShape to get target deltas for
+	@type blendShape: str
+	@param target: Name of blendShape target to get deltas for
+	@type target: str
+	@param geometry: Name of blendShape driven geometry to get deltas for
+	@type geometry: str
+	@param inbetween: Target inbetween weight to get deltas for
+	@type inbetween: float
+	'''
+	# Check blendShape
+	if not isBlendShape(blendShape):
+		raise Exception('Object "'+blendShape+'" is not a valid blendShape node!')
+	
+	# Get Target Item Plug
+	itemPlug = _getTargetPlug(blendShape,target,geometry,inbetween)
+	pointPlug = _getTargetChildPlug(itemPlug,'inputPointsTarget')
+	componentPlug = _getTargetChildPlug(itemPlug,'inputComponentsTarget')
+	
+	# Get Deltas
+	pointObj = pointPlug.asMObject()
+	if pointObj.isNull(): return [],[]
+	pointArray = OpenMaya.MFnPointArrayData(pointObj).array()
+	deltaList = [(pointArray[i].x,pointArray[i].y,pointArray[i].z) for i in xrange(pointArray.length())]
+	
+	# Get Component Indices
+	indexList = []
+	componentObj = componentPlug.asMObject()
+	if not componentObj.isNull():
+		componentListFn = OpenMaya.MFnComponentListData(componentObj)
+		elementArray = OpenMaya.MIntArray()
+		for i in xrange(componentListFn.length()):
+			OpenMaya.MFnSingleIndexedComponent(componentListFn[i]).getElements(elementArray)
+			indexList.extend(list(elementArray))
+	
+	# Check Result
+	if len(indexList) != len(deltaList):
+		raise Exception('BlendShape "'+blendShape+'" target "'+target+'" component and delta count mis-match!')
+	
+	# Return Result
+	return indexList,deltaList
+
+def setTargetDeltas(blendShape,target,indexList,deltaList,geometry='',inbetween=1.0):
+	'''
+	Set the sparse point deltas of the specified blendShape target.
+	Deltas are written directly to the inputPointsTarget and inputComponentsTarget attributes,
+	through a recorded MDGModifier, so the change is undoable (see glTools.utils.apiUndo).
+	@param blendShape: Name of blendShape to set target deltas for
+	@type blendShape: str
+	@param target: Name of blendShape target to set deltas for
+	@type target: str
+	@param indexList: List of component indices for each delta
+	@type indexList: list
+	@param deltaList: List of point deltas
+	@type deltaList: list
+	@param geometry: Name of blendShape driven geometry to set deltas for
+	@type geometry: str
+	@param inbetween: Target inbetween weight to set deltas for
+	@type inbetween: float
+	'''
+	# Check blendShape
+	if not isBlendShape(blendShape):
+		raise Exception('Object "'+blendShape+'" is not a valid blendShape node!')
+	
+	# Check Deltas
+	if len(indexList) != len(deltaList):
+		raise Exception('Component index and delta list length mis-match!')
+	
+	# Get Component Type
+	if not geometry: geometry = getBaseGeo(blendShape)[0]
+	geoShape = geometry
+	if mc.objectType(geoShape) == 'transform':
+		geoShape = mc.listRelatives(geoShape,s=True,ni=True,pa=True)[0]
+	geoType = mc.objectType(geoShape)
+	if geoType == 'mesh': componentType = OpenMaya.MFn.kMeshVertComponent
+	elif geoType == 'nurbsCurve': componentType = OpenMaya.MFn.kCurveCVComponent
+	else: raise Exception('Unsupported blendShape geometry type "'+geoType+'"!')
+	
+	# Build Point Array Data
+	pointArray = OpenMaya.MPointArray(len(deltaList),OpenMaya.MPoint.origin)
+	for i in xrange(len(deltaList)): pointArray.set(i,deltaList[i][0],deltaList[i][1],deltaList[i][2],1.0)
+	pointObj = OpenMaya.MFnPointArrayData().create(pointArray)
+	
+	# Build Component List Data
+	componentFn = OpenMaya.MFnSingleIndexedComponent()
+	componentObj = componentFn.create(componentType)
+	componentFn.addElements(glTools.utils.arrayUtils.toMIntArray(indexList))
+	componentListFn = OpenMaya.MFnComponentListData()
+	componentListObj = componentListFn.create()
+	componentListFn.add(componentObj)
+	
+	# Set Target Item Data
+	itemPlug = _getTargetPlug(blendShape,target,geometry,inbetween)
+	with glTools.utils.apiUndo.ApiUndo() as undo:
+		dgMod = undo.dgModifier()
+		dgMod.newPlugValue(_getTargetChildPlug(itemPlug,'inputPointsTarget'),pointObj)
+		dgMod.newPlugValue(_getTargetChildPlug(itemPlug,'inputComponentsTarget'),componentListObj)
+		dgMod.doIt()
+
+def addDeltaTarget(blendShape,targetName,indexList,deltaList,geometry='',targetWeight=0.0):
+	'''
+	Add a new blendShape target directly from sparse point deltas, without creating target geometry.
+	@param blendShape: Name of blendShape to add target to
+	@type blendShape: str
+	@param targetName: Alias name for the new target
+	@type targetName: str
+	@param indexList: List of component indices for each delta
+	@type indexList: list
+	@param deltaList: List of point deltas
+	@type deltaList: list
+	@param geometry: Name of blendShape driven geometry to add the target deltas for
+	@type geometry: str
+	@param targetWeight: Set the target weight value
+	@type targetWeight: float
+	'''
+	# Check blendShape
+	if not isBlendShape(blendShape):
+		raise Exception('Object "'+blendShape+'" is not a valid blendShape node!')
+	if mc.objExists(blendShape+'.'+targetName):
+		raise Exception('BlendShape "'+blendShape+'" already has a target "'+targetName+'"!')
+	
+	mc.undoInfo(openChunk=True)
+	try:
+		# Add Target Weight
+		targetIndex = nextAvailableTargetIndex(blendShape)
+		mc.setAttr(blendShape+'.weight['+str(targetIndex)+']',targetWeight)
+		mc.aliasAttr(targetName,blendShape+'.weight['+str(targetIndex)+']')
+		
+		# Set Target Deltas
+		setTargetDeltas(blendShape,targetName,indexList,deltaList,geometry)
+	finally:
+		mc.undoInfo(closeChunk=True)
+	
+	# Return Result
+	return (blendShape+'.'+targetName)
+
+def weightDeltas(indexList,deltaList,weightList,tolerance=0.0):
+	'''
+	Scale sparse point deltas by a dense per vertex weight list.
+	Deltas with a weighted length at or below the tolerance are dropped.
+	Returns a tuple of (componentIndexList,deltaList).
+	@param indexList: List of component indices for each delta
+	@type indexList: list
+	@param deltaList: List of point deltas
+	@type deltaList: list
+	@param weightList: Dense per vertex weight list
+	@type weightList: list
+	@param tolerance: Delta length tolerance
+	@type tolerance: float
+	'''
+	tol = tolerance*tolerance
+	resultIndex = []
+	resultDelta = []
+	for i in xrange(len(indexList)):
+		w = weightList[indexList[i]]
+		d = deltaList[i]
+		delta = (d[0]*w,d[1]*w,d[2]*w)
+		if (delta[0]*delta[0] + delta[1]*delta[1] + delta[2]*delta[2]) <= tol: continue
+		resultIndex.append(indexList[i])
+		resultDelta.append(delta)
+	return resultIndex,resultDelta
+
+def extractShapePoints(basePts,targetPts,weightList):
+	'''
+	Calculate weighted shape points in memory (base + weight * (target - base)).
+	@param basePts: Base point list
+	@type basePts: list
+	@param targetPts: Target point list
+	@type targetPts: list
+	@param weightList: Dense per vertex weight list
+	@type weightList: list
+	'''
+	# Check Point Counts
+	if (len(basePts) != len(targetPts)) or (len(basePts) != len(weightList)):
+		raise Exception('Base, target and weight list length mis-match!')
+	
+	# Return Result
+	return [	(	b[0] + w*(t[0]-b[0]),
+					b[1] + w*(t[1]-b[1]),
+					b[2] + w*(t[2]-b[2])	) for b,t,w in zip(basePts,targetPts,weightList)	]
+
+def splitTarget(blendShape,target,weightMaps,geometry='',tolerance=0.00001):
+	'''
+	Split a blendShape target into regions in memory. Target deltas are read once, weighted by each
+	region weight map and added back to the blendShape as new geometry-less targets.
+	No temporary geometry or blendShape nodes are created.
+	@param blendShape: Name of blendShape containing the target to split
+	@type blendShape: str
+	@param target: Name of blendShape target to split
+	@type target: str
+	@param weightMaps: Dictionary of region target name and dense weight list pairs ({targetName:weightList})
+	@type weightMaps: dict
+	@param geometry: Name of blendShape driven geometry to split target deltas for
+	@type geometry: str
+	@param tolerance: Drop region deltas with a weighted length at or below this value
+	@type tolerance: float
+	'''
+	# Get Target Deltas
+	indexList,deltaList = getTargetDeltas(blendShape,target,geometry)
+	
+	# Build Region Targets
+	targetList = []
+	mc.undoInfo(openChunk=True)
+	try:
+		for targetName in sorted(weightMaps.keys()):
+			regionIndex,regionDelta = weightDeltas(indexList,deltaList,weightMaps[targetName],tolerance)
+			targetList.append(addDeltaTarget(blendShape,targetName,regionIndex,regionDelta,geometry))
+	finally:
+		mc.undoInfo(closeChunk=True)
+	
+	# Return Result
+	return targetList
+
+
 def connectToTarget(blendShape,targetGeo,targetName,baseGeo,weight=1.0,force=False):
 	'''
 	Connect a new target geometry to a specified blendShape target
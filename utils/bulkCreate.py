@@ -0,0 +1,249 @@
+import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
+
+import glTools.utils.apiUndo
+import glTools.utils.mathUtils
+
+import math
+
+# ==========
+# - Checks -
+# ==========
+
+def _checkListLength(valueList,count,label):
+	'''
+	Verify that an optional per node value list is empty or matches the node count.
+	'''
+	if valueList and len(valueList) != count:
+		raise Exception(label+' list length ('+str(len(valueList))+') does not match the node count ('+str(count)+')!')
+
+# ================
+# - Create Nodes -
+# ================
+
+def createNodes(	nameList,
+					nodeType		= 'transform',
+					positionList	= [],
+					rotationList	= [],
+					parentList		= [],
+					localScale		= None,
+					worldSpace		= True ):
+	'''
+	Create a list of DAG nodes through a single MDagModifier.
+	Shape node types (ie. "locator") are created with a parent transform, and the shape is renamed to match.
+	The whole batch is a single undoable operation (see glTools.utils.apiUndo). Returns the list of created (transform) node names.
+	@param nameList: List of node names. Maya will rename nodes if the name is not unique.
+	@type nameList: list
+	@param nodeType: DAG node type to create ("transform", "joint", "locator", ...)
+	@type nodeType: str
+	@param positionList: List of world space positions. If empty, nodes are created at the origin.
+	@type positionList: list
+	@param rotationList: List of (XYZ euler) rotation values, in degrees. Rotations are relative to the parent.
+	@type rotationList: list
+	@param parentList: List of parents. Parents can be existing scene nodes or names from nameList (of earlier nodes in the list). Use None for world.
+	@type parentList: list
+	@param localScale: Locator shape local scale. Only used for locator nodes.
+	@type localScale: float or None
+	@param worldSpace: Positions are world space. If False, positions are set as local translate values.
+	@type worldSpace: bool
+	'''
+	# ==========
+	# - Checks -
+	# ==========
+
+	count = len(nameList)
+	if not count: return []
+	_checkListLength(positionList,count,'Position')
+	_checkListLength(rotationList,count,'Rotation')
+	_checkListLength(parentList,count,'Parent')
+
+	# Get Existing Parents
+	nameIndex = dict([(nameList[i],i) for i in xrange(count)])
+	parentObjList = {}
+	for parent in set([p for p in parentList if p and not nameIndex.has_key(p)]):
+		if not mc.objExists(parent): raise Exception('Parent "'+parent+'" does not exist!')
+		selList = OpenMaya.MSelectionList()
+		selList.add(parent)
+		parentObj = OpenMaya.MObject()
+		selList.getDependNode(0,parentObj)
+		parentObjList[parent] = parentObj
+
+	# ================
+	# - Create Nodes -
+	# ================
+
+	with glTools.utils.apiUndo.ApiUndo() as undo:
+
+		dagMod = undo.dagModifier()
+		nodeObjList = []
+		for i in xrange(count):
+			nodeObj = dagMod.createNode(nodeType)
+			dagMod.renameNode(nodeObj,nameList[i])
+			nodeObjList.append(nodeObj)
+
+		# Parent Nodes
+		for i in xrange(len(parentList)):
+			parent = parentList[i]
+			if not parent: continue
+			if nameIndex.has_key(parent): parentObj = nodeObjList[nameIndex[parent]]
+			else: parentObj = parentObjList[parent]
+			dagMod.reparentNode(nodeObjList[i],parentObj)
+
+		dagMod.doIt()
+
+		# Rename Shapes
+		shapeMod = undo.dagModifier()
+		shapeObjList = []
+		for i in xrange(count):
+			dagFn = OpenMaya.MFnDagNode(nodeObjList[i])
+			if dagFn.childCount() and dagFn.child(0).hasFn(OpenMaya.MFn.kShape):
+				shapeObj = dagFn.child(0)
+				shapeMod.renameNode(shapeObj,dagFn.name()+'Shape')
+				shapeObjList.append(shapeObj)
+		if shapeObjList: shapeMod.doIt()
+
+		# ===================
+		# - Set Node Values -
+		# ===================
+
+		# Values are set directly on the new nodes. Undo deletes the nodes, so values only need to be reapplied on redo.
+
+		space = OpenMaya.MSpace.kTransform
+		if worldSpace: space = OpenMaya.MSpace.kWorld
+
+		def setNodeValues():
+			for i in xrange(count):
+				transformFn = OpenMaya.MFnTransform(nodeObjList[i])
+				dagPath = OpenMaya.MDagPath()
+				transformFn.getPath(dagPath)
+				transformFn.setObject(dagPath)
+
+				# Rotation
+				if rotationList:
+					rot = rotationList[i]
+					transformFn.setRotation(OpenMaya.MEulerRotation(math.radians(rot[0]),math.radians(rot[1]),math.radians(rot[2])))
+
+				# Position
+				if positionList:
+					pos = positionList[i]
+					transformFn.setTranslation(OpenMaya.MVector(pos[0],pos[1],pos[2]),space)
+
+			# Locator Scale
+			if localScale != None:
+				for shapeObj in shapeObjList:
+					shapeFn = OpenMaya.MFnDependencyNode(shapeObj)
+					if not shapeFn.hasAttribute('localScale'): continue
+					for axis in 'XYZ': shapeFn.findPlug('localScale'+axis).setDouble(localScale)
+
+		setNodeValues()
+		undo.callback(lambda: None,setNodeValues)
+
+	# =================
+	# - Return Result -
+	# =================
+
+	nodeList = []
+	for nodeObj in nodeObjList:
+		dagPath = OpenMaya.MDagPath()
+		OpenMaya.MFnDagNode(nodeObj).getPath(dagPath)
+		nodeList.append(dagPath.partialPathName())
+	return nodeList
+
+def createLocators(nameList,positionList=[],rotationList=[],parentList=[],localScale=1.0,worldSpace=True):
+	'''
+	Create a list of locators through a single MDagModifier. See createNodes().
+	@param nameList: List of locator names
+	@type nameList: list
+	@param positionList: List of world space positions
+	@type positionList: list
+	@param rotationList: List of (XYZ euler) rotation values, in degrees
+	@type rotationList: list
+	@param parentList: List of parents (existing scene nodes, names from nameList or None)
+	@type parentList: list
+	@param localScale: Locator shape local scale
+	@type localScale: float
+	@param worldSpace: Positions are world space. If False, positions are set as local translate values.
+	@type worldSpace: bool
+	'''
+	return createNodes(nameList,'locator',positionList,rotationList,parentList,localScale,worldSpace)
+
+def createJoints(nameList,positionList=[],rotationList=[],parentList=[],worldSpace=True):
+	'''
+	Create a list of joints through a single MDagModifier. See createNodes().
+	@param nameList: List of joint names
+	@type nameList: list
+	@param positionList: List of world space positions
+	@type positionList: list
+	@param rotationList: List of (XYZ euler) rotation values, in degrees
+	@type rotationList: list
+	@param parentList: List of parents (existing scene nodes, names from nameList or None)
+	@type parentList: list
+	@param worldSpace: Positions are world space. If False, positions are set as local translate values.
+	@type worldSpace: bool
+	'''
+	return createNodes(nameList,'joint',positionList,rotationList,parentList,None,worldSpace)
+
+# ============
+# - Rotation -
+# ============
+
+def aimRotations(aimList,upVector=(0,1,0)):
+	'''
+	Return the (XYZ euler) rotations, in degrees, that aim the X axis along each vector in a list,
+	with the Y axis towards a common up vector. Matches the default normalConstraint/aimConstraint orientation.
+	@param aimList: List of aim vectors
+	@type aimList: list
+	@param upVector: World up vector
+	@type upVector: tuple or list
+	'''
+	up = glTools.utils.mathUtils.normalizeVector(upVector)
+	altUp = (up[1],up[2],up[0])
+	rotationList = []
+	for aim in aimList:
+
+		# Build Orthonormal Frame
+		x = glTools.utils.mathUtils.normalizeVector(aim)
+		z = glTools.utils.mathUtils.crossProduct(x,up)
+		if glTools.utils.mathUtils.mag(z) < 0.000001: z = glTools.utils.mathUtils.crossProduct(x,altUp)
+		z = glTools.utils.mathUtils.normalizeVector(z)
+		y = glTools.utils.mathUtils.crossProduct(z,x)
+
+		# Extract XYZ Euler Rotation (row axis matrix = Rx*Ry*Rz)
+		sy = max(-1.0,min(1.0,-x[2]))
+		ry = math.asin(sy)
+		if abs(sy) < 0.999999:
+			rx = math.atan2(y[2],z[2])
+			rz = math.atan2(x[1],x[0])
+		else:
+			rx = 0.0
+			rz = math.atan2(-y[0],y[1])
+		rotationList.append((math.degrees(rx),math.degrees(ry),math.degrees(rz)))
+
+	return rotationList
+
+def surfaceNormalRotations(surface,positionList,upVector=(0,1,0)):
+	'''
+	Return the (XYZ euler) rotations, in degrees, that orient the X axis along the closest surface normal
+	to each position in a list. Replaces per node temporary normalConstraints.
+	@param surface: Mesh or NURBS surface to get closest normals from
+	@type surface: str
+	@param positionList: List of world space positions
+	@type positionList: list
+	@param upVector: World up vector
+	@type upVector: tuple or list
+	'''
+	# Import Geometry Utils (local import, to avoid a circular dependency with utils.curve and utils.mesh)
+	import glTools.utils.mesh
+	import glTools.utils.surface
+
+	# Get Closest Normals
+	if glTools.utils.mesh.isMesh(surface):
+		normalList = glTools.utils.mesh.closestNormals(surface,positionList)
+	elif glTools.utils.surface.isSurface(surface):
+		evaluator = glTools.utils.surface.SurfaceEvaluator(surface)
+		normalList = evaluator.normals(evaluator.closestUVs(positionList))
+	else:
+		raise Exception('Object "'+surface+'" is not a valid mesh or nurbs surface!')
+
+	# Return Result
+	return aimRotations(normalList,upVector)
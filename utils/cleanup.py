@@ -1,5 +1,6 @@
 import maya.mel as mm
 import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
 
 import glTools.utils.attribute
 import glTools.utils.base
@@ -638,6 +639,425 @@ def displayOverridesCheck(objList=[]):
 	# Return Result
 	return displayOverrideList
 
+# ===============
+# - Scene Audit -
+# ===============
+
+class SceneTable(object):
+	'''
+	Columnar table of scene node data, gathered with a single dependency graph traversal.
+	Each column is a list indexed by node, so audit checks can evaluate scene data without
+	issuing per node commands. Only the requested columns are gathered.
+	'''
+	# Available columns (base columns are always gathered)
+	baseColumns = ['name','type','isDag','isTransform','isShape','isDefault']
+	dagColumns = ['fullPath','parent','children','intermediate','overrideEnabled']
+	transformColumns = ['translate','rotate','scale']
+	attrColumns = ['userAttrs']
+	
+	def __init__(self,columns=[]):
+		'''
+		SceneTable class initializer
+		@param columns: List of columns to gather. If empty, gather all available columns.
+		@type columns: list
+		'''
+		self.columns = {}
+		self.index = {}
+		self.pathIndex = {}
+		self.size = 0
+		
+		self.build(columns)
+	
+	def __len__(self):
+		return self.size
+	
+	def __getitem__(self,column):
+		return self.columns[column]
+	
+	def build(self,columns=[]):
+		'''
+		Gather scene data for the requested columns.
+		@param columns: List of columns to gather. If empty, gather all available columns.
+		@type columns: list
+		'''
+		# Check Columns
+		allColumns = self.baseColumns + self.dagColumns + self.transformColumns + self.attrColumns
+		if not columns: columns = allColumns
+		for column in columns:
+			if not allColumns.count(column):
+				raise Exception('Invalid scene table column "'+column+'"!')
+		
+		getDag = bool(set(columns).intersection(self.dagColumns))
+		getTransform = bool(set(columns).intersection(self.transformColumns))
+		getAttrs = columns.count('userAttrs')
+		
+		# Initialize Columns
+		self.columns = {}
+		for column in self.baseColumns: self.columns[column] = []
+		if getDag:
+			for column in self.dagColumns: self.columns[column] = []
+		if getTransform:
+			for column in self.transformColumns: self.columns[column] = []
+		if getAttrs: self.columns['userAttrs'] = []
+		
+		name = self.columns['name']
+		nodeType = self.columns['type']
+		isDag = self.columns['isDag']
+		isTransform = self.columns['isTransform']
+		isShape = self.columns['isShape']
+		isDefault = self.columns['isDefault']
+		
+		parentPathList = []
+		
+		# ========================
+		# - Traverse Scene Graph -
+		# ========================
+		
+		depFn = OpenMaya.MFnDependencyNode()
+		dagFn = OpenMaya.MFnDagNode()
+		nodeIt = OpenMaya.MItDependencyNodes()
+		while not nodeIt.isDone():
+			
+			mObject = nodeIt.thisNode()
+			depFn.setObject(mObject)
+			
+			dag = mObject.hasFn(OpenMaya.MFn.kDagNode)
+			transform = mObject.hasFn(OpenMaya.MFn.kTransform)
+			
+			# Base Columns
+			if dag:
+				dagFn.setObject(mObject)
+				name.append(dagFn.partialPathName())
+			else:
+				name.append(depFn.name())
+			nodeType.append(depFn.typeName())
+			isDag.append(dag)
+			isTransform.append(transform)
+			isShape.append(mObject.hasFn(OpenMaya.MFn.kShape))
+			isDefault.append(depFn.isDefaultNode())
+			
+			# DAG Columns
+			if getDag:
+				if dag:
+					fullPath = dagFn.fullPathName()
+					parentPathList.append(fullPath.rsplit('|',1)[0])
+					self.columns['fullPath'].append(fullPath)
+					self.columns['intermediate'].append(dagFn.isIntermediateObject())
+					self.columns['overrideEnabled'].append(depFn.findPlug('overrideEnabled').asBool())
+				else:
+					parentPathList.append('')
+					self.columns['fullPath'].append('')
+					self.columns['intermediate'].append(False)
+					self.columns['overrideEnabled'].append(False)
+				self.columns['children'].append([])
+			
+			# Transform Columns
+			if getTransform:
+				if transform:
+					self.columns['translate'].append([depFn.findPlug(attr).asDouble() for attr in ['tx','ty','tz']])
+					self.columns['rotate'].append([depFn.findPlug(attr).asDouble() for attr in ['rx','ry','rz']])
+					self.columns['scale'].append([depFn.findPlug(attr).asDouble() for attr in ['sx','sy','sz']])
+				else:
+					self.columns['translate'].append(None)
+					self.columns['rotate'].append(None)
+					self.columns['scale'].append(None)
+			
+			# Attribute Columns
+			if getAttrs:
+				userAttrs = []
+				for i in range(depFn.attributeCount()):
+					attr = depFn.attribute(i)
+					if depFn.attributeClass(attr) == OpenMaya.MFnDependencyNode.kLocalDynamicAttr:
+						userAttrs.append(OpenMaya.MFnAttribute(attr).name())
+				self.columns['userAttrs'].append(userAttrs)
+			
+			nodeIt.next()
+		
+		# ====================
+		# - Build Name Index -
+		# ====================
+		
+		self.size = len(name)
+		self.index = dict([(name[i],i) for i in range(self.size)])
+		
+		# =========================
+		# - Build DAG Connections -
+		# =========================
+		
+		self.pathIndex = {}
+		if getDag:
+			fullPath = self.columns['fullPath']
+			self.pathIndex = dict([(fullPath[i],i) for i in range(self.size) if isDag[i]])
+			parent = self.columns['parent']
+			children = self.columns['children']
+			for i in range(self.size):
+				p = self.pathIndex.get(parentPathList[i],-1)
+				parent.append(p)
+				if p >= 0: children[p].append(i)
+	
+	def column(self,column):
+		'''
+		Return the specified table column
+		@param column: Name of the column to return
+		@type column: str
+		'''
+		if not self.columns.has_key(column):
+			raise Exception('Scene table column "'+column+'" was not gathered!')
+		return self.columns[column]
+	
+	def select(self,nodeList=[]):
+		'''
+		Return the table indices of the specified nodes. If empty, return all table indices.
+		@param nodeList: List of nodes to return table indices for.
+		@type nodeList: list
+		'''
+		if not nodeList: return range(self.size)
+		indexList = []
+		for node in mc.ls(nodeList) or []:
+			if self.index.has_key(node): indexList.append(self.index[node])
+		return indexList
+	
+	def shapes(self,i):
+		'''
+		Return the table indices of the shape children of the specified transform
+		@param i: Table index of the transform to return shapes for
+		@type i: int
+		'''
+		isShape = self.columns['isShape']
+		return [c for c in self.column('children')[i] if isShape[c]]
+
+class SceneAudit(object):
+	'''
+	Scene audit engine. Registered checks are evaluated against a single SceneTable,
+	so the scene is only traversed once regardless of the number of checks.
+	'''
+	def __init__(self,nodeList=[]):
+		'''
+		SceneAudit class initializer
+		@param nodeList: List of nodes to audit. If empty, audit all scene nodes.
+		@type nodeList: list
+		'''
+		self.nodeList = nodeList
+		self.checks = []
+		self.table = None
+		self.result = {}
+		self.timing = {}
+	
+	def registerCheck(self,name,func,columns=[]):
+		'''
+		Register an audit check.
+		The check function is called with the scene table and the list of table indices to check,
+		and should return a list of failed node (or attribute) names.
+		@param name: Check name
+		@type name: str
+		@param func: Check function
+		@type func: function
+		@param columns: Scene table columns required by the check
+		@type columns: list
+		'''
+		self.checks.append((name,func,columns))
+	
+	def registerDefaultChecks(self):
+		'''
+		Register the default set of table based scene checks.
+		'''
+		self.registerCheck('uniqueName',auditUniqueName)
+		self.registerCheck('validName',auditValidName)
+		self.registerCheck('shapeName',auditShapeName,['parent'])
+		self.registerCheck('intermediateShapes',auditIntermediateShapes,['children','intermediate'])
+		self.registerCheck('multipleShape',auditMultipleShape,['children'])
+		self.registerCheck('userAttr',auditUserAttr,['userAttrs'])
+		self.registerCheck('emptyGroup',auditEmptyGroup,['children'])
+		self.registerCheck('unknownNode',auditUnknownNode)
+		self.registerCheck('transforms',auditTransforms,['translate','rotate','scale'])
+		self.registerCheck('displayOverrides',auditDisplayOverrides,['overrideEnabled'])
+	
+	def run(self,verbose=True):
+		'''
+		Build the scene table and evaluate all registered checks.
+		Returns a dictionary of check results (keyed by check name).
+		@param verbose: Print per check timing and failure counts
+		@type verbose: bool
+		'''
+		# Build Scene Table
+		columns = []
+		for check in self.checks:
+			for column in check[2]:
+				if not columns.count(column): columns.append(column)
+		
+		timer = mc.timerX()
+		self.table = SceneTable(columns or SceneTable.baseColumns)
+		self.timing = {'sceneTable':mc.timerX(st=timer)}
+		if verbose: print('# Scene Audit: Scene Table ('+str(len(self.table))+' nodes) - '+str(self.timing['sceneTable']))
+		
+		indexList = self.table.select(self.nodeList)
+		
+		# Run Checks
+		self.result = {}
+		for name,func,cols in self.checks:
+			timer = mc.timerX()
+			self.result[name] = func(self.table,indexList)
+			self.timing[name] = mc.timerX(st=timer)
+			if verbose: print('# Scene Audit: '+name+' ('+str(len(self.result[name]))+' failed) - '+str(self.timing[name]))
+		
+		# Return Result
+		return self.result
+
+def sceneAudit(nodeList=[],verbose=True):
+	'''
+	Run all default scene checks in a single pass of the scene graph.
+	@param nodeList: List of nodes to audit. If empty, audit all scene nodes.
+	@type nodeList: list
+	@param verbose: Print per check timing and failure counts
+	@type verbose: bool
+	'''
+	audit = SceneAudit(nodeList)
+	audit.registerDefaultChecks()
+	return audit.run(verbose=verbose)
+
+# ================
+# - Audit Checks -
+# ================
+
+def auditUniqueName(table,indexList):
+	'''
+	Scene audit check - Return a list of DAG nodes with non unique names
+	'''
+	name = table['name']
+	isDag = table['isDag']
+	return [name[i] for i in indexList if isDag[i] and name[i].count('|')]
+
+def auditValidName(table,indexList):
+	'''
+	Scene audit check - Return a list of nodes with invalid names
+	'''
+	name = table['name']
+	nodeType = table['type']
+	isTransform = table['isTransform']
+	
+	defNodes = ['dof1','time1','lambert1','postProcessList1','sequenceManager1','lightLinker1','renderGlobalsList1','dynController1','lightList1','particleCloud1','shaderGlow1']
+	filterTypes = ['objectTypeFilter','objectNameFilter','objectScriptFilter']
+	digitSearch = re.compile('(\d+)$')
+	
+	result = []
+	for i in indexList:
+		obj = name[i]
+		if defNodes.count(obj) or obj.startswith('default'): continue
+		if filterTypes.count(nodeType[i]): continue
+		if obj.count('pasted') or obj.count('poly') or obj.count('__'):
+			result.append(obj)
+		elif isTransform[i] and digitSearch.search(obj):
+			result.append(obj)
+	return result
+
+def auditShapeName(table,indexList,typeList=['mesh','nurbsCurve','nurbsSurface'],skipIntermediates=True,strict=True):
+	'''
+	Scene audit check - Return a list of incorrectly named geometry shape nodes
+	'''
+	name = table['name']
+	nodeType = table['type']
+	parent = table['parent']
+	intermediate = table['intermediate']
+	
+	result = []
+	for i in indexList:
+		if not typeList.count(nodeType[i]): continue
+		if skipIntermediates and intermediate[i]: continue
+		if parent[i] < 0: continue
+		
+		shape = name[i]
+		parentName = name[parent[i]]
+		shapeSN = shape.split('|')[-1]
+		parentSN = parentName.split('|')[-1]
+		
+		if strict and (shape != parentName+'Shape'): result.append(shape)
+		elif not shapeSN.startswith(parentSN): result.append(shape)
+		elif not shapeSN.count('Shape'): result.append(shape)
+	return result
+
+def auditIntermediateShapes(table,indexList):
+	'''
+	Scene audit check - Return a list of intermediate shapes
+	'''
+	name = table['name']
+	intermediate = table['intermediate']
+	isTransform = table['isTransform']
+	
+	result = []
+	for i in indexList:
+		if not isTransform[i]: continue
+		result.extend([name[s] for s in table.shapes(i) if intermediate[s]])
+	return result
+
+def auditMultipleShape(table,indexList,typeList=['mesh','nurbsSurface','nurbsCurve']):
+	'''
+	Scene audit check - Return a list of transforms with multiple geometry shape nodes
+	'''
+	name = table['name']
+	nodeType = table['type']
+	isTransform = table['isTransform']
+	
+	result = []
+	for i in indexList:
+		if not isTransform[i]: continue
+		shapeList = [s for s in table.shapes(i) if typeList.count(nodeType[s])]
+		if len(shapeList) > 1: result.append(name[i])
+	return result
+
+def auditUserAttr(table,indexList):
+	'''
+	Scene audit check - Return a list of user defined attributes
+	'''
+	name = table['name']
+	userAttrs = table['userAttrs']
+	
+	result = []
+	for i in indexList:
+		result.extend([name[i]+'.'+attr for attr in userAttrs[i]])
+	return result
+
+def auditEmptyGroup(table,indexList):
+	'''
+	Scene audit check - Return a list of empty groups
+	'''
+	name = table['name']
+	isTransform = table['isTransform']
+	children = table['children']
+	return [name[i] for i in indexList if isTransform[i] and not children[i]]
+
+def auditUnknownNode(table,indexList):
+	'''
+	Scene audit check - Return a list of unknown nodes
+	'''
+	name = table['name']
+	nodeType = table['type']
+	return [name[i] for i in indexList if nodeType[i] == 'unknown']
+
+def auditTransforms(table,indexList,tol=0.0000000001):
+	'''
+	Scene audit check - Return a list of transforms with non-zero transform values
+	'''
+	name = table['name']
+	translate = table['translate']
+	rotate = table['rotate']
+	scale = table['scale']
+	
+	result = []
+	for i in indexList:
+		if translate[i] == None: continue
+		if ['persp','front','side','top'].count(name[i]): continue
+		if max([abs(v) for v in translate[i]+rotate[i]]) > tol or max([abs(v-1.0) for v in scale[i]]) > tol:
+			result.append(name[i])
+	return result
+
+def auditDisplayOverrides(table,indexList):
+	'''
+	Scene audit check - Return a list of DAG nodes with display overrides enabled
+	'''
+	name = table['name']
+	overrideEnabled = table['overrideEnabled']
+	return [name[i] for i in indexList if overrideEnabled[i]]
+
 # =========
 # - Fixes -
 # =========
@@ -3,12 +3,16 @@ import maya.cmds as mc
 import maya.OpenMaya as OpenMaya
 
 import glTools.utils.base
+import glTools.utils.bulkCreate
 import glTools.utils.component
 import glTools.utils.mathUtils
 import glTools.utils.matrix
 import glTools.utils.shape
 import glTools.utils.stringUtils
 
+import math
+import bisect
+
 def isCurve(curve):
 	'''
 	Check if the specified object is a nurbs curve or transform parent of a curve
@@ -188,40 +192,38 @@ def locatorCurve(curve,controlPoints=[],locatorScale=0.05,local=False,freeze=Tru
 	# - Create Locators -
 	# ===================
 	
-	# Initialize Return List
-	locatorList = []
-	
 	# Set Locator Scale
 	locatorScale *= mc.arclen(curve)
 	
-	# Iterate Over CVs
-	for i in controlPointList:
-		
-		# Generate String Index
-		ind = glTools.utils.stringUtils.stringIndex(i,1)
-		
-		# Get CV Position
-		pos = mc.pointPosition(curve+'.cv['+str(i)+']')
-		
-		# Create Locator
-		locator = mc.spaceLocator(n=prefix+'_cv'+ind+'_'+suffix)[0]
-		
-		# Position Locator
-		mc.xform(locator,ws=True,t=pos)
-		mc.setAttr(locator+".localScale",locatorScale,locatorScale,locatorScale)
-		
-		# Add CV ID Attribute
-		mc.addAttr(locator,ln='cvID',at='long',dv=i)
+	# Get CV Positions
+	ptList = glTools.utils.base.getPointArray(curve)
+	posList = [ptList[i] for i in controlPointList]
+	
+	mc.undoInfo(openChunk=True)
+	try:
+		# Create Locators
+		nameList = [prefix+'_cv'+glTools.utils.stringUtils.stringIndex(i,1)+'_'+suffix for i in controlPointList]
+		locatorList = glTools.utils.bulkCreate.createLocators(nameList,positionList=posList,localScale=locatorScale)
 		
-		# Connect to CV
-		if local:
-			mc.connectAttr(locator+'.translate',curve+'.controlPoints['+str(i)+']')
-		else:
-			if freeze: mc.makeIdentity(locator,apply=True,t=1,r=1,s=1,n=0)
-			mc.connectAttr(locator+'.worldPosition[0]',curve+'.controlPoints['+str(i)+']')
+		# Freeze Locators
+		if not local and freeze: mc.makeIdentity(locatorList,apply=True,t=1,r=1,s=1,n=0)
 		
-		# Append to Return List
-		locatorList.append(locator)
+		# Iterate Over CVs
+		for n in range(len(controlPointList)):
+			
+			i = controlPointList[n]
+			locator = locatorList[n]
+			
+			# Add CV ID Attribute
+			mc.addAttr(locator,ln='cvID',at='long',dv=i)
+			
+			# Connect to CV
+			if local:
+				mc.connectAttr(locator+'.translate',curve+'.controlPoints['+str(i)+']')
+			else:
+				mc.connectAttr(locator+'.worldPosition[0]',curve+'.controlPoints['+str(i)+']')
+	finally:
+		mc.undoInfo(closeChunk=True)
 	
 	# =================
 	# - Return Result -
@@ -563,19 +565,16 @@ def sampleParam(curve,samples,useDistance=False,minPercent=0.0,maxPercent=1.0,sp
 															rangeEnd = maxPercent )
 	
 	# Build parameter list
-	paramList = []
 	if useDistance:
 		curveFn = getCurveFn(curve)
 		dist = curveFn.length()
-		for i in range(samples):
-			paramList.append(curveFn.findParamFromLength(dist*percentList[i]))
+		paramList = [curveFn.findParamFromLength(dist*percentList[i]) for i in range(samples)]
 	else:
 		# Get parameter range
 		minU = mc.getAttr(curve+'.minValue')
 		maxU = mc.getAttr(curve+'.maxValue')
 		uDist = maxU - minU
-		for i in range(samples):
-			paramList.append(minU+(uDist*percentList[i]))
+		paramList = [minU+(uDist*percentList[i]) for i in range(samples)]
 	# Return result
 	return paramList
 
@@ -1073,3 +1072,578 @@ def matchCurve(srcCrv,dstCrv):
 	# Execute Command
 	mm.eval(cmd)
 
+
+# ===================
+# - Curve Evaluator -
+# ===================
+
+class CurveEvaluator(object):
+	'''
+	NURBS curve evaluator. Curve data (CVs, weights, knots and degree) is captured once, either from a
+	curve in the scene or from stored curve data, and all evaluation is performed in python (de Boor /
+	B-spline basis derivatives), so no API function sets are built per query and stored data can be
+	evaluated headlessly. An arc-length lookup table is built on demand for length/parameter conversion.
+	Knots are stored using the Maya convention (numCVs + degree - 1 knots).
+	'''
+	# Gauss-Legendre (5 point) quadrature
+	_glNodes = [0.0,-0.5384693101056831,0.5384693101056831,-0.9061798459386640,0.9061798459386640]
+	_glWeights = [0.5688888888888889,0.4786286704993665,0.4786286704993665,0.2369268850561891,0.2369268850561891]
+	
+	def __init__(self,curve=None,worldSpace=True,lengthResolution=16):
+		'''
+		CurveEvaluator class initializer
+		@param curve: Curve to capture evaluation data from. If None, use setData() to specify curve data.
+		@type curve: str or None
+		@param worldSpace: Capture the curve CVs in world space
+		@type worldSpace: bool
+		@param lengthResolution: Number of arc-length table samples per curve span
+		@type lengthResolution: int
+		'''
+		self.degree = 3
+		self.cvs = []
+		self.weights = []
+		self.knots = []
+		self.periodic = False
+		self.lengthResolution = lengthResolution
+		
+		self._knots = []
+		self._rational = False
+		self._minU = 0.0
+		self._maxU = 0.0
+		self._lengthParams = None
+		self._lengthTable = None
+		self._samplePoints = None
+		
+		if curve: self.setCurve(curve,worldSpace)
+	
+	@classmethod
+	def fromData(cls,data,lengthResolution=16):
+		'''
+		Create a CurveEvaluator from stored curve data (see data()).
+		@param data: Curve data dictionary with "cvs", "knots", "degree", "periodic" and (optional) "weights" keys
+		@type data: dict
+		@param lengthResolution: Number of arc-length table samples per curve span
+		@type lengthResolution: int
+		'''
+		evaluator = cls(lengthResolution=lengthResolution)
+		evaluator.setData(data['cvs'],data['knots'],data['degree'],data.get('periodic',False),data.get('weights'))
+		return evaluator
+	
+	def setCurve(self,curve,worldSpace=True):
+		'''
+		Capture evaluation data from the specified curve.
+		@param curve: Curve to capture evaluation data from
+		@type curve: str
+		@param worldSpace: Capture the curve CVs in world space
+		@type worldSpace: bool
+		'''
+		# Get Curve Data
+		curveFn = getCurveFn(curve)
+		space = OpenMaya.MSpace.kObject
+		if worldSpace: space = OpenMaya.MSpace.kWorld
+		cvArray = OpenMaya.MPointArray()
+		curveFn.getCVs(cvArray,space)
+		knotArray = OpenMaya.MDoubleArray()
+		curveFn.getKnots(knotArray)
+		
+		cvs = [(cvArray[i].x,cvArray[i].y,cvArray[i].z) for i in xrange(cvArray.length())]
+		weights = [cvArray[i].w for i in xrange(cvArray.length())]
+		periodic = curveFn.form() == OpenMaya.MFnNurbsCurve.kPeriodic
+		
+		# Set Data
+		self.setData(cvs,list(knotArray),curveFn.degree(),periodic,weights)
+	
+	def setData(self,cvs,knots,degree,periodic=False,weights=None):
+		'''
+		Set the curve evaluation data.
+		@param cvs: List of curve CV positions
+		@type cvs: list
+		@param knots: Curve knot vector (Maya convention - numCVs + degree - 1 knots)
+		@type knots: list
+		@param degree: Curve degree
+		@type degree: int
+		@param periodic: Curve is periodic. Parameters outside the curve range are wrapped instead of clamped.
+		@type periodic: bool
+		@param weights: Optional list of CV weights (rational curves)
+		@type weights: list or None
+		'''
+		# Check Data
+		if len(knots) != len(cvs) + degree - 1:
+			raise Exception('Invalid curve data! Expected '+str(len(cvs)+degree-1)+' knots, found '+str(len(knots))+'!')
+		if weights and len(weights) != len(cvs):
+			raise Exception('Invalid curve data! CV weight count does not match CV count!')
+		
+		self.degree = int(degree)
+		self.cvs = [tuple([float(v) for v in cv[0:3]]) for cv in cvs]
+		self.knots = [float(k) for k in knots]
+		self.periodic = bool(periodic)
+		self.weights = [float(w) for w in (weights or [1.0]*len(cvs))]
+		
+		# Full (padded) knot vector
+		self._knots = [self.knots[0]] + self.knots + [self.knots[-1]]
+		self._rational = bool([w for w in self.weights if w != 1.0])
+		self._minU = self._knots[self.degree]
+		self._maxU = self._knots[len(self.cvs)]
+		
+		# Reset Arc-Length Table
+		self._lengthParams = None
+		self._lengthTable = None
+		self._samplePoints = None
+	
+	def data(self):
+		'''
+		Return the curve evaluation data as a dictionary, which can be stored and passed to fromData().
+		'''
+		return {	'cvs':list(self.cvs),
+					'knots':list(self.knots),
+					'degree':self.degree,
+					'periodic':self.periodic,
+					'weights':list(self.weights)	}
+	
+	def paramRange(self):
+		'''
+		Return the (min,max) parameter range of the curve.
+		'''
+		return (self._minU,self._maxU)
+	
+	# ==============
+	# - Evaluation -
+	# ==============
+	
+	def _checkParam(self,u):
+		'''
+		Clamp (or wrap, for periodic curves) the specified parameter to the curve parameter range.
+		'''
+		if self.periodic and (u < self._minU or u > self._maxU):
+			return self._minU + ((u - self._minU) % (self._maxU - self._minU))
+		return min(max(u,self._minU),self._maxU)
+	
+	def evaluate(self,u,order=1):
+		'''
+		Evaluate the curve position and derivatives (up to the specified order) at the parameter u.
+		Returns a list of [position,firstDerivative,...] (x,y,z) tuples.
+		@param u: Curve parameter to evaluate
+		@type u: float
+		@param order: Highest derivative order to evaluate
+		@type order: int
+		'''
+		u = self._checkParam(u)
+		span = knotSpan(self._knots,self.degree,len(self.cvs),u)
+		ders = basisDerivs(self._knots,self.degree,span,u,order)
+		p = self.degree
+		
+		# Weighted (Homogeneous) Derivatives
+		aders = []
+		wders = []
+		for k in range(order+1):
+			x = y = z = w = 0.0
+			for j in range(p+1):
+				i = span - p + j
+				n = ders[k][j] * self.weights[i]
+				cv = self.cvs[i]
+				x += n*cv[0]
+				y += n*cv[1]
+				z += n*cv[2]
+				w += n
+			aders.append((x,y,z))
+			wders.append(w)
+		
+		# Non Rational
+		if not self._rational: return aders
+		
+		# Rational
+		result = []
+		for k in range(order+1):
+			v = list(aders[k])
+			for i in range(1,k+1):
+				binomial = math.factorial(k) / (math.factorial(i)*math.factorial(k-i))
+				for c in range(3): v[c] -= binomial * wders[i] * result[k-i][c]
+			result.append((v[0]/wders[0],v[1]/wders[0],v[2]/wders[0]))
+		return result
+	
+	def point(self,u):
+		'''
+		Return the curve position at the parameter u.
+		@param u: Curve parameter to evaluate
+		@type u: float
+		'''
+		return self.evaluate(u,0)[0]
+	
+	def tangent(self,u,normalize=True):
+		'''
+		Return the curve tangent at the parameter u.
+		@param u: Curve parameter to evaluate
+		@type u: float
+		@param normalize: Normalize the tangent vector
+		@type normalize: bool
+		'''
+		tan = self.evaluate(u,1)[1]
+		if normalize: tan = _normalize(tan)
+		return tan
+	
+	def points(self,paramList):
+		'''
+		Return the curve positions for a list of parameters.
+		@param paramList: List of curve parameters to evaluate
+		@type paramList: list
+		'''
+		return [self.evaluate(u,0)[0] for u in paramList]
+	
+	def tangents(self,paramList,normalize=True):
+		'''
+		Return the curve tangents for a list of parameters.
+		@param paramList: List of curve parameters to evaluate
+		@type paramList: list
+		@param normalize: Normalize the tangent vectors
+		@type normalize: bool
+		'''
+		return [self.tangent(u,normalize) for u in paramList]
+	
+	def frames(self,paramList,upVector=None):
+		'''
+		Return a list of (position,tangent,normal,binormal) frames for a list of parameters.
+		If an upVector is specified, the normal of each frame is aligned to the upVector.
+		Otherwise, frames are parallel transported (rotation minimizing) along the parameter list.
+		@param paramList: List of curve parameters to evaluate, in order along the curve
+		@type paramList: list
+		@param upVector: Up vector used to orient the frames. If None, use parallel transport frames.
+		@type upVector: tuple or None
+		'''
+		frameList = []
+		normal = None
+		prevTan = None
+		for u in paramList:
+			
+			pos,tan = self.evaluate(u,1)
+			tan = _normalize(tan)
+			
+			if upVector:
+				binormal = _normalize(_cross(tan,upVector))
+			else:
+				# Initial Normal
+				if normal == None:
+					axis = (1.0,0.0,0.0)
+					if abs(tan[0]) > 0.9: axis = (0.0,1.0,0.0)
+					normal = _normalize(_cross(_cross(tan,axis),tan))
+				# Parallel Transport
+				elif prevTan:
+					normal = _rotateVector(normal,prevTan,tan)
+				binormal = _normalize(_cross(tan,normal))
+			normal = _cross(binormal,tan)
+			
+			frameList.append((pos,tan,normal,binormal))
+			prevTan = tan
+		
+		return frameList
+	
+	# ==============
+	# - Arc-Length -
+	# ==============
+	
+	def _speed(self,u):
+		'''
+		Return the magnitude of the first derivative at the parameter u.
+		'''
+		d = self.evaluate(u,1)[1]
+		return math.sqrt(d[0]*d[0]+d[1]*d[1]+d[2]*d[2])
+	
+	def _integrate(self,u0,u1):
+		'''
+		Integrate the curve length between two parameters (Gauss-Legendre quadrature).
+		'''
+		if u1 == u0: return 0.0
+		half = (u1 - u0) * 0.5
+		mid = (u1 + u0) * 0.5
+		return half * sum([self._glWeights[i] * self._speed(mid + half*self._glNodes[i]) for i in range(5)])
+	
+	def buildLengthTable(self,resolution=None):
+		'''
+		Build the arc-length lookup table. Each curve span is divided into a number of samples and
+		the curve length between samples is integrated using Gauss-Legendre quadrature.
+		@param resolution: Number of table samples per curve span. If None, use the evaluator lengthResolution.
+		@type resolution: int or None
+		'''
+		if resolution: self.lengthResolution = resolution
+		
+		# Get Span Parameters
+		spanParams = sorted(set([k for k in self._knots if k >= self._minU and k <= self._maxU]))
+		
+		# Build Table
+		params = [spanParams[0]]
+		table = [0.0]
+		for i in range(len(spanParams)-1):
+			step = (spanParams[i+1] - spanParams[i]) / self.lengthResolution
+			for j in range(1,self.lengthResolution+1):
+				u = spanParams[i] + step*j
+				if j == self.lengthResolution: u = spanParams[i+1]
+				table.append(table[-1] + self._integrate(params[-1],u))
+				params.append(u)
+		
+		self._lengthParams = params
+		self._lengthTable = table
+		self._samplePoints = None
+		return table[-1]
+	
+	def length(self):
+		'''
+		Return the total curve length.
+		'''
+		if self._lengthTable == None: self.buildLengthTable()
+		return self._lengthTable[-1]
+	
+	def lengthFromParam(self,u):
+		'''
+		Return the curve length at the specified parameter.
+		@param u: Curve parameter
+		@type u: float
+		'''
+		if self._lengthTable == None: self.buildLengthTable()
+		u = min(max(u,self._minU),self._maxU)
+		i = min(max(bisect.bisect_right(self._lengthParams,u)-1,0),len(self._lengthParams)-1)
+		return self._lengthTable[i] + self._integrate(self._lengthParams[i],u)
+	
+	def paramFromLength(self,length,tolerance=0.000001,maxIterations=8):
+		'''
+		Return the curve parameter at the specified length along the curve.
+		@param length: Length along the curve
+		@type length: float
+		@param tolerance: Length tolerance
+		@type tolerance: float
+		@param maxIterations: Maximum number of refinement iterations
+		@type maxIterations: int
+		'''
+		if self._lengthTable == None: self.buildLengthTable()
+		table = self._lengthTable
+		params = self._lengthParams
+		
+		# Check Range
+		if length <= 0.0: return params[0]
+		if length >= table[-1]: return params[-1]
+		
+		# Find Table Interval
+		i = bisect.bisect_right(table,length) - 1
+		u0 = params[i]
+		u1 = params[i+1]
+		interval = table[i+1] - table[i]
+		if not interval: return u0
+		
+		# Linear Estimate
+		u = u0 + (u1 - u0) * (length - table[i]) / interval
+		
+		# Newton Refinement
+		for it in range(maxIterations):
+			error = table[i] + self._integrate(u0,u) - length
+			if abs(error) < tolerance: break
+			speed = self._speed(u)
+			if not speed: break
+			u = min(max(u - error/speed,u0),u1)
+		
+		return u
+	
+	def lengthsFromParams(self,paramList):
+		'''
+		Return the curve lengths at a list of parameters.
+		@param paramList: List of curve parameters
+		@type paramList: list
+		'''
+		return [self.lengthFromParam(u) for u in paramList]
+	
+	def paramsFromLengths(self,lengthList):
+		'''
+		Return the curve parameters at a list of lengths along the curve.
+		@param lengthList: List of lengths along the curve
+		@type lengthList: list
+		'''
+		return [self.paramFromLength(length) for length in lengthList]
+	
+	# =================
+	# - Closest Point -
+	# =================
+	
+	def closestParams(self,pointList,tolerance=0.0000001,maxIterations=10):
+		'''
+		Return the closest curve parameters to a list of points.
+		Each point is matched against the (cached) arc-length table sample points, and the parameter
+		is then refined using Newton iteration.
+		@param pointList: List of points to find the closest curve parameters for
+		@type pointList: list
+		@param tolerance: Parameter tolerance
+		@type tolerance: float
+		@param maxIterations: Maximum number of refinement iterations
+		@type maxIterations: int
+		'''
+		# Get Sample Points
+		if self._lengthTable == None: self.buildLengthTable()
+		params = self._lengthParams
+		if self._samplePoints == None: self._samplePoints = self.points(params)
+		samples = self._samplePoints
+		sampleRange = range(len(samples))
+		
+		paramList = []
+		for pt in pointList:
+			
+			pt = glTools.utils.base.getPosition(pt)
+			
+			# Closest Sample
+			distList = [(samples[i][0]-pt[0])**2 + (samples[i][1]-pt[1])**2 + (samples[i][2]-pt[2])**2 for i in sampleRange]
+			i = distList.index(min(distList))
+			uMin = params[max(i-1,0)]
+			uMax = params[min(i+1,len(params)-1)]
+			u = params[i]
+			
+			# Newton Refinement
+			for it in range(maxIterations):
+				pos,d1,d2 = self.evaluate(u,2)
+				diff = (pos[0]-pt[0],pos[1]-pt[1],pos[2]-pt[2])
+				f = _dot(d1,diff)
+				df = _dot(d2,diff) + _dot(d1,d1)
+				if not df: break
+				du = -f/df
+				u = min(max(u+du,uMin),uMax)
+				if abs(du) < tolerance: break
+			
+			paramList.append(u)
+		
+		return paramList
+	
+	def closestPoints(self,pointList):
+		'''
+		Return the closest curve positions to a list of points.
+		@param pointList: List of points to find the closest curve positions for
+		@type pointList: list
+		'''
+		return self.points(self.closestParams(pointList))
+
+def knotSpan(knots,degree,numCVs,u):
+	'''
+	Return the knot span index of a B-spline parameter.
+	@param knots: Full (padded) knot vector - numCVs + degree + 1 knots
+	@type knots: list
+	@param degree: B-spline degree
+	@type degree: int
+	@param numCVs: Number of control points
+	@type numCVs: int
+	@param u: Parameter to find the knot span for. Must be within the parameter range.
+	@type u: float
+	'''
+	n = numCVs - 1
+	if u >= knots[n+1]: return n
+	span = bisect.bisect_right(knots,u) - 1
+	return min(max(span,degree),n)
+
+def basisDerivs(knots,degree,span,u,order):
+	'''
+	Return the non zero B-spline basis functions and their derivatives (up to the specified order)
+	at the parameter u, for the given knot span. Returns a list of [order+1][degree+1] values.
+	@param knots: Full (padded) knot vector - numCVs + degree + 1 knots
+	@type knots: list
+	@param degree: B-spline degree
+	@type degree: int
+	@param span: Knot span index (see knotSpan())
+	@type span: int
+	@param u: Parameter to evaluate
+	@type u: float
+	@param order: Highest derivative order to evaluate
+	@type order: int
+	'''
+	p = degree
+	U = knots
+	
+	# Basis Functions and Knot Differences
+	ndu = [[0.0]*(p+1) for i in range(p+1)]
+	ndu[0][0] = 1.0
+	left = [0.0]*(p+1)
+	right = [0.0]*(p+1)
+	for j in range(1,p+1):
+		left[j] = u - U[span+1-j]
+		right[j] = U[span+j] - u
+		saved = 0.0
+		for r in range(j):
+			ndu[j][r] = right[r+1] + left[j-r]
+			temp = 0.0
+			if ndu[j][r]: temp = ndu[r][j-1] / ndu[j][r]
+			ndu[r][j] = saved + right[r+1]*temp
+			saved = left[j-r]*temp
+		ndu[j][j] = saved
+	
+	# Derivatives
+	ders = [[0.0]*(p+1) for k in range(order+1)]
+	for j in range(p+1): ders[0][j] = ndu[j][p]
+	a = [[0.0]*(p+1) for i in range(2)]
+	for r in range(p+1):
+		s1 = 0
+		s2 = 1
+		a[0][0] = 1.0
+		for k in range(1,min(order,p)+1):
+			d = 0.0
+			rk = r - k
+			pk = p - k
+			if r >= k:
+				a[s2][0] = a[s1][0] / ndu[pk+1][rk]
+				d = a[s2][0] * ndu[rk][pk]
+			if rk >= -1: j1 = 1
+			else: j1 = -rk
+			if r-1 <= pk: j2 = k - 1
+			else: j2 = p - r
+			for j in range(j1,j2+1):
+				a[s2][j] = (a[s1][j] - a[s1][j-1]) / ndu[pk+1][rk+j]
+				d += a[s2][j] * ndu[rk+j][pk]
+			if r <= pk:
+				a[s2][k] = -a[s1][k-1] / ndu[pk+1][r]
+				d += a[s2][k] * ndu[r][pk]
+			ders[k][r] = d
+			s1,s2 = s2,s1
+	
+	# Multiply Through by the Correct Factors
+	r = p
+	for k in range(1,min(order,p)+1):
+		for j in range(p+1): ders[k][j] *= r
+		r *= (p - k)
+	
+	return ders
+
+def _dot(v1,v2):
+	return v1[0]*v2[0] + v1[1]*v2[1] + v1[2]*v2[2]
+
+def _cross(v1,v2):
+	return (v1[1]*v2[2]-v1[2]*v2[1],v1[2]*v2[0]-v1[0]*v2[2],v1[0]*v2[1]-v1[1]*v2[0])
+
+def _normalize(v):
+	length = math.sqrt(_dot(v,v))
+	if not length: return tuple(v)
+	return (v[0]/length,v[1]/length,v[2]/length)
+
+def _rotateVector(v,fromVector,toVector):
+	'''
+	Rotate a vector by the minimal rotation between two (normalized) vectors.
+	'''
+	axis = _cross(fromVector,toVector)
+	sin = math.sqrt(_dot(axis,axis))
+	cos = _dot(fromVector,toVector)
+	if sin < 0.0000001: return v
+	axis = (axis[0]/sin,axis[1]/sin,axis[2]/sin)
+	# Rodrigues Rotation
+	cross = _cross(axis,v)
+	dot = _dot(axis,v)
+	return tuple([v[i]*cos + cross[i]*sin + axis[i]*dot*(1.0-cos) for i in range(3)])
+
+def closestParams(curve,pointList):
+	'''
+	Return the closest curve parameters to a list of points.
+	Values expected in world space.
+	@param curve: Curve to query closest parameters from
+	@type curve: str
+	@param pointList: List of points to find the closest curve parameters for
+	@type pointList: list
+	'''
+	return CurveEvaluator(curve).closestParams(pointList)
+
+def getParamsFromLengths(curve,lengthList):
+	'''
+	Return the curve parameters at a list of lengths along the specified curve.
+	@param curve: Curve to get parameters from
+	@type curve: str
+	@param lengthList: List of lengths along the curve
+	@type lengthList: list
+	'''
+	return CurveEvaluator(curve).paramsFromLengths(lengthList)
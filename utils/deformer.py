@@ -2,10 +2,12 @@ import maya.cmds as mc
 import maya.OpenMaya as OpenMaya
 import maya.OpenMayaAnim as OpenMayaAnim
 
+import glTools.utils.apiUndo
 import glTools.utils.attribute
 import glTools.utils.arrayUtils
 import glTools.utils.base
 import glTools.utils.geometry
+import glTools.utils.queryCache
 import glTools.utils.selection
 
 import re
@@ -541,6 +543,7 @@ def setWeights(deformer,weights,geometry=None):
 	
 	# Set weights
 	deformerFn.setWeight(deformerSetMem[0],deformerSetMem[1],weightList)
+	glTools.utils.queryCache.invalidate()
 
 def bindPreMatrix(deformer,bindPreMatrix='',parent=True):
 	'''
@@ -693,10 +696,193 @@ def clean(deformer,threshold=0.001):
 	if not isDeformer(deformer):
 		raise Exception('Object "'+deformer+'" is not a valid deformer!')
 	
-	# Prune Weights
-	glTools.utils.deformer.pruneWeights(deformer,threshold=threshold)
-	# Prune Membership
-	glTools.utils.deformer.pruneMembershipByWeights(deformer,threshold=threshold)
+	# Prune Weights and Membership
+	return cleanDeformers(deformerList=[deformer],threshold=threshold,printResult=False)[deformer]
+
+def getComponentElements(component):
+	'''
+	Return the element index arrays (MIntArray) of the specified single, double or triple indexed component object.
+	@param component: Component object to return element indices for
+	@type component: MObject
+	'''
+	if component.hasFn(OpenMaya.MFn.kSingleIndexedComponent):
+		indices = OpenMaya.MIntArray()
+		OpenMaya.MFnSingleIndexedComponent(component).getElements(indices)
+		return [indices]
+	if component.hasFn(OpenMaya.MFn.kDoubleIndexedComponent):
+		indicesU = OpenMaya.MIntArray()
+		indicesV = OpenMaya.MIntArray()
+		OpenMaya.MFnDoubleIndexedComponent(component).getElements(indicesU,indicesV)
+		return [indicesU,indicesV]
+	if component.hasFn(OpenMaya.MFn.kTripleIndexedComponent):
+		indicesS = OpenMaya.MIntArray()
+		indicesT = OpenMaya.MIntArray()
+		indicesU = OpenMaya.MIntArray()
+		OpenMaya.MFnTripleIndexedComponent(component).getElements(indicesS,indicesT,indicesU)
+		return [indicesS,indicesT,indicesU]
+	raise Exception('Unsupported component type! ('+component.apiTypeStr()+')')
+
+def getComponentSubset(component,elementList):
+	'''
+	Return a new component object (of the same type as the input component) containing a subset of the component elements.
+	@param component: Component object to return an element subset of
+	@type component: MObject
+	@param elementList: List of element positions (into the component element arrays) to include in the subset
+	@type elementList: list
+	'''
+	# Get Subset Element Indices
+	subsetIndices = []
+	for indices in getComponentElements(component):
+		subset = OpenMaya.MIntArray(len(elementList),0)
+		for i in range(len(elementList)): subset.set(indices[elementList[i]],i)
+		subsetIndices.append(subset)
+	
+	# Build Subset Component
+	if len(subsetIndices) == 1:
+		componentFn = OpenMaya.MFnSingleIndexedComponent()
+		subsetComponent = componentFn.create(component.apiType())
+		componentFn.addElements(subsetIndices[0])
+	elif len(subsetIndices) == 2:
+		componentFn = OpenMaya.MFnDoubleIndexedComponent()
+		subsetComponent = componentFn.create(component.apiType())
+		componentFn.addElements(subsetIndices[0],subsetIndices[1])
+	else:
+		componentFn = OpenMaya.MFnTripleIndexedComponent()
+		subsetComponent = componentFn.create(component.apiType())
+		componentFn.addElements(subsetIndices[0],subsetIndices[1],subsetIndices[2])
+	
+	# Return Result
+	return subsetComponent
+
+def _setWeightFn(deformerFn,memberPath,memberComp,weights):
+	'''
+	Return a function that sets the specified deformer member weights. Used to record weight edits for undo.
+	'''
+	def setWeight(): deformerFn.setWeight(memberPath,memberComp,weights)
+	return setWeight
+
+def cleanDeformers(geoList=[],deformerList=[],threshold=0.001,pruneWeights=True,pruneMembership=True,printResult=True):
+	'''
+	Clean all weighted deformers affecting a list of geometry in a single pass.
+	The weights of each deformer/geometry pair are read once, weights under the given tolerance are set to 0.0
+	with a single setWeight() call, and the pruned components of each deformer are removed from the deformer set with a single sets call.
+	Weight and membership edits are undoable as a single operation (see glTools.utils.apiUndo).
+	Returns a dictionary of deformer clean results (weightsPruned, membersRemoved, bytesRemoved).
+	@param geoList: List of geometry to clean deformers for. If empty, use all geometry affected by the deformer list.
+	@type geoList: list
+	@param deformerList: List of deformers to clean. If empty, clean all weighted deformers affecting the geometry list.
+	@type deformerList: list
+	@param threshold: Weight value tolerance for prune operations.
+	@type threshold: float
+	@param pruneWeights: Set weights under the given tolerance to 0.0
+	@type pruneWeights: bool
+	@param pruneMembership: Remove components with weights under the given tolerance from the deformer set
+	@type pruneMembership: bool
+	@param printResult: Print clean results to the script editor
+	@type printResult: bool
+	'''
+	# ==========
+	# - Checks -
+	# ==========
+	
+	if type(geoList) == str or type(geoList) == unicode: geoList = [geoList]
+	if type(deformerList) == str or type(deformerList) == unicode: deformerList = [deformerList]
+	if not geoList and not deformerList:
+		raise Exception('No geometry or deformers specified!')
+	
+	# Geometry Shapes
+	shapeList = []
+	for geo in geoList:
+		if not mc.objExists(geo): raise Exception('Geometry "'+geo+'" does not exist!')
+		shapeList.extend(mc.ls(mc.listRelatives(geo,s=True,ni=True,pa=True) or [geo],l=True))
+	
+	# Deformer List
+	if not deformerList: deformerList = getDeformerList(nodeType='weightGeometryFilter',affectedGeometry=geoList)
+	for deformer in deformerList:
+		if not isDeformer(deformer): raise Exception('Object "'+deformer+'" is not a valid deformer!')
+	deformerList = mc.ls(deformerList,type='weightGeometryFilter')
+	
+	# ===================
+	# - Clean Deformers -
+	# ===================
+	
+	# Weight Storage (bytes per element)
+	itemSize = 4
+	
+	result = {}
+	mc.undoInfo(openChunk=True)
+	try:
+		for deformer in deformerList:
+			
+			# Get Deformer and Set Function Sets
+			deformerFn = getDeformerFn(deformer)
+			deformerSetObj = deformerFn.deformerSet()
+			deformerSet = OpenMaya.MFnDependencyNode(deformerSetObj).name()
+			deformerSetFn = OpenMaya.MFnSet(deformerSetObj)
+			
+			# Get Deformer Set Members
+			memberSel = OpenMaya.MSelectionList()
+			deformerSetFn.getMembers(memberSel,True)
+			
+			weightsPruned = 0
+			membersRemoved = 0
+			pruneSel = OpenMaya.MSelectionList()
+			with glTools.utils.apiUndo.ApiUndo() as undo:
+				for i in range(memberSel.length()):
+					
+					# Get Member Geometry and Components
+					memberPath = OpenMaya.MDagPath()
+					memberComp = OpenMaya.MObject()
+					memberSel.getDagPath(i,memberPath,memberComp)
+					if shapeList and not memberPath.fullPathName() in shapeList: continue
+					if memberComp.isNull(): continue
+					
+					# Get Weights
+					weights = OpenMaya.MFloatArray()
+					deformerFn.getWeights(memberPath,memberComp,weights)
+					
+					# Get Prune Mask
+					pruneList = [n for n,wt in enumerate(weights) if wt <= threshold]
+					if not pruneList: continue
+					
+					# Prune Weights (setWeight is not undoable, so the previous weights are recorded)
+					if pruneWeights:
+						zeroList = [n for n in pruneList if weights[n]]
+						if zeroList:
+							oldWeights = OpenMaya.MFloatArray(weights)
+							for n in zeroList: weights.set(0.0,n)
+							deformerFn.setWeight(memberPath,memberComp,weights)
+							undo.callback(	_setWeightFn(deformerFn,memberPath,memberComp,oldWeights),
+											_setWeightFn(deformerFn,memberPath,memberComp,weights)	)
+							weightsPruned += len(zeroList)
+					
+					# Prune Membership
+					if pruneMembership:
+						pruneSel.add(memberPath,getComponentSubset(memberComp,pruneList))
+						membersRemoved += len(pruneList)
+			
+			# Remove Pruned Members (single undoable sets call, after the weights are registered for undo)
+			if pruneSel.length():
+				pruneComponents = []
+				pruneSel.getSelectionStrings(pruneComponents)
+				mc.sets(pruneComponents,rm=deformerSet)
+			
+			# Record Result
+			result[deformer] = {	'weightsPruned':weightsPruned,
+									'membersRemoved':membersRemoved,
+									'bytesRemoved':membersRemoved*itemSize	}
+			
+			# Print Result
+			if printResult:
+				print('Cleaned deformer "'+deformer+'": '+str(weightsPruned)+' weights pruned, '+str(membersRemoved)+' members removed ('+str(membersRemoved*itemSize)+' bytes)')
+	finally:
+		mc.undoInfo(closeChunk=True)
+	
+	# =================
+	# - Return Result -
+	# =================
+	
+	return result
 
 def checkMultipleOutputs(deformer,printResult=True):
 	'''
@@ -2,6 +2,7 @@ import maya.cmds as mc
 
 import glTools.utils.base
 import glTools.utils.mesh
+import glTools.utils.stringUtils
 import glTools.utils.surface
 
 def isFollicle(follicle):
@@ -181,3 +182,68 @@ def buildAtPoint(	pt,
 	# =================
 	
 	return follicle
+
+def buildAtPoints(	ptList,
+					geo,
+					uvSet		= None,
+					translate   = True,
+					rotate      = True,
+					prefix		= None ):
+	'''
+	Build follicles at the closest UV points on the specified geometry to a list of input points.
+	For NURBS surfaces, the closest UV parameters for all points are solved in a single batch query.
+	@param ptList: List of points to create follicles at
+	@type ptList: list
+	@param geo: Geometry to attach follicles to.
+	@type geo: str
+	@param uvSet: UV set to attach follicles to.
+	@type uvSet: str or None
+	@param prefix: Naming prefix
+	@type prefix: str
+	'''
+	# ==========
+	# - Checks -
+	# ==========
+	
+	if not ptList: raise Exception('Invalid input point list!')
+	if not prefix: prefix = geo
+	
+	# Check Target Geo Type
+	targetIsMesh = glTools.utils.mesh.isMesh(geo)
+	targetIsSurface = glTools.utils.surface.isSurface(geo)
+	if not targetIsMesh and not targetIsSurface:
+		raise Exception('Invalid target geometry type! ('+geo+')')
+	
+	# UV Set
+	if uvSet and targetIsMesh:
+		if not uvSet in mc.polyUVSet(geo,q=True,auv=True):
+			raise Exception('Target geometry has no UV set "'+uvSet+'"!')
+	
+	# =======================================
+	# - Get Point Positions and Closest UVs -
+	# =======================================
+	
+	posList = [glTools.utils.base.getPosition(pt) for pt in ptList]
+	if targetIsSurface: parameterList = glTools.utils.surface.closestUVs(geo,posList)
+	else: parameterList = [glTools.utils.mesh.closestUV(geo,point=pos) for pos in posList]
+	
+	# ===================
+	# - Build Follicles -
+	# ===================
+	
+	follicleList = []
+	for i in range(len(parameterList)):
+		ind = glTools.utils.stringUtils.stringIndex(i+1,padding=2)
+		follicle = create(	geo,
+							parameter	= list(parameterList[i]),
+							uvSet		= uvSet,
+							translate   = translate,
+							rotate      = rotate,
+							prefix		= prefix+'_'+ind )
+		follicleList.append(follicle)
+	
+	# =================
+	# - Return Result -
+	# =================
+	
+	return follicleList
@@ -183,19 +183,21 @@ def createFollicles(ptList,childList,follicleSurface,prefix):
 	# - Create Follicles -
 	# ====================
 	
+	# Get follicle positions
+	posList = [glTools.utils.base.getPosition(pt) for pt in ptList]
+	
+	# Determine closest surface uvs
+	if srfType == 'mesh':
+		uvList = [glTools.utils.mesh.closestUV(follicleSurface,pt,uvSet='') for pt in posList]
+	elif srfType == 'nurbsSurface':
+		uvList = glTools.utils.surface.closestUVs(follicleSurface,posList)
+	else:
+		raise Exception('Invalid surface type!')
+	
 	follicleList = []
 	for i in range(len(ptList)):
 		
-		# Get follicle position
-		pt = glTools.utils.base.getPosition(ptList[i])
-		
-		# Determine closest surface uv
-		if srfType == 'mesh':
-			u,v =  glTools.utils.mesh.closestUV(follicleSurface,pt,uvSet='')
-		elif srfType == 'nurbsSurface':
-			u,v =  glTools.utils.surface.closestPoint(follicleSurface,pt)
-		else:
-			raise Exception('Invalid surface type!')
+		u,v = uvList[i]
 		
 		# Create Follicle
 		ind = glTools.utils.stringUtils.stringIndex(i+1,padding=2)
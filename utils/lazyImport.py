@@ -0,0 +1,156 @@
+'''
+Lazy module loading and import time reporting.
+This module is imported by package __init__ files, so it must not import maya or other glTools modules.
+'''
+
+import sys
+import time
+import types
+import __builtin__
+
+# Use the highest resolution wall clock available
+if sys.platform == 'win32': clock = time.clock
+else: clock = time.time
+
+class LazyModule(types.ModuleType):
+	'''
+	Module proxy that imports the named module on first attribute access.
+	The proxy is set as an attribute of the parent package only (not in sys.modules), so an explicit
+	import (or reload) of the module always loads the real module and replaces the proxy.
+	'''
+	def __init__(self,name):
+		types.ModuleType.__init__(self,name)
+		self.__dict__['_lazyModule'] = None
+
+	def _load(self):
+		'''
+		Import and return the real module.
+		'''
+		module = self.__dict__['_lazyModule']
+		if module == None:
+			__import__(self.__name__)
+			module = sys.modules[self.__name__]
+			self.__dict__['_lazyModule'] = module
+		return module
+
+	def __getattr__(self,attr):
+		return getattr(self._load(),attr)
+
+	def __setattr__(self,attr,value):
+		setattr(self._load(),attr,value)
+
+	def __repr__(self):
+		state = 'loaded'
+		if self.__dict__['_lazyModule'] == None: state = 'not loaded'
+		return '<lazy module \''+self.__name__+'\' ('+state+')>'
+
+def lazyModule(name):
+	'''
+	Declare a lazily loaded module. The module is imported on first attribute access.
+	If the module has already been imported, it is returned as is.
+		glTools.utils.lazyImport.lazyModule('glTools.tools.blendShape')
+		...
+		glTools.tools.blendShape.createFromSelection()
+	@param name: Full module name
+	@type name: str
+	'''
+	# Check Loaded
+	if sys.modules.get(name): return sys.modules[name]
+
+	# Check Package
+	if not '.' in name: raise Exception('Lazy module "'+name+'" is not a package submodule!')
+	packageName,moduleName = name.rsplit('.',1)
+	__import__(packageName)
+	package = sys.modules[packageName]
+
+	# Check Existing Proxy
+	existing = package.__dict__.get(moduleName)
+	if isinstance(existing,LazyModule): return existing
+
+	# Set Proxy
+	proxy = LazyModule(name)
+	setattr(package,moduleName,proxy)
+
+	# Return Result
+	return proxy
+
+def isLoaded(module):
+	'''
+	Return True if the specified module (or lazy module) has been imported.
+	@param module: Module or full module name to check
+	@type module: module or str
+	'''
+	if isinstance(module,LazyModule): return module.__dict__['_lazyModule'] != None
+	if isinstance(module,types.ModuleType): return True
+	return sys.modules.get(str(module)) != None
+
+# =================
+# - Import Report -
+# =================
+
+def importReport(moduleList,printResult=True,minTime=0.001):
+	'''
+	Import the specified modules and report the import cost per module.
+	Only modules that are not already loaded are measured, so run this in a fresh session.
+	Returns a list of (module,inclusiveTime,selfTime) tuples, sorted by self time.
+	@param moduleList: List of full module names to import
+	@type moduleList: list
+	@param printResult: Print the import report
+	@type printResult: bool
+	@param minTime: Minimum self time (in seconds) for a module to be printed
+	@type minTime: float
+	'''
+	# Check Module List
+	if isinstance(moduleList,types.StringTypes): moduleList = [moduleList]
+
+	timing = {}
+	stack = []
+	builtinImport = __builtin__.__import__
+
+	def timedImport(name,globals=None,locals=None,fromlist=None,level=-1):
+		# Get Candidate Module Names (implicit relative, then absolute)
+		nameList = [name]
+		if level != 0 and globals and globals.get('__name__'):
+			package = globals['__name__']
+			if not globals.has_key('__path__'): package = package.rpartition('.')[0]
+			if package: nameList.insert(0,package+'.'+name)
+		nameList = [n for n in nameList if sys.modules.get(n) == None]
+
+		# Check Loaded
+		if not nameList: return builtinImport(name,globals,locals,fromlist,level)
+
+		# Timed Import
+		stack.append(0.0)
+		start = clock()
+		try:
+			return builtinImport(name,globals,locals,fromlist,level)
+		finally:
+			elapsed = clock() - start
+			childTime = stack.pop()
+			if stack: stack[-1] += elapsed
+			for loaded in nameList:
+				if sys.modules.get(loaded) != None:
+					timing[loaded] = (elapsed,elapsed-childTime)
+					break
+
+	# Import Modules
+	__builtin__.__import__ = timedImport
+	try:
+		for module in moduleList: __import__(module)
+	finally:
+		__builtin__.__import__ = builtinImport
+
+	# Build Report
+	result = [(module,timing[module][0],timing[module][1]) for module in timing]
+	result.sort(key=lambda item: -item[2])
+
+	# Print Result
+	if printResult:
+		total = sum([item[2] for item in result])
+		print('Import Report: '+str(len(result))+' modules imported in '+str(round(total,4))+' seconds')
+		for module,inclusive,selfTime in result:
+			if selfTime < minTime: continue
+			print('  %-60s self: %8.4f  total: %8.4f' % (module,selfTime,inclusive))
+
+	# Return Result
+	return result
@@ -1,6 +1,10 @@
 import maya.cmds as mc
 import maya.OpenMaya as OpenMaya
 
+import math
+import heapq
+import itertools
+
 def isEqual(x,y,tolerance=0.00001):
 	'''
 	Check if 2 float values are equal within a given tolerance
@@ -50,9 +54,7 @@ def distanceBetween(point1=[0.0,0.0,0.0],point2=[0.0,0.0,0.0]):
 	@param point2: End point of the distance calculation
 	@type point1: tuple
 	'''
-	pnt1 = OpenMaya.MPoint(point1[0],point1[1],point1[2],1.0)
-	pnt2 = OpenMaya.MPoint(point2[0],point2[1],point2[2],1.0)
-	return OpenMaya.MVector(pnt1-pnt2).length()
+	return distanceArray([point1],point2)[0]
 
 def offsetVector(point1=(0.0,0.0,0.0),point2=(0.0,0.0,0.0)):
 	'''
@@ -103,20 +105,7 @@ def closestPointOnLine(pt,lineA,lineB,clampSegment=False):
 	@param lineB: End point of line
 	@type lineB: list
 	'''
-	# Get Vector Offsets
-	ptOffset = offsetVector(lineA,pt)
-	lineOffset = offsetVector(lineA,lineB)
-	
-	# Vector Comparison
-	dot = dotProduct(ptOffset,lineOffset)
-	
-	# Clamp Segment
-	if clampSegment:
-		if dot < 0.0: return lineA
-		if dot > 1.0: return lineB
-	
-	# Project Vector
-	return [lineA[0]+(lineOffset[0]*dot),lineA[1]+(lineOffset[1]*dot),lineA[2]+(lineOffset[2]*dot)]
+	return closestPointOnLineArray([pt],lineA,lineB,clampSegment)[0]
 
 def smoothStep(value,rangeStart=0.0,rangeEnd=1.0,smooth=1.0):
 	'''
@@ -130,16 +119,7 @@ def smoothStep(value,rangeStart=0.0,rangeEnd=1.0,smooth=1.0):
 	@param smooth: Strength of the smooth applied to the value
 	@type smooth: float
 	'''
-	# Get range
-	rangeVal = rangeEnd - rangeStart
-	# Normalize value
-	nValue = value / rangeVal
-	# Get smooth value
-	sValue = pow(nValue,2) * (3-(nValue*2))
-	sValue = nValue + ((sValue-nValue)*smooth)
-	value = rangeStart + (rangeVal * sValue)
-	# Return result
-	return value
+	return smoothStepArray([value],rangeStart,rangeEnd,smooth)[0]
 
 def distributeValue(samples,spacing=1.0,rangeStart=0.0,rangeEnd=1.0):
 	'''
@@ -153,31 +133,7 @@ def distributeValue(samples,spacing=1.0,rangeStart=0.0,rangeEnd=1.0):
 	@param rangeEnd: Maximum value in the sample range
 	@type rangeEnd: float
 	'''
-	# Get Value Range
-	vList = [rangeStart]
-	vDist = abs(rangeEnd - rangeStart)
-	unit = 1.0
-	
-	# Find the Unit Distance
-	factor = 1.0
-	for i in range(samples-2):
-		unit += factor * spacing
-		factor *= spacing
-	unit = vDist/unit
-	totalUnit = unit
-	
-	# Build Sample List
-	for i in range(samples-2):
-		multFactor = totalUnit/vDist
-		vList.append(rangeStart-((rangeStart - rangeEnd) * multFactor))
-		unit *= spacing
-		totalUnit += unit
-	
-	# Append Final Sample
-	vList.append(rangeEnd)
-	
-	# Return Result
-	return vList
+	return distributeValueArray(samples,spacing,[rangeStart],[rangeEnd])[0]
 
 def inverseDistanceWeight1D(valueArray,sampleValue,valueDomain=(0,1),cycleValue=False):
 	'''
@@ -191,38 +147,7 @@ def inverseDistanceWeight1D(valueArray,sampleValue,valueDomain=(0,1),cycleValue=
 	@param cycleValue: Calculate distance based on a closed loop of values
 	@type cycleValue: bool
 	'''
-	# Initialize method varialbles
-	distArray = []
-	totalInvDist = 0.0
-	
-	# Initialize weightArray
-	wtArray = []
-	
-	# Calculate inverse distance weight
-	for v in range(len(valueArray)):
-		# Calculate distance
-		dist = abs(sampleValue - valueArray[v])
-		
-		# Check cycle value
-		if cycleValue:
-			valueDomainLen = valueDomain[1]-valueDomain[0]
-			fCycDist = abs(sampleValue - (valueArray[v] + valueDomainLen))
-			rCycDist = abs(sampleValue - (valueArray[v] - valueDomainLen))
-			if fCycDist < dist: dist = fCycDist
-			if rCycDist < dist: dist = rCycDist
-		
-		# Check zero distance
-		if dist < 0.00001: dist = 0.00001
-		
-		# Append distance
-		distArray.append(dist)
-		totalInvDist += 1.0/dist
-	
-	# Normalize value weights
-	wtArray = [(1.0/d)/totalInvDist for d in distArray]
-	
-	# Return result
-	return wtArray
+	return inverseDistanceWeight1DArray(valueArray,[sampleValue],valueDomain,cycleValue)[0]
 
 def inverseDistanceWeight3D(pointArray,samplePoint):
 	'''
@@ -232,27 +157,202 @@ def inverseDistanceWeight3D(pointArray,samplePoint):
 	@param samplePoint: The sample point to calculate weights for
 	@type samplePoint: tuple or list
 	'''
-	# Initialize Method Variables
-	distArray = []
-	totalInvDist = 0.0
-	
-	# Initialize weightArray
+	return inverseDistanceWeight3DArray(pointArray,[samplePoint])[0]
+
+# =================
+# - Array Kernels -
+# =================
+
+def _isPoint(value):
+	'''
+	Return True if the input value is a single point (sequence of numbers), rather than a list of points.
+	An empty sequence is an (empty) list of points.
+	'''
+	if not len(value): return False
+	return not hasattr(value[0],'__getitem__')
+
+def _inverseDistanceRow(distArray,maxCount=0):
+	'''
+	Return the normalized inverse distance weights for a list of distances.
+	If maxCount is non zero, only the maxCount closest values receive a (non zero) weight.
+	'''
+	# Calculate Inverse Distance (Clamp Zero Distance)
+	invDist = [1.0/d if d > 0.00001 else 100000.0 for d in distArray]
+
+	# Check Max Count
+	if maxCount and maxCount < len(invDist):
+		keep = set(heapq.nlargest(maxCount,xrange(len(invDist)),key=invDist.__getitem__))
+		invDist = [invDist[i] if i in keep else 0.0 for i in xrange(len(invDist))]
+
+	# Normalize Weights
+	total = sum(invDist)
+	return [w/total for w in invDist]
+
+def distanceArray(pointArray1,pointArray2):
+	'''
+	Return the distances between 2 arrays of points (N x 3).
+	Either input can be a single point, in which case the distance from each point in the other array to that point is returned.
+	@param pointArray1: First point array (or point)
+	@type pointArray1: list
+	@param pointArray2: Second point array (or point)
+	@type pointArray2: list
+	'''
+	sqrt = math.sqrt
+
+	# Check Empty Input
+	if not len(pointArray1) or not len(pointArray2): return []
+
+	# Check Single Point
+	if _isPoint(pointArray1): pointArray1,pointArray2 = pointArray2,pointArray1
+	if _isPoint(pointArray2):
+		x,y,z = pointArray2[0],pointArray2[1],pointArray2[2]
+		return [sqrt((p[0]-x)*(p[0]-x)+(p[1]-y)*(p[1]-y)+(p[2]-z)*(p[2]-z)) for p in pointArray1]
+
+	# Check Array Length
+	if len(pointArray1) != len(pointArray2):
+		raise Exception('Point array lengths do not match! ('+str(len(pointArray1))+' != '+str(len(pointArray2))+')')
+
+	return [sqrt((p[0]-q[0])*(p[0]-q[0])+(p[1]-q[1])*(p[1]-q[1])+(p[2]-q[2])*(p[2]-q[2])) for p,q in itertools.izip(pointArray1,pointArray2)]
+
+def closestPointOnLineArray(ptArray,lineA,lineB,clampSegment=False):
+	'''
+	Find the closest points (to a list of positions) on the line specified by the incoming arguments.
+	Array version of closestPointOnLine().
+	@param ptArray: Find the closest points to these positions
+	@type ptArray: list
+	@param lineA: Start point of line
+	@type lineA: list
+	@param lineB: End point of line
+	@type lineB: list
+	@param clampSegment: Clamp the result to the line segment
+	@type clampSegment: bool
+	'''
+	# Get Line Offset
+	ax,ay,az = float(lineA[0]),float(lineA[1]),float(lineA[2])
+	lx,ly,lz = lineB[0]-ax,lineB[1]-ay,lineB[2]-az
+
+	# Project Points
+	result = []
+	for pt in ptArray:
+		dot = (pt[0]-ax)*lx + (pt[1]-ay)*ly + (pt[2]-az)*lz
+		if clampSegment:
+			if dot < 0.0:
+				result.append(lineA)
+				continue
+			if dot > 1.0:
+				result.append(lineB)
+				continue
+		result.append([ax+(lx*dot),ay+(ly*dot),az+(lz*dot)])
+
+	# Return Result
+	return result
+
+def smoothStepArray(valueArray,rangeStart=0.0,rangeEnd=1.0,smooth=1.0,iterations=1):
+	'''
+	Interpolate a list of values using hermite interpolation. Array version of smoothStep().
+	@param valueArray: Values to smooth
+	@type valueArray: list
+	@param rangeStart: Minimum value of interpolation range
+	@type rangeStart: float
+	@param rangeEnd: Maximum value of interpolation range
+	@type rangeEnd: float
+	@param smooth: Strength of the smooth applied to the values
+	@type smooth: float
+	@param iterations: Number of times to apply the smooth
+	@type iterations: int
+	'''
+	rangeVal = float(rangeEnd - rangeStart)
+	for i in xrange(int(iterations)):
+		nArray = [v/rangeVal for v in valueArray]
+		valueArray = [rangeStart + rangeVal*(n + ((n*n*(3-(n*2))-n)*smooth)) for n in nArray]
+	return list(valueArray)
+
+def distributeValueArray(samples,spacing=1.0,rangeStart=0.0,rangeEnd=1.0):
+	'''
+	Returns a list of values distributed between a start and end range, for each range in a list of ranges.
+	Array version of distributeValue(). The sample distribution is calculated once and applied to all ranges.
+	@param samples: Number of values to sample across each value range
+	@type samples: int
+	@param spacing: Incremental scale for each sample distance
+	@type spacing: float
+	@param rangeStart: Minimum value (or list of values) of the sample range
+	@type rangeStart: float or list
+	@param rangeEnd: Maximum value (or list of values) of the sample range
+	@type rangeEnd: float or list
+	'''
+	# Check Ranges
+	if not hasattr(rangeStart,'__getitem__'): rangeStart = [rangeStart]
+	if not hasattr(rangeEnd,'__getitem__'): rangeEnd = [rangeEnd]
+	if len(rangeStart) == 1: rangeStart = list(rangeStart) * len(rangeEnd)
+	if len(rangeEnd) == 1: rangeEnd = list(rangeEnd) * len(rangeStart)
+	if len(rangeStart) != len(rangeEnd):
+		raise Exception('Range start and end list lengths do not match! ('+str(len(rangeStart))+' != '+str(len(rangeEnd))+')')
+
+	# Find the Unit Distance
+	unitList = [spacing**i for i in xrange(max(samples-1,1))]
+	unitTotal = sum(unitList)
+
+	# Build Normalized Sample List
+	factorList = []
+	total = 0.0
+	for unit in unitList[:-1]:
+		total += unit
+		factorList.append(total/unitTotal)
+
+	# Build Sample Lists
+	vList = []
+	for start,end in itertools.izip(rangeStart,rangeEnd):
+		vList.append([start] + [start+((end-start)*f) for f in factorList] + [end])
+
+	# Return Result
+	return vList
+
+def inverseDistanceWeight1DArray(valueArray,sampleArray,valueDomain=(0,1),cycleValue=False,maxValues=0):
+	'''
+	Return the inverse distance weights for a list of sample values given an array of scalar values.
+	Returns a list of weights (one per value) for each sample. Array version of inverseDistanceWeight1D().
+	@param valueArray: Value array to calculate weights from
+	@type valueArray: list
+	@param sampleArray: The sample values to calculate weights for
+	@type sampleArray: list
+	@param valueDomain: The minimum and maximum range of the value array
+	@type valueDomain: tuple or list
+	@param cycleValue: Calculate distance based on a closed loop of values
+	@type cycleValue: bool
+	@param maxValues: Maximum number of (closest) values to weight per sample. If 0, weight all values.
+	@type maxValues: int
+	'''
+	# Check Sample Array
+	if not hasattr(sampleArray,'__getitem__'): sampleArray = [sampleArray]
+
+	# Get Cycle Offset
+	if cycleValue:
+		valueDomainLen = valueDomain[1]-valueDomain[0]
+		fCycArray = [v+valueDomainLen for v in valueArray]
+		rCycArray = [v-valueDomainLen for v in valueArray]
+
+	# Calculate Inverse Distance Weights
 	wtArray = []
-	
-	# Calculate inverse distance weight
-	for i in range(len(pointArray)):
-		# Calculate Distance
-		dist = distanceBetween(samplePoint, pointArray[i])
-		
-		# Check Zero Distance
-		if dist < 0.00001: dist = 0.00001
-		
-		# Append distance
-		distArray.append(dist)
-		totalInvDist += 1.0/dist
-	
-	# Normalize Value Weights
-	wtArray = [(1.0/d)/totalInvDist for d in distArray]
-	
+	for s in sampleArray:
+		distArray = [abs(s-v) for v in valueArray]
+		if cycleValue:
+			distArray = [min(d,abs(s-f),abs(s-r)) for d,f,r in itertools.izip(distArray,fCycArray,rCycArray)]
+		wtArray.append(_inverseDistanceRow(distArray,maxValues))
+
 	# Return Result
 	return wtArray
+
+def inverseDistanceWeight3DArray(pointArray,sampleArray,maxPoints=0):
+	'''
+	Return the inverse distance weights for a list of sample points given an array of points (N x 3).
+	Returns a list of weights (one per point) for each sample point. Array version of inverseDistanceWeight3D().
+	@param pointArray: Point array to calculate weights from
+	@type pointArray: list of tuples or lists
+	@param sampleArray: The sample points to calculate weights for. A single sample point is also accepted.
+	@type sampleArray: list
+	@param maxPoints: Maximum number of (closest) points to weight per sample. If 0, weight all points.
+	@type maxPoints: int
+	'''
+	if not len(sampleArray): return []
+	if _isPoint(sampleArray): sampleArray = [sampleArray]
+	return [_inverseDistanceRow(distanceArray(pointArray,s),maxPoints) for s in sampleArray]
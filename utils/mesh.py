@@ -3,6 +3,7 @@ import maya.cmds as mc
 import maya.OpenMaya as OpenMaya
 
 import glTools.utils.base
+import glTools.utils.bulkCreate
 import glTools.utils.component
 import glTools.utils.mathUtils
 import glTools.utils.matrix
@@ -11,6 +12,9 @@ import math
 
 class UserInterupted(Exception): pass
 
+# Active MeshIntersectorCache scopes
+_meshIntersectorCache = []
+
 def isMesh(mesh):
 	'''
 	Check if the specified object is a polygon mesh or transform parent of a mesh
@@ -159,6 +163,144 @@ def getMeshEdgeIter(mesh,edgeId=None):
 	# Return result
 	return meshEdgeIt
 
+class MeshIntersectorCache(object):
+	'''
+	Scoped cache of MMeshIntersectors, for batch closest point queries against unchanged meshes.
+	Outside of an active scope, getMeshIntersector() always builds a new intersector.
+		with glTools.utils.mesh.MeshIntersectorCache():
+			for ptList in batchList: glTools.utils.mesh.closestPointData(mesh,ptList)
+	Intersectors are keyed by shape path, world matrix, vertex count and bounds. Mesh deformation is NOT tracked,
+	so call clear() after modifying a mesh within the scope. The cache is cleared when a new scene is created or a scene is opened.
+	Nested scopes share the outermost cache.
+	@param maxSize: Maximum number of cached intersectors
+	@type maxSize: int
+	'''
+	def __init__(self,maxSize=8):
+		self.maxSize = maxSize
+		self._cache = {}
+		self._callbacks = []
+	
+	def __enter__(self):
+		if _meshIntersectorCache: return _meshIntersectorCache[0]
+		
+		# Clear Cache on Scene Change
+		for msg in [OpenMaya.MSceneMessage.kBeforeNew,OpenMaya.MSceneMessage.kBeforeOpen]:
+			self._callbacks.append(OpenMaya.MSceneMessage.addCallback(msg,self._sceneChanged))
+		
+		_meshIntersectorCache.append(self)
+		return self
+	
+	def __exit__(self,excType,excValue,tb):
+		if self in _meshIntersectorCache:
+			_meshIntersectorCache.remove(self)
+			for callback in self._callbacks: OpenMaya.MMessage.removeCallback(callback)
+			self._callbacks = []
+			self.clear()
+		return False
+	
+	def _sceneChanged(self,clientData=None):
+		self.clear()
+	
+	def get(self,key):
+		'''
+		Return the cached intersector for the specified key, or None.
+		Intersectors built against a mesh that has since been deleted are discarded.
+		'''
+		if not self._cache.has_key(key): return None
+		meshIntersector,meshHandle = self._cache[key]
+		if not meshHandle.isValid():
+			self._cache.pop(key)
+			return None
+		return meshIntersector
+	
+	def add(self,key,meshIntersector,meshObj):
+		'''
+		Add an intersector to the cache, replacing any cached intersectors for the same shape.
+		'''
+		self.clear(key[0])
+		if len(self._cache) >= self.maxSize: self._cache.pop(self._cache.keys()[0])
+		self._cache[key] = (meshIntersector,OpenMaya.MObjectHandle(meshObj))
+	
+	def clear(self,meshPath=None):
+		'''
+		Clear cached intersectors.
+		@param meshPath: Full path of the mesh shape to clear cached intersectors for. If None, clear all cached intersectors.
+		@type meshPath: str or None
+		'''
+		if not meshPath:
+			self._cache.clear()
+			return
+		for key in self._cache.keys():
+			if key[0] == meshPath: self._cache.pop(key)
+
+def getMeshIntersector(mesh,useCache=True):
+	'''
+	Return an MMeshIntersector for the specified mesh, built against the current mesh world matrix.
+	Within an active MeshIntersectorCache scope, intersectors are reused for repeated queries against the same mesh.
+	@param mesh: Mesh to build intersector for
+	@type mesh: str
+	@param useCache: Use the active MeshIntersectorCache, if any
+	@type useCache: bool
+	'''
+	# Checks
+	if not isMesh(mesh): raise Exception('Object '+mesh+' is not a polygon mesh!')
+	
+	# Get shape
+	if mc.objectType(mesh) == 'transform':
+		mesh = mc.listRelatives(mesh,s=True,ni=True,pa=True)[0]
+	
+	# Get Mesh Path and World Matrix
+	meshPath = glTools.utils.base.getMDagPath(mesh)
+	meshMatrix = meshPath.inclusiveMatrix()
+	
+	# Check Cache
+	cache = None
+	if useCache and _meshIntersectorCache: cache = _meshIntersectorCache[0]
+	if cache:
+		# Build Cache Key (Shape Path, World Matrix, Vertex Count, Local Bounds)
+		meshFn = OpenMaya.MFnMesh(meshPath)
+		bbox = meshFn.boundingBox()
+		bMin = bbox.min()
+		bMax = bbox.max()
+		cacheKey = (	meshPath.fullPathName(),
+						tuple([meshMatrix(r,c) for r in range(4) for c in range(4)]),
+						meshFn.numVertices(),
+						(bMin.x,bMin.y,bMin.z,bMax.x,bMax.y,bMax.z)	)
+		meshIntersector = cache.get(cacheKey)
+		if meshIntersector: return meshIntersector
+	
+	# Build Intersector
+	meshIntersector = OpenMaya.MMeshIntersector()
+	meshIntersector.create(meshPath.node(),meshMatrix)
+	
+	# Update Cache
+	if cache: cache.add(cacheKey,meshIntersector,meshPath.node())
+	
+	# Return Result
+	return meshIntersector
+
+def clearMeshIntersectorCache(mesh=None):
+	'''
+	Clear intersectors from the active MeshIntersectorCache.
+	@param mesh: Mesh to clear cached intersectors for. If None, clear all cached intersectors.
+	@type mesh: str or None
+	'''
+	# Check Active Cache
+	if not _meshIntersectorCache: return
+	cache = _meshIntersectorCache[0]
+	
+	# Clear All
+	if not mesh:
+		cache.clear()
+		return
+	
+	# Get shape
+	if mc.objectType(mesh) == 'transform':
+		mesh = mc.listRelatives(mesh,s=True,ni=True,pa=True)[0]
+	
+	# Clear Mesh Entries
+	cache.clear(glTools.utils.base.getMDagPath(mesh).fullPathName())
+
 def getRawPoints(mesh):
 	'''
 	Get mesh vertex positions via the MFnMesh.getRawPoints() method.
@@ -817,6 +959,262 @@ def closestUV(mesh,point=(0,0,0),uvSet=''):
 	# Return result
 	return (uv.getFloat2ArrayItem(uvPtr,0,0),uv.getFloat2ArrayItem(uvPtr,0,1))
 
+def closestPointData(mesh,pointList,uvSet=None,maxDist=9999999.0):
+	'''
+	Get closest point data on the specified mesh for a list of points in a single pass.
+	A single MMeshIntersector is used for all point queries (reused from the active MeshIntersectorCache, if any).
+	Returns a dictionary of per point lists, keyed by "point", "normal", "faceId", "triangleId",
+	"triangleVertices", "barycentric" and "uv" (only if a uvSet is specified).
+	Values expected and returned in world space.
+	@param mesh: Mesh to query
+	@type mesh: str
+	@param pointList: List of points to find the closest mesh point data for
+	@type pointList: list or MPointArray
+	@param uvSet: UV set to interpolate closest point UVs from. If None, no UVs are returned.
+	@type uvSet: str or None
+	@param maxDist: Maximum closest point search distance
+	@type maxDist: float
+	'''
+	# ==========
+	# - Checks -
+	# ==========
+	
+	# Check Mesh
+	if not isMesh(mesh): raise Exception('Object '+mesh+' is not a polygon mesh!')
+	
+	# Get shape
+	if mc.objectType(mesh) == 'transform':
+		mesh = mc.listRelatives(mesh,s=True,ni=True,pa=True)[0]
+	
+	# Check UV Set
+	if uvSet and not mc.polyUVSet(mesh,q=True,auv=True).count(uvSet):
+		raise Exception('Invalid UV set "'+uvSet+'" specified!"')
+	
+	# =====================
+	# - Get Mesh Data -
+	# =====================
+	
+	meshPath = glTools.utils.base.getMDagPath(mesh)
+	meshFn = OpenMaya.MFnMesh(meshPath)
+	meshMatrix = meshPath.inclusiveMatrix()
+	normalMatrix = meshMatrix.inverse().transpose()
+	meshIntersector = getMeshIntersector(mesh)
+	
+	# Get UV Data
+	if uvSet:
+		uArray = OpenMaya.MFloatArray()
+		vArray = OpenMaya.MFloatArray()
+		meshFn.getUVs(uArray,vArray,uvSet)
+		uvCounts = OpenMaya.MIntArray()
+		uvIds = OpenMaya.MIntArray()
+		meshFn.getAssignedUVs(uvCounts,uvIds,uvSet)
+		polyCounts = OpenMaya.MIntArray()
+		polyConnects = OpenMaya.MIntArray()
+		meshFn.getVertices(polyCounts,polyConnects)
+		
+		# Build Face Vertex Offsets
+		faceOffset = [0 for i in xrange(polyCounts.length())]
+		for i in xrange(1,polyCounts.length()):
+			faceOffset[i] = faceOffset[i-1] + polyCounts[i-1]
+	
+	# ============================
+	# - Get Closest Point Data -
+	# ============================
+	
+	# Initialize Pointers
+	meshPt = OpenMaya.MPointOnMesh()
+	uUtil = OpenMaya.MScriptUtil(0.0)
+	vUtil = OpenMaya.MScriptUtil(0.0)
+	uPtr = uUtil.asFloatPtr()
+	vPtr = vUtil.asFloatPtr()
+	idUtil = OpenMaya.MScriptUtil()
+	idUtil.createFromList([0,0,0],3)
+	idPtr = idUtil.asIntPtr()
+	
+	# Initialize Result
+	ptCount = len(pointList)
+	result = {	'point':[None]*ptCount,
+				'normal':[None]*ptCount,
+				'faceId':[-1]*ptCount,
+				'triangleId':[-1]*ptCount,
+				'triangleVertices':[None]*ptCount,
+				'barycentric':[None]*ptCount	}
+	if uvSet: result['uv'] = [None]*ptCount
+	
+	for i in xrange(ptCount):
+		
+		# Get Closest Point
+		pnt = glTools.utils.base.getMPoint(pointList[i])
+		meshIntersector.getClosestPoint(pnt,meshPt,maxDist)
+		faceId = meshPt.faceIndex()
+		triId = meshPt.triangleIndex()
+		
+		# Closest Point and Normal (Object to World Space)
+		pt = OpenMaya.MPoint(meshPt.getPoint()) * meshMatrix
+		norm = (OpenMaya.MVector(meshPt.getNormal()) * normalMatrix).normal()
+		
+		# Barycentric Coords
+		meshPt.getBarycentricCoords(uPtr,vPtr)
+		u = OpenMaya.MScriptUtil(uPtr).asFloat()
+		v = OpenMaya.MScriptUtil(vPtr).asFloat()
+		bary = (u,v,1.0-(u+v))
+		
+		# Triangle Vertex IDs
+		meshFn.getPolygonTriangleVertices(faceId,triId,idPtr)
+		triVtx = tuple([OpenMaya.MScriptUtil().getIntArrayItem(idPtr,n) for n in range(3)])
+		
+		# Append Result
+		result['point'][i] = (pt.x,pt.y,pt.z)
+		result['normal'][i] = (norm.x,norm.y,norm.z)
+		result['faceId'][i] = faceId
+		result['triangleId'][i] = triId
+		result['triangleVertices'][i] = triVtx
+		result['barycentric'][i] = bary
+		
+		# Interpolate UV
+		if uvSet:
+			offset = faceOffset[faceId]
+			faceVtx = [polyConnects[offset+n] for n in xrange(polyCounts[faceId])]
+			uv = [0.0,0.0]
+			for n in range(3):
+				uvId = uvIds[offset+faceVtx.index(triVtx[n])]
+				uv[0] += uArray[uvId] * bary[n]
+				uv[1] += vArray[uvId] * bary[n]
+			result['uv'][i] = (uv[0],uv[1])
+	
+	# =================
+	# - Return Result -
+	# =================
+	
+	return result
+
+def closestPoints(mesh,pointList):
+	'''
+	Get the closest points on the specified mesh to a list of points.
+	Values expected and returned in world space.
+	@param mesh: Mesh to query
+	@type mesh: str
+	@param pointList: Find the closest points to THESE points
+	@type pointList: list or MPointArray
+	'''
+	return closestPointData(mesh,pointList)['point']
+
+def closestNormals(mesh,pointList):
+	'''
+	Get the interpolated normals at the closest points on the specified mesh to a list of points.
+	Values expected and returned in world space.
+	@param mesh: Mesh to query
+	@type mesh: str
+	@param pointList: Find the closest normals to THESE points
+	@type pointList: list or MPointArray
+	'''
+	return closestPointData(mesh,pointList)['normal']
+
+def closestFaces(mesh,pointList):
+	'''
+	Get the closest face IDs on the specified mesh to a list of points.
+	@param mesh: Mesh to query
+	@type mesh: str
+	@param pointList: Find the closest faces to THESE points
+	@type pointList: list or MPointArray
+	'''
+	return closestPointData(mesh,pointList)['faceId']
+
+def closestVertices(mesh,pointList):
+	'''
+	Get the closest vertex IDs on the specified mesh to a list of points.
+	The closest vertex is selected from the vertices of the closest face.
+	@param mesh: Mesh to query
+	@type mesh: str
+	@param pointList: Find the closest vertices to THESE points
+	@type pointList: list or MPointArray
+	'''
+	# Check mesh
+	if not isMesh(mesh): raise Exception('Object '+mesh+' is not a polygon mesh!')
+	
+	# Get Closest Faces
+	pointList = [glTools.utils.base.getMPoint(pt) for pt in pointList]
+	faceList = closestFaces(mesh,pointList)
+	
+	# Get Mesh Data
+	meshFn = getMeshFn(mesh)
+	meshPts = OpenMaya.MPointArray()
+	meshFn.getPoints(meshPts,OpenMaya.MSpace.kWorld)
+	faceVtxArray = OpenMaya.MIntArray()
+	
+	# Get Closest Vertices
+	vtxList = []
+	for i in xrange(len(pointList)):
+		meshFn.getPolygonVertices(faceList[i],faceVtxArray)
+		vtxId = -1
+		minDist = 99999
+		for vtx in faceVtxArray:
+			dist = pointList[i].distanceTo(meshPts[vtx])
+			if dist < minDist:
+				vtxId = vtx
+				minDist = dist
+		vtxList.append(vtxId)
+	
+	# Return Result
+	return vtxList
+
+def closestPointWeightedAverages(mesh,pointList):
+	'''
+	Get the inverse distance weighted average of the vertices of the closest face on the specified mesh for a list of points.
+	Returns a list of {vertexId:weight} dictionaries.
+	@param mesh: Mesh to query
+	@type mesh: str
+	@param pointList: Find the closest face vertex weights for THESE points
+	@type pointList: list or MPointArray
+	'''
+	# Check mesh
+	if not isMesh(mesh): raise Exception('Object '+mesh+' is not a polygon mesh!')
+	
+	# Get Closest Faces
+	pointList = [glTools.utils.base.getMPoint(pt) for pt in pointList]
+	faceList = closestFaces(mesh,pointList)
+	
+	# Get Mesh Data
+	meshFn = getMeshFn(mesh)
+	meshPts = OpenMaya.MPointArray()
+	meshFn.getPoints(meshPts,OpenMaya.MSpace.kWorld)
+	faceVtxArray = OpenMaya.MIntArray()
+	
+	# Calculate Weighted Averages
+	wtList = []
+	for i in xrange(len(pointList)):
+		meshFn.getPolygonVertices(faceList[i],faceVtxArray)
+		faceVtx = list(faceVtxArray)
+		invDist = [1.0/max(pointList[i].distanceTo(meshPts[vtx]),0.00001) for vtx in faceVtx]
+		totalInvDist = sum(invDist)
+		wtList.append(dict([(faceVtx[n],invDist[n]/totalInvDist) for n in range(len(faceVtx))]))
+	
+	# Return Result
+	return wtList
+
+def closestUVs(mesh,pointList,uvSet=''):
+	'''
+	Get the UVs of the closest points on a mesh to a list of points.
+	UVs are interpolated from the barycentric coordinates of the closest triangle.
+	@param mesh: Mesh to query
+	@type mesh: str
+	@param pointList: Find the closest UVs to THESE points
+	@type pointList: list or MPointArray
+	@param uvSet: UV set to query. If empty, use the current UV set.
+	@type uvSet: str
+	'''
+	# Check mesh
+	if not isMesh(mesh): raise Exception('Object "'+mesh+'" is not a valid mesh!')
+	
+	# Check uvSet
+	if not uvSet:
+		currentUvSet = mc.polyUVSet(mesh,q=True,cuv=True)
+		if not currentUvSet: raise Exception('Mesh "'+mesh+'" has no valid uvSet!')
+		uvSet = currentUvSet[0]
+	
+	# Return Result
+	return closestPointData(mesh,pointList,uvSet=uvSet)['uv']
+
 def getPointFromUV(mesh,uv=(-1,-1),uvSet=None,tolerance=0.01):
 	'''
 	Get the UV of the closest point on a mesh to a specified point
@@ -1093,16 +1491,14 @@ def snapPtsToMesh(mesh,pointList,amount=1.0):
 	pointList = mc.ls(pointList,fl=True)
 	if not pointList: pointList = mc.ls(sl=True,fl=True)
 	
-	# Get MFnMesh
-	meshFn = getMeshFn(mesh)
+	# Get Closest Points (Single Pass)
+	ptList = [glTools.utils.base.getMPoint(pt) for pt in pointList]
+	meshPtList = closestPoints(mesh,ptList)
 	
 	# Snap points
-	pos = OpenMaya.MPoint()
-	for pt in pointList:
-		pnt = glTools.utils.base.getMPoint(pt)
-		meshFn.getClosestPoint(pnt,pos,OpenMaya.MSpace.kWorld)
-		offset = (pos - pnt) * amount
-		mc.move(offset[0],offset[1],offset[2],pt,ws=True,r=True)
+	for i in xrange(len(pointList)):
+		offset = (OpenMaya.MPoint(*meshPtList[i]) - ptList[i]) * amount
+		mc.move(offset[0],offset[1],offset[2],pointList[i],ws=True,r=True)
 
 def closestVertexAttr(obj,mesh,attr='vtx'):
 	'''
@@ -1341,6 +1737,183 @@ def intersectAllFaces(mesh,source,direction,testBothDirections=False,maxDist=999
 	# Return intersection hit point
 	return list(hitFaceArray)
 
+def intersectData(mesh,sourceList,directionList,testBothDirections=False,allHits=False,maxDist=9999,tolerance=0.0001):
+	'''
+	Cast a batch of rays against the specified mesh and return the intersection data for each ray.
+	A single MFnMesh and uniform grid acceleration structure is shared by all rays.
+	Returns a dictionary of per ray lists, keyed by "hit", "point", "distance", "faceId", "triangleId" and "barycentric".
+	If allHits is True, each per ray entry (except "hit") is a list of all hits sorted by distance,
+	otherwise each entry holds the closest hit only (or None for rays that miss the mesh).
+	Ray directions are normalized, so hit distances are in world units. Hits found behind the ray
+	source (testBothDirections) are returned with a negative distance.
+	@param mesh: Polygon mesh to perform intersections on
+	@type mesh: str
+	@param sourceList: List of ray source points
+	@type sourceList: list
+	@param directionList: List of ray directions, or a single direction shared by all rays
+	@type directionList: list or tuple
+	@param testBothDirections: Test both directions for intersection
+	@type testBothDirections: bool
+	@param allHits: Return all intersections along each ray instead of the closest only
+	@type allHits: bool
+	@param maxDist: Maximum search distance for intersection
+	@type maxDist: float
+	@param tolerance: Intersection tolerance
+	@type tolerance: float
+	'''
+	# ==========
+	# - Checks -
+	# ==========
+	
+	# Check Mesh
+	if not isMesh(mesh): raise Exception('Object '+mesh+' is not a polygon mesh!')
+	
+	# Check Directions
+	rayCount = len(sourceList)
+	if isinstance(directionList[0],(int,float)):
+		directionList = [directionList for i in xrange(rayCount)]
+	if len(directionList) != rayCount:
+		raise Exception('Ray source and direction list length mismatch!')
+	
+	# ===========================
+	# - Build Intersection Data -
+	# ===========================
+	
+	# Get MFnMesh and Acceleration Structure
+	meshFn = getMeshFn(mesh)
+	accelParams = meshFn.autoUniformGridParams()
+	
+	# Initialize Result
+	result = {	'hit':[False]*rayCount,
+				'point':[None]*rayCount,
+				'distance':[None]*rayCount,
+				'faceId':[None]*rayCount,
+				'triangleId':[None]*rayCount,
+				'barycentric':[None]*rayCount	}
+	
+	# Initialize Hit Data
+	if allHits:
+		hitPtArray = OpenMaya.MFloatPointArray()
+		hitDistArray = OpenMaya.MFloatArray()
+		hitFaceArray = OpenMaya.MIntArray()
+		hitTriArray = OpenMaya.MIntArray()
+		hitBary1Array = OpenMaya.MFloatArray()
+		hitBary2Array = OpenMaya.MFloatArray()
+	else:
+		hitPt = OpenMaya.MFloatPoint()
+		hitDistUtil = OpenMaya.MScriptUtil(0.0)
+		hitDistPtr = hitDistUtil.asFloatPtr()
+		hitFaceUtil = OpenMaya.MScriptUtil(0)
+		hitFacePtr = hitFaceUtil.asIntPtr()
+		hitTriUtil = OpenMaya.MScriptUtil(0)
+		hitTriPtr = hitTriUtil.asIntPtr()
+		hitBary1Util = OpenMaya.MScriptUtil(0.0)
+		hitBary1Ptr = hitBary1Util.asFloatPtr()
+		hitBary2Util = OpenMaya.MScriptUtil(0.0)
+		hitBary2Ptr = hitBary2Util.asFloatPtr()
+	
+	# ==================
+	# - Intersect Rays -
+	# ==================
+	
+	for i in xrange(rayCount):
+		
+		# Get Ray
+		source = sourceList[i]
+		direction = directionList[i]
+		sourcePt = OpenMaya.MFloatPoint(source[0],source[1],source[2])
+		directionVec = OpenMaya.MFloatVector(direction[0],direction[1],direction[2]).normal()
+		
+		if allHits:
+			
+			# Calculate All Intersections
+			hit = meshFn.allIntersections(	sourcePt,directionVec,None,None,False,OpenMaya.MSpace.kWorld,maxDist,testBothDirections,accelParams,True,
+											hitPtArray,hitDistArray,hitFaceArray,hitTriArray,hitBary1Array,hitBary2Array,tolerance	)
+			if not hit: continue
+			
+			# Append Result
+			hitCount = hitPtArray.length()
+			result['hit'][i] = True
+			result['point'][i] = [(hitPtArray[n].x,hitPtArray[n].y,hitPtArray[n].z) for n in xrange(hitCount)]
+			result['distance'][i] = list(hitDistArray)
+			result['faceId'][i] = list(hitFaceArray)
+			result['triangleId'][i] = list(hitTriArray)
+			result['barycentric'][i] = [(hitBary1Array[n],hitBary2Array[n],1.0-(hitBary1Array[n]+hitBary2Array[n])) for n in xrange(hitCount)]
+			
+		else:
+			
+			# Calculate Closest Intersection
+			hit = meshFn.closestIntersection(	sourcePt,directionVec,None,None,False,OpenMaya.MSpace.kWorld,maxDist,testBothDirections,accelParams,
+												hitPt,hitDistPtr,hitFacePtr,hitTriPtr,hitBary1Ptr,hitBary2Ptr,tolerance	)
+			if not hit: continue
+			
+			# Append Result
+			bary1 = OpenMaya.MScriptUtil(hitBary1Ptr).asFloat()
+			bary2 = OpenMaya.MScriptUtil(hitBary2Ptr).asFloat()
+			result['hit'][i] = True
+			result['point'][i] = (hitPt.x,hitPt.y,hitPt.z)
+			result['distance'][i] = OpenMaya.MScriptUtil(hitDistPtr).asFloat()
+			result['faceId'][i] = OpenMaya.MScriptUtil(hitFacePtr).asInt()
+			result['triangleId'][i] = OpenMaya.MScriptUtil(hitTriPtr).asInt()
+			result['barycentric'][i] = (bary1,bary2,1.0-(bary1+bary2))
+	
+	# =================
+	# - Return Result -
+	# =================
+	
+	return result
+
+def intersectPoints(mesh,sourceList,directionList,testBothDirections=False,maxDist=9999):
+	'''
+	Return the closest intersection points on a specified mesh for a batch of rays.
+	Rays that miss the mesh return None.
+	@param mesh: Polygon mesh to perform intersections on
+	@type mesh: str
+	@param sourceList: List of ray source points
+	@type sourceList: list
+	@param directionList: List of ray directions, or a single direction shared by all rays
+	@type directionList: list or tuple
+	@param testBothDirections: Test both directions for intersection
+	@type testBothDirections: bool
+	@param maxDist: Maximum search distance for intersection
+	@type maxDist: float
+	'''
+	return intersectData(mesh,sourceList,directionList,testBothDirections,False,maxDist)['point']
+
+def intersectDists(mesh,sourceList,directionList,testBothDirections=False,maxDist=9999):
+	'''
+	Return the distance to the closest intersection point on a specified mesh for a batch of rays.
+	Rays that miss the mesh return None.
+	@param mesh: Polygon mesh to perform intersections on
+	@type mesh: str
+	@param sourceList: List of ray source points
+	@type sourceList: list
+	@param directionList: List of ray directions, or a single direction shared by all rays
+	@type directionList: list or tuple
+	@param testBothDirections: Test both directions for intersection
+	@type testBothDirections: bool
+	@param maxDist: Maximum search distance for intersection
+	@type maxDist: float
+	'''
+	return intersectData(mesh,sourceList,directionList,testBothDirections,False,maxDist)['distance']
+
+def intersectFaces(mesh,sourceList,directionList,testBothDirections=False,maxDist=9999):
+	'''
+	Return the closest intersected face ID on a specified mesh for a batch of rays.
+	Rays that miss the mesh return None.
+	@param mesh: Polygon mesh to perform intersections on
+	@type mesh: str
+	@param sourceList: List of ray source points
+	@type sourceList: list
+	@param directionList: List of ray directions, or a single direction shared by all rays
+	@type directionList: list or tuple
+	@param testBothDirections: Test both directions for intersection
+	@type testBothDirections: bool
+	@param maxDist: Maximum search distance for intersection
+	@type maxDist: float
+	'''
+	return intersectData(mesh,sourceList,directionList,testBothDirections,False,maxDist)['faceId']
+
 def faceArea(mesh,faceId):
 	'''
 	Return the surface area of a specified mesh polygon face.
@@ -1396,29 +1969,28 @@ def locatorMesh(mesh,locatorScale=0.1,prefix=''):
 	# Get Vertices
 	componentList = glTools.utils.component.getComponentStrList(mesh)
 	
-	# Iterate over component list
-	locatorList = []
-	for i in range(len(componentList)):
-		
-		# Get componet position
-		pos = mc.pointPosition(componentList[i])
-		
-		# Build Vertex Locator
-		loc = mc.spaceLocator(n=prefix+'_vtx'+str(i)+'_loc')[0]
-		mc.move(pos[0],pos[1],pos[2],loc,a=True,ws=True)
-		mc.setAttr(loc+'.localScale',locatorScale,locatorScale,locatorScale)
-		locatorList.append(loc)
+	# Get Vertex Positions
+	posList = glTools.utils.base.getPointArray(mesh)
+	
+	mc.undoInfo(openChunk=True)
+	try:
+		# Build Vertex Locators
+		nameList = [prefix+'_vtx'+str(i)+'_loc' for i in range(len(componentList))]
+		locatorList = glTools.utils.bulkCreate.createLocators(nameList,positionList=posList,localScale=locatorScale)
 		
 		# Freeze Vertices
-		mc.move(0,0,0,componentList[i],a=True,ws=True)
+		for i in range(len(componentList)):
+			mc.move(0,0,0,componentList[i],a=True,ws=True)
+			
+		# Freeze Mesh
+		deformer = mc.deformer(mesh,type='cluster')
+		mc.delete(mesh,constructionHistory=True)
 		
-	# Freeze Mesh
-	deformer = mc.deformer(mesh,type='cluster')
-	mc.delete(mesh,constructionHistory=True)
-	
-	# Connect Locators
-	for i in range(len(locatorList)):
-		mc.connectAttr(locatorList[i]+'.worldPosition[0]',mesh+'.controlPoints['+str(i)+']',f=True)
+		# Connect Locators
+		for i in range(len(locatorList)):
+			mc.connectAttr(locatorList[i]+'.worldPosition[0]',mesh+'.controlPoints['+str(i)+']',f=True)
+	finally:
+		mc.undoInfo(closeChunk=True)
 	
 	# =================
 	# - Return Result -
@@ -1,6 +1,9 @@
 import maya.cmds as mc
 import maya.mel as mm
+import maya.OpenMaya as OpenMaya
 
+import glTools.utils.apiUndo
+import glTools.utils.arrayUtils
 import glTools.utils.attribute
 import glTools.utils.base
 import glTools.utils.mesh
@@ -9,6 +12,9 @@ import glTools.utils.stringUtils
 from glTools.utils.weightList import WeightList
 
 import os.path
+import sys
+import array
+import struct
 
 # ----------
 # - Checks -
@@ -572,7 +578,7 @@ def getVertexWeights(nCloth,attr):
 	nCloth = connNCloth[0]
 		
 	# Get vertex weights
-	wt = mc.getAttr(nCloth+'.'+attr+'PerVertex')
+	wt = getVertexMap(nCloth,attr)
 	
 	# Return Result
 	return wt
@@ -660,3 +666,457 @@ def loadWeightMap(nCloth,attr,filePath,loadAsVertexMap=False):
 		mc.setAttr(nCloth+'.'+attr+'MapType',1) # Per-vertex
 		mc.delete(fileNode)
 
+
+# ---------------
+# - Vertex Maps -
+# ---------------
+
+VERTEX_MAP_FILE_ID = 'NVMP'
+VERTEX_MAP_FILE_VERSION = 1
+
+def listVertexMapAttrs(nCloth):
+	'''
+	Return the list of per-vertex map attributes (without the "PerVertex" suffix) for the specified nCloth object.
+	@param nCloth: nCloth object to list vertex map attributes for
+	@type nCloth: str
+	'''
+	# Checks nCloth
+	connNCloth = getConnectedNCloth(nCloth)
+	if not connNCloth: raise Exception('Object "'+nCloth+'" is not a valid nCloth object!')
+	nCloth = connNCloth[0]
+	
+	# List Vertex Map Attributes
+	attrList = mc.listAttr(nCloth,st='*PerVertex') or []
+	
+	# Return Result
+	return [str(attr[:-len('PerVertex')]) for attr in attrList]
+
+def getVertexMap(nCloth,attr,default=None):
+	'''
+	Return the nCloth per-vertex map values for the specified attribute.
+	Values are read directly from the attribute data (MFnDoubleArrayData), bypassing getAttr.
+	@param nCloth: nCloth object to get the vertex map for
+	@type nCloth: str
+	@param attr: nCloth attribute to get the vertex map for
+	@type attr: str
+	@param default: If the vertex map is empty, return a map of this value for each mesh vertex. If None, return an empty map.
+	@type default: float or None
+	'''
+	# Checks nCloth
+	connNCloth = getConnectedNCloth(nCloth)
+	if not connNCloth: raise Exception('Object "'+nCloth+'" is not a valid nCloth object!')
+	nCloth = connNCloth[0]
+	
+	# Get Vertex Map Data
+	plug = OpenMaya.MFnDependencyNode(glTools.utils.base.getMObject(nCloth)).findPlug(attr+'PerVertex')
+	dataObj = plug.asMObject()
+	wt = []
+	if not dataObj.isNull():
+		wt = list(OpenMaya.MFnDoubleArrayData(dataObj).array())
+	
+	# Check Default
+	if not wt and default != None:
+		mesh = getConnectedMesh(nCloth,returnShape=True)
+		wt = [float(default)] * glTools.utils.mesh.getMeshFn(mesh).numVertices()
+	
+	# Return Result
+	return wt
+
+def setVertexMap(nCloth,attr,wt,setMapType=True):
+	'''
+	Set the nCloth per-vertex map values for the specified attribute.
+	Values are written directly to the attribute data (MFnDoubleArrayData), bypassing setAttr.
+	The attribute data is set through a recorded MDGModifier, so the change is undoable (see glTools.utils.apiUndo).
+	@param nCloth: nCloth object to set the vertex map for
+	@type nCloth: str
+	@param attr: nCloth attribute to set the vertex map for
+	@type attr: str
+	@param wt: Vertex map values
+	@type wt: list
+	@param setMapType: Set the attribute map type to per-vertex
+	@type setMapType: bool
+	'''
+	# Checks nCloth
+	connNCloth = getConnectedNCloth(nCloth)
+	if not connNCloth: raise Exception('Object "'+nCloth+'" is not a valid nCloth object!')
+	nCloth = connNCloth[0]
+	
+	mc.undoInfo(openChunk=True)
+	try:
+		# Set Vertex Map Data
+		plug = OpenMaya.MFnDependencyNode(glTools.utils.base.getMObject(nCloth)).findPlug(attr+'PerVertex')
+		dataFn = OpenMaya.MFnDoubleArrayData()
+		dataObj = dataFn.create(glTools.utils.arrayUtils.toMDoubleArray(wt))
+		with glTools.utils.apiUndo.ApiUndo() as undo:
+			dgMod = undo.dgModifier()
+			dgMod.newPlugValue(plug,dataObj)
+			dgMod.doIt()
+		
+		# Set Map Type
+		if setMapType and mc.attributeQuery(attr+'MapType',n=nCloth,ex=True):
+			mc.setAttr(nCloth+'.'+attr+'MapType',1) # Per-vertex
+	finally:
+		mc.undoInfo(closeChunk=True)
+
+def getVertexMaps(nCloth,attrList=None):
+	'''
+	Return a dictionary of attribute:vertexMap values for the specified nCloth object.
+	Empty vertex maps are not included.
+	@param nCloth: nCloth object to get the vertex maps for
+	@type nCloth: str
+	@param attrList: List of attributes to get vertex maps for. If None, get all vertex maps.
+	@type attrList: list or None
+	'''
+	# Checks nCloth
+	connNCloth = getConnectedNCloth(nCloth)
+	if not connNCloth: raise Exception('Object "'+nCloth+'" is not a valid nCloth object!')
+	nCloth = connNCloth[0]
+	
+	# Check Attribute List
+	if attrList == None: attrList = listVertexMapAttrs(nCloth)
+	
+	# Get Vertex Maps
+	mapDict = {}
+	for attr in attrList:
+		wt = getVertexMap(nCloth,attr)
+		if wt: mapDict[attr] = wt
+	
+	# Return Result
+	return mapDict
+
+def setVertexMaps(nCloth,mapDict,setMapType=True):
+	'''
+	Set multiple nCloth per-vertex maps from a dictionary of attribute:vertexMap values.
+	@param nCloth: nCloth object to set the vertex maps for
+	@type nCloth: str
+	@param mapDict: Dictionary of attribute:vertexMap values
+	@type mapDict: dict
+	@param setMapType: Set the attribute map type to per-vertex
+	@type setMapType: bool
+	'''
+	# Checks nCloth
+	connNCloth = getConnectedNCloth(nCloth)
+	if not connNCloth: raise Exception('Object "'+nCloth+'" is not a valid nCloth object!')
+	nCloth = connNCloth[0]
+	
+	# Set Vertex Maps
+	mc.undoInfo(openChunk=True)
+	try:
+		for attr in mapDict.iterkeys():
+			setVertexMap(nCloth,attr,mapDict[attr],setMapType)
+	finally:
+		mc.undoInfo(closeChunk=True)
+
+def getVertexAdjacency(mesh):
+	'''
+	Return the edge connected vertex adjacency of the specified mesh as a compact (offsetList,indexList) pair.
+	The neighbours of vertex i are indexList[offsetList[i]:offsetList[i+1]].
+	Built from the mesh polygon connectivity in a single pass.
+	@param mesh: Mesh to get vertex adjacency for
+	@type mesh: str
+	'''
+	# Check Mesh
+	if not glTools.utils.mesh.isMesh(mesh):
+		raise Exception('Object "'+mesh+'" is not a valid mesh!')
+	
+	# Get Polygon Connectivity
+	meshFn = glTools.utils.mesh.getMeshFn(mesh)
+	vtxCount = meshFn.numVertices()
+	polyCounts = OpenMaya.MIntArray()
+	polyConnects = OpenMaya.MIntArray()
+	meshFn.getVertices(polyCounts,polyConnects)
+	polyCounts = list(polyCounts)
+	polyConnects = list(polyConnects)
+	
+	# Build Neighbour Sets
+	neighbours = [set() for i in xrange(vtxCount)]
+	offset = 0
+	for count in polyCounts:
+		face = polyConnects[offset:offset+count]
+		for n in xrange(count):
+			a = face[n]
+			b = face[n-1]
+			neighbours[a].add(b)
+			neighbours[b].add(a)
+		offset += count
+	
+	# Build Adjacency
+	offsetList = [0]
+	indexList = []
+	for vtxNeighbours in neighbours:
+		indexList.extend(vtxNeighbours)
+		offsetList.append(len(indexList))
+	
+	# Return Result
+	return (offsetList,indexList)
+
+def smoothVertexMap(wt,adjacency,iterations=1,amount=1.0):
+	'''
+	Smooth vertex map values by averaging with the values of adjacent vertices.
+	@param wt: Vertex map values to smooth
+	@type wt: list
+	@param adjacency: Vertex adjacency (offsetList,indexList) of the map mesh (see getVertexAdjacency())
+	@type adjacency: tuple
+	@param iterations: Number of smooth iterations
+	@type iterations: int
+	@param amount: Smooth amount per iteration (0-1)
+	@type amount: float
+	'''
+	offsetList,indexList = adjacency
+	if len(offsetList)-1 != len(wt):
+		raise Exception('Vertex map length ('+str(len(wt))+') does not match adjacency vertex count ('+str(len(offsetList)-1)+')!')
+	
+	# Smooth
+	wt = list(wt)
+	keep = 1.0 - amount
+	for it in xrange(iterations):
+		smooth = []
+		for i in xrange(len(wt)):
+			start = offsetList[i]
+			end = offsetList[i+1]
+			if start == end:
+				smooth.append(wt[i])
+				continue
+			avg = sum([wt[n] for n in indexList[start:end]]) / float(end-start)
+			smooth.append(wt[i]*keep + avg*amount)
+		wt = smooth
+	
+	# Return Result
+	return wt
+
+def remapVertexMap(wt,inMin=0.0,inMax=1.0,outMin=0.0,outMax=1.0,clamp=True):
+	'''
+	Linearly remap vertex map values from an input range to an output range.
+	@param wt: Vertex map values to remap
+	@type wt: list
+	@param inMin: Input range minimum
+	@type inMin: float
+	@param inMax: Input range maximum
+	@type inMax: float
+	@param outMin: Output range minimum
+	@type outMin: float
+	@param outMax: Output range maximum
+	@type outMax: float
+	@param clamp: Clamp the result to the output range
+	@type clamp: bool
+	'''
+	if inMax == inMin: raise Exception('Invalid input range! Minimum and maximum values are equal.')
+	
+	# Remap
+	scale = float(outMax-outMin)/(inMax-inMin)
+	wt = [outMin+(val-inMin)*scale for val in wt]
+	
+	# Clamp
+	if clamp: wt = clampVertexMap(wt,min(outMin,outMax),max(outMin,outMax))
+	
+	# Return Result
+	return wt
+
+def clampVertexMap(wt,minValue=0.0,maxValue=1.0):
+	'''
+	Clamp vertex map values to the specified range.
+	@param wt: Vertex map values to clamp
+	@type wt: list
+	@param minValue: Minimum value
+	@type minValue: float
+	@param maxValue: Maximum value
+	@type maxValue: float
+	'''
+	minValue = float(minValue)
+	maxValue = float(maxValue)
+	return [max(minValue,min(val,maxValue)) for val in wt]
+
+def blendVertexMap(wtA,wtB,blend=0.5):
+	'''
+	Blend between two vertex maps.
+	@param wtA: Vertex map values to blend from
+	@type wtA: list
+	@param wtB: Vertex map values to blend to
+	@type wtB: list
+	@param blend: Blend amount (0=wtA, 1=wtB). A single value, or a per-vertex list of values (mask).
+	@type blend: float or list
+	'''
+	if len(wtA) != len(wtB):
+		raise Exception('Vertex map lengths do not match! ('+str(len(wtA))+' != '+str(len(wtB))+')')
+	
+	# Blend
+	if isinstance(blend,(int,float)):
+		return [a+(b-a)*blend for a,b in zip(wtA,wtB)]
+	if len(blend) != len(wtA):
+		raise Exception('Blend mask length ('+str(len(blend))+') does not match vertex map length ('+str(len(wtA))+')!')
+	return [a+(b-a)*t for a,b,t in zip(wtA,wtB,blend)]
+
+def transferVertexMap(wt,sourceMesh,targetMesh):
+	'''
+	Transfer vertex map values from a source mesh to a target mesh by closest point.
+	Values are interpolated from the closest source triangle vertices using barycentric coordinates.
+	@param wt: Source mesh vertex map values
+	@type wt: list
+	@param sourceMesh: Mesh to transfer the vertex map from
+	@type sourceMesh: str
+	@param targetMesh: Mesh to transfer the vertex map to
+	@type targetMesh: str
+	'''
+	# Check Meshes
+	if not glTools.utils.mesh.isMesh(sourceMesh):
+		raise Exception('Object "'+sourceMesh+'" is not a valid mesh!')
+	if not glTools.utils.mesh.isMesh(targetMesh):
+		raise Exception('Object "'+targetMesh+'" is not a valid mesh!')
+	if len(wt) != glTools.utils.mesh.getMeshFn(sourceMesh).numVertices():
+		raise Exception('Vertex map length ('+str(len(wt))+') does not match source mesh vertex count!')
+	
+	# Get Target Points
+	targetPts = OpenMaya.MPointArray()
+	glTools.utils.mesh.getMeshFn(targetMesh).getPoints(targetPts,OpenMaya.MSpace.kWorld)
+	
+	# Get Closest Point Data
+	closestData = glTools.utils.mesh.closestPointData(sourceMesh,targetPts)
+	triVtxList = closestData['triangleVertices']
+	baryList = closestData['barycentric']
+	
+	# Interpolate Values
+	result = []
+	for triVtx,bary in zip(triVtxList,baryList):
+		result.append(wt[triVtx[0]]*bary[0] + wt[triVtx[1]]*bary[1] + wt[triVtx[2]]*bary[2])
+	
+	# Return Result
+	return result
+
+def transferVertexMaps(sourceNCloth,targetNCloth,attrList=None):
+	'''
+	Transfer per-vertex maps from one nCloth object to another by closest point.
+	@param sourceNCloth: nCloth object to transfer vertex maps from
+	@type sourceNCloth: str
+	@param targetNCloth: nCloth object to transfer vertex maps to
+	@type targetNCloth: str
+	@param attrList: List of attributes to transfer vertex maps for. If None, transfer all non empty vertex maps.
+	@type attrList: list or None
+	'''
+	# Get Meshes
+	sourceMesh = getConnectedMesh(sourceNCloth,returnShape=True)
+	targetMesh = getConnectedMesh(targetNCloth,returnShape=True)
+	if not sourceMesh: raise Exception('Unable to determine mesh for nCloth "'+sourceNCloth+'"!')
+	if not targetMesh: raise Exception('Unable to determine mesh for nCloth "'+targetNCloth+'"!')
+	
+	# Get Source Maps
+	mapDict = getVertexMaps(sourceNCloth,attrList)
+	if not mapDict: return {}
+	
+	# Get Closest Point Data (once for all maps)
+	targetPts = OpenMaya.MPointArray()
+	glTools.utils.mesh.getMeshFn(targetMesh).getPoints(targetPts,OpenMaya.MSpace.kWorld)
+	closestData = glTools.utils.mesh.closestPointData(sourceMesh,targetPts)
+	triVtxList = closestData['triangleVertices']
+	baryList = closestData['barycentric']
+	
+	# Transfer Maps
+	result = {}
+	for attr in mapDict.iterkeys():
+		wt = mapDict[attr]
+		result[attr] = [wt[t[0]]*b[0] + wt[t[1]]*b[1] + wt[t[2]]*b[2] for t,b in zip(triVtxList,baryList)]
+	setVertexMaps(targetNCloth,result)
+	
+	# Return Result
+	return result
+
+def writeVertexMapFile(mapDict,filePath,force=False):
+	'''
+	Write a dictionary of attribute:vertexMap values to a compact binary file.
+	Values are stored as little endian doubles.
+	@param mapDict: Dictionary of attribute:vertexMap values
+	@type mapDict: dict
+	@param filePath: Destination file path
+	@type filePath: str
+	@param force: Overwrite existing file
+	@type force: bool
+	'''
+	# Check File Path
+	if os.path.isfile(filePath) and not force:
+		raise Exception('File "'+filePath+'" already exists! Use "force=True" to overwrite.')
+	
+	# Write File
+	f = open(filePath,'wb')
+	try:
+		f.write(struct.pack('<4sII',VERTEX_MAP_FILE_ID,VERTEX_MAP_FILE_VERSION,len(mapDict)))
+		for attr in sorted(mapDict.keys()):
+			values = array.array('d',mapDict[attr])
+			if sys.byteorder == 'big': values.byteswap()
+			f.write(struct.pack('<I',len(attr)))
+			f.write(str(attr))
+			f.write(struct.pack('<I',len(values)))
+			values.tofile(f)
+	finally:
+		f.close()
+	
+	# Return Result
+	return filePath
+
+def readVertexMapFile(filePath):
+	'''
+	Read a dictionary of attribute:vertexMap values from a binary file written by writeVertexMapFile().
+	@param filePath: Vertex map file path
+	@type filePath: str
+	'''
+	# Check File Path
+	if not os.path.isfile(filePath):
+		raise Exception('Vertex map file "'+filePath+'" does not exist!')
+	
+	# Read File
+	mapDict = {}
+	f = open(filePath,'rb')
+	try:
+		fileId,version,mapCount = struct.unpack('<4sII',f.read(12))
+		if fileId != VERTEX_MAP_FILE_ID:
+			raise Exception('File "'+filePath+'" is not a valid vertex map file!')
+		if version > VERTEX_MAP_FILE_VERSION:
+			raise Exception('Unsupported vertex map file version ('+str(version)+')!')
+		for i in xrange(mapCount):
+			attr = f.read(struct.unpack('<I',f.read(4))[0])
+			valueCount = struct.unpack('<I',f.read(4))[0]
+			values = array.array('d')
+			values.fromfile(f,valueCount)
+			if sys.byteorder == 'big': values.byteswap()
+			mapDict[attr] = values.tolist()
+	finally:
+		f.close()
+	
+	# Return Result
+	return mapDict
+
+def saveVertexMaps(nCloth,filePath,attrList=None,force=False):
+	'''
+	Save nCloth per-vertex maps to a compact binary file.
+	@param nCloth: nCloth object to save vertex maps for
+	@type nCloth: str
+	@param filePath: Destination file path
+	@type filePath: str
+	@param attrList: List of attributes to save vertex maps for. If None, save all non empty vertex maps.
+	@type attrList: list or None
+	@param force: Overwrite existing file
+	@type force: bool
+	'''
+	mapDict = getVertexMaps(nCloth,attrList)
+	return writeVertexMapFile(mapDict,filePath,force)
+
+def loadVertexMaps(nCloth,filePath,attrList=None,apply=True):
+	'''
+	Load nCloth per-vertex maps from a binary file written by saveVertexMaps().
+	@param nCloth: nCloth object to load vertex maps for
+	@type nCloth: str
+	@param filePath: Vertex map file path
+	@type filePath: str
+	@param attrList: List of attributes to load vertex maps for. If None, load all vertex maps in the file.
+	@type attrList: list or None
+	@param apply: Apply the loaded vertex maps to the nCloth object
+	@type apply: bool
+	'''
+	# Read Vertex Maps
+	mapDict = readVertexMapFile(filePath)
+	if attrList != None:
+		mapDict = dict([(attr,mapDict[attr]) for attr in attrList if mapDict.has_key(attr)])
+	
+	# Apply Vertex Maps
+	if apply: setVertexMaps(nCloth,mapDict)
+	
+	# Return Result
+	return mapDict
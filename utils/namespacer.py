@@ -5,6 +5,9 @@ import types
 import maya.cmds as mc
 import maya.mel as mm
 import maya.utils as mu
+import maya.OpenMaya as OpenMaya
+
+import glTools.utils.apiUndo
 
 DEFAULT_NODES = [u'characterPartition', u'defaultHardwareRenderGlobals', u'defaultLayer', u'defaultLightList1', u'defaultLightSet', 
 u'defaultObjectSet', u'defaultRenderGlobals', u'defaultRenderLayer', u'defaultRenderLayerFilter', u'defaultRenderQuality', 
@@ -691,6 +694,214 @@ def _processNodes(nodes, autoExpandShapes=True):
     nodes.reverse()
     return nodes
 
+
+def _processNodesBulk(nodes, autoExpandShapes=True):
+    '''
+    Batched version of _processNodes(). Existence, reference and shape queries are
+    performed with a single command each for the whole node list.
+    
+    @param nodes: the nodes to process
+    @type nodes: list(str)
+    @param autoExpandShapes: include the shapes of the nodes provided
+    @type autoExpandShapes: bool
+    
+    @return: sorted (reversed) list of long node names
+    @rtype: list(str)
+    '''
+    # existing nodes
+    nodes = mc.ls(nodes, long=True) or []
+    if not nodes:
+        return []
+    
+    # handle shapes
+    if autoExpandShapes:
+        nodes.extend(mc.ls(mc.listRelatives(nodes, shapes=True, pa=True) or [], long=True) or [])
+    
+    # remove referenced nodes
+    referenced = set(mc.ls(nodes, referencedNodes=True, long=True) or [])
+    newNodes = set([node for node in nodes if not node in referenced])
+    
+    # sort the nodes so we rename them in the right order
+    nodes = sorted(newNodes)
+    nodes.reverse()
+    return nodes
+
+
+def _uniqueName(name, taken):
+    '''
+    Generate a unique name by incrementing the trailing digits of the name provided,
+    the same way maya resolves a rename conflict.
+    
+    @param name: the name to make unique (may include a namespace)
+    @type name: str
+    @param taken: the names already in use
+    @type taken: dict or set
+    
+    @return: a name that is not in taken
+    @rtype: str
+    '''
+    base = name.rstrip('0123456789')
+    digits = name[len(base):]
+    cnt = int(digits) + 1 if digits else 1
+    while (base + str(cnt)) in taken:
+        cnt += 1
+    return base + str(cnt)
+
+
+def bulkRenameNS(nodes, nameFunc, force=True, autoExpandShapes=True, dryRun=False):
+    '''
+    Batched namespace renamer. The full old to new name mapping is computed up front, name conflicts are
+    detected against a hash table of existing scene names (no per node objExists), and the renames are applied
+    through a single MDGModifier. The live namespace is never changed.
+    
+    The namespace creation and renames are registered as one undo queue entry, so the whole batch is reverted with a single undo.
+    
+    @param nodes: the nodes to rename
+    @type nodes: list(str)
+    @param nameFunc: function taking (namespace, baseName) and returning the new namespace, or None to skip the node
+    @type nameFunc: function
+    @param force: rename conflicting nodes to the next available unique name. If False, conflicting nodes are skipped.
+    @type force: bool
+    @param autoExpandShapes: include the shapes of the nodes provided
+    @type autoExpandShapes: bool
+    @param dryRun: only compute and return the rename report, do not touch the scene
+    @type dryRun: bool
+    
+    @return: rename report {'mapping': {old: new}, 'conflicts': {old: wanted}, 'skipped': [old], 'namespaces': [new namespaces]}
+    @rtype: dict
+    '''
+    report = {'mapping': {}, 'conflicts': {}, 'skipped': [], 'namespaces': []}
+    if not nodes:
+        return report
+    
+    # process the nodes
+    nodes = _processNodesBulk(nodes, autoExpandShapes)
+    
+    # build the name table (name counts, since dag nodes can share a short name)
+    taken = {}
+    for name in mc.ls(long=True) or []:
+        name = name.split('|')[-1]
+        taken[name] = taken.get(name, 0) + 1
+    
+    # compute the mapping
+    defaultNodes = set(DEFAULT_NODES)
+    namespaces = set()
+    renameList = []
+    for node in nodes:
+        
+        # check if default
+        if node in defaultNodes or node.split('|')[-1] in defaultNodes:
+            continue
+        
+        # split the namespace and generate the new name
+        ns, baseNode = splitNS(node)
+        newNS = nameFunc(ns, baseNode)
+        if newNS is None:
+            continue
+        newNS = cleanNS(newNS)
+        oldName = node.split('|')[-1]
+        newName = baseNode if newNS == ':' else newNS + ':' + baseNode
+        
+        # no change
+        if newName == oldName:
+            report['mapping'][node] = node
+            continue
+        
+        # check conflict
+        if newName in taken:
+            report['conflicts'][node] = newName
+            if not force:
+                report['skipped'].append(node)
+                continue
+            newName = _uniqueName(newName, taken)
+        
+        # update the name table
+        taken[oldName] -= 1
+        if not taken[oldName]:
+            del taken[oldName]
+        taken[newName] = taken.get(newName, 0) + 1
+        
+        if newNS != ':':
+            namespaces.add(newNS)
+        renameList.append((node, newName))
+        report['mapping'][node] = newName
+    
+    report['namespaces'] = sorted([ns for ns in namespaces if not mc.namespace(exists=':%s' % ns)])
+    
+    # dry run
+    if dryRun or not renameList:
+        return report
+    
+    mc.undoInfo(openChunk=True)
+    try:
+        # create the namespaces
+        for ns in report['namespaces']:
+            createNS(ns)
+        
+        # get the node MObjects
+        selList = OpenMaya.MSelectionList()
+        for node, newName in renameList:
+            selList.add(node)
+        
+        # rename (absolute names, so the live namespace does not matter)
+        with glTools.utils.apiUndo.ApiUndo() as undo:
+            dgMod = undo.dgModifier()
+            mObject = OpenMaya.MObject()
+            for i in range(len(renameList)):
+                selList.getDependNode(i, mObject)
+                dgMod.renameNode(mObject, ':' + renameList[i][1])
+            dgMod.doIt()
+    finally:
+        mc.undoInfo(closeChunk=True)
+    
+    return report
+
+
+def bulkStripNS(nodes, force=True, autoExpandShapes=True, dryRun=False):
+    '''
+    Batched version of stripNS(). See bulkRenameNS() for the returned rename report.
+    '''
+    return bulkRenameNS(nodes, lambda ns, baseNode: ':', force=force, autoExpandShapes=autoExpandShapes, dryRun=dryRun)
+
+
+def bulkSetNS(nodes, namespace, force=True, autoExpandShapes=True, prefix=False, dryRun=False):
+    '''
+    Batched version of setNS(). See bulkRenameNS() for the returned rename report.
+    
+    @param namespace: the namespace to apply to the nodes
+    @type namespace: str
+    @param prefix: whether to use the namespace provided to prefix existing namespaces as opposed to flat out replacing
+    @type prefix: bool
+    '''
+    namespace = cleanNS(namespace)
+    if prefix:
+        nameFunc = lambda ns, baseNode: namespace + ':' + ns
+    else:
+        nameFunc = lambda ns, baseNode: namespace
+    return bulkRenameNS(nodes, nameFunc, force=force, autoExpandShapes=autoExpandShapes, dryRun=dryRun)
+
+
+def bulkSearchReplaceNS(nodes, search, replace, force=True, autoExpandShapes=True, dryRun=False):
+    '''
+    Batched version of searchReplaceNS(). See bulkRenameNS() for the returned rename report.
+    
+    @param search: the namespace string to search for
+    @type search: str
+    @param replace: the replacement string
+    @type replace: str
+    '''
+    search = cleanNS(search)
+    replace = cleanNS(replace)
+    if search == ':':
+        raise NamespacerError('You are attempting to bulkSearchReplaceNS without any search string.. use bulkSetNS for this functionality')
+    
+    def nameFunc(ns, baseNode):
+        if not ns.count(search):
+            return None
+        return ns.replace(search, replace)
+    
+    return bulkRenameNS(nodes, nameFunc, force=force, autoExpandShapes=autoExpandShapes, dryRun=dryRun)
+
     
 # This converts a namespace to a list (removes empty spots that a split might leave behind) (":set:asset:" >> ['set', 'asset'])
 def namespaceToList(namespace):
@@ -0,0 +1,365 @@
+import maya.mel as mm
+import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
+
+import glTools.utils.progressBar
+
+import os
+import sys
+import time
+import json
+import thread
+import functools
+
+# =============
+# - Constants -
+# =============
+
+# Use the highest resolution wall clock available
+if sys.platform == 'win32': clock = time.clock
+else: clock = time.time
+
+# Maximum number of recorded spans. Spans beyond this limit are counted, but not recorded.
+MAX_SPANS = 200000
+
+# Default progress update interval (milliseconds)
+PROGRESS_INTERVAL = 100
+
+# =========
+# - State -
+# =========
+
+_enabled = True
+_origin = clock()
+_spans = []
+_stacks = {}
+_counters = {}
+_dropped = [0]
+
+def enable(state=True):
+	'''
+	Enable or disable span recording and call counters.
+	Spans still measure elapsed time while disabled, but nothing is recorded.
+	@param state: Enabled state
+	@type state: bool
+	'''
+	global _enabled
+	_enabled = bool(state)
+
+def isEnabled():
+	'''
+	Return True if span recording and call counters are enabled.
+	'''
+	return _enabled
+
+def reset():
+	'''
+	Clear all recorded spans and call counters.
+	'''
+	global _origin
+	_origin = clock()
+	del _spans[:]
+	_stacks.clear()
+	_counters.clear()
+	_dropped[0] = 0
+
+# =========
+# - Spans -
+# =========
+
+class Span(object):
+	'''
+	Timed span. Records the start time and duration of a named block of code.
+	Spans can be used as a context manager, or started and stopped explicitly:
+		timer = glTools.utils.profiler.start('MeshData.buildData')
+		...
+		buildTime = timer.stop()
+	Spans started while another span is running (in the same thread) are nested under it.
+	@param name: Span name
+	@type name: str
+	@param args: Span arguments, stored with the span and written to the chrome trace.
+	@type args: dict
+	'''
+	__slots__ = ('name','args','startTime','duration','depth','thread')
+
+	def __init__(self,name,**args):
+		self.name = name
+		self.args = args
+		self.startTime = None
+		self.duration = None
+		self.depth = 0
+		self.thread = 0
+
+	def start(self):
+		'''
+		Start the span timer.
+		'''
+		if _enabled:
+			self.thread = thread.get_ident()
+			stack = _stacks.setdefault(self.thread,[])
+			self.depth = len(stack)
+			stack.append(self)
+		self.startTime = clock()
+		return self
+
+	def stop(self):
+		'''
+		Stop the span timer, record the span and return the elapsed time (in seconds).
+		'''
+		self.duration = clock() - self.startTime
+		if not _enabled: return self.duration
+
+		# Pop Span (and any spans left open by an exception)
+		stack = _stacks.get(self.thread)
+		if stack and self in stack: del stack[stack.index(self):]
+
+		# Record Span
+		if len(_spans) < MAX_SPANS: _spans.append(self)
+		else: _dropped[0] += 1
+
+		return self.duration
+
+	def elapsed(self):
+		'''
+		Return the elapsed time (in seconds) of the span. Running spans return the current elapsed time.
+		'''
+		if self.duration != None: return self.duration
+		return clock() - self.startTime
+
+	def __enter__(self):
+		return self.start()
+
+	def __exit__(self,excType,excValue,tb):
+		self.stop()
+		return False
+
+def start(name,**args):
+	'''
+	Start and return a new timed span.
+	@param name: Span name
+	@type name: str
+	@param args: Span arguments, stored with the span and written to the chrome trace.
+	@type args: dict
+	'''
+	return Span(name,**args).start()
+
+def span(name,**args):
+	'''
+	Return a new (unstarted) timed span, for use as a context manager.
+		with glTools.utils.profiler.span('rebuildWorldSpaceData'):
+			...
+	@param name: Span name
+	@type name: str
+	@param args: Span arguments, stored with the span and written to the chrome trace.
+	@type args: dict
+	'''
+	return Span(name,**args)
+
+def timed(name=''):
+	'''
+	Function decorator that counts calls to, and records a timed span for, each call of the decorated function.
+		@glTools.utils.profiler.timed()
+		def buildData(self,mesh):
+			...
+	@param name: Span name. If empty, use the function module and name.
+	@type name: str
+	'''
+	def decorator(func):
+		spanName = name or func.__module__+'.'+func.__name__
+		@functools.wraps(func)
+		def wrapper(*args,**kwargs):
+			if not _enabled: return func(*args,**kwargs)
+			_counters[spanName] = _counters.get(spanName,0) + 1
+			timer = Span(spanName).start()
+			try: return func(*args,**kwargs)
+			finally: timer.stop()
+		return wrapper
+	return decorator
+
+def spans():
+	'''
+	Return the list of recorded spans, in the order they finished.
+	'''
+	return list(_spans)
+
+# ============
+# - Counters -
+# ============
+
+def count(name,value=1):
+	'''
+	Increment a named counter.
+	@param name: Counter name
+	@type name: str
+	@param value: Counter increment
+	@type value: int
+	'''
+	if _enabled: _counters[name] = _counters.get(name,0) + value
+
+def counters():
+	'''
+	Return a copy of the counter dictionary.
+	'''
+	return dict(_counters)
+
+# ===========
+# - Reports -
+# ===========
+
+def summary():
+	'''
+	Return a per name summary of the recorded spans.
+	Returns a dictionary of {name:{'count','total','min','max'}} entries.
+	'''
+	result = {}
+	for s in _spans:
+		if not result.has_key(s.name): result[s.name] = {'count':0,'total':0.0,'min':s.duration,'max':s.duration}
+		item = result[s.name]
+		item['count'] += 1
+		item['total'] += s.duration
+		item['min'] = min(item['min'],s.duration)
+		item['max'] = max(item['max'],s.duration)
+	return result
+
+def printSummary():
+	'''
+	Print a summary of the recorded spans (sorted by total time) and counters.
+	'''
+	result = summary()
+	print('Profiler: '+str(len(_spans))+' spans recorded ('+str(_dropped[0])+' dropped)')
+	for name in sorted(result.keys(),key=lambda n: -result[n]['total']):
+		item = result[name]
+		print('  %-60s calls: %8d  total: %10.4f  avg: %10.6f  max: %10.6f' % (name,item['count'],item['total'],item['total']/item['count'],item['max']))
+	for name in sorted(_counters.keys()):
+		print('  %-60s count: %8d' % (name,_counters[name]))
+
+def chromeTrace():
+	'''
+	Return the recorded spans and counters as a chrome trace (about://tracing) event dictionary.
+	'''
+	pid = os.getpid()
+	events = []
+	for s in _spans:
+		event = {	'name':s.name,
+					'ph':'X',
+					'ts':(s.startTime-_origin)*1000000.0,
+					'dur':s.duration*1000000.0,
+					'pid':pid,
+					'tid':s.thread	}
+		if s.args: event['args'] = dict([(k,str(v)) for k,v in s.args.items()])
+		events.append(event)
+	if _counters:
+		events.append({'name':'counters','ph':'C','ts':(clock()-_origin)*1000000.0,'pid':pid,'tid':0,'args':dict(_counters)})
+	return {'traceEvents':events,'displayTimeUnit':'ms'}
+
+def exportChromeTrace(filePath):
+	'''
+	Write the recorded spans and counters to a chrome trace (about://tracing) JSON file.
+	@param filePath: Output file path
+	@type filePath: str
+	'''
+	# Check Directory Path
+	dirpath = os.path.dirname(filePath)
+	if dirpath and not os.path.isdir(dirpath): os.makedirs(dirpath)
+
+	# Write File
+	f = open(filePath,'w')
+	json.dump(chromeTrace(),f)
+	f.close()
+
+	# Return Result
+	print('Profiler: Saved chrome trace "'+filePath+'"')
+	return filePath
+
+# ============
+# - Progress -
+# ============
+
+class Progress(object):
+	'''
+	Throttled main progress bar.
+	Steps are accumulated on update, and the progress bar UI is only updated once per interval.
+	The main progress bar name is resolved once, and all UI updates are skipped in batch mode.
+		progress = glTools.utils.profiler.Progress('Rebuilding...',maxValue=numVerts)
+		for i in range(numVerts):
+			...
+			progress.update()
+		progress.end()
+	@param status: Progress status message
+	@type status: str
+	@param maxValue: Progress maximum value
+	@type maxValue: int
+	@param interval: Minimum time (in milliseconds) between progress bar updates
+	@type interval: int or float
+	@param enableUserInterupt: Check the progress bar for user cancellation on each progress bar update.
+	@type enableUserInterupt: bool
+	'''
+	def __init__(self,status='',maxValue=100,interval=PROGRESS_INTERVAL,enableUserInterupt=False):
+		self.interval = interval * 0.001
+		self.enableUserInterupt = enableUserInterupt
+		self.value = 0
+		self._pending = 0
+		self._status = ''
+		self._last = clock()
+		self._progressBar = None
+
+		# Check Interactive Session
+		if OpenMaya.MGlobal.mayaState(): return
+
+		# Initialize Progress Bar
+		self._progressBar = mm.eval('$tmp = $gMainProgressBar')
+		mc.progressBar(self._progressBar,e=True,bp=True,ii=enableUserInterupt,status=status,maxValue=max(int(maxValue),1))
+
+	def update(self,step=1,status=''):
+		'''
+		Step the progress. The progress bar UI is updated if the update interval has elapsed.
+		@param step: Progress step
+		@type step: int
+		@param status: Progress status message
+		@type status: str
+		'''
+		self.value += step
+		if not self._progressBar: return
+		self._pending += step
+		if status: self._status = status
+		now = clock()
+		if now - self._last < self.interval: return
+		self._last = now
+		self.flush()
+
+	def flush(self):
+		'''
+		Apply any pending progress steps and status to the progress bar UI.
+		'''
+		if not self._progressBar: return
+
+		# Check User Interuption
+		if self.enableUserInterupt:
+			if mc.progressBar(self._progressBar,q=True,isCancelled=True):
+				self.end()
+				raise glTools.utils.progressBar.UserInterupted('Operation cancelled by user!')
+
+		# Update Status
+		if self._status:
+			mc.progressBar(self._progressBar,e=True,status=self._status)
+			self._status = ''
+
+		# Step Progress
+		if self._pending:
+			mc.progressBar(self._progressBar,e=True,step=self._pending)
+			self._pending = 0
+
+	def end(self):
+		'''
+		End the progress.
+		'''
+		if not self._progressBar: return
+		mc.progressBar(self._progressBar,e=True,endProgress=True)
+		self._progressBar = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self,excType,excValue,tb):
+		self.end()
+		return False
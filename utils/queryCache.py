@@ -0,0 +1,259 @@
+import maya.cmds as mc
+import maya.mel as mm
+
+import types
+
+# =============
+# - Constants -
+# =============
+
+# Commands that never modify the scene. Results are always cached.
+QUERY_COMMANDS = [	'attributeQuery',
+					'connectionInfo',
+					'filterExpand',
+					'getAttr',
+					'isConnected',
+					'listAttr',
+					'listConnections',
+					'listHistory',
+					'listRelatives',
+					'ls',
+					'namespaceInfo',
+					'nodeType',
+					'objExists',
+					'objectType',
+					'pointPosition',
+					'polyEvaluate',
+					'polyListComponentConversion',
+					'referenceQuery'	]
+
+# Commands that are cached only when called in query mode (q=True).
+QUERY_FLAG_COMMANDS = [	'blendShape',
+						'cluster',
+						'currentTime',
+						'deformer',
+						'file',
+						'keyTangent',
+						'keyframe',
+						'namespace',
+						'playbackOptions',
+						'sets',
+						'skinCluster',
+						'wire',
+						'xform'	]
+
+# Commands that neither use nor invalidate the cache (timers, progress and messages).
+PASSTHROUGH_COMMANDS = [	'about',
+							'error',
+							'headsUpMessage',
+							'progressBar',
+							'refresh',
+							'timerX',
+							'undoInfo',
+							'waitCursor',
+							'warning'	]
+
+# =========
+# - State -
+# =========
+
+_active = []
+
+class QueryCache(object):
+	'''
+	Scoped memoization of read-only maya.cmds queries.
+	While the scope is active, maya.cmds functions are replaced by wrappers:
+	read-only queries are cached (keyed by command and arguments), and any other command clears the cache.
+	API (OpenMaya) writers in glTools clear the cache through invalidate(): all edits recorded with glTools.utils.apiUndo
+	(ie. animCurve.writeKeys(), blendShape.setTargetDeltas()/setTargetWeightMap(), nDynamics.setVertexMap(),
+	bulkCreate.createNodes(), deformer.cleanDeformers()), the skinCluster weight setters (setInfluenceWeights(),
+	setInfluenceWeightsAll(), clearWeights(), SkinWeightAccessor.apply(), skinClusterData weight loaders) and deformer.setWeights().
+	Other API writes are NOT tracked and are unsupported within the scope, unless followed by invalidate().
+		with glTools.utils.queryCache.QueryCache():
+			skinData.loadWeights()
+	Nested scopes share the outermost cache.
+	@param verbose: Print the cache hit rates when the scope exits.
+	@type verbose: bool
+	'''
+	def __init__(self,verbose=True):
+		self.verbose = verbose
+		self._cache = {}
+		self._original = {}
+		self._hits = {}
+		self._misses = {}
+		self._invalidations = 0
+		self._installed = False
+
+	# ==========
+	# - Scope -
+	# ==========
+
+	def __enter__(self):
+		if _active: return _active[0]
+		self.install()
+		return self
+
+	def __exit__(self,excType,excValue,tb):
+		if self._installed:
+			self.uninstall()
+			if self.verbose: self.report()
+		return False
+
+	def install(self):
+		'''
+		Replace the maya.cmds (and maya.mel.eval) functions with caching wrappers.
+		'''
+		if _active: raise Exception('A QueryCache scope is already active!')
+
+		for cmd in dir(mc):
+			if cmd.startswith('_'): continue
+			func = getattr(mc,cmd)
+			if not callable(func) or isinstance(func,(types.ClassType,type)): continue
+			if cmd in PASSTHROUGH_COMMANDS: continue
+			self._original[cmd] = func
+			if cmd in QUERY_COMMANDS: setattr(mc,cmd,self._queryWrapper(cmd,func,False))
+			elif cmd in QUERY_FLAG_COMMANDS: setattr(mc,cmd,self._queryWrapper(cmd,func,True))
+			else: setattr(mc,cmd,self._editWrapper(func))
+
+		# MEL commands can modify the scene
+		self._original['mel.eval'] = mm.eval
+		mm.eval = self._editWrapper(mm.eval)
+
+		_active.append(self)
+		self._installed = True
+
+	def uninstall(self):
+		'''
+		Restore the original maya.cmds (and maya.mel.eval) functions.
+		'''
+		for cmd,func in self._original.items():
+			if cmd == 'mel.eval': mm.eval = func
+			else: setattr(mc,cmd,func)
+		self._original = {}
+		self._cache = {}
+		if self in _active: _active.remove(self)
+		self._installed = False
+
+	def clear(self):
+		'''
+		Clear all cached query results.
+		'''
+		if self._cache:
+			self._cache.clear()
+			self._invalidations += 1
+
+	# ============
+	# - Wrappers -
+	# ============
+
+	def _queryWrapper(self,cmd,func,queryFlagOnly):
+		'''
+		Return a caching wrapper for the specified query command.
+		'''
+		cache = self._cache
+		hits = self._hits
+		misses = self._misses
+		def wrapper(*args,**kwargs):
+
+			# Check Query Mode
+			if queryFlagOnly and not (kwargs.get('q') or kwargs.get('query')):
+				self.clear()
+				return func(*args,**kwargs)
+
+			# Build Key
+			try:
+				key = (cmd,_hashable(args),_hashable(sorted(kwargs.items())))
+				hash(key)
+			except TypeError:
+				return func(*args,**kwargs)
+
+			# Check Cache
+			if cache.has_key(key):
+				hits[cmd] = hits.get(cmd,0) + 1
+				return _copy(cache[key])
+
+			# Query
+			misses[cmd] = misses.get(cmd,0) + 1
+			result = func(*args,**kwargs)
+			cache[key] = result
+			return _copy(result)
+
+		wrapper.__name__ = cmd
+		wrapper.__doc__ = func.__doc__
+		return wrapper
+
+	def _editWrapper(self,func):
+		'''
+		Return a wrapper that clears the cache before calling the specified (scene modifying) command.
+		'''
+		def wrapper(*args,**kwargs):
+			self.clear()
+			return func(*args,**kwargs)
+		wrapper.__name__ = getattr(func,'__name__','eval')
+		wrapper.__doc__ = func.__doc__
+		return wrapper
+
+	# ===========
+	# - Report -
+	# ===========
+
+	def stats(self):
+		'''
+		Return the cache statistics as a {command:{'hits','misses'}} dictionary.
+		'''
+		result = {}
+		for cmd in set(self._hits.keys() + self._misses.keys()):
+			result[cmd] = {'hits':self._hits.get(cmd,0),'misses':self._misses.get(cmd,0)}
+		return result
+
+	def hitRate(self):
+		'''
+		Return the overall cache hit rate (0.0 - 1.0).
+		'''
+		hits = sum(self._hits.values())
+		total = hits + sum(self._misses.values())
+		if not total: return 0.0
+		return float(hits)/total
+
+	def report(self):
+		'''
+		Print the cache hit rates per command.
+		'''
+		hits = sum(self._hits.values())
+		total = hits + sum(self._misses.values())
+		print('QueryCache: '+str(hits)+'/'+str(total)+' queries served from cache ('+str(round(self.hitRate()*100.0,1))+'%), '+str(self._invalidations)+' invalidations')
+		stats = self.stats()
+		for cmd in sorted(stats.keys(),key=lambda c: -stats[c]['hits']):
+			cmdTotal = stats[cmd]['hits'] + stats[cmd]['misses']
+			print('  %-30s hits: %8d  misses: %8d  (%5.1f%%)' % (cmd,stats[cmd]['hits'],stats[cmd]['misses'],stats[cmd]['hits']*100.0/cmdTotal))
+
+# ===========
+# - Helpers -
+# ===========
+
+def _hashable(value):
+	'''
+	Convert (nested) lists and tuples to tuples, for use as a cache key.
+	'''
+	if isinstance(value,(list,tuple)): return tuple([_hashable(v) for v in value])
+	return value
+
+def _copy(value):
+	'''
+	Return a shallow copy of list results, so callers can not modify cached values.
+	'''
+	if isinstance(value,list): return list(value)
+	return value
+
+def invalidate():
+	'''
+	Clear the active QueryCache (if any). Call after scene changes made through the API (OpenMaya).
+	'''
+	if _active: _active[0].clear()
+
+def active():
+	'''
+	Return the active QueryCache, or None.
+	'''
+	if _active: return _active[0]
+	return None
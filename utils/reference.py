@@ -2,6 +2,7 @@ import maya.mel as mm
 import maya.cmds as mc
 
 import os.path
+import shlex
 
 def listReferences(parentNS=None):
 	'''
@@ -804,12 +805,12 @@ def removeReferenceEdits(	refNode,
 		mm.eval(refQueryCmd+' -removeEdits '+node)
 	else:
 		# Remove Edits Per Command
-		if parent: mm.eval(refQueryCmd+'-editCommand parent -removeEdits '+node)
-		if setAttr: mm.eval(refQueryCmd+'-editCommand setAttr -removeEdits '+node)
-		if addAttr: mm.eval(refQueryCmd+'-editCommand addAttr -removeEdits '+node)
-		if deleteAttr: mm.eval(refQueryCmd+'-editCommand deleteAttr -removeEdits '+node)
-		if connectAttr: mm.eval(refQueryCmd+'-editCommand connectAttr -removeEdits '+node)
-		if disconnectAttr: mm.eval(refQueryCmd+'-editCommand disconnectAttr -removeEdits '+node)
+		if parent: mm.eval(refQueryCmd+' -editCommand parent -removeEdits '+node)
+		if setAttr: mm.eval(refQueryCmd+' -editCommand setAttr -removeEdits '+node)
+		if addAttr: mm.eval(refQueryCmd+' -editCommand addAttr -removeEdits '+node)
+		if deleteAttr: mm.eval(refQueryCmd+' -editCommand deleteAttr -removeEdits '+node)
+		if connectAttr: mm.eval(refQueryCmd+' -editCommand connectAttr -removeEdits '+node)
+		if disconnectAttr: mm.eval(refQueryCmd+' -editCommand disconnectAttr -removeEdits '+node)
 		
 	# Reload Reference
 	if refLoaded: mc.file(loadReference=refNode)
@@ -868,3 +869,295 @@ def removeConnectAttrEdits(nodeList=''):
 	# Reload Reference
 	if refLoaded: mc.file(loadReference=refNode)
 
+# ========================
+# - Reference Edit Index -
+# ========================
+
+def parseEditString(editString):
+	'''
+	Parse a reference edit string into a structured edit dictionary.
+	The returned dictionary contains the edit command, the edited node and attribute,
+	any other nodes involved in the edit and the remaining edit values.
+	Node names are stored as short names (node, nodes) and as they appear in the edit string (nodePath, nodePaths).
+	@param editString: Reference edit string to parse
+	@type editString: str
+	'''
+	# Tokenize Edit String
+	if isinstance(editString,unicode): editString = editString.encode('utf-8')
+	try: tokens = shlex.split(editString)
+	except ValueError: tokens = editString.split()
+	if not tokens: return None
+	
+	command = tokens[0]
+	args = tokens[1:]
+	
+	edit = {'command':command,'node':'','attr':'','nodes':[],'values':[],'string':editString}
+	
+	# Plug Arguments (exclude numeric values)
+	def isPlug(arg):
+		if arg.startswith('-') or not arg.count('.'): return False
+		try: float(arg)
+		except ValueError: return True
+		return False
+	plugs = [i for i in range(len(args)) if isPlug(args[i])]
+	
+	# Flag Value
+	def flagValue(flags):
+		for i in range(len(args)-1):
+			if flags.count(args[i]): return args[i+1]
+		return ''
+	
+	if command == 'setAttr':
+		if plugs:
+			edit['node'],edit['attr'] = args[plugs[0]].split('.',1)
+			edit['values'] = args[plugs[0]+1:]
+	
+	elif command == 'connectAttr' or command == 'disconnectAttr':
+		plugList = [args[i] for i in plugs]
+		if plugList:
+			edit['node'],edit['attr'] = plugList[-1].split('.',1)
+			edit['nodes'] = [plug.split('.',1)[0] for plug in plugList]
+			edit['values'] = plugList
+	
+	elif command == 'parent':
+		nodeList = [arg for arg in args if not arg.startswith('-')]
+		if nodeList:
+			edit['node'] = nodeList[0]
+			edit['nodes'] = nodeList
+	
+	elif command == 'addAttr':
+		edit['node'] = args and args[-1] or ''
+		edit['attr'] = flagValue(['-ln','-longName']) or flagValue(['-sn','-shortName'])
+		edit['values'] = args[:-1]
+	
+	elif command == 'deleteAttr':
+		if plugs:
+			edit['node'],edit['attr'] = args[plugs[0]].split('.',1)
+		else:
+			edit['node'] = args and args[-1] or ''
+			edit['attr'] = flagValue(['-at','-attribute'])
+	
+	else:
+		nodeList = [arg for arg in args if not arg.startswith('-')]
+		if nodeList: edit['node'] = nodeList[-1]
+		edit['values'] = args
+	
+	# Clean Node Names
+	edit['nodePath'] = edit['node']
+	edit['nodePaths'] = edit['nodes'] or (edit['node'] and [edit['node']]) or []
+	edit['node'] = edit['node'].split('|')[-1]
+	edit['nodes'] = [node.split('|')[-1] for node in edit['nodePaths']]
+	
+	# Return Result
+	return edit
+
+class ReferenceEditIndex(object):
+	'''
+	Structured index of all reference edits for a reference node.
+	Edits are queried once, parsed into an edit table and indexed by node, attribute and command,
+	so edits can be inspected without further referenceQuery calls and removed in bulk
+	with a single unload/reload cycle.
+	'''
+	def __init__(self,refNode,successfulEdits=True,failedEdits=True):
+		'''
+		ReferenceEditIndex class initializer
+		@param refNode: Reference node to index edits for
+		@type refNode: str
+		@param successfulEdits: Index successful edits
+		@type successfulEdits: bool
+		@param failedEdits: Index failed edits
+		@type failedEdits: bool
+		'''
+		# Check Reference Node
+		if not isReference(refNode): raise Exception('Object "'+refNode+'" is not a valid reference node!')
+		
+		self.refNode = refNode
+		self.successfulEdits = successfulEdits
+		self.failedEdits = failedEdits
+		
+		self.editList = []
+		self.nodeIndex = {}
+		self.attrIndex = {}
+		self.commandIndex = {}
+		
+		self.build()
+	
+	def __len__(self):
+		return len(self.editList)
+	
+	def build(self):
+		'''
+		Query and index all edits for the reference node.
+		'''
+		self.editList = []
+		self.nodeIndex = {}
+		self.attrIndex = {}
+		self.commandIndex = {}
+		
+		# Query Edits (one query per edit state, with full DAG paths)
+		refQueryCmd = 'referenceQuery -showNamespace true -showDagPath true'
+		editStrings = []
+		if self.successfulEdits:
+			editStrings.extend([(edit,False) for edit in mm.eval(refQueryCmd+' -successfulEdits true -failedEdits false -editStrings "'+self.refNode+'"') or []])
+		if self.failedEdits:
+			editStrings.extend([(edit,True) for edit in mm.eval(refQueryCmd+' -successfulEdits false -failedEdits true -editStrings "'+self.refNode+'"') or []])
+		
+		# Parse and Index Edits
+		for editString,failed in editStrings:
+			edit = parseEditString(editString)
+			if not edit: continue
+			edit['failed'] = failed
+			
+			i = len(self.editList)
+			self.editList.append(edit)
+			for node in edit['nodes']:
+				self.nodeIndex.setdefault(node,[]).append(i)
+			if edit['attr']:
+				self.attrIndex.setdefault(edit['node']+'.'+edit['attr'],[]).append(i)
+			self.commandIndex.setdefault(edit['command'],[]).append(i)
+	
+	def edits(self,node='',attr='',command='',failed=None):
+		'''
+		Return a list of indexed edits matching the specified filters.
+		@param node: Return edits for this node. Short names match all nodes with that name, full DAG paths match a single node. If empty, return edits for all nodes.
+		@type node: str
+		@param attr: Return edits for this attribute. Requires node.
+		@type attr: str
+		@param command: Return edits of this command type (setAttr, connectAttr, parent etc.). If empty, return all command types.
+		@type command: str
+		@param failed: Return only failed (True) or successful (False) edits. If None, return both.
+		@type failed: bool or None
+		'''
+		# Get Candidate Edits
+		if node and attr: indexList = self.attrIndex.get(node.split('|')[-1]+'.'+attr,[])
+		elif node: indexList = self.nodeIndex.get(node.split('|')[-1],[])
+		elif command: indexList = self.commandIndex.get(command,[])
+		else: indexList = range(len(self.editList))
+		
+		# Filter Edits
+		editList = [self.editList[i] for i in indexList]
+		if node.count('|'):
+			if attr: editList = [edit for edit in editList if edit['nodePath'] == node]
+			else: editList = [edit for edit in editList if edit['nodePaths'].count(node)]
+		if command: editList = [edit for edit in editList if edit['command'] == command]
+		if failed != None: editList = [edit for edit in editList if edit['failed'] == failed]
+		
+		# Return Result
+		return editList
+	
+	def nodes(self,command=''):
+		'''
+		Return a sorted list of nodes with reference edits.
+		@param command: Return nodes with edits of this command type only. If empty, consider all command types.
+		@type command: str
+		'''
+		if not command: return sorted(self.nodeIndex.keys())
+		nodeList = set()
+		for edit in self.edits(command=command): nodeList.update(edit['nodes'])
+		return sorted(nodeList)
+	
+	def attrs(self,node,command=''):
+		'''
+		Return a sorted list of edited attributes for the specified node.
+		@param node: Node to return edited attributes for
+		@type node: str
+		@param command: Return attributes with edits of this command type only. If empty, consider all command types.
+		@type command: str
+		'''
+		return sorted(set([edit['attr'] for edit in self.edits(node=node,command=command) if edit['attr']]))
+	
+	def commands(self,node='',command=''):
+		'''
+		Return a list of edit strings for the specified node.
+		@param node: Node to return edit strings for. If empty, return edit strings for all nodes.
+		@type node: str
+		@param command: Return edits of this command type only. If empty, return all command types.
+		@type command: str
+		'''
+		return [edit['string'] for edit in self.edits(node=node,command=command)]
+	
+	def removeEdits(self,editList=[],rebuild=True,verbose=True):
+		'''
+		Remove the specified edits in a single unload/reload cycle of the reference.
+		Edits are removed per target (full DAG path node.attr for attribute edits, node otherwise), command type
+		and edit state (successful/failed), as set by the edits being removed. referenceEdit can not remove edits
+		at a finer level, so any other edits that share the target, command and state of a removed edit are also removed.
+		@param editList: List of indexed edits to remove. If empty, remove all indexed edits.
+		@type editList: list
+		@param rebuild: Rebuild the edit index after the edits have been removed
+		@type rebuild: bool
+		@param verbose: Print progress
+		@type verbose: bool
+		'''
+		if not editList: editList = self.editList
+		if not editList: return []
+		
+		# Build Unique Removal Targets (command,target,failed)
+		targetList = []
+		for edit in editList:
+			target = edit['nodePath']
+			if edit['attr'] and edit['command'] != 'addAttr': target += '.'+edit['attr']
+			if not target: continue
+			if not targetList.count((edit['command'],target,edit['failed'])): targetList.append((edit['command'],target,edit['failed']))
+		
+		# Unload Reference
+		refLoaded = isLoaded(self.refNode)
+		if refLoaded: mc.file(unloadReference=self.refNode)
+		
+		# Remove Edits
+		if verbose: print('Removing '+str(len(targetList))+' Reference Edit Targets: "'+self.refNode+'"...')
+		try:
+			for command,target,failed in targetList:
+				refEditCmd = 'referenceEdit'
+				refEditCmd += ' -successfulEdits '+str(not failed).lower()
+				refEditCmd += ' -failedEdits '+str(failed).lower()
+				mm.eval(refEditCmd+' -editCommand '+command+' -removeEdits "'+target+'"')
+		finally:
+			# Reload Reference
+			if refLoaded: mc.file(loadReference=self.refNode)
+		
+		# Rebuild Index
+		if rebuild: self.build()
+		
+		# Return Result
+		return targetList
+
+def getEditIndex(refNode,successfulEdits=True,failedEdits=True):
+	'''
+	Return a ReferenceEditIndex for the specified reference node
+	@param refNode: Reference node to index edits for
+	@type refNode: str
+	@param successfulEdits: Index successful edits
+	@type successfulEdits: bool
+	@param failedEdits: Index failed edits
+	@type failedEdits: bool
+	'''
+	return ReferenceEditIndex(refNode,successfulEdits,failedEdits)
+
+def removeReferenceEditsBulk(refNode,nodeList=[],commandList=[],successfulEdits=True,failedEdits=True):
+	'''
+	Remove reference edits for a list of nodes using a single unload/reload cycle.
+	@param refNode: Reference node to remove edits from
+	@type refNode: str
+	@param nodeList: List of referenced nodes to remove edits for. If empty, remove edits for all nodes.
+	@type nodeList: list
+	@param commandList: List of edit command types to remove. If empty, remove all command types.
+	@type commandList: list
+	@param successfulEdits: Remove successful edits
+	@type successfulEdits: bool
+	@param failedEdits: Remove failed edits
+	@type failedEdits: bool
+	'''
+	# Build Edit Index
+	editIndex = ReferenceEditIndex(refNode,successfulEdits,failedEdits)
+	
+	# Get Edits to Remove
+	if nodeList:
+		editList = []
+		for node in nodeList: editList.extend(editIndex.edits(node=node))
+	else:
+		editList = list(editIndex.editList)
+	if commandList: editList = [edit for edit in editList if commandList.count(edit['command'])]
+	
+	# Remove Edits
+	return editIndex.removeEdits(editList,rebuild=False)
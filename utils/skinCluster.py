@@ -3,10 +3,12 @@ import maya.cmds as mc
 import maya.OpenMaya as OpenMaya
 import maya.OpenMayaAnim as OpenMayaAnim
 
+import glTools.utils.arrayUtils
 import glTools.utils.component
 import glTools.utils.deformer
 import glTools.utils.joint
 import glTools.utils.mesh
+import glTools.utils.queryCache
 import glTools.utils.selection
 import glTools.utils.stringUtils
 import glTools.utils.mathUtils
@@ -155,6 +157,31 @@ def getInfluencePhysicalIndex(skinCluster,influence):
 	# Retrun result
 	return infIndex
 
+def getInfluencePhysicalIndexMap(skinCluster,returnList=False):
+	'''
+	Return the physical (non-sparce) index of every influence of a specified skinCluster,
+	as an {influence:index} dictionary, from a single influence scan.
+	@param skinCluster: SkinCluster to query influence indices from
+	@type skinCluster: str
+	@param returnList: Return the influence list ordered by physical index instead of a dictionary
+	@type returnList: bool
+	'''
+	# Verify skinCluster
+	if not isSkinCluster(skinCluster):
+		raise Exception('Invalid skinCluster "'+skinCluster+'" specified!')
+	
+	# Get skinCluster node
+	skinClusterFn = getSkinClusterFn(skinCluster)
+	
+	# Get influence path list
+	infPathArray = OpenMaya.MDagPathArray()
+	skinClusterFn.influenceObjects(infPathArray)
+	infNameArray = [infPathArray[i].partialPathName() for i in range(infPathArray.length())]
+	
+	# Return result
+	if returnList: return infNameArray
+	return dict([(infNameArray[i],i) for i in range(len(infNameArray))])
+
 def getInfluenceWeights(skinCluster,influence,componentList=[]):
 	'''
 	Return the weights of an influence for a specified skinCluster
@@ -308,6 +335,7 @@ def setInfluenceWeights(skinCluster,influence,weightList,normalize=True,componen
 	
 	# Set skinCluster weight values
 	skinFn.setWeights(componentSel[0],componentSel[1],infIndexArray,wtArray,normalize,oldWtArray)
+	glTools.utils.queryCache.invalidate()
 	
 	# Return result
 	return list(oldWtArray)
@@ -362,10 +390,9 @@ def setInfluenceWeightsAll(skinCluster,weightList,normalize=True,componentList=[
 	
 	# Get SkinCluster Influence List
 	influenceList = mc.skinCluster(skinCluster,q=True,inf=True)
+	infDict = getInfluencePhysicalIndexMap(skinCluster)
 	infIndexArray = OpenMaya.MIntArray()
-	[infIndexArray.append(getInfluencePhysicalIndex(skinCluster,inf)) for inf in influenceList]
-	infDict = {}
-	for inf in influenceList: infDict[inf] = getInfluencePhysicalIndex(skinCluster,inf)
+	[infIndexArray.append(infDict[inf]) for inf in influenceList]
 	
 	# Get SkinCluster Geometry
 	skinGeo = glTools.utils.deformer.getAffectedGeometry(skinCluster).keys()[0]
@@ -398,6 +425,239 @@ def setInfluenceWeightsAll(skinCluster,weightList,normalize=True,componentList=[
 	
 	# Set skinCluster weights
 	skinFn.setWeights(componentSel[0],componentSel[1],infIndexArray,wtArray,False,oldWtArray)
+	glTools.utils.queryCache.invalidate()
+
+class SkinWeightAccessor( object ):
+	'''
+	SkinWeightAccessor class object.
+	Reads the complete weight matrix of a skinCluster once and provides sliced access by influence and component.
+	Weight edits are tracked per component and influence, and only the modified weights are written back
+	to the skinCluster with a single MFnSkinCluster.setWeights() call.
+	'''
+	def __init__(self,skinCluster,componentList=[]):
+		'''
+		SkinWeightAccessor class initializer.
+		@param skinCluster: SkinCluster to access weights for
+		@type skinCluster: str
+		@param componentList: List of components to access weights for. If empty, use all components.
+		@type componentList: list
+		'''
+		# Verify skinCluster
+		if not isSkinCluster(skinCluster):
+			raise Exception('Invalid skinCluster "' + skinCluster + '" specified!')
+		
+		# Get Geometry
+		self.skinCluster = skinCluster
+		self.geometry = glTools.utils.deformer.getAffectedGeometry(skinCluster).keys()[0]
+		self.skinFn = getSkinClusterFn(skinCluster)
+		
+		# Get Component Selection
+		if not componentList: componentList = glTools.utils.component.getComponentStrList(self.geometry)
+		self.geoPath, self.componentObj = glTools.utils.selection.getSelectionElement(componentList,0)
+		
+		# Build Component Row Map
+		indexList = OpenMaya.MIntArray()
+		OpenMaya.MFnSingleIndexedComponent(self.componentObj).getElements(indexList)
+		self.componentList = list(indexList)
+		self.componentRow = dict([(self.componentList[i],i) for i in xrange(len(self.componentList))])
+		
+		# Build Influence Index Map
+		self.influenceList = getInfluencePhysicalIndexMap(skinCluster,returnList=True)
+		self.influenceIndex = dict([(self.influenceList[i],i) for i in xrange(len(self.influenceList))])
+		
+		# Read Weights
+		self.read()
+	
+	def read(self):
+		'''
+		Read the complete skinCluster weight matrix. Clears any pending (unwritten) weight edits.
+		'''
+		# Get Weights
+		weightList = OpenMaya.MDoubleArray()
+		infCountUtil = OpenMaya.MScriptUtil(0)
+		infCountPtr = infCountUtil.asUintPtr()
+		self.skinFn.getWeights(self.geoPath,self.componentObj,weightList,infCountPtr)
+		
+		# Store Flat (Component Major) Weight Matrix
+		self.influenceCount = OpenMaya.MScriptUtil(infCountPtr).asUint()
+		self.weights = list(weightList)
+		
+		# Reset Dirty State
+		self.dirtyComponents = set()
+		self.dirtyInfluences = set()
+	
+	def isDirty(self):
+		'''
+		Return True if there are weight edits that have not been written back to the skinCluster.
+		'''
+		return bool(self.dirtyComponents)
+	
+	def _getRows(self,components=None):
+		'''
+		Return the weight matrix row indices for the specified components.
+		@param components: List of component indices or names. If None, return all rows.
+		@type components: list or None
+		'''
+		if components == None: return range(len(self.componentList))
+		if components and isinstance(components[0],basestring):
+			components = glTools.utils.component.getSingleIndexComponentList(components).values()[0]
+		try: return [self.componentRow[c] for c in components]
+		except KeyError, e: raise Exception('Component index '+str(e)+' is not accessed by this SkinWeightAccessor!')
+	
+	def _getColumns(self,influences=None):
+		'''
+		Return the weight matrix column (physical influence) indices for the specified influences.
+		@param influences: List of influence names. If None, return all columns.
+		@type influences: list or None
+		'''
+		if influences == None: return range(self.influenceCount)
+		if isinstance(influences,basestring): influences = [influences]
+		try: return [self.influenceIndex[inf] for inf in influences]
+		except KeyError, e: raise Exception('Object '+str(e)+' is not an influence of skinCluster "'+self.skinCluster+'"!')
+	
+	def getWeights(self,influences=None,components=None):
+		'''
+		Return the cached weights for the specified influences and components as a list of per influence weight lists.
+		@param influences: List of influences to return weights for. If None, return all influences.
+		@type influences: list or None
+		@param components: List of component indices or names to return weights for. If None, return all components.
+		@type components: list or None
+		'''
+		rows = self._getRows(components)
+		cols = self._getColumns(influences)
+		infCount = self.influenceCount
+		wt = self.weights
+		return [[wt[r*infCount+c] for r in rows] for c in cols]
+	
+	def getInfluenceWeights(self,influence,components=None):
+		'''
+		Return the cached weights of a single influence.
+		@param influence: Influence to return weights for
+		@type influence: str
+		@param components: List of component indices or names to return weights for. If None, return all components.
+		@type components: list or None
+		'''
+		return self.getWeights([influence],components)[0]
+	
+	def getComponentWeights(self,component):
+		'''
+		Return the cached influence weights of a single component as an {influence:weight} dictionary.
+		Zero weights are skipped.
+		@param component: Component index to return weights for
+		@type component: int
+		'''
+		row = self._getRows([component])[0] * self.influenceCount
+		wt = self.weights
+		return dict([(self.influenceList[c],wt[row+c]) for c in xrange(self.influenceCount) if wt[row+c]])
+	
+	def setWeights(self,weightList,influences=None,components=None):
+		'''
+		Set cached weights for the specified influences and components. Changes are written to the skinCluster by apply().
+		@param weightList: List of per influence weight lists, ordered to match the influences and components arguments.
+		@type weightList: list
+		@param influences: List of influences to set weights for. If None, set all influences.
+		@type influences: list or None
+		@param components: List of component indices or names to set weights for. If None, set all components.
+		@type components: list or None
+		'''
+		rows = self._getRows(components)
+		cols = self._getColumns(influences)
+		
+		# Check Weight List
+		if len(weightList) != len(cols):
+			raise Exception('Influence and weight list miss-match!')
+		
+		# Set Weights
+		infCount = self.influenceCount
+		wt = self.weights
+		for i in xrange(len(cols)):
+			c = cols[i]
+			infWt = weightList[i]
+			if len(infWt) != len(rows):
+				raise Exception('Component and weight list length mis-match!')
+			for n in xrange(len(rows)): wt[rows[n]*infCount+c] = infWt[n]
+		
+		# Update Dirty State
+		self.dirtyComponents.update(rows)
+		self.dirtyInfluences.update(cols)
+	
+	def setInfluenceWeights(self,influence,weightList,components=None):
+		'''
+		Set cached weights of a single influence. Changes are written to the skinCluster by apply().
+		@param influence: Influence to set weights for
+		@type influence: str
+		@param weightList: Influence weight list to set
+		@type weightList: list
+		@param components: List of component indices or names to set weights for. If None, set all components.
+		@type components: list or None
+		'''
+		self.setWeights([weightList],[influence],components)
+	
+	def normalize(self,components=None,lockedInfluences=[]):
+		'''
+		Normalize cached weights so that each component's influence weights sum to 1.0.
+		Weights of locked influences are preserved and only the remaining influences are scaled.
+		@param components: List of component indices or names to normalize. If None, normalize all components.
+		@type components: list or None
+		@param lockedInfluences: List of influences to preserve weights for
+		@type lockedInfluences: list
+		'''
+		rows = self._getRows(components)
+		locked = set(self._getColumns(lockedInfluences))
+		free = [c for c in xrange(self.influenceCount) if not c in locked]
+		
+		infCount = self.influenceCount
+		wt = self.weights
+		for r in rows:
+			offset = r*infCount
+			lockedTotal = sum([wt[offset+c] for c in locked])
+			freeTotal = sum([wt[offset+c] for c in free])
+			if freeTotal < 0.000001: continue
+			scale = max(1.0-lockedTotal,0.0) / freeTotal
+			for c in free: wt[offset+c] *= scale
+		
+		# Update Dirty State
+		self.dirtyComponents.update(rows)
+		self.dirtyInfluences.update(free)
+	
+	def apply(self,normalize=False):
+		'''
+		Write modified weights back to the skinCluster with a single setWeights() call.
+		Only the modified components and influences are written.
+		Returns the previous weight values of the written components and influences.
+		@param normalize: Normalize weights as they are applied
+		@type normalize: bool
+		'''
+		# Check Dirty State
+		if not self.dirtyComponents: return []
+		
+		rows = sorted(self.dirtyComponents)
+		cols = sorted(self.dirtyInfluences)
+		
+		# Build Component Object
+		componentFn = OpenMaya.MFnSingleIndexedComponent()
+		componentObj = componentFn.create(self.componentObj.apiType())
+		componentFn.addElements(glTools.utils.arrayUtils.toMIntArray([self.componentList[r] for r in rows]))
+		
+		# Build Weight Arrays
+		infCount = self.influenceCount
+		wt = self.weights
+		infIndexArray = glTools.utils.arrayUtils.toMIntArray(cols)
+		wtArray = glTools.utils.arrayUtils.toMDoubleArray([wt[r*infCount+c] for r in rows for c in cols])
+		oldWtArray = OpenMaya.MDoubleArray()
+		
+		# Set skinCluster weights
+		self.skinFn.setWeights(self.geoPath,componentObj,infIndexArray,wtArray,normalize,oldWtArray)
+		glTools.utils.queryCache.invalidate()
+		
+		# Reset Dirty State (Re-read if weights were normalized on apply)
+		if normalize: self.read()
+		else:
+			self.dirtyComponents = set()
+			self.dirtyInfluences = set()
+		
+		# Return Result
+		return list(oldWtArray)
 
 def lockInfluenceWeights(influence,lock=True,lockAttr=False):
 	'''
@@ -605,6 +865,7 @@ def clearWeights(geometry):
 	# Set skinCluster weights
 	skinFn = glTools.utils.skinCluster.getSkinClusterFn(skinCluster)
 	skinFn.setWeights(componentSel[0],componentSel[1],infIndexArray,wtArray,False,oldWtArray)
+	glTools.utils.queryCache.invalidate()
 
 def deleteBindPose():
 	'''
@@ -131,17 +131,21 @@ def snapPtsToSurface(surface,pointList):
 	# Transform types
 	transform = ['transform','joint','ikHandle','effector']
 	
-	# Snap points
+	# Snap transforms
+	componentList = []
 	for pt in pointList:
-		# Check Transform
 		if transform.count(mc.objectType(pt)):
 			snapToSurface(surface,pt,0.0,0.0,True,snapPivot=False)
-			continue
-		# Move Point
-		pos = mc.pointPosition(pt)
-		(uParam,vParam) = closestPoint(surface,pos)
-		sPt = mc.pointOnSurface(surface,u=uParam,v=vParam,position=True)
-		mc.move(sPt[0],sPt[1],sPt[2],pt,ws=True,a=True)
+		else:
+			componentList.append(pt)
+	if not componentList: return
+	
+	# Snap components (batch closest point query)
+	posList = [mc.pointPosition(pt) for pt in componentList]
+	surfacePtList = SurfaceEvaluator(surface).closestPoints(posList)
+	for i in range(len(componentList)):
+		sPt = surfacePtList[i]
+		mc.move(sPt[0],sPt[1],sPt[2],componentList[i],ws=True,a=True)
 	
 def locatorSurface(surface,controlPoints=[],locatorScale=0.075,prefix=''):
 	'''
@@ -843,3 +847,435 @@ def rebuildFromIsoparms(surface,spansU=0,spansV=0,degree=3,keepHistory=False):
 	# Return result
 	return rebuildSurface
 
+
+# =====================
+# - Surface Evaluator -
+# =====================
+
+class SurfaceEvaluator(object):
+	'''
+	NURBS surface evaluator. Surface data (CV grid, weights, knot vectors and degrees) is captured once,
+	either from a surface in the scene or from stored surface data, and all evaluation is performed in python,
+	so no API function sets are built per query and stored data can be evaluated headlessly.
+	Closest UV queries are seeded from a (cached) tessellation grid and refined using Newton iteration.
+	CVs are stored in the Maya order (U major - index = u * numCVsInV + v) and knots use the Maya convention
+	(numCVs + degree - 1 knots).
+	'''
+	def __init__(self,surface=None,worldSpace=True,gridResolution=4):
+		'''
+		SurfaceEvaluator class initializer
+		@param surface: Surface to capture evaluation data from. If None, use setData() to specify surface data.
+		@type surface: str or None
+		@param worldSpace: Capture the surface CVs in world space
+		@type worldSpace: bool
+		@param gridResolution: Number of tessellation grid samples per surface span (closest UV seed)
+		@type gridResolution: int
+		'''
+		self.degreeU = 3
+		self.degreeV = 3
+		self.numCVsU = 0
+		self.numCVsV = 0
+		self.cvs = []
+		self.weights = []
+		self.knotsU = []
+		self.knotsV = []
+		self.periodicU = False
+		self.periodicV = False
+		self.gridResolution = gridResolution
+		
+		self._knotsU = []
+		self._knotsV = []
+		self._rational = False
+		self._rangeU = (0.0,0.0)
+		self._rangeV = (0.0,0.0)
+		self._gridU = None
+		self._gridV = None
+		self._gridPoints = None
+		
+		if surface: self.setSurface(surface,worldSpace)
+	
+	@classmethod
+	def fromData(cls,data,gridResolution=4):
+		'''
+		Create a SurfaceEvaluator from stored surface data (see data()).
+		@param data: Surface data dictionary
+		@type data: dict
+		@param gridResolution: Number of tessellation grid samples per surface span
+		@type gridResolution: int
+		'''
+		evaluator = cls(gridResolution=gridResolution)
+		evaluator.setData(	data['cvs'],
+							data['numCVsU'],
+							data['numCVsV'],
+							data['knotsU'],
+							data['knotsV'],
+							data['degreeU'],
+							data['degreeV'],
+							data.get('periodicU',False),
+							data.get('periodicV',False),
+							data.get('weights')	)
+		return evaluator
+	
+	def setSurface(self,surface,worldSpace=True):
+		'''
+		Capture evaluation data from the specified surface.
+		@param surface: Surface to capture evaluation data from
+		@type surface: str
+		@param worldSpace: Capture the surface CVs in world space
+		@type worldSpace: bool
+		'''
+		# Get Surface Data
+		surfaceFn = getSurfaceFn(surface)
+		space = OpenMaya.MSpace.kObject
+		if worldSpace: space = OpenMaya.MSpace.kWorld
+		cvArray = OpenMaya.MPointArray()
+		surfaceFn.getCVs(cvArray,space)
+		knotsU = OpenMaya.MDoubleArray()
+		knotsV = OpenMaya.MDoubleArray()
+		surfaceFn.getKnotsInU(knotsU)
+		surfaceFn.getKnotsInV(knotsV)
+		
+		cvs = [(cvArray[i].x,cvArray[i].y,cvArray[i].z) for i in xrange(cvArray.length())]
+		weights = [cvArray[i].w for i in xrange(cvArray.length())]
+		
+		# Set Data
+		self.setData(	cvs,
+						surfaceFn.numCVsInU(),
+						surfaceFn.numCVsInV(),
+						list(knotsU),
+						list(knotsV),
+						surfaceFn.degreeU(),
+						surfaceFn.degreeV(),
+						surfaceFn.formInU() == OpenMaya.MFnNurbsSurface.kPeriodic,
+						surfaceFn.formInV() == OpenMaya.MFnNurbsSurface.kPeriodic,
+						weights	)
+	
+	def setData(self,cvs,numCVsU,numCVsV,knotsU,knotsV,degreeU,degreeV,periodicU=False,periodicV=False,weights=None):
+		'''
+		Set the surface evaluation data.
+		@param cvs: List of surface CV positions (U major)
+		@type cvs: list
+		@param numCVsU: Number of CVs in U
+		@type numCVsU: int
+		@param numCVsV: Number of CVs in V
+		@type numCVsV: int
+		@param knotsU: Surface U knot vector (Maya convention)
+		@type knotsU: list
+		@param knotsV: Surface V knot vector (Maya convention)
+		@type knotsV: list
+		@param degreeU: Surface degree in U
+		@type degreeU: int
+		@param degreeV: Surface degree in V
+		@type degreeV: int
+		@param periodicU: Surface is periodic in U
+		@type periodicU: bool
+		@param periodicV: Surface is periodic in V
+		@type periodicV: bool
+		@param weights: Optional list of CV weights (rational surfaces)
+		@type weights: list or None
+		'''
+		# Check Data
+		if len(cvs) != numCVsU * numCVsV:
+			raise Exception('Invalid surface data! CV count does not match CV grid dimensions!')
+		if len(knotsU) != numCVsU + degreeU - 1:
+			raise Exception('Invalid surface data! Expected '+str(numCVsU+degreeU-1)+' U knots, found '+str(len(knotsU))+'!')
+		if len(knotsV) != numCVsV + degreeV - 1:
+			raise Exception('Invalid surface data! Expected '+str(numCVsV+degreeV-1)+' V knots, found '+str(len(knotsV))+'!')
+		if weights and len(weights) != len(cvs):
+			raise Exception('Invalid surface data! CV weight count does not match CV count!')
+		
+		self.numCVsU = int(numCVsU)
+		self.numCVsV = int(numCVsV)
+		self.degreeU = int(degreeU)
+		self.degreeV = int(degreeV)
+		self.cvs = [tuple([float(v) for v in cv[0:3]]) for cv in cvs]
+		self.weights = [float(w) for w in (weights or [1.0]*len(cvs))]
+		self.knotsU = [float(k) for k in knotsU]
+		self.knotsV = [float(k) for k in knotsV]
+		self.periodicU = bool(periodicU)
+		self.periodicV = bool(periodicV)
+		
+		# Full (padded) knot vectors
+		self._knotsU = [self.knotsU[0]] + self.knotsU + [self.knotsU[-1]]
+		self._knotsV = [self.knotsV[0]] + self.knotsV + [self.knotsV[-1]]
+		self._rational = bool([w for w in self.weights if w != 1.0])
+		self._rangeU = (self._knotsU[self.degreeU],self._knotsU[self.numCVsU])
+		self._rangeV = (self._knotsV[self.degreeV],self._knotsV[self.numCVsV])
+		
+		# Reset Grid
+		self._gridU = None
+		self._gridV = None
+		self._gridPoints = None
+	
+	def data(self):
+		'''
+		Return the surface evaluation data as a dictionary, which can be stored and passed to fromData().
+		'''
+		return {	'cvs':list(self.cvs),
+					'numCVsU':self.numCVsU,
+					'numCVsV':self.numCVsV,
+					'knotsU':list(self.knotsU),
+					'knotsV':list(self.knotsV),
+					'degreeU':self.degreeU,
+					'degreeV':self.degreeV,
+					'periodicU':self.periodicU,
+					'periodicV':self.periodicV,
+					'weights':list(self.weights)	}
+	
+	def paramRange(self):
+		'''
+		Return the ((minU,maxU),(minV,maxV)) parameter range of the surface.
+		'''
+		return (self._rangeU,self._rangeV)
+	
+	# ==============
+	# - Evaluation -
+	# ==============
+	
+	def _checkParam(self,param,paramRange,periodic):
+		'''
+		Clamp (or wrap, for periodic directions) the specified parameter to the parameter range.
+		'''
+		if periodic and (param < paramRange[0] or param > paramRange[1]):
+			return paramRange[0] + ((param - paramRange[0]) % (paramRange[1] - paramRange[0]))
+		return min(max(param,paramRange[0]),paramRange[1])
+	
+	def evaluate(self,u,v,order=1):
+		'''
+		Evaluate the surface position and partial derivatives (up to the specified order) at the specified UV parameter.
+		Returns a nested list SKL, where SKL[k][l] is the derivative of order k in U and l in V (k+l <= order).
+		SKL[0][0] is the surface position.
+		@param u: Surface U parameter to evaluate
+		@type u: float
+		@param v: Surface V parameter to evaluate
+		@type v: float
+		@param order: Highest derivative order to evaluate
+		@type order: int
+		'''
+		u = self._checkParam(u,self._rangeU,self.periodicU)
+		v = self._checkParam(v,self._rangeV,self.periodicV)
+		p = self.degreeU
+		q = self.degreeV
+		spanU = glTools.utils.curve.knotSpan(self._knotsU,p,self.numCVsU,u)
+		spanV = glTools.utils.curve.knotSpan(self._knotsV,q,self.numCVsV,v)
+		Nu = glTools.utils.curve.basisDerivs(self._knotsU,p,spanU,u,order)
+		Nv = glTools.utils.curve.basisDerivs(self._knotsV,q,spanV,v,order)
+		
+		# Weighted (Homogeneous) Derivatives
+		aders = [[None]*(order+1) for k in range(order+1)]
+		wders = [[0.0]*(order+1) for k in range(order+1)]
+		for k in range(order+1):
+			for l in range(order-k+1):
+				x = y = z = w = 0.0
+				for i in range(p+1):
+					nu = Nu[k][i]
+					if not nu: continue
+					row = (spanU - p + i) * self.numCVsV + spanV - q
+					for j in range(q+1):
+						n = nu * Nv[l][j] * self.weights[row+j]
+						cv = self.cvs[row+j]
+						x += n*cv[0]
+						y += n*cv[1]
+						z += n*cv[2]
+						w += n
+				aders[k][l] = (x,y,z)
+				wders[k][l] = w
+		
+		# Non Rational
+		if not self._rational: return aders
+		
+		# Rational
+		skl = [[None]*(order+1) for k in range(order+1)]
+		for k in range(order+1):
+			for l in range(order-k+1):
+				val = list(aders[k][l])
+				for j in range(1,l+1):
+					b = _binomial(l,j) * wders[0][j]
+					for c in range(3): val[c] -= b * skl[k][l-j][c]
+				for i in range(1,k+1):
+					b = _binomial(k,i) * wders[i][0]
+					for c in range(3): val[c] -= b * skl[k-i][l][c]
+					for j in range(1,l+1):
+						b2 = _binomial(k,i) * _binomial(l,j) * wders[i][j]
+						for c in range(3): val[c] -= b2 * skl[k-i][l-j][c]
+				skl[k][l] = (val[0]/wders[0][0],val[1]/wders[0][0],val[2]/wders[0][0])
+		return skl
+	
+	def point(self,u,v):
+		'''
+		Return the surface position at the specified UV parameter.
+		@param u: Surface U parameter to evaluate
+		@type u: float
+		@param v: Surface V parameter to evaluate
+		@type v: float
+		'''
+		return self.evaluate(u,v,0)[0][0]
+	
+	def frame(self,u,v):
+		'''
+		Return the (position,tangentU,tangentV,normal) surface frame at the specified UV parameter.
+		Tangents and normal are normalized.
+		@param u: Surface U parameter to evaluate
+		@type u: float
+		@param v: Surface V parameter to evaluate
+		@type v: float
+		'''
+		skl = self.evaluate(u,v,1)
+		tanU = _normalize(skl[1][0])
+		tanV = _normalize(skl[0][1])
+		normal = _normalize(_cross(skl[1][0],skl[0][1]))
+		return (skl[0][0],tanU,tanV,normal)
+	
+	def normal(self,u,v):
+		'''
+		Return the (normalized) surface normal at the specified UV parameter.
+		@param u: Surface U parameter to evaluate
+		@type u: float
+		@param v: Surface V parameter to evaluate
+		@type v: float
+		'''
+		return self.frame(u,v)[3]
+	
+	def points(self,uvList):
+		'''
+		Return the surface positions for a list of UV parameters.
+		@param uvList: List of (u,v) parameters to evaluate
+		@type uvList: list
+		'''
+		return [self.evaluate(uv[0],uv[1],0)[0][0] for uv in uvList]
+	
+	def normals(self,uvList):
+		'''
+		Return the surface normals for a list of UV parameters.
+		@param uvList: List of (u,v) parameters to evaluate
+		@type uvList: list
+		'''
+		return [self.frame(uv[0],uv[1])[3] for uv in uvList]
+	
+	def frames(self,uvList):
+		'''
+		Return the (position,tangentU,tangentV,normal) surface frames for a list of UV parameters.
+		@param uvList: List of (u,v) parameters to evaluate
+		@type uvList: list
+		'''
+		return [self.frame(uv[0],uv[1]) for uv in uvList]
+	
+	# =================
+	# - Closest Point -
+	# =================
+	
+	def buildGrid(self,resolution=None):
+		'''
+		Build the tessellation grid used to seed closest UV queries.
+		@param resolution: Number of grid samples per surface span. If None, use the evaluator gridResolution.
+		@type resolution: int or None
+		'''
+		if resolution: self.gridResolution = resolution
+		self._gridU = _spanSamples(self._knotsU,self._rangeU,self.gridResolution)
+		self._gridV = _spanSamples(self._knotsV,self._rangeV,self.gridResolution)
+		self._gridPoints = [self.point(u,v) for u in self._gridU for v in self._gridV]
+		return len(self._gridPoints)
+	
+	def closestUVs(self,pointList,tolerance=0.0000001,maxIterations=10):
+		'''
+		Return the closest surface UV parameters to a list of points.
+		Each point is matched against the (cached) tessellation grid, and the UV parameter is then refined using Newton iteration.
+		@param pointList: List of points to find the closest surface UV parameters for
+		@type pointList: list
+		@param tolerance: Parameter tolerance
+		@type tolerance: float
+		@param maxIterations: Maximum number of refinement iterations
+		@type maxIterations: int
+		'''
+		# Get Grid
+		if self._gridPoints == None: self.buildGrid()
+		gridU = self._gridU
+		gridV = self._gridV
+		gridPts = self._gridPoints
+		gridRange = range(len(gridPts))
+		countV = len(gridV)
+		
+		uvList = []
+		for pt in pointList:
+			
+			pt = glTools.utils.base.getPosition(pt)
+			
+			# Closest Grid Sample
+			distList = [(gridPts[i][0]-pt[0])**2 + (gridPts[i][1]-pt[1])**2 + (gridPts[i][2]-pt[2])**2 for i in gridRange]
+			i = distList.index(min(distList))
+			iu = i / countV
+			iv = i % countV
+			u = gridU[iu]
+			v = gridV[iv]
+			uMin = gridU[max(iu-1,0)]
+			uMax = gridU[min(iu+1,len(gridU)-1)]
+			vMin = gridV[max(iv-1,0)]
+			vMax = gridV[min(iv+1,countV-1)]
+			
+			# Newton Refinement
+			for it in range(maxIterations):
+				skl = self.evaluate(u,v,2)
+				r = (skl[0][0][0]-pt[0],skl[0][0][1]-pt[1],skl[0][0][2]-pt[2])
+				su = skl[1][0]
+				sv = skl[0][1]
+				f = _dot(r,su)
+				g = _dot(r,sv)
+				a = _dot(su,su) + _dot(r,skl[2][0])
+				b = _dot(su,sv) + _dot(r,skl[1][1])
+				d = _dot(sv,sv) + _dot(r,skl[0][2])
+				det = a*d - b*b
+				if not det: break
+				du = (b*g - d*f) / det
+				dv = (b*f - a*g) / det
+				u = min(max(u+du,uMin),uMax)
+				v = min(max(v+dv,vMin),vMax)
+				if abs(du) < tolerance and abs(dv) < tolerance: break
+			
+			uvList.append((u,v))
+		
+		return uvList
+	
+	def closestPoints(self,pointList):
+		'''
+		Return the closest surface positions to a list of points.
+		@param pointList: List of points to find the closest surface positions for
+		@type pointList: list
+		'''
+		return self.points(self.closestUVs(pointList))
+
+def _spanSamples(knots,paramRange,resolution):
+	'''
+	Return a list of parameters sampled uniformly within each knot span of the parameter range.
+	'''
+	spanParams = sorted(set([k for k in knots if k >= paramRange[0] and k <= paramRange[1]]))
+	params = [spanParams[0]]
+	for i in range(len(spanParams)-1):
+		step = (spanParams[i+1] - spanParams[i]) / resolution
+		for j in range(1,resolution): params.append(spanParams[i] + step*j)
+		params.append(spanParams[i+1])
+	return params
+
+def _binomial(n,k):
+	return math.factorial(n) / (math.factorial(k)*math.factorial(n-k))
+
+def _dot(v1,v2):
+	return v1[0]*v2[0] + v1[1]*v2[1] + v1[2]*v2[2]
+
+def _cross(v1,v2):
+	return (v1[1]*v2[2]-v1[2]*v2[1],v1[2]*v2[0]-v1[0]*v2[2],v1[0]*v2[1]-v1[1]*v2[0])
+
+def _normalize(v):
+	length = math.sqrt(_dot(v,v))
+	if not length: return tuple(v)
+	return (v[0]/length,v[1]/length,v[2]/length)
+
+def closestUVs(surface,pointList):
+	'''
+	Return the closest surface UV parameters to a list of points.
+	Values expected in world space.
+	@param surface: Surface to query closest UV parameters from
+	@type surface: str
+	@param pointList: List of points to find the closest surface UV parameters for
+	@type pointList: list
+	'''
+	return SurfaceEvaluator(surface).closestUVs(pointList)
@@ -1,133 +1,207 @@
+'''
+WeightList: a weight value list stored as an array.array of doubles.
+WeightList was previously a list subclass. Indexing, iteration, len(), slicing (returns a WeightList),
+pickling and comparison (==, != against any sequence) behave as before. Remaining differences:
+- isinstance(weightList,list) is False. Use list(weightList) or weightList.tolist() where a list is required (ie. json).
+- Values are stored as floats. Appending or assigning non numeric values raises a TypeError.
+- List only methods are not available (ie. sort()). Use sorted(weightList) instead.
+- Modifiers (clamp, normalize, invert) and in place operators update the weight list in place.
+'''
+
 import maya.cmds as mc
+import maya.OpenMaya as OpenMaya
+
+import glTools.utils.arrayUtils
 
 import types
+import array
+import struct
+import sys
+import operator
+import itertools
 
 import cPickle
 import os.path
 
-class WeightList(list):
-	
+class WeightList(array.array):
+
 	'''
-	to do : remap(0,1), normalize(), smooth()
+	Weight list stored as a contiguous array of doubles.
+	Arithmetic operators are applied per element against a scalar or another weight list (or sequence).
+	If the operand lengths differ, the operation is applied over the common length and the extra
+	elements of the longer operand are passed through unchanged.
+	Modifiers and in place operators (+=, -=, *=, /=) update the weight list in place.
 	'''
-	
+
 	FILE_FILTER = "All Files (*.*)"
-	
+	FILE_ID = 'WTLS'
+	FILE_VERSION = 1
+
+	def __new__(cls, values=[]):
+		if isinstance(values,(OpenMaya.MDoubleArray,OpenMaya.MFloatArray)):
+			values = [values[i] for i in xrange(values.length())]
+		return array.array.__new__(cls,'d',values)
+
+	def __reduce__(self):
+		return (self.__class__,(self.tolist(),))
+
+	def __copy__(self):
+		return WeightList(self)
+
+	def __deepcopy__(self, memo):
+		return WeightList(self)
+
+	def __repr__(self):
+		return self.__class__.__name__+'('+repr(self.tolist())+')'
+
+	def __getitem__(self, index):
+		if isinstance(index,slice): return WeightList(array.array.__getitem__(self,index))
+		return array.array.__getitem__(self,index)
+
+	def __getslice__(self, i, j):
+		return WeightList(array.array.__getslice__(self,i,j))
+
+	def __eq__(self, other):
+		if not self._isSequence(other): return NotImplemented
+		if len(self) != len(other): return False
+		for a,b in itertools.izip(self,other):
+			if a != b: return False
+		return True
+
+	def __ne__(self, other):
+		result = self.__eq__(other)
+		if result is NotImplemented: return result
+		return not result
+
 	#=============================
 	# Checks
 	#=============================
-	def _initialChecks(self, other):
-		
-		self._extraElements=[]
-		self._scalar=False
-		
-		self._checkType(other)
-		self._checkLength(other)
-	
-	def _checkType(self, other):
-		if isinstance(other,types.FloatType) or isinstance(other,types.IntType):
-			self._scalar=True
-			
-	def _checkLength(self, other):
-		if self._scalar : return
-		
-		if len(self) < len(other):
-			self._extraElements = other[len(self):]
-		elif len(self) > len(other):
-			self._extraElements = self[len(other):]
-	
+
+	def _isScalar(self, other):
+		return isinstance(other,(types.FloatType,types.IntType,types.LongType))
+
+	def _isSequence(self, other):
+		return isinstance(other,(array.array,types.ListType,types.TupleType))
+
 	#=============================
 	# Utilities
 	#=============================
-	
-	def _addExtraElements(self, other):
-		other.extend(self._extraElements)
-		return WeightList(other)
-	
+
+	def _apply(self, other, func, inPlace=False):
+		'''
+		Apply a binary operation (func) per element, between this weight list and a scalar or sequence.
+		'''
+		result = self
+		if not inPlace: result = WeightList(self)
+
+		# Scalar
+		if self._isScalar(other):
+			result[:] = array.array('d',itertools.imap(func,self,itertools.repeat(other)))
+			return result
+
+		# Sequence
+		count = min(len(self),len(other))
+		result[:count] = array.array('d',itertools.imap(func,self,other))
+		if len(other) > count: result.extend(other[count:])
+		return result
+
+	def copy(self):
+		'''
+		Return a copy of the weight list.
+		'''
+		return WeightList(self)
+
+	def asMDoubleArray(self):
+		'''
+		Return the weight list values as an MDoubleArray.
+		'''
+		return glTools.utils.arrayUtils.toMDoubleArray(self.tolist())
+
+	def asMFloatArray(self):
+		'''
+		Return the weight list values as an MFloatArray.
+		'''
+		return glTools.utils.arrayUtils.toMFloatArray(self.tolist())
+
 	#=============================
 	# Modifiers
 	#=============================
-	
+
 	def clamp(self, clampMin=0, clampMax=1):
-		self = [max( clampMin, min(i, clampMax)) for i in self ]
+		clampMin = float(clampMin)
+		clampMax = float(clampMax)
+		self[:] = array.array('d',[max(clampMin,min(i,clampMax)) for i in self])
 		return self
 
 	def normalize(self, normalizeMin=0, normalizeMax=1):
+		if not len(self): return self
 		old_min = min(self)
 		old_range = max(self) - old_min
-		self = WeightList([(n - old_min) / old_range * normalizeMax + normalizeMin for n in self])
+		if not old_range:
+			self[:] = array.array('d',[float(normalizeMin)]*len(self))
+			return self
+		scale = (normalizeMax - normalizeMin) / old_range
+		self[:] = array.array('d',[(n - old_min) * scale + normalizeMin for n in self])
 		return self
-	
+
 	def invert(self):
-		self = WeightList([1.0-i for i in self])
+		self[:] = array.array('d',itertools.imap(operator.sub,itertools.repeat(1.0),self))
 		return self
-	
+
 	#=============================
 	# Operators
 	#=============================
-	
+
 	def __add__(self,other):
-		self._initialChecks(other)
-		if self._scalar:
-			return WeightList([i+other for i in self])
-		else:
-			return self._addExtraElements([i[0]+i[1] for i in zip(self,other)])
+		return self._apply(other,operator.add)
 
 	def __sub__(self,other):
-		self._initialChecks(other)
-		if self._scalar:
-			return WeightList([i-other for i in self])
-		else:
-			return self._addExtraElements([i[0]-i[1] for i in zip(self,other)])
+		return self._apply(other,operator.sub)
 
 	def __mul__(self,other):
-		self._initialChecks(other)
-		if self._scalar:
-			return WeightList([i*other for i in self])
-		else:
-			return self._addExtraElements([i[0]*i[1] for i in zip(self,other)])
-			
-	# needs a 0 check
+		return self._apply(other,operator.mul)
+
 	def __div__(self,other):
-		self._initialChecks(other)
-		if self._scalar:
-			return WeightList([i/other for i in self])
-		else:
-			return self._addExtraElements([i[0]/i[1] for i in zip(self,other)])
-	
-	
+		return self._apply(other,_safeDiv)
+
+	__truediv__ = __div__
+
 	def __iadd__(self,other):
-		return WeightList(self.__add__(other))
-		
+		return self._apply(other,operator.add,inPlace=True)
+
 	def __isub__(self,other):
-		return WeightList(self.__sub__(other))
-			
+		return self._apply(other,operator.sub,inPlace=True)
+
 	def __imul__(self,other):
-		return WeightList(self.__mul__(other))
-		
+		return self._apply(other,operator.mul,inPlace=True)
+
 	def __idiv__(self,other):
-		return WeightList(self.__div__(other))
-		
+		return self._apply(other,_safeDiv,inPlace=True)
+
+	__itruediv__ = __idiv__
+
 	def __radd__(self,other):
 		return self.__add__(other)
-		
+
 	def __rsub__(self,other):
-		return self.__sub__(other)
-		
+		return self._apply(other,_reverseSub)
+
 	def __rmul__(self,other):
 		return self.__mul__(other)
-		
+
 	def __rdiv__(self,other):
-		return self.__div__(other)
-	
-	
+		return self._apply(other,_reverseDiv)
+
+	__rtruediv__ = __rdiv__
+
 	# ===============
 	# - SAVE / LOAD -
 	# ===============
-	
+
 	def save(self,filePath,force=False):
 		'''
 		Save data object to file.
+		Weight values are written as a binary block of little endian doubles.
 		@param filePath: Target file path.
 		@type filePath: str
 		@param force: Force save if file already exists. (Overwrite).
@@ -135,44 +209,48 @@ class WeightList(list):
 		'''
 		# Check Directory Path
 		dirpath = os.path.dirname(filePath)
-		if not os.path.isdir(dirpath): os.makedirs(dirpath)
-		
+		if dirpath and not os.path.isdir(dirpath): os.makedirs(dirpath)
+
 		# Check File Path
 		if os.path.isfile(filePath) and not force:
 			raise Exception('File "'+filePath+'" already exists! Use "force=True" to overwrite the existing file.')
-		
+
 		# Save File
+		values = array.array('d',self)
+		if sys.byteorder == 'big': values.byteswap()
 		fileOut = open(filePath,'wb')
-		cPickle.dump(self,fileOut)
+		fileOut.write(struct.pack('<4sII',self.FILE_ID,self.FILE_VERSION,len(values)))
+		values.tofile(fileOut)
 		fileOut.close()
-		
+
 		# Print Message
 		print('Saved '+self.__class__.__name__+': "'+filePath+'"')
-		
+
 		# Return Result
 		return filePath
-	
+
 	def saveAs(self):
 		'''
 		Save data object to file.
-		Opens a file dialog, to allow the user to specify a file path. 
+		Opens a file dialog, to allow the user to specify a file path.
 		'''
 		# Specify File Path
 		filePath = mc.fileDialog2(fileFilter=self.FILE_FILTER,dialogStyle=2,fileMode=0,caption='Save As')
-		
+
 		# Check Path
 		if not filePath: return
 		filePath = filePath[0]
-		
+
 		# Save Data File
 		filePath = self.save(filePath,force=True)
-		
+
 		# Return Result
 		return filePath
-	
+
 	def load(self,filePath=''):
 		'''
 		Load data object from file.
+		Weight list files saved in the previous (pickled) format are also supported.
 		@param filePath: Target file path
 		@type filePath: str
 		'''
@@ -184,14 +262,64 @@ class WeightList(list):
 		else:
 			if not os.path.isfile(filePath):
 				raise Exception('File "'+filePath+'" does not exist!')
-		
+
 		# Open File
 		fileIn = open(filePath,'rb')
-		self = cPickle.load(fileIn)
-		
+		header = fileIn.read(12)
+		if len(header) == 12 and header[:4] == self.FILE_ID:
+			fileId,version,count = struct.unpack('<4sII',header)
+			if version > self.FILE_VERSION:
+				fileIn.close()
+				raise Exception('Unsupported '+self.__class__.__name__+' file version ('+str(version)+')!')
+			values = array.array('d')
+			values.fromfile(fileIn,count)
+			if sys.byteorder == 'big': values.byteswap()
+			self = WeightList(values)
+		else:
+			# Legacy (pickled list) format
+			fileIn.seek(0)
+			unpickler = cPickle.Unpickler(fileIn)
+			unpickler.find_global = _legacyFindGlobal
+			self = WeightList(unpickler.load())
+		fileIn.close()
+
 		# Print Message
 		print('Loaded '+self.__class__.__name__+': "'+filePath+'"')
-		
+
 		# Return Result
-		return self	
-		
+		return self
+
+#=============================
+# Operator Functions
+#=============================
+
+def _safeDiv(a,b):
+	'''
+	Division that returns 0.0 for a zero divisor.
+	'''
+	if not b: return 0.0
+	return a/b
+
+def _reverseSub(a,b):
+	return b-a
+
+def _reverseDiv(a,b):
+	return _safeDiv(b,a)
+
+#=============================
+# Legacy File Support
+#=============================
+
+class _LegacyWeightList(list):
+	'''
+	Stand in class for unpickling weight lists saved from the previous list based WeightList.
+	'''
+	pass
+
+def _legacyFindGlobal(module,name):
+	'''
+	Unpickler global lookup that maps the WeightList class to _LegacyWeightList.
+	'''
+	if name == 'WeightList': return _LegacyWeightList
+	__import__(module)
+	return getattr(sys.modules[module],name)